@@ -8,7 +8,9 @@ Capability Map을 로컬에 복사 탑재하여 L1 수준 차단을 수행한다
 설계 원칙:
   - 네트워크 의존성 없음 (오프라인 실행 가능)
   - frozenset 룩업 O(1) — Capability Map (shared_policy.py에서 가져옴)
-  - 패턴 컴파일 캐싱 — re.compile() 사전 수행
+  - 패턴 컴파일 캐싱 — 정책 버전(패턴 목록)당 결합 오토마톤 1회 빌드
+  - 단일 패스 스캔 — 필수 리터럴(앵커) trie 정규식으로 후보 패턴만 선별 후 검증
+  - 잠금 없는 check() — 불변 스냅샷 참조 교체 방식 (inject_patterns가 교체)
   - ring_level: int 대신 BridgeRingLevel Enum으로 타입 안전 보장
   - 텍스트 정규화 (Zero-Width Space, RTL Override, Homoglyph) 후 패턴 매칭
   - params 스캔 크기 제한 (MAX_PARAMS_SCAN_BYTES) — 대용량 params 성능 보호
@@ -17,6 +19,7 @@ Capability Map을 로컬에 복사 탑재하여 L1 수준 차단을 수행한다
 
 from __future__ import annotations
 
+import functools
 import json
 import logging
 import re
@@ -25,6 +28,16 @@ import unicodedata
 from dataclasses import dataclass
 from typing import Optional
 
+try:
+    from re import _parser as _re_parser  # Python 3.11+
+except ImportError:  # pragma: no cover
+    import sre_parse as _re_parser
+
+try:
+    from re._casefix import _EXTRA_CASES as _IGNORECASE_EXTRA  # Python 3.11+
+except ImportError:  # pragma: no cover
+    from sre_compile import _ignorecase_fixes as _IGNORECASE_EXTRA
+
 from .shared_policy import (
     CAPABILITY_MAP,
     INJECTION_PATTERNS,
@@ -67,6 +80,34 @@ _HOMOGLYPH_MAP: dict[str, str] = {
 }
 _HOMOGLYPH_TABLE = str.maketrans(_HOMOGLYPH_MAP)
 
+_PATTERN_FLAGS = re.IGNORECASE | re.UNICODE
+
+# 앵커 최소 길이 — 이보다 짧은 필수 리터럴만 가진 패턴은 매 호출 개별 검사
+# (1~2자 앵커는 거의 모든 텍스트에 등장해 사전 필터 효과가 없음)
+_MIN_ANCHOR_LEN: int = 3
+
+# re.IGNORECASE는 문자 단위 simple lowercase 비교 + 같은 대문자를 갖는 소문자 묶음
+# (ı/i, ſ/s, ς/σ …)으로 매칭한다. casefold()는 İ → "i̇", ß → "ss" 처럼 길이를 바꿔
+# 앵커 사전 필터를 우회할 수 있으므로, 접기도 같은 문자 단위 규칙을 따른다.
+# str.lower()가 simple 매핑과 다른 유일한 무조건 규칙(İ → "i̇")은 먼저 치환한다.
+_FOLD_PRE_LOWER = str.maketrans({"\u0130": "i"})
+_FOLD_FIXES = str.maketrans({
+    chr(ch): chr(min((lo, *extra)))
+    for lo, extra in _IGNORECASE_EXTRA.items()
+    for ch in (lo, *extra)
+    if ch != min((lo, *extra))
+})
+
+# 필수 리터럴이 하위 패턴에 있는 반복/그룹 opcode (버전별 존재 여부 상이)
+_REPEAT_OPS = tuple(
+    op for op in (
+        _re_parser.MAX_REPEAT,
+        _re_parser.MIN_REPEAT,
+        getattr(_re_parser, "POSSESSIVE_REPEAT", None),
+    ) if op is not None
+)
+_ATOMIC_GROUP = getattr(_re_parser, "ATOMIC_GROUP", None)
+
 
 @dataclass(frozen=True)
 class L1Result:
@@ -95,6 +136,130 @@ def _normalize(text: str) -> str:
     return text
 
 
+def _fold(text: str) -> str:
+    """re.IGNORECASE와 같은 문자 단위 대소문자 접기 (앵커 사전 필터용, 길이 보존)."""
+    return text.translate(_FOLD_PRE_LOWER).lower().translate(_FOLD_FIXES)
+
+
+def _required_literals(parsed) -> Optional[list[str]]:
+    """
+    파싱된 정규식 시퀀스에서 "매칭 시 반드시 등장하는" 리터럴 후보를 추출.
+
+    반환된 리터럴 중 최소 하나가 매칭 텍스트에 포함된다 (최상위 분기는 분기별
+    리터럴을 모두 반환). 후보 중 가장 짧은 리터럴이 가장 긴 조합을 선택한다.
+
+    Returns:
+        list[str] — 필수 리터럴 목록. 추출 불가(선택적/문자 클래스뿐)면 None.
+    """
+    best: Optional[list[str]] = None
+
+    def consider(candidate: Optional[list[str]]) -> None:
+        nonlocal best
+        if candidate and (
+            best is None or min(map(len, candidate)) > min(map(len, best))
+        ):
+            best = candidate
+
+    run: list[str] = []
+    for op, av in parsed:
+        if op is _re_parser.LITERAL:
+            run.append(chr(av))
+            continue
+        consider(["".join(run)] if run else None)
+        run = []
+        if op is _re_parser.SUBPATTERN:
+            consider(_required_literals(av[-1]))
+        elif _ATOMIC_GROUP is not None and op is _ATOMIC_GROUP:
+            consider(_required_literals(av))
+        elif op is _re_parser.BRANCH:
+            branches = [_required_literals(branch) for branch in av[1]]
+            if all(branches):
+                consider([literal for branch in branches for literal in branch])
+        elif op in _REPEAT_OPS and av[0] >= 1:
+            consider(_required_literals(av[2]))
+    consider(["".join(run)] if run else None)
+    return best
+
+
+def _trie_regex(node: dict) -> str:
+    """앵커 trie → 정규식. 종단 노드의 자식은 greedy optional이라 최장 앵커를 매칭."""
+    children = [
+        re.escape(ch) + _trie_regex(child)
+        for ch, child in sorted(node.items(), key=lambda kv: kv[0] or "")
+        if ch is not None
+    ]
+    if not children:
+        return ""
+    body = children[0] if len(children) == 1 else "(?:" + "|".join(children) + ")"
+    return f"(?:{body})?" if None in node else body
+
+
+@dataclass(frozen=True)
+class _PatternAutomaton:
+    """
+    한 정책 버전(패턴 목록)의 결합 매처. 빌드 후 불변.
+
+    각 패턴의 필수 리터럴(앵커)을 하나의 trie 정규식으로 결합해 텍스트를 한 번만
+    스캔하고, 앵커가 등장한 패턴과 앵커가 없는 패턴만 원래 정규식으로 검증한다.
+    """
+    compiled: tuple[re.Pattern, ...]
+    prefilter: Optional[re.Pattern]
+    trie: dict                     # folded 앵커 trie, 종단 노드의 None 키 = 패턴 인덱스
+    unanchored: frozenset[int]
+
+    def first_match(self, text: str) -> Optional[re.Pattern]:
+        """목록 순서상 처음으로 매칭되는 패턴 (기존 순차 검사와 동일한 결과)."""
+        candidates = set(self.unanchored)
+        if self.prefilter is not None:
+            folded = _fold(text)
+            search = self.prefilter.search
+            match = search(folded)
+            while match is not None:
+                node = self.trie
+                for ch in match.group():
+                    node = node[ch]
+                    ids = node.get(None)
+                    if ids:
+                        candidates.update(ids)
+                match = search(folded, match.start() + 1)
+
+        for index in sorted(candidates):
+            pattern = self.compiled[index]
+            if pattern.search(text):
+                return pattern
+        return None
+
+
+@functools.lru_cache(maxsize=8)
+def _build_automaton(patterns: tuple[str, ...]) -> _PatternAutomaton:
+    """패턴 목록당 1회 빌드 (같은 정책을 쓰는 브릿지 인스턴스 간 공유)."""
+    compiled = tuple(re.compile(p, _PATTERN_FLAGS) for p in patterns)
+    trie: dict = {}
+    unanchored: set[int] = set()
+
+    for index, pattern in enumerate(patterns):
+        try:
+            literals = _required_literals(_re_parser.parse(pattern, _PATTERN_FLAGS))
+        except Exception:  # 파서 내부 구조 변화 등 — 개별 검사로 안전하게 폴백
+            literals = None
+        if not literals or min(map(len, literals)) < _MIN_ANCHOR_LEN:
+            unanchored.add(index)
+            continue
+        for literal in literals:
+            node = trie
+            for ch in _fold(literal):
+                node = node.setdefault(ch, {})
+            node.setdefault(None, set()).add(index)
+
+    prefilter = re.compile(_trie_regex(trie)) if trie else None
+    return _PatternAutomaton(
+        compiled=compiled,
+        prefilter=prefilter,
+        trie=trie,
+        unanchored=frozenset(unanchored),
+    )
+
+
 class LocalL1Checker:
     """
     브릿지 내장 경량 L1 보안 검사기.
@@ -117,14 +282,12 @@ class LocalL1Checker:
     """
 
     def __init__(self) -> None:
+        # inject_patterns 간 직렬화 전용 — check()는 잠금 없이 스냅샷 참조만 읽는다
         self._lock = threading.RLock()
         # 인스턴스 레벨 패턴 (inject_patterns로 업데이트 가능)
         self._patterns_raw: list[str] = list(INJECTION_PATTERNS)
-        self._compiled: list[re.Pattern] = [
-            re.compile(p, re.IGNORECASE | re.UNICODE)
-            for p in self._patterns_raw
-        ]
-        # 인스턴스 레벨 Capability Map (inject_patterns로 업데이트 가능)
+        self._automaton: _PatternAutomaton = _build_automaton(tuple(self._patterns_raw))
+        # 인스턴스 레벨 Capability Map (inject_patterns로 통째로 교체, 제자리 수정 금지)
         self._capability_map: dict[BridgeRingLevel, frozenset[str]] = dict(CAPABILITY_MAP)
         self._policy_version: str = "local_default"
 
@@ -177,21 +340,18 @@ class LocalL1Checker:
 
         scan_text = f"{normalized_thought} {normalized_action} {params_text}"
 
-        # 2. 인젝션 패턴 검사
-        with self._lock:
-            compiled = list(self._compiled)
-
-        for pattern in compiled:
-            if pattern.search(scan_text):
-                logger.warning(
-                    "[LocalL1Checker] Injection pattern matched. "
-                    "pattern=%s action=%s ring=%d",
-                    pattern.pattern, action, ring_level,
-                )
-                return L1Result(
-                    allowed=False,
-                    reason=f"L1 injection pattern blocked: {pattern.pattern}",
-                )
+        # 2. 인젝션 패턴 검사 (결합 오토마톤 단일 스캔, 불변 스냅샷)
+        pattern = self._automaton.first_match(scan_text)
+        if pattern is not None:
+            logger.warning(
+                "[LocalL1Checker] Injection pattern matched. "
+                "pattern=%s action=%s ring=%d",
+                pattern.pattern, action, ring_level,
+            )
+            return L1Result(
+                allowed=False,
+                reason=f"L1 injection pattern blocked: {pattern.pattern}",
+            )
 
         # 3. Capability Map 확인 (BridgeRingLevel Enum 기반)
         ring = BridgeRingLevel.from_int(ring_level)
@@ -221,18 +381,18 @@ class LocalL1Checker:
         커널에서 동기화된 최신 패턴 및 Capability Map 주입.
 
         sync_from_kernel()이 내부적으로 호출하며, 직접 호출도 가능.
+        결합 오토마톤을 먼저 빌드한 뒤 참조만 교체하므로 진행 중인 check()는
+        이전 정책 또는 새 정책 중 하나를 온전히 사용한다.
 
         Args:
             injection_patterns: 새 인젝션 패턴 정규식 목록.
             capability_map:     {ring_level(int): [allowed_tool, ...]} (선택적).
             version:            정책 버전 식별자 (로그용).
         """
+        automaton = _build_automaton(tuple(injection_patterns))
         with self._lock:
             self._patterns_raw = injection_patterns
-            self._compiled = [
-                re.compile(p, re.IGNORECASE | re.UNICODE)
-                for p in injection_patterns
-            ]
+            self._automaton = automaton
             if capability_map:
                 self._capability_map = {
                     BridgeRingLevel.from_int(int(k)): frozenset(v)
@@ -322,6 +482,5 @@ class LocalL1Checker:
         if ring == BridgeRingLevel.KERNEL:
             return True
 
-        with self._lock:
-            allowed = self._capability_map.get(ring, frozenset())
+        allowed = self._capability_map.get(ring, frozenset())
         return action in allowed  # Default-Deny
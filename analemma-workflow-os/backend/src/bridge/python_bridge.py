@@ -48,7 +48,7 @@ import re
 import threading
 from contextlib import contextmanager
 from dataclasses import dataclass, field
-from typing import Any, Dict, Iterator, Optional
+from typing import Any, ContextManager, Dict, Iterator, Optional
 
 from .local_l1_checker import LocalL1Checker, L1Result
 from .shared_policy import DESTRUCTIVE_ACTIONS, DESTRUCTIVE_PATTERNS
@@ -203,6 +203,9 @@ class AnalemmaBridge:
 
         self._loop_index: int = 0
         self._parent_segment_id: Optional[str] = None
+        # _parent_segment_id를 마지막으로 갱신한 segment의 loop_index
+        # (동시에 닫히는 segment 중 가장 늦게 열린 것이 다음 부모가 됨)
+        self._parent_loop_index: int = 0
         self._lock = threading.Lock()
         self._l1_checker = LocalL1Checker()
         self._kernel_headers: Dict[str, str] = (
@@ -225,7 +228,6 @@ class AnalemmaBridge:
 
     # ── 공개 API ───────────────────────────────────────────────────────────────
 
-    @contextmanager
     def segment(
         self,
         thought: str,
@@ -233,7 +235,7 @@ class AnalemmaBridge:
         params: Dict[str, Any],
         segment_type: str = "TOOL_CALL",
         state_snapshot: Optional[Dict[str, Any]] = None,
-    ) -> Iterator[_SegmentHandle | _OptimisticHandle]:
+    ) -> ContextManager[_SegmentHandle | _OptimisticHandle]:
         """
         에이전트 행동을 커널 거버넌스 하에 실행하는 컨텍스트 매니저.
 
@@ -258,10 +260,32 @@ class AnalemmaBridge:
                 if seg.allowed:
                     result = s3.get_object(...)
                     seg.report_observation(result)
+
+        loop_index와 parent_segment_id는 segment() 호출 시점에 확정된다.
+        여러 segment를 호출 순서대로 만든 뒤 서로 다른 스레드에서 동시에 enter해도
+        (ReactExecutor 병렬 거버넌스 probe) 순번과 부모가 호출 순서를 따르며,
+        배치 내 segment는 배치 이전 segment를 공통 부모로 갖는 형제가 된다.
         """
         with self._lock:
             self._loop_index += 1
             loop_index = self._loop_index
+            parent_segment_id = self._parent_segment_id
+        return self._segment(
+            thought, action, params, segment_type, state_snapshot,
+            loop_index, parent_segment_id,
+        )
+
+    @contextmanager
+    def _segment(
+        self,
+        thought: str,
+        action: str,
+        params: Dict[str, Any],
+        segment_type: str,
+        state_snapshot: Optional[Dict[str, Any]],
+        loop_index: int,
+        parent_segment_id: Optional[str],
+    ) -> Iterator[_SegmentHandle | _OptimisticHandle]:
 
         # ── Hybrid Interceptor ─────────────────────────────────────────────────
         effective_mode = self.mode
@@ -273,14 +297,19 @@ class AnalemmaBridge:
                 action, self.workflow_id, loop_index,
             )
 
+        # _optimistic_segment/_strict_segment는 @contextmanager 객체를 반환하므로
+        # yield from이 아닌 with로 위임한다 (generator가 아니라 iterable이 아님)
         if effective_mode == "optimistic":
-            yield from self._optimistic_segment(
-                thought, action, params, loop_index
+            inner = self._optimistic_segment(
+                thought, action, params, loop_index, parent_segment_id
             )
         else:
-            yield from self._strict_segment(
-                thought, action, params, segment_type, loop_index, state_snapshot
+            inner = self._strict_segment(
+                thought, action, params, segment_type, loop_index, state_snapshot,
+                parent_segment_id,
             )
+        with inner as seg:
+            yield seg
 
     # ── Strict Mode ────────────────────────────────────────────────────────────
 
@@ -293,10 +322,12 @@ class AnalemmaBridge:
         segment_type: str,
         loop_index: int,
         state_snapshot: Optional[Dict[str, Any]],
+        parent_segment_id: Optional[str] = None,
     ) -> Iterator[_SegmentHandle]:
         """PROPOSE → 커널 동기 승인 → 실행."""
         proposal = self._build_proposal(
-            thought, action, params, segment_type, loop_index, state_snapshot
+            thought, action, params, segment_type, loop_index, state_snapshot,
+            parent_segment_id,
         )
         commit = self._send_propose(proposal)
         seg = _SegmentHandle(commit, params)
@@ -309,7 +340,10 @@ class AnalemmaBridge:
             self._send_failure(commit.checkpoint_id, str(exc))
             raise
         finally:
-            self._parent_segment_id = commit.checkpoint_id
+            with self._lock:
+                if loop_index >= self._parent_loop_index:
+                    self._parent_segment_id = commit.checkpoint_id
+                    self._parent_loop_index = loop_index
 
     # ── Optimistic Mode ────────────────────────────────────────────────────────
 
@@ -320,6 +354,7 @@ class AnalemmaBridge:
         action: str,
         params: Dict[str, Any],
         loop_index: int,
+        parent_segment_id: Optional[str] = None,
     ) -> Iterator[_OptimisticHandle]:
         """L1 로컬 검사 → 즉시 실행 → 비동기 커널 보고."""
         l1_result: L1Result = self._l1_checker.check(
@@ -337,7 +372,9 @@ class AnalemmaBridge:
             yield seg
         finally:
             # 사후 비동기 보고 (fire-and-forget)
-            self._async_report(thought, action, params, loop_index, seg._observation)
+            self._async_report(
+                thought, action, params, loop_index, seg._observation, parent_segment_id
+            )
 
     def _async_report(
         self,
@@ -346,12 +383,14 @@ class AnalemmaBridge:
         params: Dict[str, Any],
         loop_index: int,
         observation: Optional[Any],
+        parent_segment_id: Optional[str] = None,
     ) -> None:
         """별도 스레드에서 커널에 비동기 보고."""
         def _do_report():
             try:
                 proposal = self._build_proposal(
-                    thought, action, params, "TOOL_CALL", loop_index, None
+                    thought, action, params, "TOOL_CALL", loop_index, None,
+                    parent_segment_id,
                 )
                 import requests
                 requests.post(
@@ -424,6 +463,7 @@ class AnalemmaBridge:
         segment_type: str,
         loop_index: int,
         state_snapshot: Optional[Dict[str, Any]],
+        parent_segment_id: Optional[str] = None,
     ) -> Dict[str, Any]:
         """SEGMENT_PROPOSE 페이로드 구성."""
         content = (
@@ -438,7 +478,7 @@ class AnalemmaBridge:
             "idempotency_key": idempotency_key,
             "segment_context": {
                 "workflow_id": self.workflow_id,
-                "parent_segment_id": self._parent_segment_id,
+                "parent_segment_id": parent_segment_id,
                 "loop_index": loop_index,
                 "segment_type": segment_type,
                 "sequence_number": loop_index,
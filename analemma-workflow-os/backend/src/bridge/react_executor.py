@@ -14,9 +14,9 @@ Execution flow:
   [1] Build messages (system + user task)
   [2] Call Claude via AnthropicBedrock with tool definitions
   [3] Post-LLM budget gate — stop before tool execution if budget blown
-  [4] Atomic governance: probe bridge.segment() for ALL tools in batch
+  [4] Atomic governance: probe bridge.segment() for ALL tools in batch (concurrently)
   [5] Kill check: if ANY SIGKILL → abort entire batch
-  [6] Execute approved handlers, return errors for rejected
+  [6] Execute approved handlers (concurrently, bounded), return errors for rejected
   [7] Post-tool budget estimate — stop if next LLM call will exceed budget
   [8] Loop until end_turn / max_iterations / budget_exceeded / sigkill
 
@@ -30,6 +30,7 @@ Usage:
 from __future__ import annotations
 
 import concurrent.futures
+import functools
 import json
 import logging
 import os
@@ -136,6 +137,10 @@ _LLM_MAX_RETRIES = 3
 _LLM_BASE_DELAY = 1.0  # seconds
 _MAX_CONSECUTIVE_REJECTIONS = 3
 _TOKEN_ESTIMATE_CHARS_PER_TOKEN = 4  # Conservative estimate for budget projection
+# Max approved tool handlers running at once within one batch (1 = sequential)
+_DEFAULT_TOOL_CONCURRENCY = int(os.environ.get("REACT_TOOL_CONCURRENCY", "4"))
+# Governance probes are kernel round trips — a batch is probed all at once up to this cap
+_MAX_GOVERNANCE_PROBE_WORKERS = 16
 
 
 # ─── ReactExecutor ───────────────────────────────────────────────────────────
@@ -169,6 +174,8 @@ class ReactExecutor:
                              seal_state_bag + S3 offload + response serialization.
         tool_timeout:        Per-tool execution timeout in seconds. Prevents a single
                              slow tool handler from consuming the entire budget.
+        tool_concurrency:    Max approved handlers executed concurrently per batch.
+                             Defaults to REACT_TOOL_CONCURRENCY (4). 1 = sequential.
     """
 
     def __init__(
@@ -184,6 +191,7 @@ class ReactExecutor:
         token_counter: Optional[Callable[[str], int]] = None,
         wall_clock_timeout: Optional[float] = None,
         tool_timeout: float = 30.0,
+        tool_concurrency: Optional[int] = None,
     ):
         self._bridge = bridge
         self._model_id = model_id
@@ -197,6 +205,7 @@ class ReactExecutor:
         self._token_counter = token_counter or self._default_token_estimate
         self._wall_clock_timeout = wall_clock_timeout
         self._tool_timeout = tool_timeout
+        self._tool_concurrency = max(1, tool_concurrency or _DEFAULT_TOOL_CONCURRENCY)
         self._start_time: Optional[float] = None
 
     @staticmethod
@@ -546,27 +555,32 @@ class ReactExecutor:
 
         Phase 1 — Governance: probe bridge.segment() for ALL tools before
                   executing any handler. Each probe opens a segment, reads the
-                  governance decision, and closes it.
+                  governance decision, and closes it. Segments are created in
+                  batch order, then the probes (kernel round trips) run
+                  concurrently.
         Phase 2 — Kill check: if ANY tool received SIGKILL, abort the entire
                   batch. ALL tools get an ABORTED error result (no partial exec).
-        Phase 3 — Execution: run approved handlers via _execute_tool_handler.
-                  Rejected tools get an error result with recovery instruction.
+                  No handler starts before every probe has returned.
+        Phase 3 — Execution: run approved handlers via _execute_tool_handler,
+                  at most ``tool_concurrency`` at a time. Rejected tools get an
+                  error result with recovery instruction. Results keep the
+                  order of ``tool_use_blocks``.
 
         Returns:
             (tool_results, segment_ids, was_killed)
         """
         # Phase 1: Governance decisions
-        decisions = []
-        for block in tool_use_blocks:
-            decision = self._check_tool_governance(
+        probes = [
+            self._prepare_governance_probe(
                 tool_name=block.name,
                 tool_input=block.input,
-                tool_use_id=block.id,
                 thought=thought,
                 iteration=iteration,
                 total_tokens=total_tokens,
             )
-            decisions.append(decision)
+            for block in tool_use_blocks
+        ]
+        decisions = self._run_concurrently(probes, _MAX_GOVERNANCE_PROBE_WORKERS)
 
         all_segments = [
             d["checkpoint_id"] for d in decisions if d.get("checkpoint_id")
@@ -595,7 +609,8 @@ class ReactExecutor:
             return tool_results, all_segments, True
 
         # Phase 3: Execute approved, error for rejected
-        tool_results = []
+        tool_results: List[Optional[Dict[str, Any]]] = []
+        approved = []  # (result index, handler thunk)
         for block, decision in zip(tool_use_blocks, decisions):
             if decision.get("should_rollback"):
                 rejection_counter[block.name] = (
@@ -619,12 +634,13 @@ class ReactExecutor:
             elif decision.get("allowed"):
                 rejection_counter.pop(block.name, None)
                 action_params = decision.get("action_params", block.input)
-                tool_result = self._execute_tool_handler(
+                approved.append((len(tool_results), functools.partial(
+                    self._execute_tool_handler,
                     tool_name=block.name,
                     tool_input=action_params,
                     tool_use_id=block.id,
-                )
-                tool_results.append(tool_result)
+                )))
+                tool_results.append(None)
             else:
                 tool_results.append({
                     "type": "tool_result",
@@ -636,8 +652,26 @@ class ReactExecutor:
                     ),
                 })
 
+        executed = self._run_concurrently(
+            [handler for _, handler in approved], self._tool_concurrency,
+        )
+        for (index, _), tool_result in zip(approved, executed):
+            tool_results[index] = tool_result
+
         return tool_results, all_segments, False
 
+    @staticmethod
+    def _run_concurrently(
+        thunks: List[Callable[[], Any]], max_workers: int,
+    ) -> List[Any]:
+        """Run zero-arg callables on up to max_workers threads; results keep input order."""
+        if len(thunks) <= 1 or max_workers <= 1:
+            return [thunk() for thunk in thunks]
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=min(max_workers, len(thunks)),
+        ) as pool:
+            return list(pool.map(lambda thunk: thunk(), thunks))
+
     def _check_tool_governance(
         self,
         tool_name: str,
@@ -657,9 +691,32 @@ class ReactExecutor:
             Dict with keys: allowed, was_killed, should_rollback,
             checkpoint_id, reason, action_params
         """
+        return self._prepare_governance_probe(
+            tool_name=tool_name,
+            tool_input=tool_input,
+            thought=thought,
+            iteration=iteration,
+            total_tokens=total_tokens,
+        )()
+
+    def _prepare_governance_probe(
+        self,
+        tool_name: str,
+        tool_input: Dict[str, Any],
+        thought: str,
+        iteration: int,
+        total_tokens: int,
+    ) -> Callable[[], Dict[str, Any]]:
+        """
+        Create the bridge segment for a tool call and return a thunk that runs the probe.
+
+        bridge.segment() is called here, on the caller's thread, so segments of
+        a batch are created in tool order; the returned thunk enters the segment
+        (the kernel round trip) and may run on a worker thread.
+        """
         tool = self._tools.get(tool_name)
         if tool is None:
-            return {
+            unknown = {
                 "allowed": False,
                 "was_killed": False,
                 "should_rollback": False,
@@ -669,6 +726,7 @@ class ReactExecutor:
                     f"Available: {list(self._tools.keys())}"
                 ),
             }
+            return lambda: unknown
 
         state_snapshot = {
             "token_usage_total": total_tokens,
@@ -676,13 +734,28 @@ class ReactExecutor:
         }
 
         try:
-            with self._bridge.segment(
+            segment = self._bridge.segment(
                 thought=thought,
                 action=tool.bridge_action,
                 params=tool_input,
                 segment_type="TOOL_CALL",
                 state_snapshot=state_snapshot,
-            ) as seg:
+            )
+        except Exception as err:
+            failure = self._governance_failure(tool_name, err)
+            return lambda: failure
+
+        return functools.partial(self._run_governance_probe, tool_name, tool_input, segment)
+
+    def _run_governance_probe(
+        self,
+        tool_name: str,
+        tool_input: Dict[str, Any],
+        segment,
+    ) -> Dict[str, Any]:
+        """Enter the segment, read the governance decision, and close it."""
+        try:
+            with segment as seg:
                 checkpoint_id = seg.checkpoint_id
 
                 if seg.should_kill:
@@ -725,48 +798,41 @@ class ReactExecutor:
                     "reason": f"Unexpected bridge status for '{tool_name}'",
                 }
 
-        except SecurityViolation as sv:
+        except Exception as err:
+            return self._governance_failure(tool_name, err)
+
+    @staticmethod
+    def _governance_failure(tool_name: str, err: Exception) -> Dict[str, Any]:
+        """Fail-safe decision (deny as rollback) for a bridge error during a probe."""
+        if isinstance(err, SecurityViolation):
             logger.warning(
                 "[ReactExecutor] SecurityViolation: tool=%s error=%s",
-                tool_name, sv,
+                tool_name, err,
             )
-            return {
-                "allowed": False,
-                "was_killed": False,
-                "should_rollback": True,
-                "checkpoint_id": None,
-                "reason": f"Security violation: {sv}",
-            }
-
-        except (ConnectionError, TimeoutError, OSError) as net_err:
+            reason = f"Security violation: {err}"
+        elif isinstance(err, (ConnectionError, TimeoutError, OSError)):
             # Bridge unreachable — fail-safe: deny execution.
             # Treat as rollback so the LLM can retry or choose a different path.
             logger.error(
                 "[ReactExecutor] Bridge connection failure: tool=%s error=%s",
-                tool_name, net_err,
+                tool_name, err,
             )
-            return {
-                "allowed": False,
-                "was_killed": False,
-                "should_rollback": True,
-                "checkpoint_id": None,
-                "reason": f"Bridge connection failure: {net_err}",
-            }
-
-        except Exception as unexpected_err:
+            reason = f"Bridge connection failure: {err}"
+        else:
             # Catch-all for unexpected bridge errors — prevents kernel crash.
             # Fail-safe: deny execution.
             logger.error(
                 "[ReactExecutor] Unexpected bridge error: tool=%s error=%s",
-                tool_name, unexpected_err,
+                tool_name, err,
             )
-            return {
-                "allowed": False,
-                "was_killed": False,
-                "should_rollback": True,
-                "checkpoint_id": None,
-                "reason": f"Bridge error: {unexpected_err}",
-            }
+            reason = f"Bridge error: {err}"
+        return {
+            "allowed": False,
+            "was_killed": False,
+            "should_rollback": True,
+            "checkpoint_id": None,
+            "reason": reason,
+        }
 
     def _execute_tool_handler(
         self,
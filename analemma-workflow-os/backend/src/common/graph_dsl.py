@@ -4,6 +4,7 @@ Graph DSL: Workflow JSON schema definition and validation
 Core module of Co-design Assistant that formalizes workflow structures.
 """
 import json
+from collections import deque
 from typing import Any, Dict, List, Literal, Optional
 
 # Fallback for when Pydantic is not available
@@ -201,17 +202,252 @@ class Workflow(BaseModel):
     metadata: Optional[Dict[str, Any]] = None
 
 
+# ──────────────────────────────────────────────────────────────
+# 공유 그래프 인덱스
+# ──────────────────────────────────────────────────────────────
+
+class WorkflowGraphIndex:
+    """
+    워크플로우 그래프 인덱스 (검증기 간 공유)
+
+    validate_workflow / validate_workflow_complexity의 각 검사기와
+    partitioning.CycleDetector가 각자 인접 리스트를 만들고 그래프를 따로
+    순회하던 것을, 노드/엣지를 한 번만 스캔해 만든 인덱스 하나로 대체합니다.
+
+    - 구축: O(V+E) 1회
+    - 순환 탐지: 반복형 Tarjan SCC, O(V+E) (재귀 한도 없음)
+    - 위상 정렬: deque 기반 Kahn, O(V+E)
+
+    인덱스는 구축 시점의 nodes/edges 리스트에 묶여 있으며,
+    matches()로 같은 워크플로우인지 확인한 뒤 재사용합니다.
+    """
+
+    def __init__(self, nodes: List[Dict[str, Any]], edges: List[Dict[str, Any]]):
+        self.nodes = nodes
+        self.edges = edges
+        self._node_count = len(nodes)
+        self._edge_count = len(edges)
+
+        # 노드 ID (truthy, 중복 포함, 입력 순서) / 타입 맵 (중복 시 마지막 값)
+        self.node_ids: List[str] = []
+        self.node_type_map: Dict[str, str] = {}
+        for node in nodes:
+            node_id = node.get("id")
+            if node_id:
+                self.node_ids.append(node_id)
+                self.node_type_map[node_id] = node.get("type", "operator")
+        self.node_id_set = set(self.node_type_map)
+        self._order = {node_id: i for i, node_id in enumerate(self.node_type_map)}
+
+        # 실행 그래프 (양 끝이 모두 존재하는 엣지), 출력 차수, 연결된 ID
+        self.successors: Dict[str, List[str]] = {node_id: [] for node_id in self.node_type_map}
+        self.out_degree: Dict[str, int] = {}
+        self.connected_ids = set()
+        for edge in edges:
+            source = edge.get("source")
+            target = edge.get("target")
+            if source:
+                self.out_degree[source] = self.out_degree.get(source, 0) + 1
+                self.connected_ids.add(source)
+            if target:
+                self.connected_ids.add(target)
+            if source in self.successors and target in self.node_id_set:
+                self.successors[source].append(target)
+
+        # 제외 노드 없는 위상 정렬 결과 (순환이 없으면 SCC 탐색 생략에 사용)
+        self._full_order: Optional[List[str]] = None
+        self._full_order_computed = False
+
+    @classmethod
+    def from_workflow(cls, workflow: Dict[str, Any]) -> "WorkflowGraphIndex":
+        return cls(workflow.get("nodes", []), workflow.get("edges", []))
+
+    def matches(self, nodes: List[Dict[str, Any]], edges: List[Dict[str, Any]]) -> bool:
+        """같은 nodes/edges 리스트로 구축되었고 이후 길이가 바뀌지 않았는지"""
+        return (
+            self.nodes is nodes and self.edges is edges
+            and self._node_count == len(nodes) and self._edge_count == len(edges)
+        )
+
+    def strongly_connected_components(self, excluded: Optional[set] = None) -> List[List[str]]:
+        """반복형 Tarjan SCC (excluded 노드와 그에 닿는 엣지는 그래프에서 제외)"""
+        excluded = excluded or set()
+        successors = self.successors
+        index_of: Dict[str, int] = {}
+        low: Dict[str, int] = {}
+        stack: List[str] = []
+        on_stack = set()
+        components: List[List[str]] = []
+
+        for root in self.successors:
+            if root in index_of or root in excluded:
+                continue
+            index_of[root] = low[root] = len(index_of)
+            stack.append(root)
+            on_stack.add(root)
+            work = [(root, iter(successors[root]))]
+
+            while work:
+                node, neighbors = work[-1]
+                descended = False
+                for neighbor in neighbors:
+                    if neighbor in excluded:
+                        continue
+                    if neighbor not in index_of:
+                        index_of[neighbor] = low[neighbor] = len(index_of)
+                        stack.append(neighbor)
+                        on_stack.add(neighbor)
+                        work.append((neighbor, iter(successors[neighbor])))
+                        descended = True
+                        break
+                    if neighbor in on_stack and index_of[neighbor] < low[node]:
+                        low[node] = index_of[neighbor]
+                if descended:
+                    continue
+
+                work.pop()
+                if work and low[node] < low[work[-1][0]]:
+                    low[work[-1][0]] = low[node]
+                if low[node] == index_of[node]:
+                    component = []
+                    while True:
+                        member = stack.pop()
+                        on_stack.discard(member)
+                        component.append(member)
+                        if member == node:
+                            break
+                    components.append(component)
+
+        return components
+
+    def find_cycles(
+        self,
+        excluded: Optional[set] = None,
+        preferred_types: Optional[set] = None
+    ) -> List[List[str]]:
+        """
+        순환 탐지: 순환을 포함한 SCC마다 대표 순환 하나를 반환
+
+        대표 순환은 SCC 안에서 시작 노드로 돌아오는 최단 경로이며
+        (예: ["A", "B", "C", "A"]), 시작 노드는 preferred_types 타입 노드가
+        있으면 그 중 첫 번째, 없으면 입력 순서상 첫 번째 노드입니다.
+        SCC는 서로소이므로 전체 비용은 O(V+E)입니다.
+        """
+        if self.is_acyclic():
+            # 부분 그래프(excluded 제외)도 순환 없음
+            return []
+        excluded = excluded or set()
+        cycles: List[List[str]] = []
+
+        for component in self.strongly_connected_components(excluded):
+            if len(component) == 1:
+                node_id = component[0]
+                if node_id in self.successors[node_id]:
+                    cycles.append([node_id, node_id])
+                continue
+
+            members = sorted(component, key=self._order.__getitem__)
+            start = members[0]
+            if preferred_types:
+                start = next(
+                    (m for m in members if self.node_type_map.get(m) in preferred_types),
+                    start
+                )
+
+            member_set = set(component)
+            parent: Dict[str, Optional[str]] = {start: None}
+            queue = deque([start])
+            closing = None
+            while queue and closing is None:
+                current = queue.popleft()
+                for neighbor in self.successors[current]:
+                    if neighbor == start:
+                        closing = current
+                        break
+                    if neighbor in member_set and neighbor not in parent:
+                        parent[neighbor] = current
+                        queue.append(neighbor)
+
+            path = [start]
+            while closing is not None:
+                path.append(closing)
+                closing = parent[closing]
+            cycles.append(path[::-1])
+
+        cycles.sort(key=lambda cycle: self._order[cycle[0]])
+        return cycles
+
+    def topological_order(self, excluded: Optional[set] = None) -> Optional[List[str]]:
+        """
+        Kahn 위상 정렬 (excluded 노드는 엣지 없이 포함)
+
+        Returns:
+            위상 정렬된 노드 ID 리스트, 순환이 있으면 None
+        """
+        if not excluded:
+            if not self._full_order_computed:
+                self._full_order = self._kahn(set())
+                self._full_order_computed = True
+            return list(self._full_order) if self._full_order is not None else None
+        return self._kahn(excluded)
+
+    def is_acyclic(self) -> bool:
+        """실행 그래프에 순환이 없는지 (Kahn 1회, 결과는 인덱스에 캐시)"""
+        return self.topological_order() is not None
+
+    def _kahn(self, excluded: set) -> Optional[List[str]]:
+        in_degree = {node_id: 0 for node_id in self.successors}
+        for node_id, targets in self.successors.items():
+            if node_id in excluded:
+                continue
+            for target in targets:
+                if target not in excluded:
+                    in_degree[target] += 1
+
+        queue = deque(node_id for node_id, degree in in_degree.items() if degree == 0)
+        order: List[str] = []
+        while queue:
+            node_id = queue.popleft()
+            order.append(node_id)
+            if node_id in excluded:
+                continue
+            for target in self.successors[node_id]:
+                if target in excluded:
+                    continue
+                in_degree[target] -= 1
+                if in_degree[target] == 0:
+                    queue.append(target)
+
+        return order if len(order) == len(in_degree) else None
+
+
+def get_graph_index(
+    workflow: Dict[str, Any],
+    index: Optional[WorkflowGraphIndex] = None
+) -> WorkflowGraphIndex:
+    """주어진 인덱스가 이 워크플로우의 것이면 재사용, 아니면 새로 구축"""
+    nodes = workflow.get("nodes", [])
+    edges = workflow.get("edges", [])
+    if index is not None and index.matches(nodes, edges):
+        return index
+    return WorkflowGraphIndex(nodes, edges)
+
+
 # ──────────────────────────────────────────────────────────────
 # 스키마 검증 함수
 # ──────────────────────────────────────────────────────────────
 
-def validate_workflow(workflow: Dict[str, Any]) -> List[Dict[str, Any]]:
+def validate_workflow(
+    workflow: Dict[str, Any],
+    index: Optional[WorkflowGraphIndex] = None
+) -> List[Dict[str, Any]]:
     """
     워크플로우 구조 검증
-    
+
     Args:
         workflow: 워크플로우 JSON 딕셔너리
-        
+        index: 같은 워크플로우로 구축한 WorkflowGraphIndex (없으면 구축)
+
     Returns:
         에러 목록 [{"level": "error|warning", "message": "...", "node_id": "..."}]
     """
@@ -263,11 +499,11 @@ def validate_workflow(workflow: Dict[str, Any]) -> List[Dict[str, Any]]:
         })
         return errors
     
-    nodes = workflow.get("nodes", [])
     edges = workflow.get("edges", [])
-    
+    index = get_graph_index(workflow, index)
+
     # 2. 노드 ID 중복 검사
-    node_ids = [n.get("id") for n in nodes if n.get("id")]
+    node_ids = index.node_ids
     seen_ids = set()
     for node_id in node_ids:
         if node_id in seen_ids:
@@ -279,7 +515,7 @@ def validate_workflow(workflow: Dict[str, Any]) -> List[Dict[str, Any]]:
         seen_ids.add(node_id)
     
     # 3. 엣지 참조 무결성
-    node_id_set = set(node_ids)
+    node_id_set = index.node_id_set
     for edge in edges:
         edge_id = edge.get("id", "unknown")
         source = edge.get("source")
@@ -639,7 +875,8 @@ class WorkflowComplexityResult:
 
 
 def validate_workflow_complexity(
-    workflow: Dict[str, Any]
+    workflow: Dict[str, Any],
+    index: Optional[WorkflowGraphIndex] = None
 ) -> WorkflowComplexityResult:
     """
     [3단계] 워크플로우 복잡도 검증
@@ -657,6 +894,8 @@ def validate_workflow_complexity(
     
     Args:
         workflow: 워크플로우 JSON (nodes, edges)
+        index: 같은 워크플로우로 구축한 WorkflowGraphIndex (없으면 1회 구축 후
+               순환/고아/병렬 분기 검사가 공유)
         
     Returns:
         WorkflowComplexityResult
@@ -665,6 +904,7 @@ def validate_workflow_complexity(
     
     nodes = workflow.get("nodes", [])
     edges = workflow.get("edges", [])
+    index = get_graph_index(workflow, index)
     
     # 기본 메트릭 수집
     result.metrics = {
@@ -735,7 +975,7 @@ def validate_workflow_complexity(
     # 3. 순환 참조 감지 (의도적 루프 vs 설계 실수 구분)
     # ────────────────────────────────────────────────
     intentional_cycles, accidental_cycles = _detect_cycles_with_intent(
-        nodes, edges, INTENTIONAL_LOOP_NODE_TYPES
+        nodes, edges, INTENTIONAL_LOOP_NODE_TYPES, index=index
     )
     
     # 의도적 루프는 info로 기록 (에러/경고 아님)
@@ -762,7 +1002,7 @@ def validate_workflow_complexity(
     # ────────────────────────────────────────────────
     # 4. 고아 노드 감지
     # ────────────────────────────────────────────────
-    orphan_nodes = _find_orphan_nodes(nodes, edges)
+    orphan_nodes = _find_orphan_nodes(nodes, edges, index=index)
     for orphan_id in orphan_nodes:
         result.add_warning(
             code="WORKFLOW_ORPHAN_NODE",
@@ -776,7 +1016,7 @@ def validate_workflow_complexity(
     # ────────────────────────────────────────────────
     # 5. 병렬 분기 수 검증
     # ────────────────────────────────────────────────
-    parallel_branches = _count_parallel_branches(nodes, edges)
+    parallel_branches = _count_parallel_branches(nodes, edges, index=index)
     max_branches = max(parallel_branches.values()) if parallel_branches else 0
     result.metrics["max_parallel_branches"] = max_branches
     
@@ -873,89 +1113,55 @@ def _calculate_complexity_score(workflow: Dict[str, Any]) -> int:
 def _detect_cycles_with_intent(
     nodes: List[Dict], 
     edges: List[Dict],
-    intentional_types: set
+    intentional_types: set,
+    index: Optional[WorkflowGraphIndex] = None
 ) -> tuple:
     """
     [① 의도적 루프 vs 설계 실수 구분]
     
-    DFS 기반 순환 참조 감지 + 의도성 판별
+    SCC 기반 순환 참조 감지 + 의도성 판별 (WorkflowGraphIndex.find_cycles)
+    
+    - 의도적 루프: 제어 노드를 포함한 강한 연결 요소마다 그 노드를 지나는 순환 하나
+    - 설계 실수: 제어 노드를 모두 제외한 그래프의 강한 연결 요소마다 순환 하나
+      (제어 노드와 같은 요소에 섞여 있는 우회 순환도 놓치지 않음)
+    
+    SCC 탐색 2회로 전체 O(V+E)입니다.
     
     Args:
         nodes: 노드 목록
         edges: 엣지 목록
         intentional_types: 의도적 루프를 허용하는 노드 타입 집합
+        index: 같은 nodes/edges로 구축한 WorkflowGraphIndex (없으면 구축)
         
     Returns:
         (intentional_cycles, accidental_cycles) 튜플
         - intentional_cycles: [{"path": [...], "control_node": "..."}]
         - accidental_cycles: [["A", "B", "C", "A"]]
     """
-    # 노드 타입 맵 구축
-    node_type_map = {n.get("id"): n.get("type", "operator") for n in nodes if n.get("id")}
-    
-    # 그래프 구축
-    graph: Dict[str, List[str]] = {}
-    node_ids = set(node_type_map.keys())
-    
-    for node_id in node_ids:
-        graph[node_id] = []
+    if index is None or not index.matches(nodes, edges):
+        index = WorkflowGraphIndex(nodes, edges)
     
-    for edge in edges:
-        source = edge.get("source")
-        target = edge.get("target")
-        if source in graph and target in node_ids:
-            graph[source].append(target)
+    control_node_ids = {
+        nid for nid, node_type in index.node_type_map.items()
+        if node_type in intentional_types
+    }
     
     intentional_cycles = []
-    accidental_cycles = []
-    visited = set()
-    rec_stack = set()
-    path = []
-    
-    def dfs(node: str):
-        visited.add(node)
-        rec_stack.add(node)
-        path.append(node)
-        
-        for neighbor in graph.get(node, []):
-            if neighbor not in visited:
-                result = dfs(neighbor)
-                if result:
-                    return result
-            elif neighbor in rec_stack:
-                # 순환 발견
-                cycle_start = path.index(neighbor)
-                cycle = path[cycle_start:] + [neighbor]
-                return cycle
-        
-        path.pop()
-        rec_stack.remove(node)
-        return None
-    
-    for node_id in graph:
-        if node_id not in visited:
-            cycle = dfs(node_id)
-            if cycle:
-                # 순환 경로 내에 의도적 제어 노드가 있는지 확인
-                control_nodes_in_cycle = [
-                    nid for nid in cycle[:-1]  # 마지막은 시작점 중복
-                    if node_type_map.get(nid) in intentional_types
-                ]
-                
-                if control_nodes_in_cycle:
-                    # 의도적 루프
-                    intentional_cycles.append({
-                        "path": cycle,
-                        "control_node": control_nodes_in_cycle[0]
-                    })
-                else:
-                    # 설계 실수로 인한 순환
-                    accidental_cycles.append(cycle)
-                
-                # 리셋 후 계속 탐색
-                visited.clear()
-                rec_stack.clear()
-                path.clear()
+    if control_node_ids:
+        for cycle in index.find_cycles(preferred_types=intentional_types):
+            # 순환 경로 내에 의도적 제어 노드가 있는지 확인
+            control_nodes_in_cycle = [
+                nid for nid in cycle[:-1]  # 마지막은 시작점 중복
+                if nid in control_node_ids
+            ]
+            if control_nodes_in_cycle:
+                intentional_cycles.append({
+                    "path": cycle,
+                    "control_node": control_nodes_in_cycle[0]
+                })
+    
+    # 제어 노드를 거치지 않는 순환 = 설계 실수
+    accidental_cycles = index.find_cycles(excluded=control_node_ids)
     
     return intentional_cycles, accidental_cycles
 
@@ -1010,16 +1216,17 @@ def _check_idempotency_readiness(workflow: Dict[str, Any]) -> List[Dict[str, Any
     return issues
 
 
-def _count_parallel_branches(nodes: List[Dict], edges: List[Dict]) -> Dict[str, int]:
+def _count_parallel_branches(
+    nodes: List[Dict],
+    edges: List[Dict],
+    index: Optional[WorkflowGraphIndex] = None
+) -> Dict[str, int]:
     """
     각 노드에서 나가는 병렬 분기 수 계산
     """
-    outgoing_count: Dict[str, int] = {}
-    
-    for edge in edges:
-        source = edge.get("source")
-        if source:
-            outgoing_count[source] = outgoing_count.get(source, 0) + 1
+    if index is None or not index.matches(nodes, edges):
+        index = WorkflowGraphIndex(nodes, edges)
+    outgoing_count = index.out_degree
     
     # Parallel 타입 노드만 필터링
     parallel_nodes = {
@@ -1031,24 +1238,21 @@ def _count_parallel_branches(nodes: List[Dict], edges: List[Dict]) -> Dict[str,
     return parallel_nodes
 
 
-def _find_orphan_nodes(nodes: List[Dict], edges: List[Dict]) -> List[str]:
+def _find_orphan_nodes(
+    nodes: List[Dict],
+    edges: List[Dict],
+    index: Optional[WorkflowGraphIndex] = None
+) -> List[str]:
     """
     연결되지 않은 고아 노드 찾기
     """
-    node_ids = {n.get("id") for n in nodes if n.get("id")}
-    connected_nodes = set()
-    
-    for edge in edges:
-        source = edge.get("source")
-        target = edge.get("target")
-        if source:
-            connected_nodes.add(source)
-        if target:
-            connected_nodes.add(target)
+    if index is None or not index.matches(nodes, edges):
+        index = WorkflowGraphIndex(nodes, edges)
+    node_ids = index.node_id_set
     
     # 노드가 1개만 있으면 고아 아님
     if len(node_ids) <= 1:
         return []
     
-    orphans = node_ids - connected_nodes
+    orphans = node_ids - index.connected_ids
     return list(orphans)
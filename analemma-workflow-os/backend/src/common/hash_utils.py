@@ -23,11 +23,47 @@ Incremental Hashing (Phase 3):
 import hashlib
 import json
 import logging
-from typing import Any, Dict, FrozenSet, Literal, Optional, Set, Tuple
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Any, Dict, FrozenSet, Iterable, List, Literal, Optional, Set, Tuple
 
 logger = logging.getLogger(__name__)
 
 
+def _canonical_default(obj: Any) -> Any:
+    """json.dumps default hook shared by canonical and streaming serialization."""
+    if isinstance(obj, (datetime, date)):
+        return obj.isoformat()
+    if isinstance(obj, Decimal):
+        # str preserves exact precision — float(Decimal("0.1") + Decimal("0.2"))
+        # yields 0.30000000000000004, causing false Merkle violations.
+        return str(obj)
+    if isinstance(obj, bytes):
+        return obj.decode("utf-8", errors="replace")
+    if isinstance(obj, (set, frozenset)):
+        return sorted(str(item) for item in obj)
+    # Explicit serialization contract takes precedence
+    if hasattr(obj, 'to_dict') and callable(obj.to_dict):
+        return obj.to_dict()
+    # __dict__ fallback — filter private/dunder keys to prevent
+    # leaking internal state (API keys, credentials, etc.)
+    if hasattr(obj, '__dict__'):
+        return {
+            k: v for k, v in obj.__dict__.items()
+            if not k.startswith('_')
+        }
+    # [v3.34] Fail-fast instead of silent hash divergence.
+    # str(obj) can produce non-deterministic output (e.g., memory addresses
+    # in default __repr__) causing identical state to hash differently
+    # across Lambda invocations.  Raising TypeError forces callers to add
+    # explicit serialization (to_dict() or type registration) rather than
+    # silently producing wrong Merkle hashes.
+    raise TypeError(
+        f"Object of type {type(obj).__qualname__} is not canonical-serializable. "
+        f"Add a to_dict() method or convert to a supported type before hashing."
+    )
+
+
 def _canonical_bytes(data: Any) -> bytes:
     """Convert data to canonical JSON bytes for deterministic hashing.
 
@@ -41,51 +77,16 @@ def _canonical_bytes(data: Any) -> bytes:
     - __dict__ → filtered (private keys excluded, to_dict() preferred)
     - Circular references → caught and replaced with safe repr fallback
     """
-    from datetime import datetime, date
-    from decimal import Decimal
-
-    def _default(obj: Any) -> Any:
-        if isinstance(obj, (datetime, date)):
-            return obj.isoformat()
-        if isinstance(obj, Decimal):
-            # str preserves exact precision — float(Decimal("0.1") + Decimal("0.2"))
-            # yields 0.30000000000000004, causing false Merkle violations.
-            return str(obj)
-        if isinstance(obj, bytes):
-            return obj.decode("utf-8", errors="replace")
-        if isinstance(obj, (set, frozenset)):
-            return sorted(str(item) for item in obj)
-        # Explicit serialization contract takes precedence
-        if hasattr(obj, 'to_dict') and callable(obj.to_dict):
-            return obj.to_dict()
-        # __dict__ fallback — filter private/dunder keys to prevent
-        # leaking internal state (API keys, credentials, etc.)
-        if hasattr(obj, '__dict__'):
-            return {
-                k: v for k, v in obj.__dict__.items()
-                if not k.startswith('_')
-            }
-        # [v3.34] Fail-fast instead of silent hash divergence.
-        # str(obj) can produce non-deterministic output (e.g., memory addresses
-        # in default __repr__) causing identical state to hash differently
-        # across Lambda invocations.  Raising TypeError forces callers to add
-        # explicit serialization (to_dict() or type registration) rather than
-        # silently producing wrong Merkle hashes.
-        raise TypeError(
-            f"Object of type {type(obj).__qualname__} is not canonical-serializable. "
-            f"Add a to_dict() method or convert to a supported type before hashing."
-        )
-
     try:
         return json.dumps(
             data,
             sort_keys=True,
             separators=(',', ':'),
             ensure_ascii=False,
-            default=_default,
+            default=_canonical_default,
         ).encode('utf-8')
     except (ValueError, TypeError, RecursionError) as exc:
-        # [v3.34] TypeError added: unsupported type in _default handler.
+        # [v3.34] TypeError added: unsupported type in _canonical_default handler.
         # Circular reference, excessive nesting, or unsupported type — fall back
         # to repr().  repr() is deterministic for the same object state, preserving
         # hash stability without crashing the kernel.
@@ -178,14 +179,122 @@ def raw_md5(data: bytes) -> str:
 
 # ── Streaming Serialization (Phase 3b) ──────────────────────────────────────
 
+# 이 크기(항목 수) 이상인 dict/list 값은 통째로 json.dumps 하지 않고
+# 하위 구조 단위로 쪼개 hasher에 흘려보냄 → 피크 메모리 = 가장 큰 leaf 서브트리
+STREAM_CONTAINER_MIN_ITEMS = 64
+
+_CANONICAL_ENCODER = json.JSONEncoder(
+    sort_keys=True,
+    separators=(',', ':'),
+    ensure_ascii=False,
+    default=_canonical_default,
+)
+
+
+def _iter_canonical_chunks(data: Any):
+    """Yield canonical JSON bytes for ``data`` piece by piece.
+
+    Concatenated output is byte-identical to ``_canonical_bytes(data)`` on
+    success: large dict/list containers are opened one level at a time and
+    small subtrees are encoded by the C encoder in one call. Unlike
+    ``_canonical_bytes`` there is no repr() fallback — errors propagate so the
+    caller can roll back and hash the whole value with the fallback instead.
+    """
+    if isinstance(data, dict) and len(data) >= STREAM_CONTAINER_MIN_ITEMS \
+            and all(type(k) is str for k in data):
+        encode_key = _CANONICAL_ENCODER.encode
+        separator = b'{'
+        for key in sorted(data):
+            yield separator + encode_key(key).encode('utf-8') + b':'
+            yield from _iter_canonical_chunks(data[key])
+            separator = b','
+        yield b'}'
+    elif isinstance(data, (list, tuple)) and len(data) >= STREAM_CONTAINER_MIN_ITEMS:
+        separator = b'['
+        for item in data:
+            yield separator
+            yield from _iter_canonical_chunks(item)
+            separator = b','
+        yield b']'
+    else:
+        yield _CANONICAL_ENCODER.encode(data).encode('utf-8')
+
+
+def _is_streamable(value: Any) -> bool:
+    return isinstance(value, (dict, list, tuple)) and len(value) >= STREAM_CONTAINER_MIN_ITEMS
+
+
+def _value_bytes(value: Any) -> bytes:
+    """Canonical bytes of a small value via the shared encoder.
+
+    ``json.dumps`` builds a new encoder per call; on failure this defers to
+    ``_canonical_bytes`` so the repr() fallback (and its warning) is unchanged.
+    """
+    try:
+        return _CANONICAL_ENCODER.encode(value).encode('utf-8')
+    except (ValueError, TypeError, RecursionError):
+        return _canonical_bytes(value)
+
+
+def _stream_canonical(hashers: List[Any], value: Any) -> None:
+    """Stream the canonical bytes of a large container into ``hashers``.
+
+    If encoding fails midway the hashers are restored in place from a
+    checkpoint and the value is re-fed via ``_canonical_bytes`` so the digest
+    matches the non-streaming path exactly.
+    """
+    checkpoints = [hasher.copy() for hasher in hashers]
+    try:
+        for chunk in _iter_canonical_chunks(value):
+            for hasher in hashers:
+                hasher.update(chunk)
+    except (ValueError, TypeError, RecursionError):
+        hashers[:] = checkpoints
+        value_bytes = _canonical_bytes(value)
+        for hasher in hashers:
+            hasher.update(value_bytes)
+
+
+def _streaming_hash_many(
+    items: Iterable[Tuple[str, Any, Tuple[int, ...]]],
+    hasher_count: int,
+) -> List[str]:
+    """Compute several streaming hashes in one pass over sorted items.
+
+    ``items`` yields ``(key, value, targets)`` in sorted key order, where
+    ``targets`` are indices of the hashes the key belongs to. A value shared
+    by several hashes (e.g. unclassified fields: WARM + UNCLASSIFIED blocks)
+    is serialized only once.
+    """
+    hashers = [hashlib.sha256() for _ in range(hasher_count)]
+    for key, value, targets in items:
+        prefix = key.encode('utf-8') + b':'
+        if not _is_streamable(value):
+            # key:value, 를 한 번의 update로 (작은 값이 대부분)
+            record = prefix + _value_bytes(value) + b','
+            for i in targets:
+                hashers[i].update(record)
+            continue
+        selected = [hashers[i] for i in targets]
+        for hasher in selected:
+            hasher.update(prefix)
+        _stream_canonical(selected, value)
+        for i, hasher in zip(targets, selected):
+            # checkpoint 복원 시 새 hasher 객체로 교체될 수 있음
+            hashers[i] = hasher
+            hasher.update(b',')
+    return [hasher.hexdigest() for hasher in hashers]
+
+
 def streaming_content_hash(data: Dict[str, Any]) -> str:
     """Streaming SHA-256 — feeds sorted keys directly into hashlib.update().
 
-    Avoids allocating the full canonical JSON string in memory.
-    hashlib releases the GIL during update(), enabling effective
-    multi-threaded sub-block hashing on Lambda's multi-core resources.
+    Avoids allocating the full canonical JSON string in memory: values are
+    encoded one at a time, and large dict/list values are streamed in
+    sub-tree chunks (``STREAM_CONTAINER_MIN_ITEMS``) instead of a single
+    ``json.dumps`` string.
 
-    Memory: O(1) per key-value pair (vs O(N) for json.dumps of entire dict)
+    Memory: O(largest leaf subtree) (vs O(N) for json.dumps of entire dict)
     CPU: Same total work, but no intermediate string concatenation overhead
 
     Note:
@@ -194,14 +303,9 @@ def streaming_content_hash(data: Dict[str, Any]) -> str:
         so digests are intentionally incompatible. Used exclusively by
         ``SubBlockHashRegistry`` for incremental merkle roots.
     """
-    hasher = hashlib.sha256()
-    for key in sorted(data.keys()):
-        hasher.update(key.encode('utf-8'))
-        hasher.update(b':')
-        value_bytes = _canonical_bytes(data[key])
-        hasher.update(value_bytes)
-        hasher.update(b',')
-    return hasher.hexdigest()
+    return _streaming_hash_many(
+        ((key, data[key], (0,)) for key in sorted(data.keys())), 1,
+    )[0]
 
 
 # ── Temperature-Aligned Sub-Block Definitions (Phase 3a) ────────────────────
@@ -287,6 +391,12 @@ class SubBlockHashRegistry:
 
     Complexity: O(changed_data) instead of O(total_state).
 
+    Block-field index:
+        block → member field 인덱스를 dirty_keys로 갱신하며 유지하므로
+        블록 필드 추출은 전체 state 스캔 없이 O(fields in block)입니다.
+        인덱스 필드 수가 state 크기와 어긋나면(dirty_keys에 누락된 키 추가/삭제)
+        전체 재구축으로 복구합니다.
+
     CPU pipelining analogy:
         Like a CPU instruction cache — unchanged pipeline stages
         (COLD block hash) are reused from the previous cycle,
@@ -295,38 +405,39 @@ class SubBlockHashRegistry:
 
     def __init__(self) -> None:
         self._block_hashes: Dict[str, str] = {}
+        # block → member fields (unclassified 필드는 "unclassified"에만 등록되고
+        # WARM 블록 해시에 함께 포함됨). None이면 다음 호출에서 재구축.
+        self._block_members: Optional[Dict[str, Set[str]]] = None
+        self._indexed_fields = 0
 
-    def compute_incremental_root(
+    def _resolve_dirty_keys(
         self,
         full_state: Dict[str, Any],
-        dirty_keys: Set[str],
-    ) -> Tuple[str, Dict[str, str]]:
-        """Compute merkle root using incremental sub-block hashing.
-
-        Args:
-            full_state: The complete state dictionary.
-            dirty_keys: Set of field names that changed since last hash.
-
-        Returns:
-            Tuple of (merkle_root_hash, {block_name: block_hash}).
-        """
-        dirty_blocks = self._classify_dirty_blocks(dirty_keys)
-
-        for block_name in dirty_blocks:
+        dirty_keys: Optional[Set[str]],
+    ) -> Set[str]:
+        """dirty_keys 미지정 시 전체 키를 dirty로 취급하고 기존 블록 해시/인덱스를 폐기."""
+        if dirty_keys is None:
+            dirty_keys = set(full_state.keys())
+            # 변경 키를 모르는 state: 기존 블록 해시(cold 포함)와 인덱스는 재사용할 수 없음
+            self._block_hashes.clear()
+            self._block_members = None
+        self._sync_block_index(full_state, dirty_keys)
+        return dirty_keys
+
+    def _blocks_to_hash(self, dirty_keys: Set[str]) -> List[str]:
+        """Dirty blocks (minus an already-hashed COLD block) plus never-hashed blocks."""
+        blocks = [
+            name for name in self._classify_dirty_blocks(dirty_keys)
             # Cold block skip: immutable after workflow init
-            if block_name == "cold" and "cold" in self._block_hashes:
-                continue
-            block_fields = self._extract_block_fields(full_state, block_name)
-            if block_fields:
-                self._block_hashes[block_name] = streaming_content_hash(block_fields)
-
+            if not (name == "cold" and "cold" in self._block_hashes)
+        ]
         # Initialize any blocks not yet hashed (first run)
         for block_name in _BLOCK_NAMES:
-            if block_name not in self._block_hashes:
-                block_fields = self._extract_block_fields(full_state, block_name)
-                if block_fields:
-                    self._block_hashes[block_name] = streaming_content_hash(block_fields)
+            if block_name not in self._block_hashes and block_name not in blocks:
+                blocks.append(block_name)
+        return blocks
 
+    def _merkle_root(self) -> Tuple[str, Dict[str, str]]:
         # Merkle root from sorted block hashes
         combined = "|".join(
             f"{name}:{h}"
@@ -335,84 +446,167 @@ class SubBlockHashRegistry:
         root = raw_sha256(combined.encode('utf-8'))
         return root, dict(self._block_hashes)
 
+    def _store_block_hashes(self, hashes: Dict[str, Optional[str]]) -> None:
+        for name, h in hashes.items():
+            if h is not None:
+                self._block_hashes[name] = h
+            else:
+                # 비어버린 블록: 전체 재계산 결과와 동일하게 root에서 제외
+                self._block_hashes.pop(name, None)
+
+    def compute_incremental_root(
+        self,
+        full_state: Dict[str, Any],
+        dirty_keys: Optional[Set[str]] = None,
+    ) -> Tuple[str, Dict[str, str]]:
+        """Compute merkle root using incremental sub-block hashing.
+
+        Args:
+            full_state: The complete state dictionary.
+            dirty_keys: Set of field names that changed since last hash.
+                None이면 전체 키를 dirty로 보고 처음부터 재계산.
+
+        Returns:
+            Tuple of (merkle_root_hash, {block_name: block_hash}).
+        """
+        dirty_keys = self._resolve_dirty_keys(full_state, dirty_keys)
+        blocks = self._blocks_to_hash(dirty_keys)
+        if blocks:
+            self._store_block_hashes(self._hash_blocks(full_state, blocks))
+        return self._merkle_root()
+
     def compute_incremental_root_parallel(
         self,
         full_state: Dict[str, Any],
-        dirty_keys: Set[str],
+        dirty_keys: Optional[Set[str]] = None,
         max_workers: int = 4,
     ) -> Tuple[str, Dict[str, str]]:
         """Multi-threaded sub-block hashing.
 
-        hashlib.sha256.update() releases the GIL, so threading is effective
-        for CPU-bound hashing of independent sub-blocks.
+        Canonical JSON encoding holds the GIL; only hashlib updates of
+        large chunks release it. Blocks are therefore fanned out only when
+        more than one independent group (HOT / WARM+UNCLASSIFIED / COLD /
+        CONTROL) is dirty — WARM and UNCLASSIFIED share one task so their
+        common fields are serialized once. Roots are identical to
+        ``compute_incremental_root``.
 
         Lambda 2048MB ~ 1 vCPU; 2-4 threads optimal for I/O overlap.
         """
-        from concurrent.futures import ThreadPoolExecutor
+        dirty_keys = self._resolve_dirty_keys(full_state, dirty_keys)
+        blocks = self._blocks_to_hash(dirty_keys)
 
-        dirty_blocks = self._classify_dirty_blocks(dirty_keys)
+        groups: List[List[str]] = []
+        shared = [name for name in blocks if name in ("warm", "unclassified")]
+        if shared:
+            groups.append(shared)
+        groups.extend([name] for name in blocks if name not in ("warm", "unclassified"))
 
-        # Determine which blocks need (re-)hashing
-        blocks_to_hash: list = []
-        for block_name in dirty_blocks:
-            if block_name == "cold" and "cold" in self._block_hashes:
-                continue
-            blocks_to_hash.append(block_name)
+        if len(groups) <= 1 or max_workers <= 1:
+            if blocks:
+                self._store_block_hashes(self._hash_blocks(full_state, blocks))
+            return self._merkle_root()
 
-        # First run: hash all blocks that have no previous hash
-        for block_name in _BLOCK_NAMES:
-            if block_name not in self._block_hashes and block_name not in blocks_to_hash:
-                blocks_to_hash.append(block_name)
-
-        def _hash_block(block_name: str) -> Tuple[str, Optional[str]]:
-            block_fields = self._extract_block_fields(full_state, block_name)
-            if block_fields:
-                return block_name, streaming_content_hash(block_fields)
-            return block_name, None
-
-        if blocks_to_hash:
-            n_workers = min(max_workers, len(blocks_to_hash))
-            with ThreadPoolExecutor(max_workers=n_workers) as pool:
-                for name, h in pool.map(_hash_block, blocks_to_hash):
-                    if h is not None:
-                        self._block_hashes[name] = h
+        from concurrent.futures import ThreadPoolExecutor
 
-        combined = "|".join(
-            f"{name}:{h}"
-            for name, h in sorted(self._block_hashes.items())
-        )
-        root = raw_sha256(combined.encode('utf-8'))
-        return root, dict(self._block_hashes)
+        n_workers = min(max_workers, len(groups))
+        with ThreadPoolExecutor(max_workers=n_workers) as pool:
+            for hashes in pool.map(lambda group: self._hash_blocks(full_state, group), groups):
+                self._store_block_hashes(hashes)
+        return self._merkle_root()
 
     # ── Internal helpers ────────────────────────────────────────────────
 
     @staticmethod
     def _classify_dirty_blocks(dirty_keys: Set[str]) -> Set[str]:
         """Map dirty field names to the set of blocks that need re-hashing."""
+        field_map = _get_field_to_block_map()
         blocks: Set[str] = set()
         for key in dirty_keys:
-            block = classify_field_block(key)
-            # "unclassified" fields are hashed with the WARM block
-            blocks.add("warm" if block == "unclassified" else block)
+            block = field_map.get(key)
+            if block is None:
+                # "unclassified" fields are hashed with the WARM block and
+                # also form the UNCLASSIFIED block → both are stale
+                blocks.add("warm")
+                blocks.add("unclassified")
+            else:
+                blocks.add(block)
         return blocks
 
-    @staticmethod
+    def _rebuild_block_index(self, full_state: Dict[str, Any]) -> None:
+        field_map = _get_field_to_block_map()
+        members: Dict[str, Set[str]] = {name: set() for name in _BLOCK_NAMES}
+        for key in full_state:
+            members[field_map.get(key, "unclassified")].add(key)
+        self._block_members = members
+        self._indexed_fields = len(full_state)
+
+    def _sync_block_index(self, full_state: Dict[str, Any], dirty_keys: Set[str]) -> None:
+        """Apply added/removed dirty keys to the block-field index."""
+        members = self._block_members
+        if members is None:
+            self._rebuild_block_index(full_state)
+            return
+        field_map = _get_field_to_block_map()
+        for key in dirty_keys:
+            block_members = members[field_map.get(key, "unclassified")]
+            if key in full_state:
+                if key not in block_members:
+                    block_members.add(key)
+                    self._indexed_fields += 1
+            elif key in block_members:
+                block_members.discard(key)
+                self._indexed_fields -= 1
+        if self._indexed_fields != len(full_state):
+            self._rebuild_block_index(full_state)
+
+    def _block_field_names(self, block_name: str) -> Set[str]:
+        members = self._block_members
+        if block_name == "warm":
+            return members["warm"] | members["unclassified"]
+        return members[block_name]
+
+    def _hash_blocks(
+        self,
+        full_state: Dict[str, Any],
+        block_names: List[str],
+    ) -> Dict[str, Optional[str]]:
+        """Streaming-hash several blocks in one sorted pass over their fields.
+
+        Returns ``{block_name: hash}``; empty blocks map to None.
+        """
+        if self._block_members is None:
+            self._rebuild_block_index(full_state)
+        targets: Dict[str, List[int]] = {}
+        for index, block_name in enumerate(block_names):
+            for key in self._block_field_names(block_name):
+                targets.setdefault(key, []).append(index)
+
+        try:
+            items = [(key, full_state[key], tuple(targets[key])) for key in sorted(targets)]
+        except KeyError:
+            # 인덱스가 dirty_keys에 보고되지 않은 키 교체로 어긋남 → 재구축 후 재시도
+            self._rebuild_block_index(full_state)
+            return self._hash_blocks(full_state, block_names)
+
+        digests = _streaming_hash_many(items, len(block_names))
+        counts = [0] * len(block_names)
+        for indices in targets.values():
+            for index in indices:
+                counts[index] += 1
+        return {
+            block_name: digests[index] if counts[index] else None
+            for index, block_name in enumerate(block_names)
+        }
+
     def _extract_block_fields(
+        self,
         full_state: Dict[str, Any],
         block_name: str,
     ) -> Dict[str, Any]:
-        """Extract fields belonging to a specific block from the full state."""
-        field_map = _get_field_to_block_map()
-
-        if block_name == "unclassified":
-            # Gather all fields not mapped to any known block
-            return {
-                k: v for k, v in full_state.items()
-                if k not in field_map
-            }
-
+        """Extract fields belonging to a specific block via the block-field index."""
+        if self._block_members is None:
+            self._rebuild_block_index(full_state)
         return {
-            k: v for k, v in full_state.items()
-            if field_map.get(k) == block_name
-            or (block_name == "warm" and k not in field_map)
+            k: full_state[k] for k in self._block_field_names(block_name)
+            if k in full_state
         }
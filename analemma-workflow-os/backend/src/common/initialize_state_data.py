@@ -48,6 +48,15 @@ except ImportError:
         _HAS_PARTITION = False
         partition_workflow_advanced = None
 
+# [Partition Artifact] Content-addressed partition 결과 (S3 + warm container 캐시)
+try:
+    from src.services.workflow.partition_artifacts import load_partition_artifact, resolve_partition
+    _HAS_PARTITION_ARTIFACTS = True
+except ImportError:
+    _HAS_PARTITION_ARTIFACTS = False
+    load_partition_artifact = None
+    resolve_partition = None
+
 # DynamoDB client (warm start optimization)
 try:
     from src.common.aws_clients import get_dynamodb_resource
@@ -313,6 +322,11 @@ def _load_workflow_config(owner_id: str, workflow_id: str) -> dict:
     """
     Load workflow config from Workflows table.
     Retrieve full config including subgraphs.
+
+    실행 시작 시 Workflows 아이템은 이 함수로 한 번만 읽습니다.
+    partition 데이터는 inline(partition_map, 구형 아이템) 또는
+    partition_artifact 참조(신형 아이템) 중 하나로 반환되며,
+    _resolve_precompiled_partition()이 둘을 동일한 형태로 풀어줍니다.
     """
     if not owner_id or not workflow_id:
         return None
@@ -323,7 +337,7 @@ def _load_workflow_config(owner_id: str, workflow_id: str) -> dict:
             Key={'ownerId': owner_id, 'workflowId': workflow_id},
             # 🛡️ [P1 FIX] 지능형 루프 제한 필드 추가
             # estimated_executions, loop_analysis 누락 시 재실행 시 LoopLimitExceeded 발생 가능
-            ProjectionExpression='config, partition_map, total_segments, llm_segments_count, hitp_segments_count, estimated_executions, loop_analysis'
+            ProjectionExpression='config, partition_map, partition_artifact, total_segments, llm_segments_count, hitp_segments_count, estimated_executions, loop_analysis'
         )
         item = response.get('Item')
         if item and item.get('config'):
@@ -336,6 +350,7 @@ def _load_workflow_config(owner_id: str, workflow_id: str) -> dict:
             return {
                 'config': config,
                 'partition_map': item.get('partition_map'),
+                'partition_artifact': item.get('partition_artifact'),
                 'total_segments': item.get('total_segments'),
                 'llm_segments_count': item.get('llm_segments_count'),
                 'hitp_segments_count': item.get('hitp_segments_count'),
@@ -348,30 +363,65 @@ def _load_workflow_config(owner_id: str, workflow_id: str) -> dict:
         return None
 
 
+def _resolve_precompiled_partition(db_data: dict) -> dict:
+    """
+    _load_workflow_config() 결과에서 pre-compiled partition을 꺼냅니다.
+
+    - inline partition_map (구형 아이템): 그대로 사용
+    - partition_artifact 참조: warm 캐시 → S3 순으로 로드 (추가 DynamoDB read 없음)
+
+    Returns:
+        partition_map / total_segments / llm_segments_count / hitp_segments_count /
+        estimated_executions / loop_analysis 키를 가진 dict, 없으면 None
+    """
+    if not db_data:
+        return None
+
+    if db_data.get('partition_map'):
+        return {
+            'partition_map': db_data.get('partition_map'),
+            'total_segments': db_data.get('total_segments'),
+            'llm_segments_count': db_data.get('llm_segments_count'),
+            'hitp_segments_count': db_data.get('hitp_segments_count'),
+            'estimated_executions': db_data.get('estimated_executions'),
+            'loop_analysis': db_data.get('loop_analysis'),
+        }
+
+    ref = db_data.get('partition_artifact')
+    if ref and _HAS_PARTITION_ARTIFACTS:
+        artifact = load_partition_artifact(ref)
+        if artifact and artifact.get('partition_map'):
+            logger.info(
+                f"Loaded partition artifact {str(ref.get('hash', ''))[:12]}: "
+                f"{artifact.get('total_segments', 0)} segments"
+            )
+            return {
+                'partition_map': artifact.get('partition_map'),
+                'total_segments': artifact.get('total_segments'),
+                'llm_segments_count': artifact.get('llm_segments'),
+                'hitp_segments_count': artifact.get('hitp_segments'),
+                'estimated_executions': artifact.get('estimated_executions'),
+                'loop_analysis': artifact.get('loop_analysis'),
+            }
+        logger.warning(
+            f"Partition artifact {str(ref.get('hash', ''))[:12]} unavailable; "
+            f"falling back to runtime partitioning"
+        )
+    return None
+
+
 def _load_precompiled_partition(owner_id: str, workflow_id: str) -> dict:
     """
     Load pre-compiled partition_map from Workflows table.
     Retrieve partition_map calculated at save time.
+
+    _load_workflow_config()와 같은 아이템을 다시 읽지 않도록 그 결과를 재사용합니다.
+    이미 db_data가 있으면 _resolve_precompiled_partition()을 직접 호출하세요.
     """
-    if not owner_id or not workflow_id:
-        return None
-    
-    try:
-        table = _dynamodb.Table(WORKFLOWS_TABLE)
-        response = table.get_item(
-            Key={'ownerId': owner_id, 'workflowId': workflow_id},
-            # 🛡️ [P1 FIX] 지능형 루프 제한 필드 추가
-            # DB에서 불러온 워크플로우 재실행 시 동적 제한 보장
-            ProjectionExpression='partition_map, total_segments, llm_segments_count, hitp_segments_count, estimated_executions, loop_analysis'
-        )
-        item = response.get('Item')
-        if item and item.get('partition_map'):
-            logger.info(f"Loaded pre-compiled partition_map from DB: {item.get('total_segments', 0)} segments")
-            return item
-        return None
-    except Exception as e:
-        logger.warning(f"Failed to load pre-compiled partition_map: {e}")
-        return None
+    precompiled = _resolve_precompiled_partition(_load_workflow_config(owner_id, workflow_id))
+    if precompiled:
+        logger.info(f"Loaded pre-compiled partition_map from DB: {precompiled.get('total_segments') or 0} segments")
+    return precompiled
 
 
 def lambda_handler(event, context):
@@ -579,17 +629,20 @@ def _execute_initialization(event, context):
         if db_data:
             workflow_config = db_data.get('config')
             # Only use DB partition map if not provided in input
+            # (inline partition_map 또는 content-addressed 아티팩트 - 추가 DB read 없음)
+            precompiled = None
             if not partition_map: 
-                db_partition = db_data.get('partition_map')
-                if db_partition:
-                    partition_map = db_partition
+                precompiled = _resolve_precompiled_partition(db_data)
+                if precompiled:
+                    partition_map = precompiled['partition_map']
+            loop_source = precompiled or db_data
             
             # 🛡️ [P1 FIX] DB에서 루프 분석 데이터 추출 (partition_result에 저장)
             # 런타임 파티셔닝을 건너뛰었을 때도 동적 루프 제한 계산 가능
-            if db_data.get('estimated_executions') is not None:
+            if loop_source.get('estimated_executions') is not None:
                 partition_result = {
-                    'estimated_executions': db_data.get('estimated_executions'),
-                    'loop_analysis': db_data.get('loop_analysis', {})
+                    'estimated_executions': loop_source.get('estimated_executions'),
+                    'loop_analysis': loop_source.get('loop_analysis') or {}
                 }
                 logger.info(
                     f"[DB Load] Restored loop analysis from DB: "
@@ -605,7 +658,14 @@ def _execute_initialization(event, context):
     if not partition_map and _HAS_PARTITION:
         logger.info("Calculating partition_map at runtime...")
         try:
-            partition_result = partition_workflow_advanced(workflow_config)
+            if _HAS_PARTITION_ARTIFACTS:
+                # 동일 config(+파티셔너 버전)의 아티팩트가 있으면 재사용, 없으면 계산 후 저장
+                partition_result, _artifact_ref, _artifact_source = resolve_partition(
+                    workflow_config, partitioner=partition_workflow_advanced
+                )
+                logger.info(f"[Partition Artifact] partition resolved from {_artifact_source}")
+            else:
+                partition_result = partition_workflow_advanced(workflow_config)
             
             # 🛡️ [Type Validation] Ensure partition_result is dict
             # Prevents AttributeError if old version returns list
@@ -16,13 +16,17 @@ v2.3 Critical Fixes:
 - (3) Soft/Hard budget policy: Flexible performance adjustment when budget is insufficient
 """
 
+import bisect
+import hashlib
+import math
 import os
+import threading
 import time
 import logging
 from typing import Dict, Any, Literal, Optional, List, Tuple
 from enum import Enum
 from dataclasses import dataclass, field
-from collections import deque
+from collections import OrderedDict, deque
 
 logger = logging.getLogger(__name__)
 
@@ -146,16 +150,33 @@ class TTFTStorageBackend:
                 self.redis.ltrim(f"ttft:{model_id}", 0, 19)  # 최근 20개만 유지
                 self.redis.expire(f"ttft:{model_id}", 300)    # 5분 TTL
             
+            def save_batch(self, model_id: str, ttft_samples: List[int]) -> None:
+                pipe = self.redis.pipeline()
+                pipe.lpush(f"ttft:{model_id}", *reversed(ttft_samples))
+                pipe.ltrim(f"ttft:{model_id}", 0, 19)
+                pipe.expire(f"ttft:{model_id}", 300)
+                pipe.execute()
+            
             def load(self, model_id: str) -> List[int]:
-                return [int(x) for x in self.redis.lrange(f"ttft:{model_id}", 0, -1)]
+                return [int(x) for x in self.redis.lrange(f"ttft:{model_id}", 0, -1)][::-1]
     """
     
     def save(self, model_id: str, ttft_ms: int) -> None:
         """TTFT 측정값 저장 (분산 스토리지에)"""
         raise NotImplementedError("Implement this for distributed storage")
     
+    def save_batch(self, model_id: str, ttft_samples: List[int]) -> None:
+        """
+        TTFT 측정값 일괄 저장 (오래된 것 → 최신 순)
+        
+        백그라운드 flush에서 호출됩니다. 기본 구현은 save()를 반복 호출하므로
+        한 번의 왕복으로 저장할 수 있는 백엔드는 이 메서드를 재정의하세요.
+        """
+        for ttft_ms in ttft_samples:
+            self.save(model_id, ttft_ms)
+    
     def load(self, model_id: str) -> List[int]:
-        """최근 TTFT 측정값 로드 (분산 스토리지에서)"""
+        """최근 TTFT 측정값 로드 (분산 스토리지에서, 오래된 것 → 최신 순)"""
         raise NotImplementedError("Implement this for distributed storage")
     
     def is_available(self) -> bool:
@@ -163,6 +184,89 @@ class TTFTStorageBackend:
         return False
 
 
+# 분산 저장소 flush 정책: 버퍼 샘플 수 또는 경과 시간 중 먼저 도달하는 쪽
+TTFT_FLUSH_BATCH_SIZE = int(os.environ.get("TTFT_FLUSH_BATCH_SIZE", "10"))
+TTFT_FLUSH_INTERVAL_SECONDS = float(os.environ.get("TTFT_FLUSH_INTERVAL_SECONDS", "5"))
+# 핸들러 종료 시 진행 중인 백그라운드 flush를 기다리는 최대 시간
+TTFT_DRAIN_TIMEOUT_SECONDS = float(os.environ.get("TTFT_DRAIN_TIMEOUT_SECONDS", "2"))
+
+# 라우팅 점수에서 꼬리 지연(p95) 비중: score = (1-w) * effective + w * p95
+TTFT_TAIL_WEIGHT = float(os.environ.get("TTFT_TAIL_WEIGHT", "0.3"))
+
+# p95 / 기준 TTFT 비율 기반 상태 판단 (평균이 정상이어도 꼬리가 나쁘면 강등)
+TTFT_TAIL_DEGRADED_RATIO = 2.5
+TTFT_TAIL_UNHEALTHY_RATIO = 4.0
+
+
+class _TTFTWindow:
+    """
+    모델별 최근 TTFT 슬라이딩 윈도우 (샘플당 O(1) 갱신)
+    
+    지수 가중 합 S = Σ x_i · d^(n-1-i) 를 점화식으로 유지:
+        윈도우가 찼을 때: S ← S - x_oldest · d^(W-1)
+        새 샘플 추가:     S ← S · d + x
+    부동소수점 오차 누적을 막기 위해 W번 추가마다 한 번 정확히 재계산합니다 (분할상환 O(1)).
+    백분위수용으로 정렬된 사본을 함께 유지합니다 (W는 작으므로 bisect 삽입/삭제).
+    """
+    
+    __slots__ = ("samples", "sorted_samples", "weighted_sum", "weight_total",
+                 "total", "_decay", "_oldest_weight", "_since_rebase")
+    
+    def __init__(self, window_size: int, decay_factor: float, initial: List[int] = ()):
+        self.samples: deque = deque(maxlen=window_size)
+        self.sorted_samples: List[int] = []
+        self._decay = decay_factor
+        self._oldest_weight = decay_factor ** (window_size - 1)
+        for sample in initial:
+            self.samples.append(sample)
+        self._rebase()
+    
+    def _rebase(self) -> None:
+        n = len(self.samples)
+        self.weighted_sum = 0.0
+        self.weight_total = 0.0
+        for i, sample in enumerate(self.samples):
+            weight = self._decay ** (n - 1 - i)
+            self.weighted_sum += sample * weight
+            self.weight_total += weight
+        self.total = sum(self.samples)
+        self.sorted_samples = sorted(self.samples)
+        self._since_rebase = 0
+    
+    def add(self, sample: int) -> None:
+        if len(self.samples) == self.samples.maxlen:
+            oldest = self.samples[0]
+            self.weighted_sum -= oldest * self._oldest_weight
+            self.weight_total -= self._oldest_weight
+            self.total -= oldest
+            del self.sorted_samples[bisect.bisect_left(self.sorted_samples, oldest)]
+        self.samples.append(sample)
+        self.weighted_sum = self.weighted_sum * self._decay + sample
+        self.weight_total = self.weight_total * self._decay + 1.0
+        self.total += sample
+        bisect.insort(self.sorted_samples, sample)
+        
+        self._since_rebase += 1
+        if self._since_rebase >= self.samples.maxlen:
+            self._rebase()
+    
+    def __len__(self) -> int:
+        return len(self.samples)
+    
+    def weighted_mean(self) -> Optional[float]:
+        if not self.samples or self.weight_total <= 0:
+            return None
+        return self.weighted_sum / self.weight_total
+    
+    def percentile(self, pct: float) -> Optional[int]:
+        """Nearest-rank 백분위수"""
+        n = len(self.sorted_samples)
+        if n == 0:
+            return None
+        rank = max(1, math.ceil(pct / 100.0 * n))
+        return self.sorted_samples[min(rank, n) - 1]
+
+
 class AdaptiveTTFTTracker:
     """
     실시간 TTFT(Time To First Token) 메트릭 추적기
@@ -170,129 +274,256 @@ class AdaptiveTTFTTracker:
     CloudWatch/Cloud Monitoring 없이도 인메모리에서 최근 측정값을 기반으로
     동적으로 모델 선택 가중치를 조절합니다.
     
+    - 기록/조회 모두 O(1): 가중 평균과 백분위수를 샘플 추가 시 점진적으로 갱신
+    - 분산 저장소 쓰기는 요청 경로에서 분리: 버퍼에 모아 백그라운드 스레드가 배치로 flush
+    - p50/p95 꼬리 지연 추정 제공 → 평균은 괜찮지만 꼬리가 나쁜 모델도 회피
+    
     사용 예:
         # 호출 후 TTFT 기록
         tracker.record_ttft("gemini-2.0-flash", measured_ttft_ms=145)
         
         # 동적 TTFT 조회
-        effective_ttft = tracker.get_effective_ttft("gemini-2.0-flash")
+        effective_ttft = tracker.get_effective_ttft("gemini-2.0-flash", base_ttft_ms=500)
+        tail_ttft = tracker.get_tail_ttft("gemini-2.0-flash", base_ttft_ms=500)
     """
     
-    def __init__(self, window_size: int = 20, decay_factor: float = 0.9, 
-                 distributed_backend: TTFTStorageBackend = None):
+    def __init__(self, window_size: int = 20, decay_factor: float = 0.9,
+                 distributed_backend: TTFTStorageBackend = None,
+                 flush_batch_size: int = None, flush_interval_seconds: float = None):
         """
         Args:
             window_size: 추적할 최근 샘플 수 (기본 20개)
             decay_factor: 오래된 샘플 가중치 감쇠 (0.0~1.0)
             distributed_backend: 분산 환경용 스토리지 백엔드 (Optional)
+            flush_batch_size: 버퍼 샘플 수가 이 값에 도달하면 백그라운드 flush
+            flush_interval_seconds: 마지막 flush 이후 이 시간이 지나면 백그라운드 flush
         """
-        self._samples: Dict[str, deque] = {}
+        self._windows: Dict[str, _TTFTWindow] = {}
         self._window_size = window_size
         self._decay_factor = decay_factor
         self._last_update: Dict[str, float] = {}
         self._distributed_backend = distributed_backend
+        self._synced_models: set = set()
+        
+        # 분산 저장소 쓰기 버퍼 (model_id -> 샘플 리스트)
+        self._flush_batch_size = flush_batch_size or TTFT_FLUSH_BATCH_SIZE
+        self._flush_interval = (
+            TTFT_FLUSH_INTERVAL_SECONDS if flush_interval_seconds is None else flush_interval_seconds
+        )
+        self._pending: Dict[str, List[int]] = {}
+        self._pending_count = 0
+        self._last_flush = time.monotonic()
+        self._flush_thread: Optional[threading.Thread] = None
+        self._flush_stats = {"flushes": 0, "flushed_samples": 0, "failed_samples": 0}
+        self._lock = threading.Lock()
     
     def _sync_from_distributed(self, model_id: str) -> None:
-        """분산 스토리지에서 최근 샘플 동기화 (Lambda 콜드 스타트 시)"""
+        """분산 스토리지에서 최근 샘플 동기화 (Lambda 콜드 스타트 시 모델당 1회)"""
+        if model_id in self._windows or model_id in self._synced_models:
+            return
+        self._synced_models.add(model_id)
         if self._distributed_backend and self._distributed_backend.is_available():
             try:
                 remote_samples = self._distributed_backend.load(model_id)
-                if remote_samples and model_id not in self._samples:
-                    self._samples[model_id] = deque(remote_samples, maxlen=self._window_size)
+                if remote_samples:
+                    with self._lock:
+                        if model_id not in self._windows:
+                            self._windows[model_id] = _TTFTWindow(
+                                self._window_size, self._decay_factor,
+                                remote_samples[-self._window_size:]
+                            )
                     logger.debug(f"Synced {len(remote_samples)} TTFT samples from distributed storage for {model_id}")
             except Exception as e:
                 logger.warning(f"Failed to sync from distributed storage: {e}")
     
     def record_ttft(self, model_id: str, measured_ttft_ms: int) -> None:
-        """Record TTFT measurement (in-memory + distributed storage)"""
-        if model_id not in self._samples:
-            self._samples[model_id] = deque(maxlen=self._window_size)
+        """Record TTFT measurement (in-memory, distributed write is batched in background)"""
+        with self._lock:
+            window = self._windows.get(model_id)
+            if window is None:
+                window = self._windows[model_id] = _TTFTWindow(self._window_size, self._decay_factor)
+            window.add(measured_ttft_ms)
+            self._last_update[model_id] = time.time()
+            
+            flush_due = False
+            if self._distributed_backend is not None:
+                self._pending.setdefault(model_id, []).append(measured_ttft_ms)
+                self._pending_count += 1
+                flush_due = (
+                    self._pending_count >= self._flush_batch_size
+                    or time.monotonic() - self._last_flush >= self._flush_interval
+                )
         
-        self._samples[model_id].append(measured_ttft_ms)
-        self._last_update[model_id] = time.time()
+        if flush_due:
+            self._schedule_flush()
         
-        # Save to distributed storage as well (async recommended but sync implemented)
-        if self._distributed_backend and self._distributed_backend.is_available():
+        logger.debug(f"TTFT recorded: {model_id}={measured_ttft_ms}ms (samples={len(window)})")
+    
+    def _schedule_flush(self) -> None:
+        """백그라운드 flush 스레드 시작 (이미 실행 중이면 다음 트리거에 맡김)"""
+        with self._lock:
+            if self._flush_thread is not None and self._flush_thread.is_alive():
+                return
+            self._flush_thread = threading.Thread(
+                target=self.flush, name="ttft-telemetry-flush", daemon=True
+            )
+            self._flush_thread.start()
+    
+    def flush(self) -> int:
+        """
+        버퍼된 TTFT 샘플을 분산 저장소에 배치로 저장
+        
+        Returns:
+            저장에 성공한 샘플 수
+        """
+        with self._lock:
+            pending, self._pending = self._pending, {}
+            self._pending_count = 0
+            self._last_flush = time.monotonic()
+        
+        backend = self._distributed_backend
+        if not pending or backend is None:
+            return 0
+        
+        flushed = 0
+        failed = 0
+        try:
+            available = backend.is_available()
+        except Exception as e:
+            logger.warning(f"TTFT storage availability check failed: {e}")
+            available = False
+        
+        for model_id, samples in pending.items():
+            if not available:
+                failed += len(samples)
+                continue
             try:
-                self._distributed_backend.save(model_id, measured_ttft_ms)
+                backend.save_batch(model_id, samples)
+                flushed += len(samples)
             except Exception as e:
-                logger.warning(f"Failed to save TTFT to distributed storage: {e}")
+                failed += len(samples)
+                logger.warning(f"Failed to save TTFT batch to distributed storage: {e}")
         
-        logger.debug(f"TTFT recorded: {model_id}={measured_ttft_ms}ms (samples={len(self._samples[model_id])})")
+        with self._lock:
+            self._flush_stats["flushes"] += 1
+            self._flush_stats["flushed_samples"] += flushed
+            self._flush_stats["failed_samples"] += failed
+        return flushed
+    
+    def drain(self, timeout: float = TTFT_DRAIN_TIMEOUT_SECONDS) -> int:
+        """
+        진행 중인 백그라운드 flush를 기다린 뒤 남은 샘플을 동기 flush
+        
+        Lambda는 핸들러 반환 후 컨테이너를 동결하므로 daemon 스레드에 맡긴
+        샘플은 다음 호출(또는 영영)까지 저장되지 않습니다. 핸들러 종료 시 호출합니다.
+        """
+        with self._lock:
+            thread = self._flush_thread
+        if thread is not None and thread.is_alive():
+            thread.join(timeout)
+        return self.flush()
+    
+    def _clamp(self, value: float, base_ttft_ms: int) -> int:
+        # Clamp if deviation from baseline is too large (outlier prevention)
+        max_deviation = base_ttft_ms * 3  # Allow up to 3x baseline
+        min_deviation = base_ttft_ms // 3  # Allow down to 1/3 baseline
+        return max(min_deviation, min(int(value), max_deviation))
     
     def get_effective_ttft(self, model_id: str, base_ttft_ms: int) -> int:
         """
-        동적 TTFT 계산 (최근 측정값 가중 평균)
+        동적 TTFT 계산 (최근 측정값 지수 가중 평균, O(1))
         
         Args:
             model_id: 모델 ID
             base_ttft_ms: ModelConfig의 기준 TTFT
-            
+        
         Returns:
             효과적 TTFT (ms) - 최근 측정값이 없으면 기준값 반환
         """
         # Sync from distributed storage on Lambda cold start
         self._sync_from_distributed(model_id)
         
-        if model_id not in self._samples or len(self._samples[model_id]) == 0:
+        window = self._windows.get(model_id)
+        effective = window.weighted_mean() if window is not None else None
+        if effective is None:
             return base_ttft_ms
+        return self._clamp(effective, base_ttft_ms)
+    
+    def get_ttft_percentiles(self, model_id: str) -> Optional[Dict[str, int]]:
+        """최근 윈도우의 p50/p95 TTFT (샘플 없으면 None)"""
+        self._sync_from_distributed(model_id)
+        window = self._windows.get(model_id)
+        if window is None or len(window) == 0:
+            return None
+        return {"p50": window.percentile(50), "p95": window.percentile(95)}
+    
+    def get_tail_ttft(self, model_id: str, base_ttft_ms: int, percentile: float = 95) -> int:
+        """
+        꼬리 지연 TTFT (기본 p95)
         
-        samples = list(self._samples[model_id])
-        
-        # Exponentially weighted average (higher weight for recent values)
-        weighted_sum = 0.0
-        weight_total = 0.0
-        
-        for i, sample in enumerate(samples):
-            weight = self._decay_factor ** (len(samples) - 1 - i)
-            weighted_sum += sample * weight
-            weight_total += weight
-        
-        if weight_total == 0:
+        Returns:
+            백분위수 TTFT (ms) - 최근 측정값이 없으면 기준값 반환
+        """
+        self._sync_from_distributed(model_id)
+        window = self._windows.get(model_id)
+        tail = window.percentile(percentile) if window is not None else None
+        if tail is None:
             return base_ttft_ms
-        
-        effective = int(weighted_sum / weight_total)
-        
-        # Clamp if deviation from baseline is too large (outlier prevention)
-        max_deviation = base_ttft_ms * 3  # Allow up to 3x baseline
-        min_deviation = base_ttft_ms // 3  # Allow down to 1/3 baseline
-        
-        return max(min_deviation, min(effective, max_deviation))
+        return self._clamp(tail, base_ttft_ms)
+    
+    def get_routing_ttft(self, model_id: str, base_ttft_ms: int) -> float:
+        """라우팅 점수용 TTFT: 가중 평균과 p95를 TTFT_TAIL_WEIGHT 비율로 혼합"""
+        effective = self.get_effective_ttft(model_id, base_ttft_ms)
+        tail = self.get_tail_ttft(model_id, base_ttft_ms)
+        return (1.0 - TTFT_TAIL_WEIGHT) * effective + TTFT_TAIL_WEIGHT * tail
     
     def get_model_health(self, model_id: str, base_ttft_ms: int) -> str:
         """
-        모델 상태 판단
+        모델 상태 판단 (평균 + 꼬리 지연)
         
         Returns:
             "healthy" | "degraded" | "unhealthy" | "unknown"
         """
-        if model_id not in self._samples or len(self._samples[model_id]) < 3:
+        window = self._windows.get(model_id)
+        if window is None or len(window) < 3:
             return "unknown"
         
         effective = self.get_effective_ttft(model_id, base_ttft_ms)
         ratio = effective / base_ttft_ms
+        tail_ratio = window.percentile(95) / base_ttft_ms
         
-        if ratio <= 1.2:
-            return "healthy"
-        elif ratio <= 2.0:
+        if ratio > 2.0 or tail_ratio > TTFT_TAIL_UNHEALTHY_RATIO:
+            return "unhealthy"
+        elif ratio > 1.2 or tail_ratio > TTFT_TAIL_DEGRADED_RATIO:
             return "degraded"
         else:
-            return "unhealthy"
+            return "healthy"
     
     def get_all_metrics(self) -> Dict[str, Dict[str, Any]]:
         """모든 모델의 TTFT 메트릭 반환"""
         result = {}
-        for model_id, samples in self._samples.items():
-            if samples:
+        with self._lock:
+            windows = list(self._windows.items())
+        for model_id, window in windows:
+            if len(window):
                 result[model_id] = {
-                    "sample_count": len(samples),
-                    "latest_ttft_ms": samples[-1] if samples else None,
-                    "avg_ttft_ms": sum(samples) / len(samples),
-                    "min_ttft_ms": min(samples),
-                    "max_ttft_ms": max(samples),
+                    "sample_count": len(window),
+                    "latest_ttft_ms": window.samples[-1],
+                    "avg_ttft_ms": window.total / len(window),
+                    "min_ttft_ms": window.sorted_samples[0],
+                    "max_ttft_ms": window.sorted_samples[-1],
+                    "p50_ttft_ms": window.percentile(50),
+                    "p95_ttft_ms": window.percentile(95),
                     "last_update": self._last_update.get(model_id)
                 }
         return result
+    
+    def get_flush_stats(self) -> Dict[str, int]:
+        """분산 저장소 flush 통계 (모니터링용)"""
+        with self._lock:
+            stats = dict(self._flush_stats)
+            stats["pending_samples"] = self._pending_count
+        return stats
 
 
 # 전역 TTFT 추적기 인스턴스
@@ -312,6 +543,11 @@ def record_model_ttft(model_id: str, ttft_ms: int) -> None:
     _ttft_tracker.record_ttft(model_id, ttft_ms)
 
 
+def flush_ttft_metrics() -> int:
+    """버퍼된 TTFT 샘플을 즉시 분산 저장소로 flush (모델 라우팅을 쓰는 핸들러의 finally에서 호출)"""
+    return _ttft_tracker.drain()
+
+
 def get_ttft_metrics() -> Dict[str, Dict[str, Any]]:
     """현재 TTFT 메트릭 조회 (모니터링용)"""
     return _ttft_tracker.get_all_metrics()
@@ -1092,6 +1328,13 @@ async def classify_intent_with_llm(user_request: str) -> Dict[str, Any]:
             "reasoning": "Keyword-based classification (Pre-Routing disabled)"
         }
     
+    # 같은 요청은 캐시된 LLM 분류 재사용 (의도는 워크플로우 형태와 무관)
+    # LLM은 원문을 그대로 보므로 원문 기준으로 키를 만든다
+    cache_key = ("intent", _request_hash(user_request))
+    cached = _cache_lookup(cache_key)
+    if cached is not None:
+        return dict(cached)
+    
     # Gemini Flash 8B로 빠른 분류 (비용: ~$0.00004 per request)
     try:
         from src.services.llm.gemini_service import get_gemini_flash_8b_service
@@ -1144,8 +1387,11 @@ JSON 형식으로만 응답 (설명 없이):
         )
         
         import json
+        with _classification_cache_lock:
+            _classification_stats["llm_calls"] += 1
         result = json.loads(response)
         result["confidence"] = 0.9  # LLM 분류는 높은 신뢰도
+        _cache_store(cache_key, dict(result))  # 키워드 폴백 결과는 캐시하지 않음 (다음 호출에서 재시도)
         return result
         
     except Exception as e:
@@ -1161,6 +1407,139 @@ JSON 형식으로만 응답 (설명 없이):
             "reasoning": f"Keyword fallback due to error: {str(e)[:50]}"
         }
 
+# ============================================================
+# Request Classification Cache (LRU)
+# ============================================================
+# 같은 요청 텍스트 + 같은 워크플로우 형태에 대한 분류 결과는 결정적이므로
+# 키워드 스캔/복잡도 계산/LLM 의도 분류를 반복하지 않고 재사용합니다.
+# 키: 분류기가 보는 텍스트 그대로의 해시 + 워크플로우 형태 fingerprint (노드 수, 노드 타입 분포, 엣지 수)
+# 공백은 정규화하지 않는다 — 부정 문맥 검사("do not", "no ")가 공백에 민감하므로
+# 공백만 다른 두 요청이 다르게 분류될 수 있다.
+
+ROUTING_CLASSIFICATION_CACHE_SIZE = int(os.environ.get("ROUTING_CLASSIFICATION_CACHE_SIZE", "256"))
+
+_classification_cache: "OrderedDict[Tuple, Dict[str, Any]]" = OrderedDict()
+_classification_cache_lock = threading.Lock()
+_classification_stats = {"hits": 0, "misses": 0, "evictions": 0, "llm_calls": 0}
+
+# 최근 라우팅 결정 지연 (ms) - 모니터링용
+_routing_latency_ms: deque = deque(maxlen=256)
+
+
+def _normalize_request(user_request: str) -> str:
+    """키워드 분류기가 보는 텍스트 (모두 lower() 기준, 공백은 그대로)"""
+    return (user_request or "").lower()
+
+
+def _request_hash(text: str) -> str:
+    return hashlib.sha256((text or "").encode("utf-8")).hexdigest()
+
+
+def workflow_shape_fingerprint(workflow: Optional[Dict[str, Any]]) -> Tuple:
+    """복잡도 분류에 영향을 주는 워크플로우 형태 (노드 수, 노드 타입 분포, 엣지 수)"""
+    workflow = workflow or {}
+    nodes = workflow.get("nodes") or []
+    edges = workflow.get("edges") or []
+    type_counts: Dict[str, int] = {}
+    for node in nodes:
+        node_type = str(node.get("type", "")) if isinstance(node, dict) else ""
+        type_counts[node_type] = type_counts.get(node_type, 0) + 1
+    return (len(nodes), tuple(sorted(type_counts.items())), len(edges))
+
+
+def _cache_lookup(key: Tuple) -> Optional[Dict[str, Any]]:
+    with _classification_cache_lock:
+        cached = _classification_cache.get(key)
+        if cached is None:
+            _classification_stats["misses"] += 1
+            return None
+        _classification_cache.move_to_end(key)
+        _classification_stats["hits"] += 1
+        return cached
+
+
+def _cache_store(key: Tuple, value: Dict[str, Any]) -> None:
+    with _classification_cache_lock:
+        _classification_cache[key] = value
+        _classification_cache.move_to_end(key)
+        while len(_classification_cache) > ROUTING_CLASSIFICATION_CACHE_SIZE:
+            _classification_cache.popitem(last=False)
+            _classification_stats["evictions"] += 1
+
+
+def classify_request(
+    canvas_mode: Literal["agentic-designer", "co-design"],
+    current_workflow: Dict[str, Any],
+    user_request: str,
+    recent_changes: list = None
+) -> Dict[str, Any]:
+    """
+    라우팅용 요청 분류 (LRU 캐시)
+    
+    estimate_request_complexity + 부정 문맥 고려 키워드 분류 결과를 묶어 반환합니다.
+    반환된 dict는 캐시와 공유되므로 수정하지 마세요.
+    
+    Returns:
+        {
+            "tier": ModelTier,
+            "needs_structure": bool, "struct_confidence": float, "struct_keywords": tuple,
+            "needs_long_context": bool, "ctx_confidence": float, "ctx_keywords": tuple,
+        }
+    """
+    key = (
+        "route",
+        canvas_mode,
+        _request_hash(_normalize_request(user_request)),
+        workflow_shape_fingerprint(current_workflow),
+        bool(recent_changes and len(recent_changes) > 5),  # estimate_request_complexity 기준
+    )
+    cached = _cache_lookup(key)
+    if cached is not None:
+        return cached
+    
+    tier = estimate_request_complexity(canvas_mode, current_workflow or {}, user_request, recent_changes)
+    needs_structure, struct_confidence, struct_keywords = _detect_structural_complexity_semantic(user_request)
+    needs_long_context, ctx_confidence, ctx_keywords = _detect_long_context_semantic(user_request)
+    result = {
+        "tier": tier,
+        "needs_structure": needs_structure,
+        "struct_confidence": struct_confidence,
+        "struct_keywords": tuple(struct_keywords),
+        "needs_long_context": needs_long_context,
+        "ctx_confidence": ctx_confidence,
+        "ctx_keywords": tuple(ctx_keywords),
+    }
+    _cache_store(key, result)
+    return result
+
+
+def get_routing_cache_stats() -> Dict[str, Any]:
+    """분류 캐시 적중률 및 라우팅 지연 통계 (모니터링용)"""
+    with _classification_cache_lock:
+        stats = dict(_classification_stats)
+        stats["entries"] = len(_classification_cache)
+        latencies = sorted(_routing_latency_ms)
+    lookups = stats["hits"] + stats["misses"]
+    stats["hit_rate_percent"] = round(stats["hits"] / lookups * 100, 2) if lookups else 0.0
+    if latencies:
+        stats["routing_latency_ms"] = {
+            "samples": len(latencies),
+            "avg": round(sum(latencies) / len(latencies), 3),
+            "p50": round(latencies[(len(latencies) - 1) // 2], 3),
+            "p95": round(latencies[max(0, math.ceil(0.95 * len(latencies)) - 1)], 3),
+        }
+    return stats
+
+
+def clear_routing_cache() -> None:
+    """분류 캐시 및 통계 초기화 (테스트용)"""
+    with _classification_cache_lock:
+        _classification_cache.clear()
+        for key in _classification_stats:
+            _classification_stats[key] = 0
+        _routing_latency_ms.clear()
+
+
 def estimate_request_complexity(
     canvas_mode: Literal["agentic-designer", "co-design"],
     current_workflow: Dict[str, Any],
@@ -1255,6 +1634,9 @@ def select_optimal_model(
     4. Soft/Hard Budget Policy: 유연한 예산 정책
     5. Gemini 불가 시 → Claude/GPT Fallback
     
+    요청 분류(복잡도 티어 + 의도 키워드)는 classify_request()의 LRU 캐시에서 재사용되며,
+    라우팅 결정 지연은 get_routing_cache_stats()로 관측할 수 있습니다.
+    
     Args:
         canvas_mode: Canvas 모드
         current_workflow: 현재 워크플로우
@@ -1270,6 +1652,32 @@ def select_optimal_model(
     Returns:
         ModelConfig: 선택된 모델 설정
     """
+    start = time.perf_counter()
+    try:
+        return _select_optimal_model(
+            canvas_mode, current_workflow, user_request, recent_changes,
+            budget_constraint, budget_policy, prefer_gemini,
+            require_low_latency, enable_context_caching, use_adaptive_ttft,
+        )
+    finally:
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        with _classification_cache_lock:
+            _routing_latency_ms.append(elapsed_ms)
+
+
+def _select_optimal_model(
+    canvas_mode: Literal["agentic-designer", "co-design"],
+    current_workflow: Dict[str, Any],
+    user_request: str,
+    recent_changes: list = None,
+    budget_constraint: ModelTier = None,
+    budget_policy: BudgetPolicy = BudgetPolicy.ADAPTIVE,
+    prefer_gemini: bool = True,
+    require_low_latency: bool = None,
+    enable_context_caching: bool = None,
+    use_adaptive_ttft: bool = True
+) -> ModelConfig:
+    """select_optimal_model() 본체 (지연 측정 래퍼 없이)"""
     
     # ──────────────────────────────────────────────────────────
     # [Design Mode Special Handling] Thinking 지원 모델 우선 선택
@@ -1294,10 +1702,9 @@ def select_optimal_model(
         
         logger.warning(f"Design mode: No thinking-capable models available, falling back to standard selection")
     
-    # 복잡도 분석
-    recommended_tier = estimate_request_complexity(
-        canvas_mode, current_workflow, user_request, recent_changes
-    )
+    # 복잡도 분석 + 의도 분류 (LRU 캐시)
+    classification = classify_request(canvas_mode, current_workflow, user_request, recent_changes)
+    recommended_tier = classification["tier"]
     
     # 환경 변수로 모델 강제 지정 가능
     forced_model = os.getenv("FORCE_MODEL_ID")
@@ -1308,8 +1715,11 @@ def select_optimal_model(
     # ──────────────────────────────────────────────────────────
     # [① Semantic Intent Detection] 부정 문맥 + 이중 부정 고려
     # ──────────────────────────────────────────────────────────
-    needs_structure, struct_confidence, struct_keywords = _detect_structural_complexity_semantic(user_request)
-    needs_long_context, ctx_confidence, ctx_keywords = _detect_long_context_semantic(user_request)
+    needs_structure = classification["needs_structure"]
+    struct_confidence = classification["struct_confidence"]
+    struct_keywords = list(classification["struct_keywords"])
+    needs_long_context = classification["needs_long_context"]
+    ctx_confidence = classification["ctx_confidence"]
     
     logger.debug(f"Semantic detection: structure={needs_structure}(conf={struct_confidence:.2f}, keywords={struct_keywords}), "
                 f"long_context={needs_long_context}(conf={ctx_confidence:.2f})")
@@ -1369,7 +1779,8 @@ def select_optimal_model(
                 
                 for model_name in candidates:
                     model_config = AVAILABLE_MODELS[model_name]
-                    effective_ttft = _ttft_tracker.get_effective_ttft(
+                    # 가중 평균 + p95 혼합: 평균만 좋고 꼬리가 나쁜 모델 회피
+                    effective_ttft = _ttft_tracker.get_routing_ttft(
                         model_name, model_config.expected_ttft_ms
                     )
                     health = _ttft_tracker.get_model_health(model_name, model_config.expected_ttft_ms)
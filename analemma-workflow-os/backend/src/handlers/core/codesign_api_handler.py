@@ -49,7 +49,7 @@ try:
     # 시스템 프롬프트 (prompts.py에서 import)
     from src.services.design.prompts import SYSTEM_PROMPT
     # 모델 라우터 및 인증
-    from src.common.model_router import select_optimal_model
+    from src.common.model_router import select_optimal_model, flush_ttft_metrics
     from src.common.auth_utils import extract_owner_id_from_event
     _IMPORTS_OK = True
     logger.info("All imports successful")
@@ -68,6 +68,7 @@ except ImportError as e:
     _mock_workflow_json = lambda: {"nodes": [], "edges": []}
     SYSTEM_PROMPT = "You are a workflow design assistant."
     select_optimal_model = None
+    flush_ttft_metrics = None
     def extract_owner_id_from_event(*args, **kwargs):
         raise Exception("Unauthorized: auth_utils not available")
 except ImportError as e:
@@ -1182,6 +1183,9 @@ async def _lambda_handler_streaming_async(event, response_stream, context):
         except Exception as e:
             logger.warning("Failed to close response stream: %s", e)
             pass
+        # 응답을 닫은 뒤, 컨테이너 동결 전에 버퍼된 TTFT 샘플 저장
+        if flush_ttft_metrics is not None:
+            flush_ttft_metrics()
 
 
 def lambda_handler_streaming_sync(event, response_stream, context):
@@ -30,6 +30,11 @@ try:
 except ImportError as e:
     logger.error(f"Failed to import optional dependencies: {e}")
 
+try:
+    from src.common.model_router import flush_ttft_metrics
+except ImportError:
+    flush_ttft_metrics = None
+
 
 def lambda_handler(event, context):
     """
@@ -101,6 +106,10 @@ def lambda_handler(event, context):
     except Exception as e:
         logger.exception(f"Worker handler failed: {e}")
         return {'statusCode': 500, 'body': str(e)}
+    finally:
+        # 모델 라우팅 중 버퍼된 TTFT 샘플을 컨테이너 동결 전에 저장
+        if flush_ttft_metrics is not None:
+            flush_ttft_metrics()
 
 
 def _process_codesign(workflow_data: Dict[str, Any], user_message: str, owner_id: str) -> Dict[str, Any]:
@@ -18,6 +18,8 @@ import os
 import json
 import logging
 import hashlib
+import threading
+import time
 from datetime import datetime, timezone
 from typing import Dict, Any, List, Optional, Tuple
 from decimal import Decimal
@@ -135,6 +137,12 @@ CONTEXT_CACHE_TTL_SECONDS = 3600  # 1시간
 CONTEXT_CACHE_MIN_TOKENS = 32000  # 최소 토큰 수 (캐싱 조건)
 ENABLE_CONTEXT_CACHING = os.environ.get("ENABLE_CONTEXT_CACHING", "true").lower() == "true"
 
+# 활성 지침 프로세스 캐시 설정 (LLM 노드마다 DynamoDB 2회 조회 방지)
+ACTIVE_INSTRUCTION_CACHE_TTL_SECONDS = int(os.environ.get("ACTIVE_INSTRUCTION_CACHE_TTL_SECONDS", "300"))
+ACTIVE_INSTRUCTION_CACHE_MAX_ENTRIES = 2048
+USAGE_FLUSH_THRESHOLD = 50  # 버퍼된 사용 횟수 합계가 이 값에 도달하면 flush
+USAGE_FLUSH_INTERVAL_SECONDS = 30  # 마지막 flush 이후 이 시간이 지나면 flush
+
 # 지침 구조 (레거시 Python dict)
 INSTRUCTION_SCHEMA_LEGACY = {
     "text": str,  # 지침 텍스트
@@ -293,6 +301,17 @@ _gemini_client = None
 # Context Cache 저장소 (workflow_id#node_id -> cache_name)
 _context_cache_registry: Dict[str, Dict[str, Any]] = {}
 
+# 활성 지침 캐시 ((owner_id, workflow_id, node_id) -> {instructions, latest_sk, expires_at})
+_active_instruction_cache: Dict[Tuple[str, str, str], Dict[str, Any]] = {}
+_active_instruction_cache_stats = {"hits": 0, "misses": 0, "invalidations": 0}
+_active_instruction_cache_lock = threading.Lock()
+
+# 사용 횟수 버퍼 ((pk, sk) -> 누적 횟수), 배치로 flush
+_usage_count_buffer: Dict[Tuple[str, str], int] = {}
+_pending_usage_total = 0  # _usage_count_buffer 값의 합계 (flush 시 0으로 초기화)
+_usage_buffer_lock = threading.Lock()
+_last_usage_flush = time.monotonic()
+
 # 충돌 감지 서비스 (Lazy Initialization)
 _conflict_service: Optional[InstructionConflictService] = None
 
@@ -845,6 +864,10 @@ def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
         )
         
         return {"statusCode": 500, "body": str(e)}
+    
+    finally:
+        # 컨테이너 freeze 전에 버퍼된 사용 횟수 기록 (임계치 미달분 포함)
+        flush_instruction_usage_counts()
 
 
 @log_external_service_call("s3", "get_object")
@@ -1603,6 +1626,9 @@ def _save_distilled_instructions(
         # 해당 노드의 최신 활성 지침 인덱스 업데이트
         _update_latest_instruction_index(pk, node_id, sk)
         
+        # 새 버전이 기록되었으므로 이 프로세스의 활성 지침 캐시 무효화
+        invalidate_active_instructions(owner_id, workflow_id, node_id, new_latest_sk=sk)
+        
         logger.info(f"Saved distilled instructions with weights: pk={pk}, sk={sk}, count={len(final_instructions)}, has_few_shot={final_few_shot is not None}")
         
     except ClientError as e:
@@ -1715,63 +1741,181 @@ def get_active_instructions(
     특정 노드에 대한 활성 지침 조회 (외부 호출용)
     가중치가 MIN_INSTRUCTION_WEIGHT 이상인 지침만 반환합니다.
     
+    증류된 지침은 드물게 바뀌므로 프로세스 캐시(TTL)로 DynamoDB 조회를 생략하고,
+    사용 횟수는 버퍼에 누적했다가 배치로 기록합니다.
+    같은 프로세스에서 새 지침이 저장되면 해당 엔트리는 즉시 무효화되며,
+    다른 컨테이너에서 저장된 지침은 최대 TTL만큼 늦게 반영됩니다.
+    
     Returns:
         활성화된 지침 목록 (가중치 순)
     """
     pk = f"{owner_id}#{workflow_id}"
+    cache_key = (owner_id, workflow_id, node_id)
+    
+    with _active_instruction_cache_lock:
+        cached = _active_instruction_cache.get(cache_key)
+        if cached is not None and time.monotonic() < cached["expires_at"]:
+            _active_instruction_cache_stats["hits"] += 1
+            instructions = list(cached["instructions"])
+            latest_sk = cached["latest_sk"]
+        else:
+            _active_instruction_cache_stats["misses"] += 1
+            cached = None
     
-    try:
-        # 최신 지침 인덱스 조회
-        response = instructions_table.get_item(
-            Key={"pk": pk, "sk": f"LATEST#{node_id}"}
-        )
-        
-        if "Item" not in response:
-            return []
-        
-        latest_sk = response["Item"].get("latest_instruction_sk")
-        if not latest_sk:
+    if cached is None:
+        try:
+            instructions, latest_sk = _load_active_instructions(pk, node_id)
+        except ClientError as e:
+            logger.error(f"Error getting active instructions: {e}")
             return []
-        
-        # 실제 지침 조회
-        response = instructions_table.get_item(
-            Key={"pk": pk, "sk": latest_sk}
+        _store_active_instructions(cache_key, instructions, latest_sk)
+    
+    if instructions and latest_sk:
+        _buffer_usage_count(pk, latest_sk)
+    
+    return instructions
+
+
+def _load_active_instructions(pk: str, node_id: str) -> Tuple[List[str], Optional[str]]:
+    """DynamoDB에서 최신 활성 지침 로드 (latest pointer → 지침 레코드)"""
+    # 최신 지침 인덱스 조회
+    response = instructions_table.get_item(
+        Key={"pk": pk, "sk": f"LATEST#{node_id}"}
+    )
+    
+    if "Item" not in response:
+        return [], None
+    
+    latest_sk = response["Item"].get("latest_instruction_sk")
+    if not latest_sk:
+        return [], None
+    
+    # 실제 지침 조회
+    response = instructions_table.get_item(
+        Key={"pk": pk, "sk": latest_sk}
+    )
+    
+    if "Item" not in response or not response["Item"].get("is_active"):
+        return [], latest_sk
+    
+    # 가중치 기반 필터링
+    weighted = response["Item"].get("weighted_instructions", [])
+    
+    if weighted:
+        # 가중치가 충분한 지침만 선택
+        valid_instructions = [
+            inst["text"] for inst in weighted
+            if Decimal(str(inst.get("weight", 0))) >= MIN_INSTRUCTION_WEIGHT
+        ]
+        return valid_instructions, latest_sk
+    
+    # 레거시 형식 호환
+    return response["Item"].get("instructions", []), latest_sk
+
+
+def _store_active_instructions(
+    cache_key: Tuple[str, str, str],
+    instructions: List[str],
+    latest_sk: Optional[str]
+) -> None:
+    """활성 지침 캐시에 저장 (빈 결과도 캐싱하여 지침 없는 노드의 반복 조회 방지)"""
+    with _active_instruction_cache_lock:
+        if (len(_active_instruction_cache) >= ACTIVE_INSTRUCTION_CACHE_MAX_ENTRIES
+                and cache_key not in _active_instruction_cache):
+            # 가장 먼저 들어온 엔트리 제거 (dict 삽입 순서)
+            _active_instruction_cache.pop(next(iter(_active_instruction_cache)))
+        _active_instruction_cache[cache_key] = {
+            "instructions": list(instructions),
+            "latest_sk": latest_sk,
+            "expires_at": time.monotonic() + ACTIVE_INSTRUCTION_CACHE_TTL_SECONDS,
+        }
+
+
+def invalidate_active_instructions(
+    owner_id: str,
+    workflow_id: str,
+    node_id: str,
+    new_latest_sk: Optional[str] = None
+) -> None:
+    """
+    활성 지침 캐시 무효화
+    
+    new_latest_sk가 주어지면 캐시된 버전과 다를 때만 제거합니다
+    (같은 버전을 가리키는 재기록은 캐시를 유지).
+    """
+    cache_key = (owner_id, workflow_id, node_id)
+    with _active_instruction_cache_lock:
+        cached = _active_instruction_cache.get(cache_key)
+        if cached is None:
+            return
+        if new_latest_sk is not None and cached.get("latest_sk") == new_latest_sk:
+            return
+        del _active_instruction_cache[cache_key]
+        _active_instruction_cache_stats["invalidations"] += 1
+
+
+def get_active_instruction_cache_stats() -> Dict[str, Any]:
+    """활성 지침 캐시 통계 (히트율, 버퍼된 사용 횟수)"""
+    with _active_instruction_cache_lock:
+        hits = _active_instruction_cache_stats["hits"]
+        misses = _active_instruction_cache_stats["misses"]
+        total = hits + misses
+        stats = {
+            "hits": hits,
+            "misses": misses,
+            "invalidations": _active_instruction_cache_stats["invalidations"],
+            "hit_ratio": round(hits / total, 4) if total else 0.0,
+            "entries": len(_active_instruction_cache),
+        }
+    with _usage_buffer_lock:
+        stats["pending_usage_increments"] = _pending_usage_total
+    return stats
+
+
+def _buffer_usage_count(pk: str, sk: str) -> None:
+    """사용 횟수를 버퍼에 누적하고 임계값/주기 도달 시 배치 flush"""
+    global _pending_usage_total
+    with _usage_buffer_lock:
+        key = (pk, sk)
+        _usage_count_buffer[key] = _usage_count_buffer.get(key, 0) + 1
+        _pending_usage_total += 1
+        due = (
+            _pending_usage_total >= USAGE_FLUSH_THRESHOLD
+            or time.monotonic() - _last_usage_flush >= USAGE_FLUSH_INTERVAL_SECONDS
         )
-        
-        if "Item" in response and response["Item"].get("is_active"):
-            # 가중치 기반 필터링
-            weighted = response["Item"].get("weighted_instructions", [])
-            
-            if weighted:
-                # 가중치가 충분한 지침만 선택
-                valid_instructions = [
-                    inst["text"] for inst in weighted
-                    if Decimal(str(inst.get("weight", 0))) >= MIN_INSTRUCTION_WEIGHT
-                ]
-                
-                # 사용 횟수 증가 (비동기)
-                _increment_usage_count(pk, latest_sk)
-                
-                return valid_instructions
-            
-            # 레거시 형식 호환
-            instructions = response["Item"].get("instructions", [])
-            _increment_usage_count(pk, latest_sk)
-            return instructions
-            
-    except ClientError as e:
-        logger.error(f"Error getting active instructions: {e}")
+    if due:
+        flush_instruction_usage_counts()
+
+
+def flush_instruction_usage_counts() -> int:
+    """
+    버퍼된 사용 횟수를 DynamoDB에 기록 (레코드당 update 1회)
     
-    return []
+    Lambda 핸들러 종료 전에 호출하면 버퍼 손실을 최소화할 수 있습니다.
+    
+    Returns:
+        기록된 레코드 수
+    """
+    global _last_usage_flush, _pending_usage_total
+    with _usage_buffer_lock:
+        pending = dict(_usage_count_buffer)
+        _usage_count_buffer.clear()
+        _pending_usage_total = 0
+        _last_usage_flush = time.monotonic()
+    
+    for (pk, sk), count in pending.items():
+        _increment_usage_count(pk, sk, count)
+    
+    return len(pending)
 
 
-def _increment_usage_count(pk: str, sk: str) -> None:
-    """사용 횟수 증가 (비동기, 실패 무시)"""
+def _increment_usage_count(pk: str, sk: str, count: int = 1) -> None:
+    """사용 횟수 증가 (실패 무시)"""
     try:
         instructions_table.update_item(
             Key={"pk": pk, "sk": sk},
             UpdateExpression="SET usage_count = usage_count + :inc, total_applications = total_applications + :inc",
-            ExpressionAttributeValues={":inc": 1}
+            ExpressionAttributeValues={":inc": count}
         )
     except Exception:
         pass
@@ -1799,6 +1943,9 @@ def record_instruction_feedback(
     """
     pk = f"{owner_id}#{workflow_id}"
     
+    # 성공률 계산이 total_applications를 쓰므로 버퍼된 사용 횟수를 먼저 반영
+    flush_instruction_usage_counts()
+    
     try:
         response = instructions_table.get_item(
             Key={"pk": pk, "sk": f"LATEST#{node_id}"}
@@ -1862,6 +2009,9 @@ def record_instruction_feedback(
                 }
             )
             
+            # 가중치가 바뀌었으므로 캐시된 필터링 결과 무효화
+            invalidate_active_instructions(owner_id, workflow_id, node_id)
+            
             logger.info(f"Updated instruction weights for {node_id}: positive={is_positive}")
             
     except ClientError as e:
@@ -1536,10 +1536,12 @@ def invoke_bedrock_model(model_id: str, system_prompt: str | None, user_prompt:
             payload["anthropic_version"] = "bedrock-2023-05-31"
         if system_prompt: payload["system"] = system_prompt
         if max_tokens: payload["max_tokens"] = int(max_tokens)
-        if temperature: payload["temperature"] = float(temperature)
+        if temperature is not None: payload["temperature"] = float(temperature)
 
-        resp = client.invoke_model(body=json.dumps(payload), modelId=model_id)
-        return json.loads(resp['body'].read())
+        from src.services.llm.concurrency_limiter import provider_slot
+        with provider_slot("bedrock", model_id):
+            resp = client.invoke_model(body=json.dumps(payload), modelId=model_id)
+            return json.loads(resp['body'].read())
 
     except ReadTimeoutError:
         logger.warning(f"Bedrock read timeout for {model_id}")
@@ -1999,6 +2001,43 @@ def _hydrate_state_for_config(state: Dict[str, Any], config: Dict[str, Any],
 # 4. Node Runners Implementation
 # -----------------------------------------------------------------------------
 
+def _coalescing_scope(actual_config: Dict[str, Any], exec_state: Dict[str, Any], temperature: Any) -> Optional[str]:
+    """
+    요청 합치기 범위(실행 ID)를 반환한다. 합치기 대상이 아니면 None.
+
+    노드 설정 coalesce_identical_requests가 환경변수 LLM_COALESCING_ENABLED보다 우선한다.
+    결정적(temperature 0) 호출만, 실행 ID가 있을 때만 합친다 (실행 간 결과 공유 금지).
+    """
+    from src.services.llm.request_coalescer import LLM_COALESCING_ENABLED, is_deterministic
+
+    enabled = actual_config.get("coalesce_identical_requests")
+    if enabled is None:
+        enabled = LLM_COALESCING_ENABLED
+    if not enabled or not is_deterministic(temperature):
+        return None
+    return exec_state.get("execution_id") or exec_state.get("execution_arn") or exec_state.get("ExecutionArn")
+
+
+def _durable_cache_context(actual_config: Dict[str, Any], exec_state: Dict[str, Any], temperature: Any) -> Optional[Tuple[Any, str, float]]:
+    """
+    영속 응답 캐시 사용 여부를 판정해 (store, workflow_id, ttl_s)를 반환한다. 대상이 아니면 None.
+
+    결정적(temperature 0) 호출, 워크플로우 ID와 저장소(WORKFLOW_STATE_BUCKET)가 있을 때만.
+    MOCK_MODE 응답은 저장하지 않는다.
+    """
+    from src.services.llm.request_coalescer import is_deterministic
+    from src.services.llm.response_store import get_response_store, resolve_cache_ttl
+
+    if _is_mock_mode() or not is_deterministic(temperature):
+        return None
+    ttl_s = resolve_cache_ttl(exec_state.get("workflow_config"), actual_config)
+    workflow_id = exec_state.get("workflow_id") or exec_state.get("workflowId")
+    if ttl_s is None or not workflow_id:
+        return None
+    store = get_response_store()
+    return (store, workflow_id, ttl_s) if store is not None else None
+
+
 def llm_chat_runner(state: Dict[str, Any], config: Dict[str, Any]) -> Dict[str, Any]:
     """Standard LLM Chat Runner with Async detection and Retry/Hydration support."""
     
@@ -2120,7 +2159,7 @@ def llm_chat_runner(state: Dict[str, Any], config: Dict[str, Any]) -> Dict[str,
             
             # [Critical] State Isolation: Deep copy to prevent attempt_count pollution
             # Each retry attempt should have clean state to avoid template rendering contamination
-            current_attempt_state = exec_state.copy()
+            current_attempt_state = dict(exec_state)  # StateViewProxy(MutableMapping)에는 copy()가 없음
             current_attempt_state["attempt_count"] = attempt + 1
             
             # Render prompts with current attempt count
@@ -2190,7 +2229,10 @@ def llm_chat_runner(state: Dict[str, Any], config: Dict[str, Any]) -> Dict[str,
             # [Fix] None defense: actual_config['llm_config'] can be None
             model = actual_config.get("model") or (actual_config.get("llm_config") or {}).get("model_id") or DEFAULT_LLM_MODEL
             max_tokens = actual_config.get("max_tokens") or (actual_config.get("llm_config") or {}).get("max_tokens", DEFAULT_MAX_TOKENS)
-            temperature = actual_config.get("temperature") or (actual_config.get("llm_config") or {}).get("temperature", DEFAULT_TEMPERATURE)
+            # temperature 0은 유효한 값 (결정적 호출) — falsy 폴백으로 기본값이 되지 않게 None만 폴백
+            temperature = actual_config.get("temperature")
+            if temperature is None:
+                temperature = (actual_config.get("llm_config") or {}).get("temperature", DEFAULT_TEMPERATURE)
             # [Fix] Extract response_schema for structured output (JSON mode)
             response_schema = actual_config.get("response_schema") or (actual_config.get("llm_config") or {}).get("response_schema")
             
@@ -2249,6 +2291,45 @@ def llm_chat_runner(state: Dict[str, Any], config: Dict[str, Any]) -> Dict[str,
             resp = None  # Initialize response object
             multimodal_parts = []  # Initialize for exception handler safety
             
+            # [Coalescing] 같은 실행 안의 동일한 temperature 0 호출은 프로바이더 요청 1건으로 합친다
+            # [Durable Cache] 실행 간(체크포인트 복원/재실행) 동일 요청은 저장된 응답을 재사용
+            coalesce_scope = _coalescing_scope(actual_config, exec_state, temperature)
+            durable_cache = _durable_cache_context(actual_config, exec_state, temperature)
+            reuse_scope = coalesce_scope or (durable_cache and (
+                exec_state.get("execution_id") or execution_arn or durable_cache[1]))
+            coalesce_source = None
+
+            def _coalesced_invoke(provider_name, model_name, invoke):
+                nonlocal coalesce_source
+                if not reuse_scope:
+                    return invoke()
+                from src.services.llm.request_coalescer import (
+                    SOURCE_DURABLE, SOURCE_PROVIDER, coalescing_key, get_request_coalescer,
+                )
+                params = {
+                    "max_tokens": max_tokens,
+                    "temperature": temperature,
+                    "response_schema": response_schema,
+                    "enable_thinking": actual_config.get("enable_thinking", False),
+                    "thinking_budget_tokens": actual_config.get("thinking_budget_tokens", 4096),
+                }
+                if durable_cache:
+                    from src.services.llm.response_store import response_key
+                    store, workflow_id, ttl_s = durable_cache
+                    durable_key = response_key(provider_name, model_name, params, system_prompt, prompt)
+                    stored = store.get(workflow_id, durable_key, ttl_s)
+                    if stored is not None:
+                        coalesce_source = SOURCE_DURABLE
+                        return stored
+                if coalesce_scope:
+                    key = coalescing_key(provider_name, model_name, params, system_prompt, prompt)
+                    result, coalesce_source = get_request_coalescer().execute(coalesce_scope, key, invoke)
+                else:
+                    result, coalesce_source = invoke(), SOURCE_PROVIDER
+                if durable_cache and coalesce_source == SOURCE_PROVIDER:
+                    store.put(workflow_id, durable_key, result, ttl_s, provider_name, model_name)
+                return result
+            
             if provider == "gemini":
                 # Use Gemini Service (Native SDK)
                 try:
@@ -2332,7 +2413,7 @@ def llm_chat_runner(state: Dict[str, Any], config: Dict[str, Any]) -> Dict[str,
                             logger.warning(f"🚨 Execution cancelled before LLM call for node {node_id}")
                             raise Exception("Execution cancelled by user")
                         
-                        resp = service.invoke_model(
+                        resp = _coalesced_invoke("gemini", gemini_model.value, lambda: service.invoke_model(
                             user_prompt=prompt,
                             system_instruction=system_prompt,
                             max_output_tokens=max_tokens,
@@ -2340,7 +2421,7 @@ def llm_chat_runner(state: Dict[str, Any], config: Dict[str, Any]) -> Dict[str,
                             response_schema=response_schema,  # [Fix] Enable JSON mode when schema provided
                             enable_thinking=enable_thinking,
                             thinking_budget_tokens=thinking_budget_tokens
-                        )
+                        ))
                     
                     # Extract text from Gemini response structure
                     if "content" in resp and isinstance(resp["content"], list) and resp["content"]:
@@ -2453,14 +2534,14 @@ def llm_chat_runner(state: Dict[str, Any], config: Dict[str, Any]) -> Dict[str,
                     logger.warning(f"🚨 Execution cancelled before Bedrock LLM call for node {node_id}")
                     raise Exception("Execution cancelled by user")
                 
-                resp = invoke_bedrock_model(
+                resp = _coalesced_invoke("bedrock", bedrock_model_id, lambda: invoke_bedrock_model(
                     model_id=bedrock_model_id,
                     system_prompt=system_prompt,
                     user_prompt=prompt,
                     max_tokens=max_tokens,
                     temperature=temperature,
                     read_timeout_seconds=read_timeout
-                )
+                ))
                 text = extract_text_from_bedrock_response(resp)
                 
                 # Extract and normalize usage stats
@@ -2469,6 +2550,15 @@ def llm_chat_runner(state: Dict[str, Any], config: Dict[str, Any]) -> Dict[str,
                     raw_usage = resp["usage"]
                 usage = normalize_llm_usage(raw_usage, "bedrock")
             
+            # [Coalescing] 합쳐진 호출은 실제 비용 0 — 실행 리포트에 합치기 전/후 토큰 기록
+            requested_tokens = usage.get("total_tokens", 0)
+            if coalesce_source:
+                from src.services.llm.request_coalescer import SOURCE_DURABLE, get_request_coalescer
+                if coalesce_source == SOURCE_DURABLE:
+                    durable_cache[0].record_saving(usage)
+                usage = get_request_coalescer().account(reuse_scope, coalesce_source, usage)
+                meta["coalesced"] = coalesce_source
+            
             # [Fix] Manually trigger on_llm_end
             if callbacks:
                 llm_result = LLMResult(generations=[[Generation(text=text)]], llm_output={"usage": usage})
@@ -2622,7 +2712,14 @@ def llm_chat_runner(state: Dict[str, Any], config: Dict[str, Any]) -> Dict[str,
             _kes["llm_call_count"] = _kes.get("llm_call_count", 0) + 1
             _kes["last_llm_node"] = node_id
             _kes["last_llm_tokens"] = usage.get("total_tokens", 0)
+            # 합치기 전 기준 토큰 (모든 호출이 프로바이더로 갔다면 들었을 양) — 매 호출 누적,
+            # 이 키가 없던 이전 요약은 그때까지의 total_llm_tokens에서 시작
+            _kes["total_llm_tokens_requested"] = (
+                _kes.get("total_llm_tokens_requested", _kes.get("total_llm_tokens", 0)) + requested_tokens
+            )
             _kes["total_llm_tokens"] = _kes.get("total_llm_tokens", 0) + usage.get("total_tokens", 0)
+            if coalesce_source:
+                _kes["coalesced_llm_calls"] = _kes.get("coalesced_llm_calls", 0) + (coalesce_source != "provider")
             validated_output["_kernel_execution_summary"] = _kes
             validated_output["_metadata"] = {
                 "last_llm_node": node_id,
@@ -14,6 +14,7 @@ Step Functions 상태 변화 이벤트를 수신하여 노드별 실행 시간 
 import os
 import json
 import logging
+import time
 from datetime import datetime, timezone
 from decimal import Decimal
 from typing import Dict, Any, Optional
@@ -36,6 +37,10 @@ TTL_DAYS = 90  # 통계 데이터 TTL (일)
 # 0에 수렴하는 값으로 이동 평균이 고착되는 것을 방지
 MIN_DURATION_FLOOR_SECONDS = Decimal("0.01")  # 10ms
 
+# 조회 실패 경고 간격 (초) — 권한/테이블 누락 시 매 세그먼트마다 경고가 쌓이지 않도록
+STATS_LOOKUP_WARN_INTERVAL_S = float(os.environ.get("NODE_STATS_LOOKUP_WARN_INTERVAL_S", "300"))
+_last_lookup_warning_at: Optional[float] = None
+
 # DynamoDB 클라이언트
 dynamodb = boto3.resource("dynamodb", region_name=os.environ.get("AWS_REGION", "us-east-1"))
 table = dynamodb.Table(NODE_STATS_TABLE)
@@ -346,31 +351,45 @@ def _update_node_stats(
         raise
 
 
-def get_node_stats_for_eta(node_types: list) -> Dict[str, float]:
+def _warn_lookup_failure(node_type: str, error: Exception) -> None:
+    """조회 실패 경고는 STATS_LOOKUP_WARN_INTERVAL_S당 한 번만, 나머지는 DEBUG."""
+    global _last_lookup_warning_at
+    now = time.monotonic()
+    if _last_lookup_warning_at is None or now - _last_lookup_warning_at >= STATS_LOOKUP_WARN_INTERVAL_S:
+        _last_lookup_warning_at = now
+        logger.warning(f"Failed to get stats for {node_type} (table={NODE_STATS_TABLE}): {error}")
+    else:
+        logger.debug(f"Failed to get stats for {node_type}: {error}")
+
+
+def get_node_stats_for_eta(node_types: list, default: Optional[float] = 5.0) -> Dict[str, float]:
     """
     ETA 계산을 위한 노드별 평균 실행 시간 조회
-    
+
     Args:
         node_types: 조회할 노드 타입 목록
-        
+        default: 통계가 없는 타입의 값. None이면 해당 타입을 결과에서 제외
+            (스케줄러가 "통계 없음"과 "5초"를 구분할 때 사용)
+
     Returns:
         {node_type: avg_duration_seconds}
     """
     result = {}
-    
+
     for node_type in node_types:
         try:
             response = table.get_item(Key={"node_type": node_type})
             item = response.get("Item", {})
-            
+
             if item:
                 result[node_type] = float(item.get("avg_duration_seconds", 5.0))
-            else:
+            elif default is not None:
                 # 기본값 사용
-                result[node_type] = 5.0
-                
+                result[node_type] = default
+
         except ClientError as e:
-            logger.warning(f"Failed to get stats for {node_type}: {e}")
-            result[node_type] = 5.0
-    
+            _warn_lookup_failure(node_type, e)
+            if default is not None:
+                result[node_type] = default
+
     return result
@@ -41,6 +41,18 @@ except ImportError:
         _HAS_PARTITION = False
         partition_workflow_advanced = None
 
+# 파티션 결과는 content-addressed 아티팩트(S3)로 저장하고 아이템에는 참조만 기록
+try:
+    from src.services.workflow.partition_artifacts import (
+        compute_partition_artifact_hash,
+        store_partition_artifact,
+    )
+    _HAS_PARTITION_ARTIFACTS = True
+except ImportError:
+    _HAS_PARTITION_ARTIFACTS = False
+    compute_partition_artifact_hash = None
+    store_partition_artifact = None
+
 
 def _nl_to_structured_condition(nl: str):
     """Very small heuristic converter from src.natural-language to structured condition.
@@ -687,6 +699,11 @@ def lambda_handler(event, context):
             if _HAS_PARTITION and cfg_for_check:
                 try:
                     partition_start = time.time()
+                    # 파티셔닝이 노드를 일부 교정(in-place)하므로 해시는 원본 기준으로 먼저 계산
+                    artifact_hash = (
+                        compute_partition_artifact_hash(cfg_for_check)
+                        if _HAS_PARTITION_ARTIFACTS else None
+                    )
                     partition_result = partition_workflow_advanced(cfg_for_check)
                     
                     # 🛡️ [Critical Fix] Ensure metadata fields are never None
@@ -699,6 +716,21 @@ def lambda_handler(event, context):
                     # 저장 안 하면 estimated_executions=None → limit=total_segments+20 → LoopLimitExceeded.
                     body['estimated_executions'] = partition_result.get('estimated_executions') or 0
                     body['loop_analysis'] = partition_result.get('loop_analysis') or {}
+
+                    # [Partition Artifact] partition_map/loop_analysis는 불변 아티팩트로 분리
+                    # 아이템에는 참조 + 스칼라 카운트만 남겨 400KB 제한과 중복 read 비용을 줄임
+                    # 아티팩트 저장 실패 시 기존처럼 inline 저장 (InitializeStateData가 둘 다 지원)
+                    artifact_ref = None
+                    if _HAS_PARTITION_ARTIFACTS:
+                        artifact_ref = store_partition_artifact(
+                            partition_result, cfg_for_check, artifact_hash=artifact_hash
+                        )
+                    if artifact_ref:
+                        body['partition_artifact'] = artifact_ref
+                        body.pop('partition_map', None)
+                        body.pop('loop_analysis', None)
+                    else:
+                        body.pop('partition_artifact', None)
                     
                     partition_time = time.time() - partition_start
                     logger.info(f"Pre-compiled partition_map: {body['total_segments']} segments "
@@ -83,6 +83,8 @@ except ImportError:
 from src.common.graph_dsl import validate_workflow, normalize_workflow
 # 🚨 [Critical Fix] logical_auditor는 src/handlers/core/에 위치함
 from src.handlers.core.logical_auditor import audit_workflow, LogicalAuditor
+from src.services.design.designer_service import WorkflowClusterIndex, extract_focus_window
+from src.services.design.incremental_audit import IncrementalAuditor, REQUIRED_NODE_CONFIGS
 
 # Gemini 서비스 import
 try:
@@ -368,10 +370,52 @@ class CodesignContext:
         self.execution_history: List[Dict[str, Any]] = []
         # [NEW] 검증 오류 이력 - Self-Correction용
         self.validation_errors: List[Dict[str, Any]] = []
+        # 증분 클러스터/Centrality 인덱스 - 변경 이벤트로 갱신 (get_cluster_index에서 생성)
+        self.cluster_index: Optional[WorkflowClusterIndex] = None
+        # 증분 감사기 - 턴 시작 시 워크플로우 diff로 동기화, 스트리밍 청크를 순서대로 반영
+        self.auditor: Optional[IncrementalAuditor] = None
+        self.streamed_node_ids: set = set()
     
     def update_workflow(self, workflow: Dict[str, Any]):
-        """현재 워크플로우 업데이트"""
+        """
+        현재 워크플로우 업데이트
+        
+        클러스터 인덱스가 새 워크플로우와 내용이 다르면 폐기합니다
+        (다음 get_cluster_index에서 재구성).
+        """
         self.current_workflow = workflow
+        if self.cluster_index is not None and not self.cluster_index.is_consistent_with(workflow):
+            self.cluster_index = None
+    
+    def sync_auditor(self) -> IncrementalAuditor:
+        """
+        증분 감사기를 현재 워크플로우와 동기화 (바뀐 노드/엣지만 재검사)
+        
+        턴 시작 시 한 번 호출하며, 이번 턴의 스트리밍 영향 노드 목록도 초기화합니다.
+        """
+        if self.auditor is None:
+            self.auditor = IncrementalAuditor.from_workflow(self.current_workflow)
+        else:
+            self.auditor.sync(self.current_workflow)
+        self.streamed_node_ids = set()
+        return self.auditor
+    
+    def record_streamed_chunk(self, obj: Dict[str, Any]):
+        """스트리밍된 node/edge 청크를 증분 감사기에 반영"""
+        if self.auditor is not None and obj.get("type") in ("node", "edge"):
+            self.streamed_node_ids |= self.auditor.apply_chunk(obj)
+    
+    def get_cluster_index(self) -> WorkflowClusterIndex:
+        """
+        현재 워크플로우에 대한 증분 클러스터 인덱스
+        
+        record_user_change로 전달된 이벤트가 이미 반영되어 있으므로
+        내용 fingerprint가 어긋날 때(이벤트 누락, 다른 워크플로우 등)만 전체 재구성합니다.
+        update_workflow에서 이미 검사한 워크플로우는 다시 순회하지 않습니다 (O(1)).
+        """
+        if self.cluster_index is None or not self.cluster_index.is_consistent_with(self.current_workflow):
+            self.cluster_index = WorkflowClusterIndex.from_workflow(self.current_workflow)
+        return self.cluster_index
     
     def record_user_change(self, change_type: str, data: Dict[str, Any]):
         """
@@ -390,6 +434,9 @@ class CodesignContext:
         })
         # 최근 20개만 유지
         self.change_history = self.change_history[-20:]
+        
+        if self.cluster_index is not None:
+            self.cluster_index.apply_change(change_type, data)
     
     def get_recent_changes_summary(self) -> str:
         """최근 변경 요약 (LLM 컨텍스트용)"""
@@ -653,7 +700,8 @@ def get_or_create_context(session_id: str = None) -> CodesignContext:
 
 def _incremental_audit(
     workflow: Dict[str, Any],
-    affected_node_ids: set
+    affected_node_ids: set,
+    auditor: Optional[IncrementalAuditor] = None
 ) -> List[Dict[str, Any]]:
     """
     변경된 노드 주변만 검사하는 증분 감사 (Incremental Audit)
@@ -664,10 +712,15 @@ def _incremental_audit(
     Args:
         workflow: 전체 워크플로우
         affected_node_ids: 변경된 노드 ID 집합
+        auditor: 동기화된 IncrementalAuditor (있으면 보관된 검사 결과를 조회,
+                 스트리밍 청크까지 반영된 상태 기준)
         
     Returns:
         감지된 이슈 목록
     """
+    if auditor is not None and auditor.exact:
+        return auditor.audit_issues(affected_node_ids)
+    
     issues = []
     nodes = workflow.get("nodes", [])
     edges = workflow.get("edges", [])
@@ -724,17 +777,7 @@ def _incremental_audit(
                 })
     
     # 3. 필수 설정 누락 검사
-    required_configs = {
-        "llm_chat": ["prompt_content"],
-        "api_call": ["url"],
-        "db_query": ["query", "connection_string"],
-        "for_each": ["items_path"],
-        "loop": ["condition"],
-        "parallel_group": ["branches"],
-        "route_condition": ["conditions"],
-        "operator_official": ["strategy"],
-        "dynamic_router": ["prompt_content", "routes"],
-    }
+    required_configs = REQUIRED_NODE_CONFIGS
     
     for node_id in nodes_to_check:
         if node_id not in node_map:
@@ -948,16 +991,18 @@ async def stream_codesign_response(
         JSONL 형식의 응답 청크
     """
     context = get_or_create_context(session_id)
-    context.update_workflow(current_workflow)
     
-    # 변경 이력 기록
+    # 변경 이력 기록 — 이전 턴 워크플로우 기준의 클러스터 인덱스에 이벤트를 한 번씩 적용한 뒤
+    # 새 워크플로우로 교체한다 (update_workflow가 인덱스와 내용을 대조)
     for change in (recent_changes or []):
         context.record_user_change(
             change.get("type", "unknown"),
             change.get("data", {})
         )
+    context.update_workflow(current_workflow)
     
     context.add_message("user", user_request)
+    context.sync_auditor()
     
     # Mock 모드 처리
     if _is_mock_mode():
@@ -1054,7 +1099,7 @@ async def stream_codesign_response(
     # TODO: 대규모 워크플로우의 경우 asyncio를 통한 병렬 감사 고려
     # 현재는 동기 방식으로 실행하되, 변경된 노드 주변만 검사하는 최적화 적용
     
-    affected_node_ids = set()
+    affected_node_ids = set(context.streamed_node_ids)
     for change in (recent_changes or []):
         change_data = change.get("data", {})
         if "id" in change_data:
@@ -1069,7 +1114,8 @@ async def stream_codesign_response(
         # 대규모 워크플로우: 변경된 노드 주변만 검사
         audit_issues = _incremental_audit(
             context.current_workflow, 
-            affected_node_ids
+            affected_node_ids,
+            auditor=context.auditor
         )
         logger.info(f"Incremental audit on {len(affected_node_ids)} affected nodes")
     else:
@@ -1365,6 +1411,9 @@ async def _stream_gemini_codesign(
                     obj["data"] = suggestion_data  # 업데이트된 데이터 반영
                     chunk = json.dumps(obj)  # 재직렬화
                 
+                # 검증을 통과한 node/edge는 증분 감사기에 반영
+                context.record_streamed_chunk(obj)
+                
                 # WebSocket 브로드캐스트
                 if connection_ids:
                     _broadcast_to_connections(connection_ids, obj)
@@ -1564,6 +1613,7 @@ async def _attempt_self_correction(
                             yield json.dumps(success_msg) + "\n"
                             
                             # 수정된 노드 전송
+                            context.record_streamed_chunk(corrected_obj)
                             yield corrected_chunk + "\n"
                             
                             if connection_ids:
@@ -1613,8 +1663,12 @@ async def _stream_bedrock_codesign(
     
     토큰 절약을 위해 워크플로우 요약 사용
     """
-    # 워크플로우 요약 (토큰 절약)
-    workflow_summary = _summarize_workflow(context.current_workflow)
+    # 워크플로우 요약 (토큰 절약) — 큰 워크플로우는 요청 주변 포커스 윈도우만
+    workflow_summary = _summarize_workflow(
+        context.current_workflow,
+        user_request=user_request,
+        cluster_index=context.get_cluster_index()
+    )
     changes_summary = context.get_recent_changes_summary()
     
     # 시스템 프롬프트 구성
@@ -1636,6 +1690,7 @@ async def _stream_bedrock_codesign(
             # 제안인 경우 컨텍스트에 저장
             if obj.get("type") == "suggestion":
                 context.add_suggestion(obj.get("data", {}))
+            context.record_streamed_chunk(obj)
             
             # WebSocket 브로드캐스트
             if connection_ids:
@@ -1783,11 +1838,18 @@ def _broadcast_thinking_to_connections(connection_ids: List[str], thinking_obj:
         logger.warning(f"Failed to broadcast thinking to connections: {e}")
 
 
-def _summarize_workflow(workflow: Dict[str, Any], max_nodes: int = 10) -> str:
+def _summarize_workflow(
+    workflow: Dict[str, Any],
+    max_nodes: int = 10,
+    user_request: Optional[str] = None,
+    cluster_index: Optional[WorkflowClusterIndex] = None
+) -> str:
     """
     워크플로우를 LLM 컨텍스트용으로 요약
     
     노드가 많을 경우 주요 정보만 추출하여 토큰 절약
+    user_request가 있으면 앞쪽 노드 대신 요청 주변 포커스 윈도우를 사용
+    (세션 클러스터 인덱스가 최신이면 인접 맵 재구성 생략)
     프롬프트 인젝션 방어를 위해 노드 라벨을 sanitize
     """
     nodes = workflow.get("nodes", [])
@@ -1810,6 +1872,14 @@ def _summarize_workflow(workflow: Dict[str, Any], max_nodes: int = 10) -> str:
         }
         return json.dumps(safe_workflow, ensure_ascii=False, indent=2)[:2000]
     
+    if user_request is not None:
+        focus = extract_focus_window(
+            workflow, user_request, max_nodes=max_nodes, cluster_index=cluster_index
+        )
+        summary_nodes, summary_edges = focus["focus_nodes"][:max_nodes], focus["focus_edges"]
+    else:
+        summary_nodes, summary_edges = nodes[:max_nodes], edges
+    
     # 노드 요약 (sanitized)
     summary = {
         "node_count": len(nodes),
@@ -1823,17 +1893,17 @@ def _summarize_workflow(workflow: Dict[str, Any], max_nodes: int = 10) -> str:
                     max_length=50
                 )
             }
-            for n in nodes[:max_nodes]
+            for n in summary_nodes
         ],
         "edges": [
             {"source": e.get("source"), "target": e.get("target")}
-            for e in edges[:20]
+            for e in summary_edges[:20]
         ]
     }
     
-    if len(nodes) > max_nodes:
+    if len(nodes) > len(summary_nodes):
         summary["truncated"] = True
-        summary["remaining_nodes"] = len(nodes) - max_nodes
+        summary["remaining_nodes"] = len(nodes) - len(summary_nodes)
     
     return json.dumps(summary, ensure_ascii=False)
 
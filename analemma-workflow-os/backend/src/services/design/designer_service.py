@@ -73,8 +73,9 @@ class PartialJSONParser:
     해결:
     - { } 브라켓 카운팅으로 완전한 JSON 객체 감지
     - 특수 구분자(<<<JSONL_END>>>) 우선 인식
-    - 파싱 실패 시 버퍼 유지 후 재시도
     - [Critical Fix ②] 첫 번째 { 이전의 preamble 텍스트 자동 제거
+    - 스캔 상태(깊이/문자열/이스케이프)를 feed 사이에 유지 → 스트림 전체 O(n)
+      (청크마다 버퍼 전체를 재스캔하지 않으므로 작은 청크가 많아도 선형)
     
     ┌─────────────────────────────────────────────────────────────────────┐
     │ [② Critical Fix] 이중 방어 구조 (Defense in Depth)                    │
@@ -98,143 +99,168 @@ class PartialJSONParser:
     """
     
     def __init__(self, delimiter: str = JSONL_DELIMITER):
-        self.buffer = ""
         self.delimiter = delimiter
         self._pending_objects: List[Dict[str, Any]] = []
         self._preamble_stripped = False  # 프리앰블 제거 완료 플래그
+        
+        # ── Resumable scanner 상태 (feed 사이에 유지) ──
+        # 모든 문자는 한 번만 검사됨: 청크마다 버퍼 전체를 다시 split/카운팅하지 않음
+        self._depth = 0             # 현재 최상위 객체의 { } 깊이 (0 = 객체 밖)
+        self._in_string = False     # JSON 문자열 내부 여부
+        self._escape_next = False   # 문자열 내부에서 직전 문자가 '\'로 끝난 경우
+        self._obj_parts: List[str] = []  # 진행 중인 객체의 이전 청크 조각들
+        self._carry = ""            # 청크 경계에 걸친 구분자 접두사 (최대 len(delimiter)-1자)
+        self._preamble_sample = ""  # 첫 객체 이전 텍스트 (로깅용, 최대 100자)
+        
+        # 객체 내부(문자열 밖)에서 의미 있는 문자: 브라켓, 따옴표, 구분자 첫 글자
+        self._object_re = re.compile(
+            "[{}\"" + re.escape(delimiter[0]) + "]" if delimiter else "[{}\"]"
+        )
     
-    def _strip_preamble(self) -> str:
+    # 문자열 내부에서 의미 있는 문자
+    _STRING_RE = re.compile(r'["\\]')
+    
+    @property
+    def buffer(self) -> str:
+        """아직 객체로 완성되지 않은 텍스트 (디버깅/호환용)"""
+        return "".join(self._obj_parts) + self._carry
+    
+    def _note_preamble(self, text: str) -> None:
         """
-        [Critical Fix ②] 첫 번째 { 이전의 모든 텍스트를 제거
+        [Critical Fix ②] 첫 번째 { 이전의 텍스트는 버림 (Gemini 3 서술형 preamble 등)
         
-        Gemini 3가 가끔 JSON 객체 전에 서술형 텍스트를 출력합니다:
         - "Here is the updated workflow:"
         - "I'll create the following nodes:"
-        - "Based on your request, I've designed..."
-        
-        이 텍스트를 무시하지 않으면 파싱이 실패합니다.
         
-        Returns:
-            제거된 preamble 텍스트 (로깅용)
+        버려진 텍스트는 버퍼에 쌓이지 않으므로 긴 preamble도 메모리를 점유하지 않음.
         """
+        if self._preamble_stripped or not text:
+            return
+        if len(self._preamble_sample) < 100:
+            self._preamble_sample += text[:100 - len(self._preamble_sample)]
+    
+    def _finish_preamble(self) -> None:
         if self._preamble_stripped:
-            return ""
-        
-        # 첫 번째 { 위치 찾기
-        first_brace = self.buffer.find("{")
-        
-        if first_brace == -1:
-            # 아직 JSON 시작이 없음 - 너무 긴 preamble은 truncate
-            if len(self.buffer) > 500:
-                preamble = self.buffer[:500]
-                self.buffer = ""
-                logger.warning(f"Long preamble truncated (no JSON found): {preamble[:100]}...")
-                return preamble
-            return ""
-        
-        if first_brace == 0:
-            # 프리앰블 없음
-            self._preamble_stripped = True
-            return ""
-        
-        # 프리앰블 제거
-        preamble = self.buffer[:first_brace]
-        self.buffer = self.buffer[first_brace:]
+            return
         self._preamble_stripped = True
-        
-        # 프리앰블 로깅 (디버깅용)
-        if preamble.strip():
-            logger.info(f"Stripped preamble before JSON: {preamble.strip()[:100]}...")
-        
-        return preamble
+        if self._preamble_sample.strip():
+            logger.info(f"Stripped preamble before JSON: {self._preamble_sample.strip()[:100]}...")
+        self._preamble_sample = ""
+    
+    def _reset_object(self) -> None:
+        self._depth = 0
+        self._in_string = False
+        self._escape_next = False
+        self._obj_parts = []
     
     def feed(self, chunk: str) -> List[Dict[str, Any]]:
         """
-        새 청크를 버퍼에 추가하고 완전한 JSON 객체들을 반환
+        새 청크를 스캔하고 이번 청크에서 닫힌 JSON 객체들을 반환
         
-        Returns:
-            파싱된 JSON 객체 리스트 (비어있을 수 있음)
-        """
-        self.buffer += chunk
-        results = []
-        
-        # [Critical Fix ②] 첫 번째 JSON 객체 이전의 preamble 제거
-        self._strip_preamble()
-        
-        # 1. 특수 구분자로 분할 시도 (가장 안전)
-        if self.delimiter in self.buffer:
-            parts = self.buffer.split(self.delimiter)
-            # 마지막 부분은 아직 완료되지 않은 것
-            for part in parts[:-1]:
-                parsed = self._try_parse_json(part.strip())
-                if parsed is not None:
-                    results.append(parsed)
-            self.buffer = parts[-1]
-            return results
-        
-        # 2. Bracket Counting으로 완전한 JSON 감지
-        while True:
-            obj, remaining = self._extract_complete_json()
-            if obj is None:
-                break
-            results.append(obj)
-            self.buffer = remaining
+        스캔 위치, 브라켓 깊이, 문자열/이스케이프 상태를 feed 사이에 유지하므로
+        스트림 전체 비용은 입력 길이에 선형입니다.
         
-        return results
-    
-    def _extract_complete_json(self) -> Tuple[Optional[Dict], str]:
-        """
-        버퍼에서 완전한 JSON 객체 하나를 추출
+        - 객체는 닫히는 즉시 파싱/반환 (구분자를 기다리지 않음)
+        - 객체 내부(문자열 밖)에서 구분자를 만나면 미완성 객체를 버리고 재동기화
+        - 브라켓은 맞지만 JSON이 아닌 구간은 버리고 계속 진행
         
         Returns:
-            (parsed_object, remaining_buffer) 또는 (None, original_buffer)
+            파싱된 JSON 객체 리스트 (비어있을 수 있음)
         """
-        buffer = self.buffer.lstrip()
-        if not buffer or not buffer.startswith("{"):
-            # 개행으로 구분된 단순 JSONL 시도
-            if "\n" in self.buffer:
-                line, remaining = self.buffer.split("\n", 1)
-                parsed = self._try_parse_json(line.strip())
-                if parsed is not None:
-                    return parsed, remaining
-            return None, self.buffer
+        results: List[Dict[str, Any]] = []
+        if not chunk:
+            return results
         
-        # Bracket Counting
-        depth = 0
-        in_string = False
-        escape_next = False
+        text = self._carry + chunk if self._carry else chunk
+        self._carry = ""
+        n = len(text)
+        pos = 0
+        obj_start = 0 if self._depth > 0 else -1  # text 내 현재 객체 시작 위치
+        delimiter = self.delimiter
         
-        for i, char in enumerate(buffer):
-            if escape_next:
-                escape_next = False
-                continue
-            
-            if char == "\\":
-                escape_next = True
+        while pos < n:
+            # ── 객체 밖: 다음 '{'까지 건너뜀 (preamble, 구분자, 개행 등) ──
+            if self._depth == 0:
+                brace = text.find("{", pos)
+                if brace == -1:
+                    self._note_preamble(text[pos:])
+                    pos = n
+                    break
+                self._note_preamble(text[pos:brace])
+                self._finish_preamble()
+                self._depth = 1
+                obj_start = brace
+                pos = brace + 1
                 continue
             
-            if char == '"' and not escape_next:
-                in_string = not in_string
+            # ── 문자열 내부: 닫는 따옴표까지 건너뜀 ──
+            if self._in_string:
+                if self._escape_next:
+                    self._escape_next = False
+                    pos += 1
+                    continue
+                m = self._STRING_RE.search(text, pos)
+                if m is None:
+                    pos = n
+                    break
+                i = m.start()
+                if text[i] == "\\":
+                    if i + 1 >= n:
+                        self._escape_next = True  # 이스케이프 대상이 다음 청크에 있음
+                        pos = n
+                        break
+                    pos = i + 2
+                else:
+                    self._in_string = False
+                    pos = i + 1
                 continue
             
-            if in_string:
-                continue
+            # ── 객체 내부, 문자열 밖 ──
+            m = self._object_re.search(text, pos)
+            if m is None:
+                pos = n
+                break
+            i = m.start()
+            char = text[i]
             
             if char == "{":
-                depth += 1
+                self._depth += 1
+                pos = i + 1
             elif char == "}":
-                depth -= 1
-                if depth == 0:
-                    # 완전한 JSON 객체 발견
-                    json_str = buffer[:i + 1]
-                    remaining = buffer[i + 1:].lstrip()
+                self._depth -= 1
+                pos = i + 1
+                if self._depth == 0:
+                    json_str = "".join(self._obj_parts) + text[obj_start:pos]
+                    self._obj_parts = []
+                    obj_start = -1
                     parsed = self._try_parse_json(json_str)
                     if parsed is not None:
-                        return parsed, remaining
-                    # 파싱 실패 시 계속 진행
-                    break
+                        results.append(parsed)
+                    else:
+                        logger.warning(f"Discarding bracket-balanced but invalid JSON: {json_str[:100]}...")
+            elif char == '"':
+                self._in_string = True
+                pos = i + 1
+            elif delimiter and text.startswith(delimiter, i):
+                # [1차 방어] 구분자는 객체 경계 - 닫히지 않은 객체는 버리고 재동기화
+                logger.warning(
+                    f"Delimiter reached inside unterminated JSON object; discarding "
+                    f"{len(''.join(self._obj_parts)) + i - obj_start} chars"
+                )
+                self._reset_object()
+                obj_start = -1
+                pos = i + len(delimiter)
+            elif delimiter and n - i < len(delimiter) and delimiter.startswith(text[i:]):
+                # 구분자 일부가 청크 끝에 걸침 → 다음 청크와 합쳐서 판단
+                self._obj_parts.append(text[obj_start:i])
+                self._carry = text[i:]
+                return results
+            else:
+                pos = i + 1
         
-        return None, self.buffer
+        if self._depth > 0 and obj_start >= 0:
+            self._obj_parts.append(text[obj_start:])
+        return results
     
     def _try_parse_json(self, text: str) -> Optional[Dict[str, Any]]:
         """JSON 파싱 시도"""
@@ -250,11 +276,13 @@ class PartialJSONParser:
         스트림 종료 시 남은 버퍼 처리
         """
         results = []
-        if self.buffer.strip():
-            parsed = self._try_parse_json(self.buffer.strip())
+        remaining = self.buffer.strip()
+        if remaining:
+            parsed = self._try_parse_json(remaining)
             if parsed is not None:
                 results.append(parsed)
-        self.buffer = ""
+        self._reset_object()
+        self._carry = ""
         return results
 
 
@@ -274,19 +302,21 @@ class PartialJSONParser:
 # │      - save_workflow() 시 compute_workflow_clusters() 호출               │
 # │      - 결과를 workflow.metadata._cluster_cache에 저장                      │
 # │                                                                           │
-# │   2. extract_focus_window 시 캐시 참조                                   │
-# │      - 캐시가 있으면 Union-Find 스킵                                        │
-# │      - 캐시가 없으면 실시간 계산 (현재 동작)                                  │
-# │                                                                           │
-# │   3. 캐시 무효화                                                             │
-# │      - 노드/엣지 추가/삭제/수정 시 자동 무효화                               │
-# │      - _cluster_cache = None 설정                                         │
+# │   2. Co-design 세션: WorkflowClusterIndex 증분 갱신                        │
+# │      - CodesignContext.record_user_change 이벤트를 그대로 적용              │
+# │      - 추가/타입 변경은 정확히, 삭제로 인한 분할은 drift로 누적              │
+# │      - drift가 임계값(CLUSTER_DRIFT_THRESHOLD)을 넘을 때만 전체 재계산        │
 # │                                                                           │
-# │ 현재는 실시간 계산 방식을 사용하며, 대부분의 워크플로우(<100노드)에서    │
-# │ 충분히 빠릅니다. 프로덕션 환경에서 성능 이슈 발생 시 위 전략을             │
-# │ 적용하시면 됩니다.                                                          │
+# │   3. extract_focus_window 시 인덱스/캐시 참조                              │
+# │      - 인덱스가 워크플로우와 일치하면 인접 맵 재구성 스킵                    │
+# │      - 없으면 실시간 계산 (기존 동작)                                        │
 # └───────────────────────────────────────────────────────────────────────────┘
 
+# 증분 클러스터 인덱스 설정
+CLUSTER_DRIFT_THRESHOLD = 0.1  # 근사 반영된 변경이 노드 수의 10%를 넘으면 전체 재계산
+CLUSTER_DRIFT_MIN = 8  # 소규모 워크플로우에서 삭제마다 재계산하지 않도록 하는 최소 drift
+_FINGERPRINT_MASK = (1 << 64) - 1
+
 def compute_workflow_clusters(workflow: Dict[str, Any]) -> Dict[str, Any]:
     """
     [① Critical Fix] 워크플로우 클러스터 정보 사전 계산
@@ -391,17 +421,371 @@ def compute_workflow_clusters(workflow: Dict[str, Any]) -> Dict[str, Any]:
     }
 
 
-def get_cached_clusters(workflow: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+def get_cached_clusters(
+    workflow: Dict[str, Any],
+    cluster_index: Optional["WorkflowClusterIndex"] = None
+) -> Optional[Dict[str, Any]]:
     """
-    워크플로우 메타데이터에서 캐시된 클러스터 정보 조회
+    클러스터 정보 조회
+    
+    세션의 증분 인덱스가 워크플로우와 일치하면 그 스냅샷을,
+    아니면 워크플로우 메타데이터에 캐시된 정보를 반환합니다.
     
     Returns:
         캐시된 클러스터 정보 또는 None
     """
+    if cluster_index is not None and cluster_index.is_consistent_with(workflow):
+        return cluster_index.snapshot()
     metadata = workflow.get("metadata", {})
     return metadata.get("_cluster_cache")
 
 
+class WorkflowClusterIndex:
+    """
+    증분 갱신되는 클러스터 / Centrality 인덱스
+    
+    CodesignContext.record_user_change가 기록하는 변경 이벤트를 그대로 적용하여
+    Co-design 턴마다 전체 그래프의 Union-Find와 인접 맵을 다시 만들지 않습니다.
+    
+    정확히 반영되는 변경:
+    - add_node / add_edge: Union-Find union, degree 증가 (O(α(n)))
+    - delete_node / delete_edge: 인접 맵, degree 갱신 (O(degree))
+    - update_node: 노드 타입 변경
+    
+    근사 반영되는 변경 (drift):
+    - 삭제로 인한 클러스터 분할은 Union-Find로 표현할 수 없어 과병합 상태로 남음
+    - group_nodes 등 구조 영향을 알 수 없는 이벤트
+    drift가 max(CLUSTER_DRIFT_MIN, 노드 수 * CLUSTER_DRIFT_THRESHOLD)를 넘으면
+    인덱스가 보유한 노드/엣지로 전체 재계산합니다 (원본 워크플로우 불필요).
+    
+    인접 맵(adjacency)과 centrality(degree)는 drift와 무관하게 항상 정확합니다.
+    """
+    
+    # 구조에 영향이 없는 이벤트
+    _NO_OP_CHANGES = frozenset({"move_node"})
+    
+    def __init__(
+        self,
+        drift_threshold: float = CLUSTER_DRIFT_THRESHOLD,
+        min_drift: int = CLUSTER_DRIFT_MIN
+    ):
+        self.drift_threshold = drift_threshold
+        self.min_drift = min_drift
+        
+        self._node_types: Dict[str, str] = {}  # 삽입 순서 = 워크플로우 노드 순서
+        self._edges: Dict[str, Tuple[str, str]] = {}  # edge key -> (source, target)
+        self._incident: Dict[str, set] = {}  # node_id -> incident edge keys
+        self._pair_counts: Dict[Tuple[str, str], int] = {}  # 병렬 엣지 수 (인접 맵 제거용)
+        self.adjacency: Dict[str, set] = {}  # extract_focus_window와 동일한 형태
+        self._degree: Dict[str, int] = {}
+        
+        self._parent: Dict[str, str] = {}
+        self._rank: Dict[str, int] = {}
+        
+        self._fingerprint = 0  # 노드(id, type) / 엣지(source, target) 토큰 합 — 순서 무관
+        
+        # 내용 검사를 통과한 워크플로우 객체와 그때의 (노드 수, 엣지 수) - 이벤트 적용 시 해제
+        self._verified_workflow: Optional[Dict[str, Any]] = None
+        self._verified_sizes: Optional[Tuple[int, int]] = None
+        
+        self.drift = 0
+        self._snapshot: Optional[Dict[str, Any]] = None
+        self.stats = {"incremental_updates": 0, "drift_events": 0, "rebuilds": 0, "ignored": 0}
+    
+    @classmethod
+    def from_workflow(cls, workflow: Dict[str, Any], **kwargs) -> "WorkflowClusterIndex":
+        index = cls(**kwargs)
+        for node in workflow.get("nodes", []):
+            index._add_node(node.get("id"), node.get("type", "unknown"))
+        for edge in workflow.get("edges", []):
+            endpoints = cls._edge_endpoints(edge)
+            if endpoints is not None:
+                index._add_edge(*endpoints, edge.get("id"))
+        index._verify(workflow)
+        return index
+    
+    @property
+    def node_count(self) -> int:
+        return len(self._node_types)
+    
+    @property
+    def edge_count(self) -> int:
+        return len(self._edges)
+    
+    @staticmethod
+    def _edge_endpoints(edge: Dict[str, Any]) -> Optional[Tuple[str, str]]:
+        """(source, target) - graph_dsl과 같이 끝점이 없는 엣지는 구조에 반영하지 않음 (None)"""
+        source, target = edge.get("source"), edge.get("target")
+        if not source or not target:
+            return None
+        return source, target
+    
+    @staticmethod
+    def _node_token(node_id: Any, node_type: Any) -> int:
+        return hash(("node", node_id, node_type)) & _FINGERPRINT_MASK
+    
+    @staticmethod
+    def _edge_token(source: Any, target: Any) -> int:
+        return hash(("edge", source, target)) & _FINGERPRINT_MASK
+    
+    @classmethod
+    def workflow_fingerprint(cls, workflow: Dict[str, Any]) -> int:
+        """
+        워크플로우 내용 fingerprint (노드 id/type, 엣지 source/target 멀티셋)
+        
+        인덱스가 증분으로 유지하는 값과 같은 규칙이며, 목록 순서와 무관합니다.
+        """
+        return cls._content_fingerprint(workflow.get("nodes", []), cls._valid_edges(workflow))
+    
+    @staticmethod
+    def _content_fingerprint(nodes: List[Dict[str, Any]], edges: List[Tuple[str, str]]) -> int:
+        # _node_token/_edge_token과 같은 값 (하위 비트만 남기므로 합산 후 한 번만 마스킹)
+        total = sum(hash(("node", n.get("id"), n.get("type", "unknown"))) for n in nodes)
+        total += sum(hash(("edge",) + endpoints) for endpoints in edges)
+        return total & _FINGERPRINT_MASK
+    
+    @classmethod
+    def _valid_edges(cls, workflow: Dict[str, Any]) -> List[Tuple[str, str]]:
+        return [e for e in map(cls._edge_endpoints, workflow.get("edges", [])) if e is not None]
+    
+    def is_consistent_with(self, workflow: Dict[str, Any]) -> bool:
+        """
+        정합성 검사 (노드/엣지 수 + 내용 fingerprint)
+        
+        같은 수의 엣지를 다시 연결하거나 다른 워크플로우로 바뀐 경우도 감지하며,
+        어긋나면 호출 측에서 from_workflow로 재구성합니다.
+        
+        내용 검사(O(V+E))는 워크플로우 객체당 한 번만 수행합니다. 검사를 통과한
+        객체는 이후 이벤트가 적용되기 전까지 노드/엣지 목록 길이만 비교(O(1))하므로,
+        Co-design 턴 하나(update_workflow → get_cluster_index → focus window)에서
+        한 번만 순회합니다. 길이가 같은 제자리 변경(재연결, 타입 변경)은
+        apply_change로 알려야 반영됩니다.
+        """
+        nodes = workflow.get("nodes", [])
+        raw_edges = workflow.get("edges", [])
+        if workflow is self._verified_workflow and self._verified_sizes == (len(nodes), len(raw_edges)):
+            return True
+        if len(nodes) != len(self._node_types):
+            return False
+        edges = self._valid_edges(workflow)
+        if len(edges) != len(self._edges) or self._content_fingerprint(nodes, edges) != self._fingerprint:
+            return False
+        self._verify(workflow)
+        return True
+    
+    def _verify(self, workflow: Dict[str, Any]) -> None:
+        self._verified_workflow = workflow
+        self._verified_sizes = (len(workflow.get("nodes", [])), len(workflow.get("edges", [])))
+    
+    def centrality(self, node_id: str) -> int:
+        """연결 수 기반 중요도 (compute_workflow_clusters의 centrality와 동일)"""
+        return self._degree.get(node_id, 0)
+    
+    # ── 변경 이벤트 적용 ─────────────────────────────────────────
+    
+    def apply_change(self, change_type: str, data: Dict[str, Any]) -> None:
+        """record_user_change 이벤트 하나를 적용"""
+        data = data or {}
+        if change_type in self._NO_OP_CHANGES:
+            return
+        
+        applied = True
+        if change_type == "add_node":
+            node_id = data.get("id")
+            applied = node_id is not None and node_id not in self._node_types
+            if applied:
+                self._add_node(node_id, data.get("type", "unknown"))
+        elif change_type == "update_node":
+            node_id = data.get("id")
+            applied = node_id in self._node_types
+            if applied and "type" in data:
+                self._fingerprint = (
+                    self._fingerprint
+                    - self._node_token(node_id, self._node_types[node_id])
+                    + self._node_token(node_id, data["type"])
+                ) & _FINGERPRINT_MASK
+                self._node_types[node_id] = data["type"]
+        elif change_type == "delete_node":
+            applied = self._delete_node(data.get("id"))
+        elif change_type == "add_edge":
+            endpoints = self._edge_endpoints(data)
+            edge_id = data.get("id")
+            applied = endpoints is not None and (edge_id is None or edge_id not in self._edges)
+            if applied:
+                self._add_edge(*endpoints, edge_id)
+        elif change_type == "delete_edge":
+            applied = self._delete_edge(data)
+        else:
+            # group_nodes / ungroup_nodes 등: 구조 영향을 알 수 없음
+            self._verified_workflow = self._verified_sizes = None
+            self._record_drift()
+            return
+        
+        if not applied:
+            self.stats["ignored"] += 1
+            return
+        self.stats["incremental_updates"] += 1
+        self._snapshot = None
+        self._verified_workflow = self._verified_sizes = None
+        if change_type in ("delete_node", "delete_edge"):
+            self._record_drift()
+    
+    def apply_changes(self, changes: List[Dict[str, Any]]) -> None:
+        for change in changes:
+            self.apply_change(change.get("type", "unknown"), change.get("data", {}))
+    
+    def _record_drift(self) -> None:
+        self.drift += 1
+        self.stats["drift_events"] += 1
+        if self.drift > max(self.min_drift, self.drift_threshold * len(self._node_types)):
+            self.rebuild()
+    
+    def rebuild(self) -> None:
+        """보유한 노드/엣지로 Union-Find 전체 재계산 (drift 해소)"""
+        self._parent = {nid: nid for nid in self._node_types}
+        self._rank = {nid: 0 for nid in self._node_types}
+        for source, target in self._edges.values():
+            if source in self._parent and target in self._parent:
+                self._union(source, target)
+        self.drift = 0
+        self._snapshot = None
+        self.stats["rebuilds"] += 1
+    
+    # ── 내부 구조 갱신 ───────────────────────────────────────────
+    
+    def _find(self, x: str) -> str:
+        root = x
+        while self._parent[root] != root:
+            root = self._parent[root]
+        while self._parent[x] != root:  # Path compression
+            self._parent[x], x = root, self._parent[x]
+        return root
+    
+    def _union(self, x: str, y: str) -> None:
+        px, py = self._find(x), self._find(y)
+        if px == py:
+            return
+        # Union by rank
+        if self._rank[px] < self._rank[py]:
+            px, py = py, px
+        self._parent[py] = px
+        if self._rank[px] == self._rank[py]:
+            self._rank[px] += 1
+    
+    def _add_node(self, node_id: str, node_type: str) -> None:
+        self._node_types[node_id] = node_type
+        self._fingerprint = (self._fingerprint + self._node_token(node_id, node_type)) & _FINGERPRINT_MASK
+        self._parent[node_id] = node_id
+        self._rank[node_id] = 0
+        # 노드보다 먼저 추가된 엣지 연결
+        for key in self._incident.get(node_id, ()):
+            source, target = self._edges[key]
+            other = target if source == node_id else source
+            if other in self._node_types:
+                self._union(node_id, other)
+    
+    def _delete_node(self, node_id: Optional[str]) -> bool:
+        if node_id not in self._node_types:
+            return False
+        # 연결된 엣지도 함께 제거 (캔버스의 노드 삭제와 동일)
+        for key in list(self._incident.get(node_id, ())):
+            self._remove_edge(key)
+        self._fingerprint = (
+            self._fingerprint - self._node_token(node_id, self._node_types.pop(node_id))
+        ) & _FINGERPRINT_MASK
+        # Union-Find의 parent 항목은 다른 노드의 경로일 수 있으므로 rebuild까지 유지
+        self.adjacency.pop(node_id, None)
+        self._incident.pop(node_id, None)
+        self._degree.pop(node_id, None)
+        return True
+    
+    def _add_edge(self, source: str, target: str, edge_id: Optional[str]) -> None:
+        key = edge_id if edge_id is not None else f"{source}->{target}"
+        suffix = 1
+        while key in self._edges:
+            key = f"{edge_id or f'{source}->{target}'}#{suffix}"
+            suffix += 1
+        self._edges[key] = (source, target)
+        self._fingerprint = (self._fingerprint + self._edge_token(source, target)) & _FINGERPRINT_MASK
+        
+        pair = (source, target) if source <= target else (target, source)
+        self._pair_counts[pair] = self._pair_counts.get(pair, 0) + 1
+        self.adjacency.setdefault(source, set()).add(target)
+        self.adjacency.setdefault(target, set()).add(source)
+        for endpoint in (source, target):
+            self._incident.setdefault(endpoint, set()).add(key)
+            self._degree[endpoint] = self._degree.get(endpoint, 0) + 1
+        
+        if source in self._node_types and target in self._node_types:
+            self._union(source, target)
+    
+    def _delete_edge(self, data: Dict[str, Any]) -> bool:
+        key = data.get("id")
+        if key not in self._edges:
+            # id 없이 source/target만 전달된 경우
+            source, target = data.get("source"), data.get("target")
+            key = next(
+                (k for k in self._incident.get(source, ()) if self._edges[k] == (source, target)),
+                None
+            )
+        if key is None:
+            return False
+        self._remove_edge(key)
+        return True
+    
+    def _remove_edge(self, key: str) -> None:
+        source, target = self._edges.pop(key)
+        self._fingerprint = (self._fingerprint - self._edge_token(source, target)) & _FINGERPRINT_MASK
+        for endpoint in (source, target):
+            self._incident[endpoint].discard(key)
+            self._degree[endpoint] -= 1
+        
+        pair = (source, target) if source <= target else (target, source)
+        self._pair_counts[pair] -= 1
+        if self._pair_counts[pair] == 0:
+            del self._pair_counts[pair]
+            self.adjacency[source].discard(target)
+            self.adjacency[target].discard(source)
+    
+    # ── 조회 ────────────────────────────────────────────────────
+    
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        compute_workflow_clusters()와 같은 형태의 결과 (변경 전까지 캐싱)
+        
+        drift가 0이면 클러스터 구성원은 전체 재계산 결과와 동일합니다.
+        """
+        if self._snapshot is not None:
+            return self._snapshot
+        
+        from datetime import datetime
+        
+        clusters_map: Dict[str, List[str]] = {}
+        for nid in self._node_types:
+            clusters_map.setdefault(self._find(nid), []).append(nid)
+        
+        clusters = []
+        node_to_cluster = {}
+        for idx, (root, members) in enumerate(clusters_map.items()):
+            clusters.append({
+                "root": root,
+                "members": members,
+                "types": list(set(self._node_types[m] for m in members)),
+                "size": len(members)
+            })
+            for m in members:
+                node_to_cluster[m] = idx
+        
+        self._snapshot = {
+            "clusters": clusters,
+            "node_to_cluster": node_to_cluster,
+            "centrality": {nid: self._degree.get(nid, 0) for nid in self._node_types},
+            "computed_at": datetime.utcnow().isoformat() + "Z",
+            "drift": self.drift
+        }
+        return self._snapshot
+
+
 # 노드 타입별 의미 있는 그룹명 매핑
 NODE_TYPE_GROUP_NAMES = {
     "aiModel": "AI 모델 호출",
@@ -441,8 +825,8 @@ def _group_omitted_nodes(
     
     Args:
         omitted_nodes: 생략된 노드 리스트
-        edges: 전체 엣지 리스트
-        adjacency: 인접 노드 맵
+        edges: 전체 엣지 리스트 (하위 호환용 - 연결 정보는 adjacency 사용)
+        adjacency: 인접 노드 맵 (extract_focus_window에서 구축)
     
     Returns:
         [
@@ -462,31 +846,27 @@ def _group_omitted_nodes(
             type_groups[node_type] = []
         type_groups[node_type].append(node)
     
-    # 2. 연결 기반 파이프라인 감지 (Union-Find)
+    # 2. 연결 기반 파이프라인 감지
+    # 생략된 노드끼리 연결된 경우 같은 그룹으로 - 인접 맵 위에서 BFS로 연결 요소 라벨링
+    # (extract_focus_window가 이미 구축한 adjacency를 재사용하여 엣지 전체 재순회 생략)
     omitted_ids = {n.get("id") for n in omitted_nodes}
-    parent = {nid: nid for nid in omitted_ids}
-    
-    def find(x):
-        if parent[x] != x:
-            parent[x] = find(parent[x])
-        return parent[x]
-    
-    def union(x, y):
-        px, py = find(x), find(y)
-        if px != py:
-            parent[px] = py
-    
-    # 생략된 노드끼리 연결된 경우 같은 그룹으로
-    for edge in edges:
-        src, tgt = edge.get("source", ""), edge.get("target", "")
-        if src in omitted_ids and tgt in omitted_ids:
-            union(src, tgt)
+    component_of: Dict[str, str] = {}
+    for nid in omitted_ids:
+        if nid in component_of:
+            continue
+        component_of[nid] = nid
+        stack = [nid]
+        while stack:
+            current = stack.pop()
+            for neighbor in adjacency.get(current, ()):
+                if neighbor in omitted_ids and neighbor not in component_of:
+                    component_of[neighbor] = nid
+                    stack.append(neighbor)
     
     # 파이프라인(연결된 노드 그룹) 구성
     pipeline_groups: Dict[str, List[Dict]] = {}
     for node in omitted_nodes:
-        node_id = node.get("id", "")
-        root = find(node_id)
+        root = component_of.get(node.get("id"))
         if root not in pipeline_groups:
             pipeline_groups[root] = []
         pipeline_groups[root].append(node)
@@ -640,11 +1020,27 @@ def _filter_by_centrality(
     return filtered
 
 
+def _build_adjacency(edges: List[Dict[str, Any]]) -> Dict[str, set]:
+    """엣지 목록으로부터 무방향 인접 맵 구축 (node_id -> set of connected node_ids)"""
+    adjacency: Dict[str, set] = {}
+    for edge in edges:
+        src = edge.get("source", "")
+        tgt = edge.get("target", "")
+        if src not in adjacency:
+            adjacency[src] = set()
+        if tgt not in adjacency:
+            adjacency[tgt] = set()
+        adjacency[src].add(tgt)
+        adjacency[tgt].add(src)
+    return adjacency
+
+
 def extract_focus_window(
     workflow: Dict[str, Any],
     user_request: str,
     max_nodes: int = FOCUS_WINDOW_MAX_NODES,
-    adjacent_depth: int = FOCUS_WINDOW_ADJACENT_DEPTH
+    adjacent_depth: int = FOCUS_WINDOW_ADJACENT_DEPTH,
+    cluster_index: Optional[WorkflowClusterIndex] = None
 ) -> Dict[str, Any]:
     """
     대규모 워크플로우에서 '포커스 윈도우'만 추출
@@ -664,6 +1060,7 @@ def extract_focus_window(
         user_request: 사용자 요청 텍스트
         max_nodes: 최대 포함 노드 수
         adjacent_depth: 인접 노드 탐색 깊이
+        cluster_index: 세션의 증분 인덱스 (워크플로우와 일치하면 인접 맵 재구성 생략)
     
     Returns:
         {
@@ -727,17 +1124,11 @@ def extract_focus_window(
                 for node in nodes[:max_nodes // 2]:
                     mentioned_node_ids.add(node.get("id"))
     
-    # 2. 인접 노드 그래프 구축
-    adjacency = {}  # node_id -> set of connected node_ids
-    for edge in edges:
-        src = edge.get("source", "")
-        tgt = edge.get("target", "")
-        if src not in adjacency:
-            adjacency[src] = set()
-        if tgt not in adjacency:
-            adjacency[tgt] = set()
-        adjacency[src].add(tgt)
-        adjacency[tgt].add(src)
+    # 2. 인접 노드 그래프 구축 (증분 인덱스가 최신이면 재사용)
+    if cluster_index is not None and cluster_index.is_consistent_with(workflow):
+        adjacency = cluster_index.adjacency
+    else:
+        adjacency = _build_adjacency(edges)
     
     # 3. BFS로 인접 노드 탐색
     focus_node_ids = set(mentioned_node_ids)
@@ -1149,7 +1540,8 @@ def stream_workflow_jsonl(
     user_request: str,
     current_workflow: Optional[Dict[str, Any]] = None,
     canvas_mode: str = "agentic-designer",
-    enable_thinking: bool = True
+    enable_thinking: bool = True,
+    cluster_index: Optional[WorkflowClusterIndex] = None
 ) -> Iterator[str]:
     """
     워크플로우 생성 JSONL 스트리밍
@@ -1164,6 +1556,7 @@ def stream_workflow_jsonl(
         current_workflow: 현재 워크플로우 상태
         canvas_mode: Canvas 모드
         enable_thinking: Thinking Mode 활성화 여부
+        cluster_index: Co-design 세션의 증분 클러스터 인덱스 (CodesignContext.get_cluster_index)
         
     Yields:
         JSONL 형식의 응답 문자열
@@ -1199,7 +1592,8 @@ def stream_workflow_jsonl(
         workflow=workflow_context,
         user_request=user_request,
         max_nodes=FOCUS_WINDOW_MAX_NODES,
-        adjacent_depth=FOCUS_WINDOW_ADJACENT_DEPTH
+        adjacent_depth=FOCUS_WINDOW_ADJACENT_DEPTH,
+        cluster_index=cluster_index
     )
     
     # 프롬프트에 포함할 워크플로우 정보 구성
@@ -0,0 +1,613 @@
+"""
+Incremental Audit Engine: 변경 단위(diff) 기반 워크플로우 감사
+
+Co-design 스트리밍 중 각 청크는 노드 또는 엣지 하나만 추가/수정하지만,
+기존 _incremental_audit / validate_workflow는 매번 그래프 전체를 다시 순회합니다.
+
+IncrementalAuditor는 노드/엣지별 검증 결과와 그래프 불변식을 보관하고
+변경된 노드/엣지와 그 이웃만 다시 검사합니다.
+
+보관하는 상태:
+    - 노드별: position 검증, 필수 설정 누락, degree / out-degree, self-loop 수
+    - 엣지별: 존재하지 않는 source/target 참조
+    - 그래프 불변식: 고아 노드, 병렬 분기 수, 순환 (graph_dsl 기준)
+
+정합성:
+    validation_errors()는 같은 워크플로우에 대한 validate_workflow()와 동일한 목록을,
+    audit_issues(ids)는 _incremental_audit(workflow, ids)와 동일한 이슈 집합을 반환합니다.
+    ID가 없거나 중복된 노드가 있으면 증분 표현이 불가능하므로 exact=False가 되고
+    호출 측은 전체 검사 경로를 사용합니다. (ID 없는/중복 ID 엣지는 내부 키로 구분)
+
+Usage:
+    auditor = IncrementalAuditor.from_workflow(workflow)
+    auditor.apply_chunk({"op": "add", "type": "node", "data": {...}})  # 스트리밍 청크 (add/update/remove)
+    auditor.sync(updated_workflow)                         # 또는 워크플로우 diff
+    issues = auditor.audit_issues({"node_1"})
+    errors = auditor.validation_errors()
+"""
+
+import logging
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from src.common.graph_dsl import (
+    INTENTIONAL_LOOP_NODE_TYPES,
+    PYDANTIC_AVAILABLE,
+    _detect_cycles_with_intent,
+)
+
+logger = logging.getLogger(__name__)
+
+# 노드 타입별 필수 설정 (codesign_assistant._incremental_audit 기준)
+REQUIRED_NODE_CONFIGS: Dict[str, List[str]] = {
+    "llm_chat": ["prompt_content"],
+    "api_call": ["url"],
+    "db_query": ["query", "connection_string"],
+    "for_each": ["items_path"],
+    "loop": ["condition"],
+    "parallel_group": ["branches"],
+    "route_condition": ["conditions"],
+    "operator_official": ["strategy"],
+    "dynamic_router": ["prompt_content", "routes"],
+}
+
+# 입력 엣지가 없어도 되는 노드 타입 (고아 경고 제외)
+ORPHAN_EXEMPT_TYPES = ("start", "trigger")
+
+# sync에서 이보다 많은 엣지가 바뀌면 엣지별 순환 DFS 대신 지연 전체 검사
+BULK_CYCLE_RECHECK_EDGES = 32
+
+# graph_dsl._count_parallel_branches 기준 병렬 분기 노드 타입
+PARALLEL_BRANCH_NODE_TYPES = ("parallel", "route_draft_quality", "conditional")
+
+
+def _missing_configs(node: Dict[str, Any]) -> List[str]:
+    required = REQUIRED_NODE_CONFIGS.get(node.get("type"))
+    if not required:
+        return []
+    config = node.get("config", {}) or node.get("data", {}).get("config", {})
+    return [field for field in required if not config.get(field)]
+
+
+def _position_issue(node: Dict[str, Any]) -> Optional[str]:
+    if not PYDANTIC_AVAILABLE:
+        return None
+    if "position" not in node:
+        return "missing"
+    if not isinstance(node["position"], dict):
+        return "not_object"
+    return None
+
+
+class IncrementalAuditor:
+    """
+    노드/엣지 단위 검증 결과와 그래프 불변식을 유지하는 증분 감사 엔진
+
+    변경 1건당 비용은 O(변경된 노드의 degree)이며, 순환 검사는 새 엣지가 순환을 닫을 수
+    있을 때(source에 입력, target에 출력 엣지가 모두 있을 때)만 target에서 DFS합니다.
+    삭제/타입 변경 후에는 순환 정보를 다음 조회 시 한 번 전체 재계산합니다.
+    """
+
+    def __init__(self):
+        self.exact = True
+        self._has_nodes_key = True
+        self._has_edges_key = True
+
+        self._nodes: Dict[str, Dict[str, Any]] = {}  # 삽입 순서 = 워크플로우 순서
+        self._edges: Dict[str, Dict[str, Any]] = {}  # edge key -> edge
+        self._edge_ends: Dict[str, Tuple[Any, Any]] = {}
+        self._dup_edge_keys: Set[str] = set()  # 중복 ID 엣지의 두 번째 이후 항목
+        self._node_pos: Dict[str, int] = {}
+        self._edge_pos: Dict[str, int] = {}
+        self._positions_dirty = False
+
+        # 노드별 검증 결과 (이슈가 있는 노드만 보관)
+        self._position_issues: Dict[str, str] = {}
+        self._missing: Dict[str, List[str]] = {}
+
+        # 엣지 인덱스 (존재하지 않는 노드 ID도 포함 - 연결 여부 판정용)
+        self._incident: Dict[Any, Set[str]] = {}
+        self._degree: Dict[Any, int] = {}
+        self._out_degree: Dict[Any, int] = {}
+        self._in_known: Dict[str, int] = {}
+        self._successors: Dict[str, Dict[str, int]] = {}
+        self._self_loops: Dict[Any, int] = {}
+        self._pair_counts: Dict[Tuple[Any, Any], int] = {}
+        self._dangling: Dict[str, Tuple[bool, bool]] = {}  # 이슈가 있는 엣지만
+
+        self._intentional_cycles: List[Dict[str, Any]] = []
+        self._accidental_cycles: List[List[str]] = []
+        self._cycles_dirty = False
+
+        self.stats = {"node_updates": 0, "edge_updates": 0, "cycle_searches": 0, "cycle_rebuilds": 0}
+
+    @classmethod
+    def from_workflow(cls, workflow: Dict[str, Any]) -> "IncrementalAuditor":
+        auditor = cls()
+        auditor.sync(workflow)
+        return auditor
+
+    @property
+    def node_count(self) -> int:
+        return len(self._nodes)
+
+    @property
+    def edge_count(self) -> int:
+        return len(self._edges)
+
+    def to_workflow(self) -> Dict[str, Any]:
+        return {"nodes": list(self._nodes.values()), "edges": list(self._edges.values())}
+
+    # ── 변경 적용 ───────────────────────────────────────────────
+
+    def sync(self, workflow: Dict[str, Any]) -> Dict[str, int]:
+        """
+        워크플로우와의 diff를 계산하여 바뀐 노드/엣지만 다시 검사
+
+        Returns:
+            {"nodes_changed": int, "edges_changed": int, "removed": int}
+        """
+        self._has_nodes_key = "nodes" in workflow
+        self._has_edges_key = "edges" in workflow
+        nodes = workflow.get("nodes", [])
+        edges = workflow.get("edges", [])
+
+        node_ids = [n.get("id") for n in nodes]
+        edge_keys, dup_edge_keys = self._edge_keys(edges)
+        if not all(node_ids) or len(set(node_ids)) != len(node_ids) \
+                or len(set(edge_keys)) != len(edge_keys):
+            self.exact = False
+            return {"nodes_changed": 0, "edges_changed": 0, "removed": 0}
+        self.exact = True
+        self._dup_edge_keys = dup_edge_keys
+
+        removed = 0
+        new_edge_keys = set(edge_keys)
+        for key in [k for k in self._edges if k not in new_edge_keys]:
+            self.remove_edge(key)
+            removed += 1
+        new_node_ids = set(node_ids)
+        for node_id in [n for n in self._nodes if n not in new_node_ids]:
+            self.remove_node(node_id)
+            removed += 1
+
+        nodes_changed = 0
+        for node in nodes:
+            current = self._nodes.get(node["id"])
+            if current is not node and current != node:
+                self.upsert_node(node)
+                nodes_changed += 1
+        changed_edges = [
+            (key, edge) for key, edge in zip(edge_keys, edges)
+            if self._edges.get(key) is not edge and self._edges.get(key) != edge
+        ]
+        if len(changed_edges) > BULK_CYCLE_RECHECK_EDGES:
+            # 대량 변경(초기 구축 등): 엣지마다 DFS 대신 다음 조회 시 한 번 전체 검사
+            self._cycles_dirty = True
+        for key, edge in changed_edges:
+            self.upsert_edge(edge, key)
+        edges_changed = len(changed_edges)
+
+        # 순서가 달라졌으면 (중간 삽입 등) 워크플로우 순서로 재정렬
+        if list(self._nodes) != node_ids:
+            self._nodes = {nid: self._nodes[nid] for nid in node_ids}
+            self._positions_dirty = True
+        if list(self._edges) != edge_keys:
+            self._edges = {key: self._edges[key] for key in edge_keys}
+            self._positions_dirty = True
+
+        return {"nodes_changed": nodes_changed, "edges_changed": edges_changed, "removed": removed}
+
+    @staticmethod
+    def _edge_keys(edges: List[Dict[str, Any]]) -> Tuple[List[str], Set[str]]:
+        """엣지별 내부 키 (ID 없음 → source->target#n, 중복 ID → id#dup<n>)"""
+        keys: List[str] = []
+        dup_keys: Set[str] = set()
+        seen_ids: Dict[str, int] = {}
+        seen_pairs: Dict[Tuple[Any, Any], int] = {}
+        for edge in edges:
+            edge_id = edge.get("id")
+            if edge_id:
+                n = seen_ids.get(edge_id, 0)
+                seen_ids[edge_id] = n + 1
+                key = edge_id if n == 0 else f"{edge_id}#dup{n}"
+                if n:
+                    dup_keys.add(key)
+            else:
+                pair = (edge.get("source"), edge.get("target"))
+                n = seen_pairs.get(pair, 0)
+                seen_pairs[pair] = n + 1
+                key = f"{pair[0]}->{pair[1]}#{n}"
+            keys.append(key)
+        return keys, dup_keys
+
+    def apply_chunk(self, obj: Dict[str, Any]) -> Set[Any]:
+        """
+        스트리밍 청크 적용
+
+        지원 형식 (prompts.py 명령 규격):
+            {"type": "node"|"edge", "data": {...}}                   # op 없음 = add
+            {"op": "add", "type": "node"|"edge", "data": {...}}
+            {"op": "update", "type": "node"|"edge", "id": ..., "changes": {...}}
+            {"op": "remove", "type": "node"|"edge", "id": ...}
+
+        대상을 찾을 수 없거나 해석할 수 없는 명령은 증분 상태가 실제 그래프와
+        어긋날 수 있으므로 exact=False로 전환합니다 (다음 sync까지 전체 검사 경로).
+
+        Returns:
+            영향받은 노드 ID 집합 (audit_issues에 전달)
+        """
+        op = obj.get("op", "add")
+        chunk_type = obj.get("type")
+        if chunk_type not in ("node", "edge"):
+            return set()
+        if op == "add":
+            return self._apply_add(chunk_type, obj.get("data") or {})
+        if op == "update":
+            return self._apply_update(chunk_type, obj.get("id"), obj.get("changes") or obj.get("data") or {})
+        if op == "remove":
+            return self._apply_remove(chunk_type, obj.get("id"))
+        return self._mark_inexact(f"unknown op {op!r}")
+
+    def _apply_add(self, chunk_type: str, data: Dict[str, Any]) -> Set[Any]:
+        if chunk_type == "node":
+            if not data.get("id"):
+                return self._mark_inexact("node without id")
+            self.upsert_node(data)
+            return {data["id"]}
+        key = data.get("id") or f"{data.get('source')}->{data.get('target')}#{len(self._edge_pos)}"
+        self.upsert_edge(data, key)
+        return {data.get("source"), data.get("target")} - {None}
+
+    def _apply_update(self, chunk_type: str, target_id: Any, changes: Dict[str, Any]) -> Set[Any]:
+        if chunk_type == "node":
+            current = self._nodes.get(target_id)
+            if current is None:
+                return self._mark_inexact(f"update of unknown node {target_id!r}")
+            self.upsert_node({**current, **changes, "id": target_id})
+            return {target_id}
+        current = self._edges.get(target_id)
+        if current is None:
+            return self._mark_inexact(f"update of unknown edge {target_id!r}")
+        updated = {**current, **changes}
+        self.upsert_edge(updated, target_id)
+        return {current.get("source"), current.get("target"),
+                updated.get("source"), updated.get("target")} - {None}
+
+    def _apply_remove(self, chunk_type: str, target_id: Any) -> Set[Any]:
+        if chunk_type == "node":
+            if target_id not in self._nodes:
+                return self._mark_inexact(f"remove of unknown node {target_id!r}")
+            neighbors = {end for key in self._incident.get(target_id, ()) for end in self._edge_ends[key]}
+            self.remove_node(target_id)
+            return neighbors - {target_id, None}
+        if target_id not in self._edges:
+            return self._mark_inexact(f"remove of unknown edge {target_id!r}")
+        ends = set(self._edge_ends[target_id])
+        self.remove_edge(target_id)
+        return ends - {None}
+
+    def _mark_inexact(self, reason: str) -> Set[Any]:
+        logger.info(f"[IncrementalAudit] Chunk not applicable ({reason}); falling back to full audit")
+        self.exact = False
+        return set()
+
+    def upsert_node(self, node: Dict[str, Any]) -> None:
+        node_id = node["id"]
+        previous = self._nodes.get(node_id)
+        self._nodes[node_id] = node
+        if previous is None:
+            self._node_pos[node_id] = len(self._node_pos)
+            self._refresh_incident_edges(node_id)
+        elif previous.get("type") != node.get("type") and self._has_cycles():
+            self._cycles_dirty = True  # 순환의 의도/실수 분류가 바뀔 수 있음
+
+        issue = _position_issue(node)
+        if issue:
+            self._position_issues[node_id] = issue
+        else:
+            self._position_issues.pop(node_id, None)
+        missing = _missing_configs(node)
+        if missing:
+            self._missing[node_id] = missing
+        else:
+            self._missing.pop(node_id, None)
+        self.stats["node_updates"] += 1
+
+    def remove_node(self, node_id: str) -> None:
+        if self._nodes.pop(node_id, None) is None:
+            return
+        self._position_issues.pop(node_id, None)
+        self._missing.pop(node_id, None)
+        self._successors.pop(node_id, None)
+        self._in_known.pop(node_id, None)
+        self._refresh_incident_edges(node_id)
+        self._positions_dirty = True
+        if self._has_cycles():
+            self._cycles_dirty = True
+
+    def upsert_edge(self, edge: Dict[str, Any], key: Optional[str] = None) -> None:
+        key = key or edge["id"]
+        if key in self._edges:
+            if self._edge_ends[key] == (edge.get("source"), edge.get("target")):
+                self._edges[key] = edge  # 연결 변화 없음 (라벨 등만 변경)
+                return
+            self._unlink_edge(key)
+        else:
+            self._edge_pos[key] = len(self._edge_pos)
+        self._edges[key] = edge
+        self._link_edge(key, edge.get("source"), edge.get("target"))
+        self.stats["edge_updates"] += 1
+
+    def remove_edge(self, key: str) -> None:
+        if key not in self._edges:
+            return
+        self._unlink_edge(key)
+        del self._edges[key]
+        self._positions_dirty = True
+
+    def _link_edge(self, key: str, source: Any, target: Any) -> None:
+        self._edge_ends[key] = (source, target)
+        for endpoint in (source, target):
+            self._incident.setdefault(endpoint, set()).add(key)
+            self._degree[endpoint] = self._degree.get(endpoint, 0) + 1
+        if source:
+            self._out_degree[source] = self._out_degree.get(source, 0) + 1
+        if source == target:
+            self._self_loops[source] = self._self_loops.get(source, 0) + 1
+        pair = (source, target)
+        self._pair_counts[pair] = self._pair_counts.get(pair, 0) + 1
+        self._refresh_dangling(key)
+
+        if source in self._nodes and target in self._nodes:
+            successors = self._successors.setdefault(source, {})
+            successors[target] = successors.get(target, 0) + 1
+            self._in_known[target] = self._in_known.get(target, 0) + 1
+            self._check_new_cycle(source, target)
+
+    def _unlink_edge(self, key: str) -> None:
+        source, target = self._edge_ends.pop(key)
+        for endpoint in (source, target):
+            self._incident[endpoint].discard(key)
+            self._degree[endpoint] -= 1
+        if source:
+            self._out_degree[source] -= 1
+        if source == target:
+            self._self_loops[source] -= 1
+        self._pair_counts[(source, target)] -= 1
+        self._dangling.pop(key, None)
+
+        successors = self._successors.get(source)
+        if successors and target in successors:
+            successors[target] -= 1
+            if not successors[target]:
+                del successors[target]
+            self._in_known[target] -= 1
+            if self._has_cycles():
+                self._cycles_dirty = True  # 기록된 순환이 끊어졌을 수 있음
+
+    def _refresh_incident_edges(self, node_id: str) -> None:
+        """노드 추가/삭제 시 해당 노드를 참조하는 엣지만 다시 검사"""
+        present = node_id in self._nodes
+        for key in self._incident.get(node_id, ()):
+            self._refresh_dangling(key)
+            source, target = self._edge_ends[key]
+            other = target if source == node_id else source
+            if present and other in self._nodes:
+                # 먼저 도착한 엣지의 양 끝이 모두 존재 → 실행 그래프에 편입
+                successors = self._successors.setdefault(source, {})
+                successors[target] = successors.get(target, 0) + 1
+                self._in_known[target] = self._in_known.get(target, 0) + 1
+                self._check_new_cycle(source, target)
+            elif not present and other in self._nodes:
+                # 상대 노드의 그래프 정보에서 제거
+                if other == source:
+                    successors = self._successors.get(source, {})
+                    if successors.get(target):
+                        successors[target] -= 1
+                        if not successors[target]:
+                            del successors[target]
+                else:
+                    self._in_known[target] = self._in_known.get(target, 1) - 1
+
+    def _refresh_dangling(self, key: str) -> None:
+        source, target = self._edge_ends[key]
+        missing = (bool(source) and source not in self._nodes,
+                   bool(target) and target not in self._nodes)
+        if any(missing):
+            self._dangling[key] = missing
+        else:
+            self._dangling.pop(key, None)
+
+    # ── 순환 ────────────────────────────────────────────────────
+
+    def _has_cycles(self) -> bool:
+        return self._cycles_dirty or bool(self._intentional_cycles or self._accidental_cycles)
+
+    def _check_new_cycle(self, source: str, target: str) -> None:
+        """source→target 엣지가 순환을 닫는지 target에서 DFS (source 입력 / target 출력이 없으면 생략)"""
+        if self._cycles_dirty:
+            return
+        if source != target and (not self._in_known.get(source) or not self._successors.get(target)):
+            return
+        self.stats["cycle_searches"] += 1
+
+        path = self._find_path(target, source)
+        if path is None:
+            return
+        cycle = [source] + path
+        control_nodes = [nid for nid in cycle[:-1]
+                         if self._nodes[nid].get("type", "operator") in INTENTIONAL_LOOP_NODE_TYPES]
+        if control_nodes:
+            self._intentional_cycles.append({"path": cycle, "control_node": control_nodes[0]})
+        else:
+            self._accidental_cycles.append(cycle)
+
+    def _find_path(self, start: str, goal: str) -> Optional[List[str]]:
+        parent: Dict[str, Optional[str]] = {start: None}
+        stack = [start]
+        while stack:
+            current = stack.pop()
+            if current == goal:
+                path = [current]
+                while parent[path[-1]] is not None:
+                    path.append(parent[path[-1]])
+                return path[::-1]
+            for neighbor in self._successors.get(current, ()):
+                if neighbor not in parent:
+                    parent[neighbor] = current
+                    stack.append(neighbor)
+        return None
+
+    def cycles(self) -> Tuple[List[Dict[str, Any]], List[List[str]]]:
+        """(intentional_cycles, accidental_cycles) - graph_dsl._detect_cycles_with_intent 형식"""
+        if self._cycles_dirty:
+            workflow = self.to_workflow()
+            self._intentional_cycles, self._accidental_cycles = _detect_cycles_with_intent(
+                workflow["nodes"], workflow["edges"], INTENTIONAL_LOOP_NODE_TYPES
+            )
+            self._cycles_dirty = False
+            self.stats["cycle_rebuilds"] += 1
+        return self._intentional_cycles, self._accidental_cycles
+
+    # ── 조회 ────────────────────────────────────────────────────
+
+    def _ensure_positions(self) -> None:
+        if self._positions_dirty:
+            self._node_pos = {nid: i for i, nid in enumerate(self._nodes)}
+            self._edge_pos = {key: i for i, key in enumerate(self._edges)}
+            self._positions_dirty = False
+
+    def orphan_nodes(self) -> List[str]:
+        """graph_dsl._find_orphan_nodes와 동일 (노드가 1개 이하면 빈 목록)"""
+        if len(self._nodes) <= 1:
+            return []
+        return [nid for nid in self._nodes if not self._degree.get(nid)]
+
+    def parallel_branches(self) -> Dict[str, int]:
+        """graph_dsl._count_parallel_branches와 동일"""
+        return {
+            nid: self._out_degree.get(nid, 0)
+            for nid, node in self._nodes.items()
+            if node.get("type") in PARALLEL_BRANCH_NODE_TYPES
+        }
+
+    def graph_invariants(self) -> Dict[str, Any]:
+        intentional, accidental = self.cycles()
+        branches = self.parallel_branches()
+        return {
+            "orphans": self.orphan_nodes(),
+            "parallel_branches": branches,
+            "max_parallel_branches": max(branches.values()) if branches else 0,
+            "intentional_cycles": intentional,
+            "accidental_cycles": accidental,
+        }
+
+    def validation_errors(self) -> List[Dict[str, Any]]:
+        """validate_workflow(self.to_workflow())와 동일한 결과 (이슈가 있는 항목만 순회)"""
+        self._ensure_positions()
+        errors: List[Dict[str, Any]] = []
+
+        for node_id in sorted(self._position_issues, key=self._node_pos.__getitem__):
+            if self._position_issues[node_id] == "missing":
+                message = f"노드 #{self._node_pos[node_id]}에 position 필드가 없습니다."
+            else:
+                message = f"노드 '{node_id}'의 position이 객체가 아닙니다."
+            errors.append({"level": "error", "message": message, "node_id": node_id})
+
+        if not self._has_nodes_key:
+            errors.append({"level": "error", "message": "워크플로우에 'nodes' 필드가 없습니다.", "node_id": None})
+            return errors
+        if not self._has_edges_key:
+            errors.append({"level": "error", "message": "워크플로우에 'edges' 필드가 없습니다.", "node_id": None})
+            return errors
+
+        for key in sorted(self._dangling, key=self._edge_pos.__getitem__):
+            edge_id = self._edges[key].get("id", "unknown")
+            source, target = self._edge_ends[key]
+            source_missing, target_missing = self._dangling[key]
+            if source_missing:
+                errors.append({
+                    "level": "error",
+                    "message": f"엣지 '{edge_id}': 존재하지 않는 source 노드 '{source}'",
+                    "node_id": source
+                })
+            if target_missing:
+                errors.append({
+                    "level": "error",
+                    "message": f"엣지 '{edge_id}': 존재하지 않는 target 노드 '{target}'",
+                    "node_id": target
+                })
+
+        for key in sorted(self._dup_edge_keys, key=self._edge_pos.__getitem__):
+            errors.append({
+                "level": "warning",
+                "message": f"중복된 엣지 ID: {self._edges[key]['id']}",
+                "node_id": None
+            })
+        return errors
+
+    def audit_issues(self, affected_node_ids: Iterable[Any]) -> List[Dict[str, Any]]:
+        """
+        영향받은 노드 + 이웃만 대상으로 한 감사 (_incremental_audit와 같은 이슈 집합)
+
+        이웃은 엣지 인덱스에서 O(degree)로 찾고, 각 검사는 보관된 결과를 조회합니다.
+        """
+        affected = set(affected_node_ids)
+        if not affected:
+            return []
+
+        nodes_to_check = set(affected)
+        for node_id in affected:
+            for key in self._incident.get(node_id, ()):
+                source, target = self._edge_ends[key]
+                nodes_to_check.add(target if source == node_id else source)
+
+        issues: List[Dict[str, Any]] = []
+        for node_id in nodes_to_check:
+            node = self._nodes.get(node_id)
+            if node is not None and not self._degree.get(node_id) \
+                    and node.get("type") not in ORPHAN_EXEMPT_TYPES:
+                issues.append({
+                    "type": "orphan_node",
+                    "level": "warning",
+                    "message": f"Node '{node_id}' is not connected to any other node.",
+                    "affected_nodes": [node_id],
+                    "suggestion": "Connect this node to the workflow or remove it."
+                })
+
+        for node_id in nodes_to_check:
+            for _ in range(self._self_loops.get(node_id, 0)):
+                issues.append({
+                    "type": "self_loop",
+                    "level": "error",
+                    "message": f"Node '{node_id}' references itself.",
+                    "affected_nodes": [node_id],
+                    "suggestion": "Remove the self-referencing edge."
+                })
+
+        for node_id in nodes_to_check:
+            for required_field in self._missing.get(node_id, ()):
+                issues.append({
+                    "type": "missing_config",
+                    "level": "warning",
+                    "message": f"Node '{node_id}' is missing required config '{required_field}'.",
+                    "affected_nodes": [node_id],
+                    "suggestion": f"Add the '{required_field}' configuration."
+                })
+
+        reported_pairs = set()
+        for node_id in nodes_to_check:
+            for key in self._incident.get(node_id, ()):
+                pair = self._edge_ends[key]
+                if pair in reported_pairs:
+                    continue
+                reported_pairs.add(pair)
+                for _ in range(self._pair_counts.get(pair, 0) - 1):
+                    issues.append({
+                        "type": "duplicate_edge",
+                        "level": "info",
+                        "message": f"Duplicate edge from '{pair[0]}' to '{pair[1]}'.",
+                        "affected_nodes": [pair[0], pair[1]],
+                        "suggestion": "Remove the duplicate edge."
+                    })
+        return issues
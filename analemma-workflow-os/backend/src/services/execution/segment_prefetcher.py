@@ -0,0 +1,320 @@
+"""
+Speculative Segment Prefetcher
+==============================
+
+세그먼트 전환마다 execute_segment는 실행을 시작하기 전에 다음 두 가지를 S3에서 가져온다.
+
+  1. 매니페스트 GetObject (_load_segment_config_from_manifest)
+  2. 선언된 read 키의 S3 포인터 (field_access_analyzer.prefetch_declared_reads)
+
+현재 세그먼트가 실행되는 동안 매니페스트와 outgoing_edges로 다음 세그먼트를 예측하고,
+그 segment_config와 정적 read set 포인터 값을 백그라운드에서 미리 받아
+컨테이너 전역(Lambda warm start 간 유지)의 짧은 TTL 캐시에 둔다.
+
+  - 예측: segment_index + 1 .. + SEGMENT_PREFETCH_DEPTH (CONTINUE 경로),
+    outgoing_edges의 target_node를 포함하는 세그먼트 (loop back-edge / 분기)
+  - 포인터 키: (bucket, key, checksum) — 오프로드 키는 쓰기마다 새로 생성되므로
+    현재 세그먼트가 필드를 덮어쓰면 다음 세그먼트의 포인터가 달라져 자연히 miss가 된다.
+  - 소비: take_config / seed_hydrator는 항목을 캐시에서 꺼낸다(pop). 실행 중
+    제자리 수정이 캐시 사본을 오염시키지 않는다.
+  - 테넌트 격리: segment_config 키에 owner_id 포함.
+
+캐시는 추측이다 — 적중하지 않으면 기존 로딩 경로가 그대로 동작하고, 백그라운드 오류는
+로그와 통계에만 남는다. 적중률과 전환 지연(이벤트 수신 → 세그먼트 실행 시작)은
+get_segment_prefetch_stats()로 보고한다.
+"""
+
+import copy
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+SEGMENT_PREFETCH_ENABLED = os.environ.get(
+    "SEGMENT_PREFETCH_ENABLED", "true"
+).strip().lower() in {"true", "1", "yes", "on"}
+# 선형 진행 기준으로 미리 가져올 다음 세그먼트 수
+SEGMENT_PREFETCH_DEPTH = int(os.environ.get("SEGMENT_PREFETCH_DEPTH", "1"))
+# 매니페스트 변경(_save_manifest_to_s3) 이후 다른 컨테이너의 캐시가 살아있을 수 있는 상한
+SEGMENT_PREFETCH_TTL_S = float(os.environ.get("SEGMENT_PREFETCH_TTL_S", "60"))
+SEGMENT_PREFETCH_MAX_ENTRIES = int(os.environ.get("SEGMENT_PREFETCH_MAX_ENTRIES", "64"))
+# 이보다 큰 포인터는 미리 받지 않는다 (Lambda 메모리 보호)
+SEGMENT_PREFETCH_MAX_POINTER_BYTES = int(os.environ.get("SEGMENT_PREFETCH_MAX_POINTER_BYTES", str(4 * 1024 * 1024)))
+
+# field_access_analyzer.POINTER_MARKER / state_hydrator.POINTER_MARKER와 동일
+POINTER_MARKER = "__s3_pointer__"
+
+
+def _entry_config(entry: Any) -> Dict[str, Any]:
+    if isinstance(entry, dict) and isinstance(entry.get("segment_config"), dict):
+        return entry["segment_config"]
+    return entry if isinstance(entry, dict) else {}
+
+
+def predict_next_segments(
+    segments: List[Any],
+    segment_index: int,
+    depth: int = SEGMENT_PREFETCH_DEPTH,
+) -> List[int]:
+    """현재 세그먼트 다음에 실행될 가능성이 높은 매니페스트 인덱스 (우선순위 순)."""
+    if not segments or not (0 <= segment_index < len(segments)):
+        return []
+
+    candidates = [i for i in range(segment_index + 1, segment_index + 1 + max(0, depth)) if i < len(segments)]
+    targets = {
+        edge.get("target_node")
+        for edge in _entry_config(segments[segment_index]).get("outgoing_edges") or []
+        if isinstance(edge, dict) and edge.get("target_node")
+    }
+    if targets:
+        for idx, entry in enumerate(segments):
+            config = _entry_config(entry)
+            node_ids = config.get("node_ids") or [
+                n.get("id") for n in config.get("nodes") or [] if isinstance(n, dict)
+            ]
+            if idx != segment_index and idx not in candidates and targets.intersection(node_ids):
+                candidates.append(idx)
+    return candidates
+
+
+def collect_state_pointers(state: Any) -> Dict[str, Dict[str, Any]]:
+    """상태에 남아있는 top-level S3 포인터 {key: pointer dict} (lazy load를 일으키지 않는다)."""
+    lazy = getattr(state, "get_lazy_pointers", None)
+    if callable(lazy):
+        return {key: pointer.to_dict() for key, pointer in lazy().items()}
+    if not isinstance(state, dict):
+        return {}
+    return {
+        key: value for key, value in dict.items(state)
+        if isinstance(value, dict) and value.get(POINTER_MARKER)
+    }
+
+
+def _pointer_key(pointer: Dict[str, Any]) -> Tuple[str, str, str]:
+    return pointer.get("bucket", ""), pointer.get("key", ""), pointer.get("checksum", "")
+
+
+class SegmentPrefetcher:
+    """다음 세그먼트 config / read 포인터 값의 추측 선반입 캐시."""
+
+    def __init__(
+        self,
+        ttl_s: float = SEGMENT_PREFETCH_TTL_S,
+        max_entries: int = SEGMENT_PREFETCH_MAX_ENTRIES,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.ttl_s = ttl_s
+        self.max_entries = max_entries
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._configs: "OrderedDict[Tuple[str, str, int], Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self._pointers: "OrderedDict[Tuple[str, str, str], Tuple[float, Any]]" = OrderedDict()
+        # 파싱된 매니페스트 (다음 선반입이 GetObject를 반복하지 않도록, 꺼내지 않고 재사용)
+        self._manifests: "OrderedDict[Tuple[str, str], Tuple[float, List[Any]]]" = OrderedDict()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._stats = self._empty_stats()
+
+    @staticmethod
+    def _empty_stats() -> Dict[str, Any]:
+        return {
+            "prefetches_scheduled": 0,
+            "configs_prefetched": 0,
+            "pointers_prefetched": 0,
+            "prefetch_errors": 0,
+            "config_hits": 0,
+            "config_misses": 0,
+            "pointer_hits": 0,
+            "pointer_misses": 0,
+            "transitions_hit": 0,
+            "transitions_miss": 0,
+            "transition_ms_hit": 0.0,
+            "transition_ms_miss": 0.0,
+        }
+
+    # ------------------------------------------------------------------
+    # 캐시
+    # ------------------------------------------------------------------
+    def _put(self, cache: OrderedDict, key: Any, value: Any) -> None:
+        with self._lock:
+            cache[key] = (self._clock() + self.ttl_s, value)
+            cache.move_to_end(key)
+            while len(cache) > self.max_entries:
+                cache.popitem(last=False)
+
+    def _peek(self, cache: OrderedDict, key: Any) -> Optional[Any]:
+        with self._lock:
+            item = cache.get(key)
+        if item is None or self._clock() >= item[0]:
+            return None
+        return item[1]
+
+    def _pop(self, cache: OrderedDict, key: Any) -> Optional[Any]:
+        with self._lock:
+            item = cache.pop(key, None)
+        if item is None or self._clock() >= item[0]:
+            return None
+        return item[1]
+
+    def take_config(self, owner_id: str, manifest_s3_path: str, segment_index: int) -> Optional[Dict[str, Any]]:
+        """선반입된 segment_config를 꺼낸다. 없거나 만료됐으면 None."""
+        config = self._pop(self._configs, (owner_id, manifest_s3_path, segment_index))
+        self._count("config_hits" if config is not None else "config_misses")
+        return config
+
+    def seed_hydrator(self, hydrator: Any, state: Any, reads: Iterable[str]) -> List[str]:
+        """
+        선반입된 read 포인터 값을 StateHydrator 인메모리 캐시에 채운다.
+
+        이후 prefetch_declared_reads / lazy load가 S3 대신 이 캐시를 사용한다.
+        Returns: 적중한 read 키 목록
+        """
+        cache = getattr(hydrator, "_cache", None)
+        if not isinstance(cache, dict):
+            return []
+        pointers = collect_state_pointers(state)
+        hits: List[str] = []
+        for key in reads or ():
+            pointer = pointers.get(key)
+            if pointer is None:
+                continue
+            value = self._pop(self._pointers, _pointer_key(pointer))
+            if value is None:
+                self._count("pointer_misses")
+                continue
+            cache[f"{pointer.get('bucket')}/{pointer.get('key')}"] = value
+            hits.append(key)
+        self._count("pointer_hits", len(hits))
+        return hits
+
+    def invalidate(self, manifest_s3_path: str) -> None:
+        """매니페스트가 제자리 수정되면 해당 경로의 선반입 config를 버린다."""
+        with self._lock:
+            for key in [k for k in self._configs if k[1] == manifest_s3_path]:
+                del self._configs[key]
+            for key in [k for k in self._manifests if k[1] == manifest_s3_path]:
+                del self._manifests[key]
+
+    # ------------------------------------------------------------------
+    # 선반입
+    # ------------------------------------------------------------------
+    def schedule(
+        self,
+        owner_id: str,
+        manifest_s3_path: str,
+        segment_index: int,
+        load_segments: Callable[[], List[Any]],
+        load_pointer: Callable[[Dict[str, Any]], Any],
+        resolve_reads: Callable[[Dict[str, Any]], Iterable[str]],
+        state_pointers: Dict[str, Dict[str, Any]],
+        current_writes: Iterable[str] = (),
+    ) -> None:
+        """
+        다음 세그먼트 선반입을 백그라운드로 예약한다 (현재 세그먼트 실행과 겹친다).
+
+        state_pointers는 현재 세그먼트 시작 시점의 포인터 스냅샷이고, current_writes는
+        현재 세그먼트가 덮어쓸 키 — 그 포인터는 다음 세그먼트에서 바뀌므로 받지 않는다.
+        """
+        if self._executor is None:
+            with self._lock:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="segment-prefetch")
+        self._count("prefetches_scheduled")
+        self._executor.submit(
+            self._prefetch, owner_id, manifest_s3_path, segment_index, load_segments,
+            load_pointer, resolve_reads, dict(state_pointers), frozenset(current_writes),
+        )
+
+    def _prefetch(self, owner_id, manifest_s3_path, segment_index, load_segments,
+                  load_pointer, resolve_reads, state_pointers, current_writes) -> None:
+        try:
+            segments = self._peek(self._manifests, (owner_id, manifest_s3_path))
+            if segments is None:
+                segments = load_segments()
+                self._put(self._manifests, (owner_id, manifest_s3_path), segments)
+            for idx in predict_next_segments(segments, segment_index):
+                # 사본 저장: 소비자가 제자리 정규화해도 캐시된 매니페스트는 그대로
+                config = copy.deepcopy(_entry_config(segments[idx]))
+                self._put(self._configs, (owner_id, manifest_s3_path, idx), config)
+                self._count("configs_prefetched")
+
+                for key in resolve_reads(config) or ():
+                    pointer = state_pointers.get(key)
+                    if (pointer is None or key in current_writes
+                            or int(pointer.get("size_bytes") or 0) > SEGMENT_PREFETCH_MAX_POINTER_BYTES):
+                        continue
+                    cache_key = _pointer_key(pointer)
+                    with self._lock:
+                        if cache_key in self._pointers:
+                            continue
+                    self._put(self._pointers, cache_key, load_pointer(pointer))
+                    self._count("pointers_prefetched")
+        except Exception as e:
+            self._count("prefetch_errors")
+            logger.warning(f"[SegmentPrefetch] Prefetch after segment {segment_index} failed: {e}")
+
+    def wait_idle(self, timeout: Optional[float] = None) -> None:
+        """예약된 선반입이 끝날 때까지 대기 (테스트/벤치마크용)."""
+        if self._executor is not None:
+            self._executor.submit(lambda: None).result(timeout=timeout)
+
+    # ------------------------------------------------------------------
+    # 통계
+    # ------------------------------------------------------------------
+    def _count(self, name: str, amount: float = 1) -> None:
+        with self._lock:
+            self._stats[name] += amount
+
+    def record_transition(self, elapsed_ms: float, config_hit: bool) -> None:
+        """세그먼트 전환 지연 1건 (이벤트 수신 → 실행 시작)."""
+        label = "hit" if config_hit else "miss"
+        with self._lock:
+            self._stats[f"transitions_{label}"] += 1
+            self._stats[f"transition_ms_{label}"] += elapsed_ms
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            stats = dict(self._stats)
+        config_lookups = stats["config_hits"] + stats["config_misses"]
+        pointer_lookups = stats["pointer_hits"] + stats["pointer_misses"]
+        stats["config_hit_rate"] = round(stats["config_hits"] / config_lookups, 4) if config_lookups else 0.0
+        stats["pointer_hit_rate"] = round(stats["pointer_hits"] / pointer_lookups, 4) if pointer_lookups else 0.0
+        for label in ("hit", "miss"):
+            count = stats[f"transitions_{label}"]
+            stats[f"avg_transition_ms_{label}"] = round(stats.pop(f"transition_ms_{label}") / count, 3) if count else 0.0
+        return stats
+
+    def clear(self) -> None:
+        self.wait_idle()
+        with self._lock:
+            self._configs.clear()
+            self._pointers.clear()
+            self._manifests.clear()
+            self._stats = self._empty_stats()
+
+
+_prefetcher: Optional[SegmentPrefetcher] = None
+_prefetcher_lock = threading.Lock()
+
+
+def get_segment_prefetcher() -> SegmentPrefetcher:
+    """컨테이너 단위 싱글톤 (SegmentRunnerService는 호출마다 새로 만들어진다)."""
+    global _prefetcher
+    if _prefetcher is None:
+        with _prefetcher_lock:
+            if _prefetcher is None:
+                _prefetcher = SegmentPrefetcher()
+    return _prefetcher
+
+
+def get_segment_prefetch_stats() -> Dict[str, Any]:
+    return get_segment_prefetcher().get_stats()
+
+
+def clear_segment_prefetch_state() -> None:
+    """캐시/통계 초기화 (테스트용)."""
+    get_segment_prefetcher().clear()
@@ -79,10 +79,35 @@ except ImportError:
     VerificationFailedError = None
     ENABLE_OPTIMISTIC_VERIFICATION = False
 
+# [v3.28] Static field-access analysis (prefetch declared reads / flag undeclared writes)
+try:
+    from src.services.workflow.field_access_analyzer import (
+        FIELD_ACCESS_MODE,
+        resolve_segment_field_access,
+        prefetch_declared_reads,
+        snapshot_state,
+        enforce_declared_writes,
+    )
+    FIELD_ACCESS_AVAILABLE = True
+except ImportError:
+    FIELD_ACCESS_AVAILABLE = False
+    FIELD_ACCESS_MODE = "off"
+
+# Speculative prefetch of the next manifest segment (config + static read-set pointers)
+try:
+    from src.services.execution.segment_prefetcher import (
+        SEGMENT_PREFETCH_ENABLED,
+        collect_state_pointers,
+        get_segment_prefetcher,
+    )
+except ImportError:
+    SEGMENT_PREFETCH_ENABLED = False
+
 # Services
 from src.services.state.state_manager import StateManager
 from src.common.security_utils import mask_pii_in_state
 from src.services.recovery.self_healing_service import SelfHealingService
+from src.services.recovery.retry_budget import get_retry_budget_controller, infer_provider
 # [v3.11] Unified State Hydration
 from src.common.state_hydrator import StateHydrator, SmartStateBag
 from src.services.workflow.repository import WorkflowRepository
@@ -235,6 +260,16 @@ STRATEGY_COST_OPTIMIZED = "COST_OPTIMIZED"        # Minimize cost
 DEFAULT_BRANCH_MEMORY_MB = 256
 DEFAULT_BRANCH_TOKENS = 5000
 
+# Duration-aware (makespan) bin packing: NodeStats 테이블의 노드 타입별 평균 실행 시간 사용
+BRANCH_PACKING_DURATION_AWARE = os.environ.get(
+    "BRANCH_PACKING_DURATION_AWARE", "true"
+).strip().lower() in {"true", "1", "yes", "on"}
+NODE_DURATION_STATS_TTL_S = float(os.environ.get("NODE_DURATION_STATS_TTL_S", "300"))
+# 통계가 없는 노드 타입의 추정 시간 (get_node_stats_for_eta 기본값과 동일)
+DEFAULT_NODE_DURATION_S = 5.0
+# for_each 반복 기본값 (main.for_each_runner: max_iterations=20, Lambda vCPU 2 → 워커 1개)
+FOR_EACH_DEFAULT_MAX_ITERATIONS = 20
+
 # Account level hard limit (checked even in SPEED_OPTIMIZED)
 ACCOUNT_LAMBDA_CONCURRENCY_LIMIT = 100  # AWS default concurrency limit
 ACCOUNT_MEMORY_HARD_LIMIT_MB = 10240    # 10GB hard limit
@@ -445,6 +480,59 @@ def _normalize_segment_config(segment_config: Dict[str, Any]) -> Dict[str, Any]:
     return segment_config
 
 
+# [Parallel] 노드 타입별 평균 실행 시간 캐시: {node_type: (fetched_at, avg_seconds | None)}
+# None = NodeStats에 기록 없음 (매 스케줄링마다 DynamoDB를 다시 조회하지 않도록 miss도 캐시)
+_node_duration_cache: Dict[str, Tuple[float, Optional[float]]] = {}
+_node_stats_warned_at: Optional[float] = None
+
+
+def _load_node_duration_stats(node_types: List[str]) -> Dict[str, float]:
+    """
+    NodeStats(node_stats_collector)에서 노드 타입별 평균 실행 시간(초)을 조회한다.
+
+    통계가 있는 타입만 반환한다. 조회 실패 시 빈 dict (호출자는 휴리스틱으로 폴백).
+    """
+    now = time.monotonic()
+    missing = [
+        t for t in node_types
+        if t not in _node_duration_cache or now - _node_duration_cache[t][0] >= NODE_DURATION_STATS_TTL_S
+    ]
+    if missing:
+        try:
+            from src.handlers.utils.node_stats_collector import get_node_stats_for_eta
+            fetched = get_node_stats_for_eta(missing, default=None)
+        except Exception as e:
+            # 실패도 TTL 동안 캐시 (매 세그먼트 재조회/경고 방지)
+            _warn_node_stats_failure(e)
+            fetched = {}
+        for node_type in missing:
+            _node_duration_cache[node_type] = (now, fetched.get(node_type))
+
+    return {
+        t: _node_duration_cache[t][1]
+        for t in node_types
+        if t in _node_duration_cache and _node_duration_cache[t][1] is not None
+    }
+
+
+def _warn_node_stats_failure(error: Exception) -> None:
+    """NodeStats 조회 실패 경고는 NODE_DURATION_STATS_TTL_S당 한 번만."""
+    global _node_stats_warned_at
+    now = time.monotonic()
+    if _node_stats_warned_at is None or now - _node_stats_warned_at >= NODE_DURATION_STATS_TTL_S:
+        _node_stats_warned_at = now
+        logger.warning(f"[Scheduler] NodeStats lookup failed, using heuristic packing: {error}")
+    else:
+        logger.debug(f"[Scheduler] NodeStats lookup failed: {error}")
+
+
+def clear_node_duration_cache() -> None:
+    """노드 실행 시간 통계 캐시 초기화 (테스트용)."""
+    global _node_stats_warned_at
+    _node_duration_cache.clear()
+    _node_stats_warned_at = None
+
+
 class SegmentRunnerService:
     def __init__(self, s3_bucket: Optional[str] = None, deadline_ms: Optional[float] = None) -> None:
         self._deadline_ms = deadline_ms
@@ -503,6 +591,9 @@ class SegmentRunnerService:
         # [v3.20] StateViewContext: Proxy pattern (78% memory reduction)
         self._state_view_context = None
 
+        # Manifest parsed by _load_segment_config_from_manifest: (manifest_s3_path, segments)
+        self._loaded_manifest = None
+
     def _check_deadline(self, phase: str) -> None:
         """[v3.35] Graceful shutdown: raise TimeoutError before Lambda hard-kills."""
         if self._deadline_ms and time.time() * 1000 > self._deadline_ms:
@@ -1183,6 +1274,8 @@ class SegmentRunnerService:
             )
             
             logger.info(f"[Kernel] Saved modified manifest to S3: {len(manifest)} segments")
+            if SEGMENT_PREFETCH_ENABLED:
+                get_segment_prefetcher().invalidate(manifest_s3_path)
             return True
             
         except Exception as e:
@@ -1783,12 +1876,7 @@ class SegmentRunnerService:
             }
         
         # [Critical Fix] Include hidden nodes for accurate token calculation
-        all_nodes = branch.get('nodes', [])
-        if not all_nodes and 'partition_map' in branch:
-            # For partitioned branches, aggregate nodes from all segments
-            for segment in branch.get('partition_map', []):
-                if isinstance(segment, dict):
-                    all_nodes.extend(segment.get('nodes', []))
+        all_nodes = self._collect_branch_nodes(branch)
         
         if not all_nodes:
             return {
@@ -1852,11 +1940,109 @@ class SegmentRunnerService:
             'has_shared_resource': has_shared_resource
         }
 
+    def _estimate_node_duration(
+        self,
+        node: Dict[str, Any],
+        node_durations: Dict[str, float],
+        state: Dict[str, Any]
+    ) -> float:
+        """
+        Estimated wall time (seconds) of one node from per-node-type averages
+
+        Containers without their own stats are expanded: loop bodies × max_iterations,
+        for_each bodies × item count (for_each_runner runs items on cpu_count // 2
+        workers = 1 on Lambda).
+        """
+        if node is None or not isinstance(node, dict):
+            return 0.0
+        node_type = node.get('type', '')
+        config = node.get('config') or {}
+        if node_type in node_durations:
+            return node_durations[node_type]
+
+        if node_type == 'for_each':
+            sub_config = config.get('sub_workflow') or config.get('sub_node_config') or {}
+            sub_nodes = sub_config.get('nodes', []) if isinstance(sub_config, dict) else []
+            max_iterations = config.get('max_iterations') or FOR_EACH_DEFAULT_MAX_ITERATIONS
+            items = state.get(config.get('input_list_key', ''), None) if isinstance(state, dict) else None
+            iterations = min(len(items), max_iterations) if isinstance(items, list) else 1
+            body = sum(self._estimate_node_duration(n, node_durations, state) for n in sub_nodes)
+            return iterations * body
+
+        if node_type == 'loop':
+            body = sum(self._estimate_node_duration(n, node_durations, state) for n in config.get('nodes') or [])
+            return (config.get('max_iterations') or 5) * body
+
+        return DEFAULT_NODE_DURATION_S
+
+    def _estimate_branch_durations(
+        self,
+        branches: List[Dict[str, Any]],
+        state: Dict[str, Any]
+    ) -> Optional[List[float]]:
+        """
+        Estimate each branch's wall time from historical NodeStats durations
+
+        Returns:
+            Per-branch seconds (same order as branches), or None when duration-aware
+            packing is disabled or no node type in the group has recorded stats
+            (caller falls back to the memory/token heuristic).
+        """
+        if not BRANCH_PACKING_DURATION_AWARE or not branches:
+            return None
+
+        branch_nodes = [self._collect_branch_nodes(b) for b in branches]
+        node_types: List[str] = []
+
+        def collect_types(nodes: List[Any]) -> None:
+            for node in nodes:
+                if not isinstance(node, dict):
+                    continue
+                node_type = node.get('type')
+                if node_type and node_type not in node_types:
+                    node_types.append(node_type)
+                config = node.get('config') or {}
+                sub_config = config.get('sub_workflow') or config.get('sub_node_config') or {}
+                collect_types(config.get('nodes') or [])
+                collect_types(sub_config.get('nodes') or [] if isinstance(sub_config, dict) else [])
+
+        for nodes in branch_nodes:
+            collect_types(nodes)
+        if not node_types:
+            return None
+
+        node_durations = _load_node_duration_stats(node_types)
+        if not node_durations:
+            return None
+
+        return [
+            sum(self._estimate_node_duration(n, node_durations, state) for n in nodes)
+            for nodes in branch_nodes
+        ]
+
+    @staticmethod
+    def _collect_branch_nodes(branch: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Branch nodes, aggregated from partition_map segments for partitioned branches."""
+        if not isinstance(branch, dict):
+            return []
+        nodes = list(branch.get('nodes') or [])
+        if not nodes:
+            for segment in branch.get('partition_map') or []:
+                if isinstance(segment, dict):
+                    nodes.extend(segment.get('nodes') or [])
+        return nodes
+
+    @staticmethod
+    def _batches_makespan(batches: List[List[Tuple]], durations: List[float]) -> float:
+        """Batches run one after another and branches in a batch run concurrently."""
+        return sum(max(durations[idx] for _, _, idx in batch) for batch in batches if batch)
+
     def _bin_pack_branches(
         self,
         branches: List[Dict[str, Any]],
         resource_estimates: List[Dict[str, int]],
-        resource_policy: Dict[str, Any]
+        resource_policy: Dict[str, Any],
+        durations: Optional[List[float]] = None
     ) -> List[List[Dict[str, Any]]]:
         """
         Bin Packing algorithm: group branches into execution batches
@@ -1866,9 +2052,45 @@ class SegmentRunnerService:
         2. Ensure each batch's total resources do not exceed limits
         3. Branches accessing shared resources go in separate batches
 
+        With durations (_estimate_branch_durations), batches are packed for makespan
+        (sum of each batch's slowest branch) under the same memory/token/count limits,
+        and the result is kept only if it beats the heuristic packing.
+
         Returns:
             [[batch1_branches], [batch2_branches], ...]
         """
+        batches = self._pack_branch_batches(branches, resource_estimates, resource_policy)
+
+        if durations is not None and len(durations) == len(branches):
+            makespan_batches = self._pack_branch_batches(
+                branches, resource_estimates, resource_policy, durations=durations
+            )
+            heuristic_makespan = self._batches_makespan(batches, durations)
+            packed_makespan = self._batches_makespan(makespan_batches, durations)
+            logger.info(f"[Scheduler] Estimated makespan: heuristic={heuristic_makespan:.1f}s, "
+                       f"duration-aware={packed_makespan:.1f}s")
+            if packed_makespan < heuristic_makespan:
+                batches = makespan_batches
+
+        # Convert results: extract branches only
+        return [[item[0] for item in batch] for batch in batches]
+
+    def _pack_branch_batches(
+        self,
+        branches: List[Dict[str, Any]],
+        resource_estimates: List[Dict[str, int]],
+        resource_policy: Dict[str, Any],
+        durations: Optional[List[float]] = None
+    ) -> List[List[Tuple]]:
+        """
+        First Fit Decreasing over (memory, tokens, count)
+
+        Sort key: durations (slowest first) when given, so slow branches share a batch
+        instead of each stretching a different one; otherwise memory/tokens by strategy.
+
+        Returns:
+            [[(branch, estimate, idx), ...], ...]
+        """
         # [Fix] Use 'or' to handle None values - .get() returns None if key exists with None value
         max_memory = resource_policy.get('max_concurrent_memory_mb') or DEFAULT_MAX_CONCURRENT_MEMORY_MB
         max_tokens = resource_policy.get('max_concurrent_tokens') or DEFAULT_MAX_CONCURRENT_TOKENS
@@ -1879,7 +2101,10 @@ class SegmentRunnerService:
         indexed_branches = list(zip(branches, resource_estimates, range(len(branches))))
         
         # Sort criteria by strategy
-        if strategy == STRATEGY_COST_OPTIMIZED:
+        if durations is not None:
+            # Slowest first; memory as tie-breaker keeps 2-D fragmentation low
+            indexed_branches.sort(key=lambda x: (durations[x[2]], x[1]['memory_mb']), reverse=True)
+        elif strategy == STRATEGY_COST_OPTIMIZED:
             # Highest tokens first (process costly tasks sequentially)
             indexed_branches.sort(key=lambda x: x[1]['tokens'], reverse=True)
         else:
@@ -1939,12 +2164,7 @@ class SegmentRunnerService:
                 'tokens': estimate['tokens']
             })
         
-        # Convert results: extract branches only
-        result = []
-        for batch in batches:
-            result.append([item[0] for item in batch])
-        
-        return result
+        return batches
 
     def _schedule_parallel_group(
         self,
@@ -2016,7 +2236,10 @@ class SegmentRunnerService:
                 }
                 # Resource estimation and batch splitting
                 resource_estimates = [self._estimate_branch_resources(b, state) for b in branches]
-                execution_batches = self._bin_pack_branches(branches, resource_estimates, forced_policy)
+                branch_durations = self._estimate_branch_durations(branches, state)
+                execution_batches = self._bin_pack_branches(
+                    branches, resource_estimates, forced_policy, durations=branch_durations
+                )
                 
                 logger.info(f"[Scheduler] [Guard] Guardrail applied: {len(execution_batches)} batches")
                 
@@ -2039,6 +2262,7 @@ class SegmentRunnerService:
                         'batch_count': len(execution_batches),
                         'guardrail_applied': True,
                         'reason': 'Account concurrency limit exceeded',
+                        'duration_aware_packing': branch_durations is not None,
                         'pointer_strategy': True,
                         'branches_s3_path': branches_s3_path
                     }
@@ -2119,7 +2343,10 @@ class SegmentRunnerService:
             }
         
         # Create batches via Bin Packing
-        execution_batches = self._bin_pack_branches(branches, resource_estimates, resource_policy)
+        branch_durations = self._estimate_branch_durations(branches, state)
+        execution_batches = self._bin_pack_branches(
+            branches, resource_estimates, resource_policy, durations=branch_durations
+        )
         
         logger.info(f"[Scheduler] [System] Created {len(execution_batches)} execution batches from {len(branches)} branches")
         for i, batch in enumerate(execution_batches):
@@ -2149,6 +2376,7 @@ class SegmentRunnerService:
                 'total_tokens_calculated': total_tokens,
                 'actual_concurrency_limit': max_tokens,
                 'resource_policy': resource_policy,
+                'duration_aware_packing': branch_durations is not None,
                 'pointer_strategy': True,
                 'branches_s3_path': branches_s3_path
             }
@@ -2952,12 +3180,17 @@ class SegmentRunnerService:
         Attempt resolution inside Lambda before Step Functions-level retry.
         - Retry on network errors, transient service failures
         - Exponential backoff + jitter applied
+        - Each retry spends a token from the shared RetryBudgetController
+          (per provider / error class). An exhausted budget delays the retry
+          until a token is due, or sheds it (returns the error) when that wait
+          exceeds RETRY_BUDGET_MAX_WAIT_S.
 
         Returns:
             (result_state, error_info) - error_info is None on success
         """
         last_error = None
         retry_history = []
+        retry_shed = False
         
         # Check if this is a parallel branch execution (for token aggregation)
         is_parallel_branch = event.get('branch_config') is not None
@@ -3076,6 +3309,7 @@ class SegmentRunnerService:
                         logger.warning(f"[Parallel Branch] Failed to extract token usage: {e}")
                 
                 # Success
+                get_retry_budget_controller().record_success(infer_provider(segment_config))
                 if attempt > 0:
                     logger.info(f"[Kernel Retry] [Success] Succeeded after {attempt} retries")
                     # Record retry history
@@ -3096,8 +3330,21 @@ class SegmentRunnerService:
                 retry_history.append(retry_info)
                 
                 if attempt < KERNEL_MAX_RETRIES and self._is_retryable_error(e):
-                    # Exponential backoff + jitter
-                    delay = KERNEL_RETRY_BASE_DELAY * (2 ** attempt) + random.uniform(0, 1)
+                    decision = get_retry_budget_controller().acquire_for_error(e, segment_config)
+                    retry_info['retry_budget'] = decision.to_dict()
+                    if not decision.allowed:
+                        retry_shed = True
+                        logger.warning(
+                            f"[Kernel Retry] [Shed] Retry budget exhausted for "
+                            f"{decision.provider}/{decision.error_class} "
+                            f"(attempt {attempt + 1}): {e}"
+                        )
+                        break
+                    # Exponential backoff + jitter (never shorter than the budget's token wait)
+                    delay = max(
+                        KERNEL_RETRY_BASE_DELAY * (2 ** attempt) + random.uniform(0, 1),
+                        decision.delay,
+                    )
                     logger.warning(
                         f"[Kernel Retry] [Warning] Attempt {attempt + 1}/{KERNEL_MAX_RETRIES + 1} failed: {e}. "
                         f"Retrying in {delay:.2f}s..."
@@ -3117,7 +3364,8 @@ class SegmentRunnerService:
             'error_type': type(last_error).__name__,
             'retry_attempts': len(retry_history),
             'retry_history': retry_history,
-            'retryable': self._is_retryable_error(last_error) if last_error else False
+            'retryable': self._is_retryable_error(last_error) if last_error else False,
+            'retry_shed': retry_shed,
         }
         
         return initial_state, error_info
@@ -3309,6 +3557,9 @@ class SegmentRunnerService:
                 "segment_id": 0
             }
         
+        # Segment transition latency: event received → segment execution starts
+        transition_start = time.perf_counter()
+
         # [v3.35] Lambda Timeout Watchdog: check deadline before hydration
         self._check_deadline("hydration")
 
@@ -3993,6 +4244,7 @@ class SegmentRunnerService:
         # ASL Direct Injection handles less than 20% due to 256KB constraint
         # Lambda Fallback is the actual primary path (expected to handle 80%)
         segment_config = event.get('segment_config')  # Injected from ASL (small manifest)
+        prefetch_config_hit = False
         
         if not segment_config:
             # Fallback 1: Lambda loads directly from S3 (large manifest)
@@ -4000,11 +4252,20 @@ class SegmentRunnerService:
             segment_index = event.get('segment_index', segment_id)
             
             if manifest_s3_path:
-                logger.info(f"[Phase 0.2] Loading segment_config from manifest: {manifest_s3_path}")
-                segment_config = self._load_segment_config_from_manifest(
-                    manifest_s3_path,
-                    segment_index
-                )
+                # Speculative prefetch from the previous segment (warm container)
+                if SEGMENT_PREFETCH_ENABLED:
+                    segment_config = get_segment_prefetcher().take_config(
+                        event.get('ownerId') or event.get('owner_id', 'unknown'),
+                        manifest_s3_path,
+                        segment_index
+                    )
+                    prefetch_config_hit = segment_config is not None
+                if not segment_config:
+                    logger.info(f"[Phase 0.2] Loading segment_config from manifest: {manifest_s3_path}")
+                    segment_config = self._load_segment_config_from_manifest(
+                        manifest_s3_path,
+                        segment_index
+                    )
             elif execution_mode in ('MAP_REDUCE', 'BATCHED') and event.get('segment_config'):
                 # Fallback 2: Direct segment_config for distributed modes
                 logger.info(f"[Hybrid Mode] Using direct segment_config for {execution_mode} mode")
@@ -4593,6 +4854,32 @@ class SegmentRunnerService:
             except Exception as e:
                 logger.warning("User check failed, but proceeding if possible: %s", e)
 
+        # [v3.28] Field Access: prefetch only the pointers this segment declares as reads
+        field_access = None
+        pre_execution_state = None
+        # Pointer snapshot before reads are loaded in place (input for the next-segment prefetch)
+        state_pointers = collect_state_pointers(initial_state) if SEGMENT_PREFETCH_ENABLED else {}
+        if FIELD_ACCESS_AVAILABLE and FIELD_ACCESS_MODE != 'off' and isinstance(initial_state, dict):
+            try:
+                field_access = resolve_segment_field_access(segment_config)
+                if SEGMENT_PREFETCH_ENABLED and field_access:
+                    # Pointers fetched speculatively by the previous segment skip their S3 GET
+                    get_segment_prefetcher().seed_hydrator(
+                        self.hydrator, initial_state, field_access.get('reads') or ()
+                    )
+                prefetch_declared_reads(initial_state, field_access, self.hydrator)
+                pre_execution_state = snapshot_state(initial_state, field_access, mode=FIELD_ACCESS_MODE)
+            except Exception as fa_err:
+                logger.warning(f"[FieldAccess] Pre-execution analysis skipped: {fa_err}")
+                field_access = None
+
+        if SEGMENT_PREFETCH_ENABLED:
+            self._schedule_next_segment_prefetch(event, segment_id, field_access, state_pointers)
+            transition_ms = (time.perf_counter() - transition_start) * 1000
+            get_segment_prefetcher().record_transition(transition_ms, prefetch_config_hit)
+            logger.info(f"[SegmentPrefetch] Segment {segment_id} transition {transition_ms:.1f}ms "
+                        f"(config {'prefetched' if prefetch_config_hit else 'loaded'})")
+
         # 7. Execute Workflow Segment
         start_time = time.time()
 
@@ -4687,6 +4974,13 @@ class SegmentRunnerService:
         
         execution_time = time.time() - start_time
         
+        # [v3.28] Field Access: flag (advisory) or revert (strict) undeclared top-level writes
+        if field_access is not None and isinstance(result_state, dict):
+            enforce_declared_writes(
+                pre_execution_state, result_state, field_access,
+                mode=FIELD_ACCESS_MODE, segment_id=segment_id,
+            )
+        
         # [Guard] [Partial Success] Return SUCCEEDED even on failure + record error metadata
         if execution_error and ENABLE_PARTIAL_SUCCESS:
             logger.warning(
@@ -5076,6 +5370,103 @@ class SegmentRunnerService:
             "total_segments": total_segments
         })
 
+    def _fetch_manifest_segments(self, manifest_s3_path: str, s3_client: Any = None) -> List[Dict[str, Any]]:
+        """
+        GetObject the manifest envelope and return its 'segments' list
+
+        [FIX] S3 Select removed: prevents MethodNotAllowed errors.
+        - S3 Select requires s3:SelectObjectContent permission + separate charges,
+          and does not work with SSE-KMS objects or Object Lock buckets.
+        - Manifest envelope (dict) is incompatible with S3 Select SQL (assumes bare list).
+        - Manifest file sizes are under a few hundred KB, easily handled by GetObject.
+        """
+        import boto3
+
+        bucket_name = manifest_s3_path.replace("s3://", "").split("/")[0]
+        key_name = "/".join(manifest_s3_path.replace("s3://", "").split("/")[1:])
+        s3 = s3_client or boto3.client('s3')
+
+        obj = s3.get_object(Bucket=bucket_name, Key=key_name)
+        object_size = obj['ContentLength']
+        content = obj['Body'].read().decode('utf-8')
+        manifest_obj = self._safe_json_load(content)
+        logger.info(f"[GetObject] Loaded manifest ({object_size}B)")
+
+        # Format convention: manifests/{id}.json is always a dict (Envelope pattern)
+        # Contains a list sorted by segment_id ascending under the 'segments' key.
+        # List format is a spec violation and treated as error (no legacy compatibility burden).
+        if not isinstance(manifest_obj, dict):
+            raise ValueError(
+                f"Invalid manifest format: expected dict (Merkle DAG envelope), "
+                f"got {type(manifest_obj)}. "
+                f"Manifest at {manifest_s3_path} may be a legacy bare list."
+            )
+        segments = manifest_obj.get('segments')
+        if segments is None:
+            raise ValueError(
+                f"Manifest missing 'segments' key. "
+                f"Available keys: {list(manifest_obj.keys())[:10]}"
+            )
+        if not isinstance(segments, list):
+            raise ValueError(
+                f"Manifest 'segments' must be list, got {type(segments)}"
+            )
+        return segments
+
+    def _schedule_next_segment_prefetch(
+        self,
+        event: Dict[str, Any],
+        segment_id: int,
+        field_access: Optional[Dict[str, Any]],
+        state_pointers: Dict[str, Dict[str, Any]]
+    ) -> None:
+        """
+        Speculatively prefetch the predicted next segment(s) while this one executes
+
+        Uses the manifest already parsed by _load_segment_config_from_manifest when
+        available (no extra GetObject), otherwise loads it in the background.
+        Read-set pointers are only prefetched when field access analysis is on.
+        """
+        manifest_s3_path = event.get('segment_manifest_s3_path')
+        if not manifest_s3_path or event.get('segment_config'):
+            return  # ASL-injected configs never go through the manifest load
+
+        loaded = getattr(self, '_loaded_manifest', None)
+        if loaded and loaded[0] == manifest_s3_path:
+            segments = loaded[1]
+            load_segments = lambda: segments
+        else:
+            from src.common.aws_clients import get_s3_client
+            load_segments = lambda: self._fetch_manifest_segments(manifest_s3_path, s3_client=get_s3_client())
+
+        s3_client = self.hydrator.s3_client
+
+        def load_pointer(pointer: Dict[str, Any]) -> Any:
+            # Own hydrator: the current segment's cache may hold the same object it mutates
+            from src.common.state_hydrator import S3Pointer
+            return StateHydrator(s3_client=s3_client)._load_from_s3(S3Pointer.from_dict(pointer))
+
+        def resolve_reads(config: Dict[str, Any]) -> List[str]:
+            if not (FIELD_ACCESS_AVAILABLE and FIELD_ACCESS_MODE != 'off' and field_access):
+                return []
+            next_access = resolve_segment_field_access(config)
+            return list(next_access.get('reads') or ()) if next_access else []
+
+        current_writes = set(field_access.get('writes') or ()) if field_access else set()
+        try:
+            get_segment_prefetcher().schedule(
+                owner_id=event.get('ownerId') or event.get('owner_id', 'unknown'),
+                manifest_s3_path=manifest_s3_path,
+                segment_index=event.get('segment_index', segment_id),
+                load_segments=load_segments,
+                load_pointer=load_pointer,
+                resolve_reads=resolve_reads,
+                state_pointers=state_pointers,
+                current_writes=current_writes,
+            )
+        except Exception as e:
+            logger.warning(f"[SegmentPrefetch] Failed to schedule prefetch: {e}")
+
     def _load_segment_config_from_manifest(
         self,
         manifest_s3_path: str,
@@ -5093,8 +5484,6 @@ class SegmentRunnerService:
         - Lambda caching is the actual primary path (ASL Direct Injection < 20%)
         - Target 80% cache hit rate via Warm Start optimization
         """
-        import boto3
-        
         # [FIX] Tenant isolation: cache key including owner_id
         cache_key = f"{manifest_s3_path}:{segment_index}"
         secure_cache_key = f"{owner_id}:{cache_key}" if owner_id else cache_key
@@ -5114,46 +5503,11 @@ class SegmentRunnerService:
                     logger.info(f"[Cache Hit] segment_config: {cache_key} (owner: {owner_id or 'unknown'})")
                     return cached['config']
         
-        # 2. Parse S3 path
-        bucket_name = manifest_s3_path.replace("s3://", "").split("/")[0]
-        key_name = "/".join(manifest_s3_path.replace("s3://", "").split("/")[1:])
-        
-        # 3. Full load via GetObject
-        # [FIX] S3 Select removed: prevents MethodNotAllowed errors.
-        # - S3 Select requires s3:SelectObjectContent permission + separate charges,
-        #   and does not work with SSE-KMS objects or Object Lock buckets.
-        # - Manifest envelope (dict) is incompatible with S3 Select SQL (assumes bare list).
-        # - Manifest file sizes are under a few hundred KB, easily handled by GetObject.
-        s3 = boto3.client('s3')
-        
         try:
-            obj = s3.get_object(Bucket=bucket_name, Key=key_name)
-            object_size = obj['ContentLength']
-            content = obj['Body'].read().decode('utf-8')
-            manifest_obj = self._safe_json_load(content)
-            logger.info(f"[GetObject] Loaded manifest ({object_size}B)")
-
-            # 4. Extract segment_config
-            # Format convention: manifests/{id}.json is always a dict (Envelope pattern)
-            # Contains a list sorted by segment_id ascending under the 'segments' key.
-            # List format is a spec violation and treated as error (no legacy compatibility burden).
-            if not isinstance(manifest_obj, dict):
-                raise ValueError(
-                    f"Invalid manifest format: expected dict (Merkle DAG envelope), "
-                    f"got {type(manifest_obj)}. "
-                    f"Manifest at {manifest_s3_path} may be a legacy bare list."
-                )
-            segments = manifest_obj.get('segments')
-            if segments is None:
-                raise ValueError(
-                    f"Manifest missing 'segments' key. "
-                    f"Available keys: {list(manifest_obj.keys())[:10]}"
-                )
-            if not isinstance(segments, list):
-                raise ValueError(
-                    f"Manifest 'segments' must be list, got {type(segments)}"
-                )
-            manifest = segments
+            # 2-4. Full load via GetObject + envelope validation
+            manifest = self._fetch_manifest_segments(manifest_s3_path)
+            # Keep the parsed manifest for the next-segment prefetch (no second GetObject)
+            self._loaded_manifest = (manifest_s3_path, manifest)
             logger.info(f"[_load_segment_config_from_manifest] Loaded {len(manifest)} segments from envelope")
             if not (0 <= segment_index < len(manifest)):
                 raise ValueError(f"Index {segment_index} out of range (manifest has {len(manifest)} segments)")
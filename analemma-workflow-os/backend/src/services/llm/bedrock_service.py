@@ -8,6 +8,7 @@ Only initializes boto3 client when first invoked.
 import os
 import json
 import logging
+from contextlib import nullcontext
 from typing import Any, Dict, Optional
 
 from botocore.config import Config
@@ -17,10 +18,14 @@ from botocore.exceptions import ReadTimeoutError
 try:
     from src.common.constants import is_mock_mode as _common_is_mock_mode
     from src.common.aws_clients import get_bedrock_client
+    from src.services.llm.concurrency_limiter import provider_slot
 except ImportError:
     _common_is_mock_mode = None
     get_bedrock_client = None
 
+    def provider_slot(provider, model):
+        return nullcontext()
+
 logger = logging.getLogger(__name__)
 
 
@@ -129,8 +134,10 @@ class BedrockService:
             if temperature:
                 payload["temperature"] = float(temperature)
 
-            resp = client.invoke_model(body=json.dumps(payload), modelId=model_id)
-            return json.loads(resp['body'].read())
+            # 프로세스 단위 AIMD 동시성 제한 — 본문 읽기까지 슬롯 유지
+            with provider_slot("bedrock", model_id):
+                resp = client.invoke_model(body=json.dumps(payload), modelId=model_id)
+                return json.loads(resp['body'].read())
 
         except ReadTimeoutError:
             logger.warning(
@@ -0,0 +1,276 @@
+"""
+Adaptive Concurrency Limiter
+============================
+
+LLM 프로바이더 호출의 프로세스(Lambda 컨테이너) 단위 동시성 제한기.
+
+병렬 그룹의 브랜치 스레드가 같은 모델을 한꺼번에 호출하면 대부분이 429를 받고
+with_retry_sync / with_exponential_backoff로 함께 물러났다가 다시 함께 몰린다.
+(provider, model)별 AIMD(additive-increase, multiplicative-decrease) 제한기가
+지속 가능한 in-flight 한도를 학습하고, 한도를 넘는 호출은 큐에서 대기시킨다:
+
+  - 성공 응답: 한도 근처까지 채워진 상태였다면 limit += 1 / limit
+    (한도만큼의 호출이 성공할 때마다 +1)
+  - 스로틀(429, ThrottlingException 등): limit *= backoff_ratio
+  - 지연 급증 (latency > baseline × latency_tolerance): limit *= LATENCY_BACKOFF_RATIO
+
+감소는 마지막 감소 이후에 시작된 호출의 신호에만 반응한다 — 같은 혼잡 구간에서
+동시에 돌아온 429 여러 개가 한도를 연쇄적으로 깎지 않도록 (TCP 혼잡 윈도우와 동일).
+
+스로틀 판정은 ErrorClassifier.transient_class()의 "throttling" 분류를 쓴다.
+제한기는 재시도 데코레이터 안쪽, 실제 프로바이더 호출만 감싼다 — 백오프 대기 중에는
+슬롯을 점유하지 않는다.
+"""
+
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterator, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+LLM_CONCURRENCY_LIMITER_ENABLED = os.environ.get(
+    "LLM_CONCURRENCY_LIMITER_ENABLED", "true"
+).strip().lower() in {"true", "1", "yes", "on"}
+# 학습 시작 한도 / 하한 / 상한
+LLM_CONCURRENCY_INITIAL_LIMIT = float(os.environ.get("LLM_CONCURRENCY_INITIAL_LIMIT", "8"))
+LLM_CONCURRENCY_MIN_LIMIT = float(os.environ.get("LLM_CONCURRENCY_MIN_LIMIT", "1"))
+LLM_CONCURRENCY_MAX_LIMIT = float(os.environ.get("LLM_CONCURRENCY_MAX_LIMIT", "64"))
+# 스로틀 시 한도 감소 비율
+LLM_CONCURRENCY_BACKOFF_RATIO = float(os.environ.get("LLM_CONCURRENCY_BACKOFF_RATIO", "0.5"))
+# baseline 대비 이 배수를 넘는 지연은 과부하 신호로 본다
+LLM_CONCURRENCY_LATENCY_TOLERANCE = float(os.environ.get("LLM_CONCURRENCY_LATENCY_TOLERANCE", "2.5"))
+# 큐 대기 최대 시간 (초과 시 ConcurrencyLimitTimeout)
+LLM_CONCURRENCY_MAX_QUEUE_WAIT_S = float(os.environ.get("LLM_CONCURRENCY_MAX_QUEUE_WAIT_S", "120"))
+
+# 지연 급증은 출력 길이 차이로도 생기므로 스로틀보다 완만하게 줄인다
+LATENCY_BACKOFF_RATIO = 0.9
+# 지연 baseline EWMA 가중치
+LATENCY_EWMA_ALPHA = 0.1
+
+OUTCOME_SUCCESS = "success"
+OUTCOME_THROTTLED = "throttled"
+OUTCOME_ERROR = "error"
+
+
+class ConcurrencyLimitTimeout(TimeoutError):
+    """큐 대기가 max_queue_wait_s를 넘은 경우. 재시도 데코레이터가 일시적 에러로 처리한다."""
+    pass
+
+
+@dataclass(frozen=True)
+class _Ticket:
+    """획득한 슬롯 — 시작 시각과 획득 시점의 in-flight 수."""
+    started_at: float
+    in_flight: int
+
+
+def is_throttle_error(error: BaseException) -> bool:
+    """프로바이더 스로틀(429/ThrottlingException/ResourceExhausted) 여부."""
+    from src.services.recovery.error_classifier import get_error_classifier
+    return get_error_classifier().transient_class(type(error).__name__, str(error)) == "throttling"
+
+
+class AdaptiveConcurrencyLimiter:
+    """
+    단일 (provider, model)의 AIMD 동시성 제한기.
+
+    Usage:
+        limiter = get_concurrency_limiter("gemini", "gemini-2.0-flash")
+        with limiter.slot():
+            response = model.generate_content(prompt)
+    """
+
+    def __init__(
+        self,
+        name: str,
+        initial_limit: float = LLM_CONCURRENCY_INITIAL_LIMIT,
+        min_limit: float = LLM_CONCURRENCY_MIN_LIMIT,
+        max_limit: float = LLM_CONCURRENCY_MAX_LIMIT,
+        backoff_ratio: float = LLM_CONCURRENCY_BACKOFF_RATIO,
+        latency_tolerance: float = LLM_CONCURRENCY_LATENCY_TOLERANCE,
+        max_queue_wait_s: float = LLM_CONCURRENCY_MAX_QUEUE_WAIT_S,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.name = name
+        self.min_limit = max(1.0, min_limit)
+        self.max_limit = max(self.min_limit, max_limit)
+        self.backoff_ratio = backoff_ratio
+        self.latency_tolerance = latency_tolerance
+        self.max_queue_wait_s = max_queue_wait_s
+        self._clock = clock
+
+        self._limit = min(self.max_limit, max(self.min_limit, initial_limit))
+        self._in_flight = 0
+        self._queued = 0
+        self._baseline_latency_s: Optional[float] = None
+        self._last_decrease_at = float("-inf")
+        self._cond = threading.Condition()
+        self._stats = {
+            "acquired": 0,
+            "queued": 0,
+            "queue_timeouts": 0,
+            "throttled": 0,
+            "latency_spikes": 0,
+            "increases": 0,
+            "decreases": 0,
+        }
+
+    @property
+    def limit(self) -> int:
+        """현재 허용되는 in-flight 수 (학습된 한도의 정수부)."""
+        return int(self._limit)
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    # ──────────────────────────────────────────────────────────────────────
+    # Acquire / Release
+    # ──────────────────────────────────────────────────────────────────────
+
+    def acquire(self, timeout: Optional[float] = None) -> _Ticket:
+        """
+        슬롯을 획득한다. 한도가 찼으면 release()가 자리를 낼 때까지 대기.
+
+        Raises:
+            ConcurrencyLimitTimeout: timeout(기본 max_queue_wait_s) 안에 슬롯을 얻지 못한 경우
+        """
+        wait_s = self.max_queue_wait_s if timeout is None else timeout
+        with self._cond:
+            if self._in_flight >= int(self._limit):
+                self._queued += 1
+                self._stats["queued"] += 1
+                deadline = time.monotonic() + wait_s
+                try:
+                    while self._in_flight >= int(self._limit):
+                        remaining = deadline - time.monotonic()
+                        if remaining <= 0:
+                            self._stats["queue_timeouts"] += 1
+                            raise ConcurrencyLimitTimeout(
+                                f"LLM concurrency limiter '{self.name}': queue wait exceeded "
+                                f"{wait_s:.1f}s (limit={int(self._limit)}, in_flight={self._in_flight})"
+                            )
+                        self._cond.wait(remaining)
+                finally:
+                    self._queued -= 1
+            self._in_flight += 1
+            self._stats["acquired"] += 1
+            return _Ticket(started_at=self._clock(), in_flight=self._in_flight)
+
+    def release(self, ticket: _Ticket, outcome: str = OUTCOME_SUCCESS) -> None:
+        """슬롯을 반환하고 호출 결과로 한도를 조정한다."""
+        with self._cond:
+            self._in_flight -= 1
+            now = self._clock()
+
+            if outcome == OUTCOME_THROTTLED:
+                self._stats["throttled"] += 1
+                self._decrease(ticket, now, self.backoff_ratio, "throttle")
+            elif outcome == OUTCOME_SUCCESS:
+                latency_s = now - ticket.started_at
+                baseline = self._baseline_latency_s
+                self._baseline_latency_s = latency_s if baseline is None else (
+                    baseline + LATENCY_EWMA_ALPHA * (latency_s - baseline)
+                )
+                if baseline is not None and latency_s > baseline * self.latency_tolerance:
+                    self._stats["latency_spikes"] += 1
+                    self._decrease(ticket, now, LATENCY_BACKOFF_RATIO, "latency")
+                elif ticket.in_flight * 2 >= self._limit and self._limit < self.max_limit:
+                    # 한도의 절반 이상 쓰던 중의 성공만 증가 근거로 삼는다 (유휴 시 무한 증가 방지)
+                    self._limit = min(self.max_limit, self._limit + 1.0 / self._limit)
+                    self._stats["increases"] += 1
+            # OUTCOME_ERROR: 스로틀 외 에러는 용량 신호가 아니므로 한도 유지
+
+            free = int(self._limit) - self._in_flight
+            if free > 0 and self._queued:
+                self._cond.notify(free)
+
+    def _decrease(self, ticket: _Ticket, now: float, ratio: float, reason: str) -> None:
+        """마지막 감소 이전에 시작된 호출의 신호는 무시 (혼잡 구간당 1회 감소)."""
+        if ticket.started_at < self._last_decrease_at:
+            return
+        previous = self._limit
+        self._limit = max(self.min_limit, self._limit * ratio)
+        self._last_decrease_at = now
+        self._stats["decreases"] += 1
+        logger.info(
+            f"[ConcurrencyLimiter] {self.name}: limit {previous:.1f} -> {self._limit:.1f} ({reason})"
+        )
+
+    @contextmanager
+    def slot(self, timeout: Optional[float] = None) -> Iterator[None]:
+        """acquire/release를 감싸고, 블록에서 발생한 예외로 스로틀 여부를 판정한다."""
+        ticket = self.acquire(timeout)
+        outcome = OUTCOME_SUCCESS
+        try:
+            yield
+        except BaseException as e:
+            outcome = OUTCOME_THROTTLED if is_throttle_error(e) else OUTCOME_ERROR
+            raise
+        finally:
+            self.release(ticket, outcome)
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._cond:
+            return {
+                **self._stats,
+                "limit": round(self._limit, 2),
+                "in_flight": self._in_flight,
+                "waiting": self._queued,
+                "baseline_latency_ms": (
+                    round(self._baseline_latency_s * 1000, 1)
+                    if self._baseline_latency_s is not None else None
+                ),
+            }
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# Process-wide registry
+# ═══════════════════════════════════════════════════════════════════════════════
+
+_limiters: Dict[Tuple[str, str], AdaptiveConcurrencyLimiter] = {}
+_limiters_lock = threading.Lock()
+
+
+def get_concurrency_limiter(provider: str, model: str) -> AdaptiveConcurrencyLimiter:
+    """(provider, model)별 제한기 싱글톤."""
+    key = (provider, model or "default")
+    limiter = _limiters.get(key)
+    if limiter is None:
+        with _limiters_lock:
+            limiter = _limiters.get(key)
+            if limiter is None:
+                limiter = AdaptiveConcurrencyLimiter(f"{key[0]}/{key[1]}")
+                _limiters[key] = limiter
+    return limiter
+
+
+@contextmanager
+def provider_slot(provider: str, model: str) -> Iterator[None]:
+    """
+    프로바이더 호출 1회를 (provider, model) 제한기로 감싼다.
+
+    LLM_CONCURRENCY_LIMITER_ENABLED=false이면 아무것도 하지 않는다.
+    """
+    if not LLM_CONCURRENCY_LIMITER_ENABLED:
+        yield
+        return
+    with get_concurrency_limiter(provider, model).slot():
+        yield
+
+
+def get_concurrency_limiter_stats() -> Dict[str, Dict[str, Any]]:
+    """제한기별 한도/대기/스로틀 통계."""
+    with _limiters_lock:
+        limiters = list(_limiters.values())
+    return {limiter.name: limiter.get_stats() for limiter in limiters}
+
+
+def reset_concurrency_limiters() -> None:
+    """모든 제한기 제거 (테스트용)."""
+    with _limiters_lock:
+        _limiters.clear()
@@ -23,6 +23,7 @@ import hashlib
 from typing import Any, Dict, Generator, List, Optional, Tuple, Union
 from dataclasses import dataclass, field
 from enum import Enum
+from contextlib import nullcontext
 from functools import wraps
 
 logger = logging.getLogger(__name__)
@@ -33,6 +34,7 @@ try:
     from src.common.constants import is_mock_mode
     from src.common.secrets_utils import get_gemini_api_key
     from src.common.retry_utils import with_retry_sync
+    from src.services.llm.concurrency_limiter import provider_slot
 except ImportError:
     def is_mock_mode():
         return os.getenv("MOCK_MODE", "true").strip().lower() in {"true", "1", "yes", "on"}
@@ -43,6 +45,9 @@ except ImportError:
             return func
         return decorator
 
+    def provider_slot(provider, model):
+        return nullcontext()
+
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # Context Caching configuration
@@ -960,7 +965,9 @@ class GeminiService:
         start_time = time.time()
         
         try:
-            response = model.generate_content(user_prompt)
+            # 프로세스 단위 AIMD 동시성 제한 (재시도 백오프 중에는 슬롯 미점유)
+            with provider_slot("gemini", self.config.model.value):
+                response = model.generate_content(user_prompt)
             
             # Track token usage
             token_usage = self._track_token_usage(response, full_input, cached_tokens)
@@ -1765,7 +1772,8 @@ Refer to all past conversations and changes to generate consistent responses.
         start_time = time.time()
         
         try:
-            response = model.generate_content(contents)
+            with provider_slot("gemini", self.config.model.value):
+                response = model.generate_content(contents)
             
             # Track token usage
             token_usage = self._track_token_usage(response, user_prompt, cached_tokens=0)
@@ -2006,7 +2014,8 @@ Refer to all past conversations and changes to generate consistent responses.
             )
             
             start_time = time.time()
-            response = model.generate_content(contents)
+            with provider_slot("gemini", self.config.model.value):
+                response = model.generate_content(contents)
             elapsed_ms = (time.time() - start_time) * 1000
             
             # Extract user prompt from contents (first element is usually text)
@@ -0,0 +1,253 @@
+"""
+LLM Request Coalescer
+=====================
+
+같은 실행(execution) 안에서 동시에 나가는 동일한 결정적(temperature 0) LLM 호출을
+하나의 프로바이더 요청으로 합친다 (single-flight).
+
+병렬 브랜치와 for_each 반복은 중복 항목을 펼칠 때 모델/렌더링된 프롬프트/파라미터가
+바이트 단위로 같은 요청을 자주 보낸다. 키는 (provider, model, 파라미터, system/user
+프롬프트)의 BLAKE2b 해시이고, 범위는 실행 단위다 — 다른 실행과 결과를 공유하지 않는다.
+
+  - leader: 키의 첫 호출. 프로바이더를 실제로 호출하고 결과를 공유한다.
+  - follower: leader가 진행 중일 때 들어온 같은 키의 호출. leader 결과(deepcopy)를 받는다.
+    leader가 실패하면 같은 예외를 받고 각자의 재시도 루프로 돌아간다.
+  - cache: LLM_RESPONSE_CACHE_TTL_S > 0이면 leader 결과를 실행 범위에서 TTL 동안 재사용.
+
+실행별로 "합치기 전"(모든 호출이 프로바이더로 갔을 때)과 "합친 후"(실제 호출) 토큰/비용을
+집계한다 — get_execution_token_report().
+"""
+
+import copy
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+LLM_COALESCING_ENABLED = os.environ.get(
+    "LLM_COALESCING_ENABLED", "false"
+).strip().lower() in {"true", "1", "yes", "on"}
+# 실행 범위 응답 캐시 TTL (0 = 비활성, in-flight 합치기만)
+LLM_RESPONSE_CACHE_TTL_S = float(os.environ.get("LLM_RESPONSE_CACHE_TTL_S", "0"))
+LLM_RESPONSE_CACHE_SIZE = int(os.environ.get("LLM_RESPONSE_CACHE_SIZE", "256"))
+# 토큰 리포트를 유지하는 최근 실행 수 (Lambda 컨테이너 재사용 시 메모리 상한)
+COALESCING_REPORT_MAX_EXECUTIONS = 256
+
+SOURCE_PROVIDER = "provider"
+SOURCE_COALESCED = "coalesced"
+SOURCE_CACHE = "cache"
+# 실행 간 영속 응답 저장소(response_store) 적중
+SOURCE_DURABLE = "durable_cache"
+
+_SOURCE_COUNTERS = {
+    SOURCE_COALESCED: "coalesced",
+    SOURCE_CACHE: "cache_hits",
+    SOURCE_DURABLE: "durable_hits",
+}
+
+
+def is_deterministic(temperature: Any) -> bool:
+    """temperature 0 호출만 결과가 결정적이라고 보고 합친다."""
+    try:
+        return temperature is not None and float(temperature) == 0.0
+    except (TypeError, ValueError):
+        return False
+
+
+def canonical_request(
+    provider: str,
+    model: str,
+    params: Dict[str, Any],
+    system_prompt: Optional[str],
+    prompt: str,
+) -> bytes:
+    """(provider, model, 파라미터, 렌더링된 프롬프트)의 정규화 직렬화. 응답 캐시 키의 입력."""
+    return json.dumps(
+        {"provider": provider, "model": model, "params": params,
+         "system": system_prompt or "", "prompt": prompt},
+        sort_keys=True, separators=(",", ":"), ensure_ascii=False, default=str,
+    ).encode("utf-8")
+
+
+def coalescing_key(
+    provider: str,
+    model: str,
+    params: Dict[str, Any],
+    system_prompt: Optional[str],
+    prompt: str,
+) -> str:
+    """canonical_request()의 BLAKE2b-128 해시 (프로세스 내 single-flight 키)."""
+    payload = canonical_request(provider, model, params, system_prompt, prompt)
+    return hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+
+class _Flight:
+    """진행 중인 leader 호출 1건."""
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+def _empty_report() -> Dict[str, Any]:
+    return {
+        "llm_calls": 0,
+        "provider_calls": 0,
+        "coalesced": 0,
+        "cache_hits": 0,
+        "durable_hits": 0,
+        "tokens_before": 0,
+        "tokens_after": 0,
+        "cost_before_usd": 0.0,
+        "cost_after_usd": 0.0,
+    }
+
+
+class LLMRequestCoalescer:
+    """실행 범위 single-flight + 선택적 TTL 응답 캐시."""
+
+    def __init__(
+        self,
+        cache_ttl_s: float = LLM_RESPONSE_CACHE_TTL_S,
+        cache_size: int = LLM_RESPONSE_CACHE_SIZE,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.cache_ttl_s = cache_ttl_s
+        self.cache_size = cache_size
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._in_flight: Dict[Tuple[str, str], _Flight] = {}
+        self._cache: "OrderedDict[Tuple[str, str], Tuple[float, Any]]" = OrderedDict()
+        self._reports: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+
+    def execute(self, execution_id: str, key: str, invoke: Callable[[], Any]) -> Tuple[Any, str]:
+        """
+        invoke()를 실행 범위 single-flight로 호출한다.
+
+        Returns:
+            (결과, source) — source는 "provider" | "coalesced" | "cache".
+            follower/cache 결과는 deepcopy이므로 호출자가 자유롭게 수정해도 된다.
+        """
+        scoped = (execution_id, key)
+        with self._lock:
+            cached = self._cache.get(scoped)
+            if cached is not None:
+                expires_at, result = cached
+                if self._clock() < expires_at:
+                    self._cache.move_to_end(scoped)
+                    return copy.deepcopy(result), SOURCE_CACHE
+                del self._cache[scoped]
+
+            flight = self._in_flight.get(scoped)
+            is_leader = flight is None
+            if is_leader:
+                flight = _Flight()
+                self._in_flight[scoped] = flight
+
+        if not is_leader:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return copy.deepcopy(flight.result), SOURCE_COALESCED
+
+        try:
+            flight.result = invoke()
+        except BaseException as e:
+            flight.error = e
+            raise
+        finally:
+            with self._lock:
+                self._in_flight.pop(scoped, None)
+                if flight.error is None and self.cache_ttl_s > 0:
+                    self._cache[scoped] = (self._clock() + self.cache_ttl_s, flight.result)
+                    while len(self._cache) > self.cache_size:
+                        self._cache.popitem(last=False)
+            flight.done.set()
+        # follower가 받는 사본과 분리 (leader 호출자가 결과를 수정해도 공유본은 그대로)
+        return copy.deepcopy(flight.result), SOURCE_PROVIDER
+
+    def account(self, execution_id: str, source: str, usage: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        호출 1건의 토큰/비용을 실행 리포트에 반영하고, 노드에 기록할 usage를 반환한다.
+
+        follower/cache/durable 호출은 실제 비용이 없으므로 토큰/비용을 0으로 바꾸고
+        절약분을 cost_saved_usd / coalesced_tokens에 남긴다.
+        """
+        tokens = int(usage.get("total_tokens", 0) or 0)
+        cost = float(usage.get("estimated_cost_usd", 0.0) or 0.0)
+        with self._lock:
+            report = self._reports.get(execution_id)
+            if report is None:
+                report = self._reports[execution_id] = _empty_report()
+                while len(self._reports) > COALESCING_REPORT_MAX_EXECUTIONS:
+                    self._reports.popitem(last=False)
+            report["llm_calls"] += 1
+            report["tokens_before"] += tokens
+            report["cost_before_usd"] += cost
+            if source == SOURCE_PROVIDER:
+                report["provider_calls"] += 1
+                report["tokens_after"] += tokens
+                report["cost_after_usd"] += cost
+            else:
+                report[_SOURCE_COUNTERS[source]] += 1
+
+        if source == SOURCE_PROVIDER:
+            return usage
+        return {
+            **usage,
+            "input_tokens": 0,
+            "output_tokens": 0,
+            "total_tokens": 0,
+            "cached_tokens": 0,
+            "estimated_cost_usd": 0.0,
+            "cost_saved_usd": float(usage.get("cost_saved_usd", 0.0) or 0.0) + cost,
+            "coalesced": source,
+            "coalesced_tokens": tokens,
+        }
+
+    def get_execution_token_report(self, execution_id: str) -> Dict[str, Any]:
+        """실행 1건의 합치기 전/후 토큰·비용."""
+        with self._lock:
+            report = dict(self._reports.get(execution_id) or _empty_report())
+        report["tokens_saved"] = report["tokens_before"] - report["tokens_after"]
+        report["cost_saved_usd"] = round(report["cost_before_usd"] - report["cost_after_usd"], 6)
+        report["cost_before_usd"] = round(report["cost_before_usd"], 6)
+        report["cost_after_usd"] = round(report["cost_after_usd"], 6)
+        return report
+
+    def clear(self) -> None:
+        with self._lock:
+            self._in_flight.clear()
+            self._cache.clear()
+            self._reports.clear()
+
+
+_coalescer: Optional[LLMRequestCoalescer] = None
+_coalescer_lock = threading.Lock()
+
+
+def get_request_coalescer() -> LLMRequestCoalescer:
+    """프로세스 단위 싱글톤."""
+    global _coalescer
+    if _coalescer is None:
+        with _coalescer_lock:
+            if _coalescer is None:
+                _coalescer = LLMRequestCoalescer()
+    return _coalescer
+
+
+def get_execution_token_report(execution_id: str) -> Dict[str, Any]:
+    return get_request_coalescer().get_execution_token_report(execution_id)
+
+
+def clear_coalescing_state() -> None:
+    """in-flight/캐시/리포트 초기화 (테스트용)."""
+    get_request_coalescer().clear()
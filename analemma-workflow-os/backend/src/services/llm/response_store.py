@@ -0,0 +1,236 @@
+"""
+Durable LLM Response Store
+==========================
+
+체크포인트 복원(CheckpointService.restore_from_checkpoint / time_machine_service)이나
+크래시 후 재실행은 복원 지점 이후의 LLM 노드를 모두 다시 호출한다 — 렌더링된 프롬프트와
+모델 설정이 이전 실행과 같아도. 결정적(temperature 0) 노드의 응답을 실행 간에 재사용하는
+opt-in 콘텐츠 주소 저장소.
+
+  - 키: canonical_request(provider, model, 파라미터, system/user 프롬프트)의 SHA-256
+    (request_coalescer와 같은 정규화 — 같은 요청이면 같은 키)
+  - 위치: Merkle 블록과 같은 버킷/프리픽스
+        merkle-blocks/{workflow_id}/llm-responses/{key[:2]}/{key}.json  (gzip, mtime=0)
+    워크플로우 단위 경로 — 다른 워크플로우와 응답을 공유하지 않는다.
+  - TTL: 워크플로우 설정 llm_response_cache.ttl_seconds (기본 LLM_DURABLE_CACHE_TTL_S).
+    읽을 때 created_at + 현재 TTL로 판정하므로 TTL을 줄이면 기존 응답에도 즉시 적용된다.
+    저장 객체 자체는 WorkflowStateBucket 수명 주기 규칙(LlmResponseCacheCleanup,
+    type=llm-response 태그)이 7일 후 삭제하며, 이전 버전은 1일 후 만료된다 —
+    따라서 실질적인 TTL 상한은 7일.
+  - 활성화: 워크플로우 설정 llm_response_cache.enabled 또는 노드 설정
+    durable_response_cache (노드가 우선), 둘 다 없으면 LLM_DURABLE_CACHE_ENABLED.
+
+백엔드는 get/put만 구현하면 된다 — S3ResponseBackend(운영), InMemoryResponseBackend(오프라인).
+저장소 오류는 노드를 실패시키지 않는다 (읽기 실패 = miss, 쓰기 실패 = 로그만).
+"""
+
+import gzip
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from collections.abc import Mapping
+from typing import Any, Callable, Dict, Optional
+
+from src.services.llm.request_coalescer import canonical_request
+
+logger = logging.getLogger(__name__)
+
+LLM_DURABLE_CACHE_ENABLED = os.environ.get(
+    "LLM_DURABLE_CACHE_ENABLED", "false"
+).strip().lower() in {"true", "1", "yes", "on"}
+# 워크플로우가 ttl_seconds를 지정하지 않았을 때의 TTL (기본 1일)
+LLM_DURABLE_CACHE_TTL_S = float(os.environ.get("LLM_DURABLE_CACHE_TTL_S", "86400"))
+
+RESPONSE_KEY_PREFIX = "merkle-blocks"
+RESPONSE_RECORD_VERSION = 1
+
+
+def response_key(
+    provider: str,
+    model: str,
+    params: Dict[str, Any],
+    system_prompt: Optional[str],
+    prompt: str,
+) -> str:
+    """요청의 콘텐츠 주소 (SHA-256 hex)."""
+    return hashlib.sha256(canonical_request(provider, model, params, system_prompt, prompt)).hexdigest()
+
+
+def resolve_cache_ttl(workflow_config: Optional[Dict[str, Any]], node_config: Dict[str, Any]) -> Optional[float]:
+    """
+    노드/워크플로우 설정으로 영속 캐시 TTL(초)을 결정한다. 비활성이면 None.
+
+    워크플로우 설정 예: {"llm_response_cache": {"enabled": true, "ttl_seconds": 3600}}
+    """
+    workflow_settings = {}
+    if isinstance(workflow_config, Mapping):
+        workflow_settings = workflow_config.get("llm_response_cache") or {}
+    enabled = node_config.get("durable_response_cache")
+    if enabled is None:
+        enabled = workflow_settings.get("enabled", LLM_DURABLE_CACHE_ENABLED)
+    if not enabled:
+        return None
+    ttl_s = float(workflow_settings.get("ttl_seconds", LLM_DURABLE_CACHE_TTL_S))
+    return ttl_s if ttl_s > 0 else None
+
+
+class InMemoryResponseBackend:
+    """오프라인/테스트용 백엔드."""
+
+    def __init__(self):
+        self.objects: Dict[str, bytes] = {}
+        self._lock = threading.Lock()
+
+    def get(self, object_key: str) -> Optional[bytes]:
+        with self._lock:
+            return self.objects.get(object_key)
+
+    def put(self, object_key: str, body: bytes, metadata: Dict[str, str]) -> None:
+        with self._lock:
+            self.objects[object_key] = body
+
+
+class S3ResponseBackend:
+    """Merkle 블록 버킷에 응답 레코드를 저장한다."""
+
+    def __init__(self, bucket: str, s3_client=None):
+        self.bucket = bucket
+        if s3_client is None:
+            from src.common.aws_clients import get_s3_client
+            s3_client = get_s3_client()
+        self.s3 = s3_client
+
+    def get(self, object_key: str) -> Optional[bytes]:
+        try:
+            return self.s3.get_object(Bucket=self.bucket, Key=object_key)["Body"].read()
+        except self.s3.exceptions.NoSuchKey:
+            return None
+
+    def put(self, object_key: str, body: bytes, metadata: Dict[str, str]) -> None:
+        # 2PC temp 태그를 쓰지 않는다 — 매니페스트가 참조하지 않는 독립 레코드이므로
+        # BackgroundGC의 temp 블록 정리 대상이 아니다. 만료는 읽기 시점 TTL로 판정하고,
+        # 객체 삭제는 type=llm-response 태그 수명 주기 규칙(template.yaml)이 담당.
+        self.s3.put_object(
+            Bucket=self.bucket,
+            Key=object_key,
+            Body=body,
+            ContentType="application/json",
+            ContentEncoding="gzip",
+            Tagging="status=ready&type=llm-response",
+            Metadata=metadata,
+        )
+
+
+class LLMResponseStore:
+    """워크플로우 범위 콘텐츠 주소 LLM 응답 저장소."""
+
+    def __init__(self, backend: Any, clock: Callable[[], float] = time.time):
+        self.backend = backend
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._stats = {
+            "hits": 0,
+            "misses": 0,
+            "expired": 0,
+            "writes": 0,
+            "read_errors": 0,
+            "write_errors": 0,
+            "tokens_saved": 0,
+            "cost_saved_usd": 0.0,
+        }
+
+    @staticmethod
+    def object_key(workflow_id: str, key: str) -> str:
+        return f"{RESPONSE_KEY_PREFIX}/{workflow_id}/llm-responses/{key[:2]}/{key}.json"
+
+    def _count(self, name: str, amount: float = 1) -> None:
+        with self._lock:
+            self._stats[name] += amount
+
+    def get(self, workflow_id: str, key: str, ttl_s: float) -> Optional[Dict[str, Any]]:
+        """저장된 응답을 반환한다. 없거나 만료됐거나 읽기 실패면 None."""
+        try:
+            body = self.backend.get(self.object_key(workflow_id, key))
+            record = json.loads(gzip.decompress(body)) if body is not None else None
+        except Exception as e:
+            logger.warning(f"[ResponseStore] Read failed for {workflow_id}/{key[:12]}: {e}")
+            self._count("read_errors")
+            return None
+
+        if record is None or record.get("key") != key:
+            self._count("misses")
+            return None
+        if self._clock() >= min(record.get("expires_at", 0), record.get("created_at", 0) + ttl_s):
+            self._count("expired")
+            return None
+        self._count("hits")
+        return record["response"]
+
+    def put(
+        self,
+        workflow_id: str,
+        key: str,
+        response: Any,
+        ttl_s: float,
+        provider: str,
+        model: str,
+    ) -> bool:
+        """응답을 저장한다. 실패해도 예외를 올리지 않는다."""
+        now = self._clock()
+        record = {
+            "version": RESPONSE_RECORD_VERSION,
+            "key": key,
+            "provider": provider,
+            "model": model,
+            "created_at": now,
+            "expires_at": now + ttl_s,
+            "response": response,
+        }
+        try:
+            raw = json.dumps(record, ensure_ascii=False, separators=(",", ":"), default=str).encode("utf-8")
+            self.backend.put(
+                self.object_key(workflow_id, key),
+                gzip.compress(raw, compresslevel=6, mtime=0),
+                {"workflow_id": workflow_id, "provider": provider, "model": model,
+                 "expires_at": str(int(now + ttl_s))},
+            )
+        except Exception as e:
+            logger.warning(f"[ResponseStore] Write failed for {workflow_id}/{key[:12]}: {e}")
+            self._count("write_errors")
+            return False
+        self._count("writes")
+        return True
+
+    def record_saving(self, usage: Dict[str, Any]) -> None:
+        """적중 1건으로 절약한 토큰/비용 (적중 응답의 원래 usage)."""
+        with self._lock:
+            self._stats["tokens_saved"] += int(usage.get("total_tokens", 0) or 0)
+            self._stats["cost_saved_usd"] += float(usage.get("estimated_cost_usd", 0.0) or 0.0)
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            stats = dict(self._stats)
+        lookups = stats["hits"] + stats["misses"] + stats["expired"]
+        stats["hit_rate"] = round(stats["hits"] / lookups, 4) if lookups else 0.0
+        stats["cost_saved_usd"] = round(stats["cost_saved_usd"], 6)
+        return stats
+
+
+_response_store: Optional[LLMResponseStore] = None
+_response_store_lock = threading.Lock()
+
+
+def get_response_store() -> Optional[LLMResponseStore]:
+    """WORKFLOW_STATE_BUCKET 기반 싱글톤. 버킷이 설정되지 않았으면 None."""
+    global _response_store
+    if _response_store is None:
+        bucket = os.environ.get("WORKFLOW_STATE_BUCKET")
+        if not bucket:
+            return None
+        with _response_store_lock:
+            if _response_store is None:
+                _response_store = LLMResponseStore(S3ResponseBackend(bucket))
+    return _response_store
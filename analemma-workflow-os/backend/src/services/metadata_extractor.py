@@ -17,6 +17,133 @@ from src.models.correction_log import ToneEnum, LengthEnum, FormalityEnum, Style
 
 logger = logging.getLogger(__name__)
 
+
+def _strip_common_affixes(a: str, b: str) -> Tuple[str, str]:
+    """공통 prefix/suffix 제거 - 편집 거리에 영향 없이 비교 구간만 축소"""
+    limit = min(len(a), len(b))
+    if limit == 0:
+        return a, b
+    
+    # 슬라이스 비교 이분 탐색 - 문자 단위 Python 루프 없이 C 레벨에서 비교
+    lo, hi = 0, limit
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        if a[:mid] == b[:mid]:
+            lo = mid
+        else:
+            hi = mid - 1
+    prefix = lo
+    
+    lo, hi = 0, limit - prefix
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        if a[len(a) - mid:] == b[len(b) - mid:]:
+            lo = mid
+        else:
+            hi = mid - 1
+    suffix = lo
+    
+    return a[prefix:len(a) - suffix], b[prefix:len(b) - suffix]
+
+
+def _banded_edit_distance(a: str, b: str, max_distance: int) -> int:
+    """
+    Ukkonen banded Levenshtein DP
+    
+    |i - j| <= k 대각선 밴드만 계산하므로 O(k·n) 시간, O(k) 메모리.
+    행 최솟값이 k를 넘으면 즉시 종료하고 k + 1 반환.
+    """
+    n, m = len(a), len(b)
+    k = max_distance
+    if abs(n - m) > k:
+        return k + 1
+    if n == 0 or m == 0:
+        return max(n, m)
+    
+    cap = k + 1
+    width = 2 * k + 1
+    # 밴드 인덱스 t는 열 j = i - k + t 에 대응
+    prev = [cap] * width
+    for t in range(k, width):
+        j = t - k
+        prev[t] = j if j <= m else cap
+    
+    for i in range(1, n + 1):
+        ca = a[i - 1]
+        cur = [cap] * width
+        row_min = cap
+        base = i - k
+        for t in range(width):
+            j = base + t
+            if j < 0 or j > m:
+                continue
+            if j == 0:
+                value = i if i < cap else cap
+            else:
+                value = prev[t] + (ca != b[j - 1])
+                if t + 1 < width and prev[t + 1] + 1 < value:
+                    value = prev[t + 1] + 1
+                if t > 0 and cur[t - 1] + 1 < value:
+                    value = cur[t - 1] + 1
+                if value > cap:
+                    value = cap
+            cur[t] = value
+            if value < row_min:
+                row_min = value
+        if row_min > k:
+            return cap
+        prev = cur
+    
+    result = prev[m - n + k]
+    return result if result <= k else cap
+
+
+def _bit_parallel_edit_distance(a: str, b: str, max_distance: Optional[int] = None) -> int:
+    """
+    Myers/Hyyrö bit-parallel Levenshtein
+    
+    긴 문자열을 비트 벡터(Python 임의 정밀도 정수)로 인코딩하고 짧은 문자열을
+    한 글자씩 스캔합니다. 열 하나당 정수 연산 십여 번이므로 O(n·⌈m/w⌉).
+    max_distance 지정 시 남은 열로 줄일 수 없는 거리가 확정되면 종료.
+    """
+    if len(a) < len(b):
+        a, b = b, a
+    m, n = len(a), len(b)
+    if n == 0:
+        return m if max_distance is None or m <= max_distance else max_distance + 1
+    
+    peq: Dict[str, int] = {}
+    for i, ch in enumerate(a):
+        peq[ch] = peq.get(ch, 0) | (1 << i)
+    
+    mask = (1 << m) - 1
+    high_bit = 1 << (m - 1)
+    pv = mask
+    mv = 0
+    score = m
+    
+    for j, ch in enumerate(b):
+        eq = peq.get(ch, 0)
+        xv = eq | mv
+        xh = ((((eq & pv) + pv) & mask) ^ pv) | eq
+        ph = mv | (~(xh | pv) & mask)
+        mh = pv & xh
+        if ph & high_bit:
+            score += 1
+        elif mh & high_bit:
+            score -= 1
+        ph = ((ph << 1) | 1) & mask
+        mh = (mh << 1) & mask
+        pv = mh | (~(xv | ph) & mask)
+        mv = ph & xv
+        # 남은 열마다 거리는 최대 1씩만 감소
+        if max_distance is not None and score - (n - j - 1) > max_distance:
+            return max_distance + 1
+    
+    if max_distance is not None and score > max_distance:
+        return max_distance + 1
+    return score
+
 class MetadataExtractor:
     """구조화된 메타데이터 추출 (고급 최적화 적용)"""
     
@@ -87,6 +214,10 @@ class MetadataExtractor:
     CONTEXT_WINDOW_SIZE = 200    # 변경 부분 주변 200자 컨텍스트
     MAX_DIFF_CHUNKS = 5          # 최대 5개의 변경 구간만 처리
     
+    # 편집 거리 계산 설정
+    EXACT_EDIT_DISTANCE_LIMIT = 200000  # 이 길이까지는 근사 없이 정확 계산
+    BANDED_WIDTH_RATIO = 1024           # 밴드 폭(2k+1) × 1024 <= 텍스트 길이면 banded DP가 더 빠름
+    
     def __init__(self):
         self.client = openai.AsyncOpenAI()
     
@@ -365,38 +496,56 @@ Extract changed metadata attributes:
                 
         return True
     
-    def calculate_edit_distance(self, original: str, corrected: str) -> int:
-        """
-        Levenshtein 편집 거리 계산 (개선된 버전)
-        
-        개선사항: 대규모 텍스트에서도 효율적으로 동작하도록 최적화
+    def calculate_edit_distance(
+        self,
+        original: str,
+        corrected: str,
+        max_distance: Optional[int] = None
+    ) -> int:
         """
+        Levenshtein 편집 거리 계산 (정확 계산 + 조기 종료)
         
-        # 대규모 텍스트의 경우 샘플링으로 근사치 계산
-        if len(original) > 10000 or len(corrected) > 10000:
-            return self._calculate_edit_distance_sampled(original, corrected)
-        
-        # 기존 정확한 계산
-        if len(original) < len(corrected):
-            return self.calculate_edit_distance(corrected, original)
-        
-        if len(corrected) == 0:
-            return len(original)
+        개선사항:
+        1. 공통 prefix/suffix 제거 후 변경 구간만 계산 (diff-based 축소)
+        2. max_distance 지정 시 임계값 초과가 확정되는 즉시 종료
+           - 텍스트 길이 대비 좁은 임계값은 banded DP (O(k·n))
+           - 그 외에는 bit-parallel 알고리즘에서 하한(lower bound) 기반 종료
+        3. Myers/Hyyrö bit-parallel 알고리즘 (O(n·⌈m/w⌉))으로
+           EXACT_EDIT_DISTANCE_LIMIT 이하 텍스트는 근사 없이 정확한 값 반환
+        
+        Args:
+            original: 원본 텍스트
+            corrected: 수정된 텍스트
+            max_distance: 조기 종료 임계값 (초과 시 max_distance + 1 반환)
         
-        previous_row = list(range(len(corrected) + 1))
-        for i, c1 in enumerate(original):
-            current_row = [i + 1]
-            for j, c2 in enumerate(corrected):
-                insertions = previous_row[j + 1] + 1
-                deletions = current_row[j] + 1
-                substitutions = previous_row[j] + (c1 != c2)
-                current_row.append(min(insertions, deletions, substitutions))
-            previous_row = current_row
+        Returns:
+            편집 거리 (max_distance 초과 시 max_distance + 1)
+        """
         
-        return previous_row[-1]
+        # 초대형 텍스트만 샘플링 근사 (정확 계산 한도 초과)
+        if (len(original) > self.EXACT_EDIT_DISTANCE_LIMIT or
+                len(corrected) > self.EXACT_EDIT_DISTANCE_LIMIT):
+            distance = self._calculate_edit_distance_sampled(original, corrected)
+            if max_distance is not None and distance > max_distance:
+                return max_distance + 1
+            return distance
+        
+        original, corrected = _strip_common_affixes(original, corrected)
+        
+        if max_distance is not None:
+            if max_distance < 0:
+                raise ValueError("max_distance must be non-negative")
+            # 길이 차이는 편집 거리의 하한
+            if abs(len(original) - len(corrected)) > max_distance:
+                return max_distance + 1
+            longest = max(len(original), len(corrected))
+            if (2 * max_distance + 1) * self.BANDED_WIDTH_RATIO <= longest:
+                return _banded_edit_distance(original, corrected, max_distance)
+        
+        return _bit_parallel_edit_distance(original, corrected, max_distance)
     
     def _calculate_edit_distance_sampled(self, original: str, corrected: str) -> int:
-        """대규모 텍스트용 샘플링 기반 편집 거리 근사 계산"""
+        """초대형 텍스트용 샘플링 기반 편집 거리 근사 계산"""
         
         # 텍스트를 청크로 나누어 샘플링
         chunk_size = 1000
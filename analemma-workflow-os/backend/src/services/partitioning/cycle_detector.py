@@ -3,7 +3,7 @@ Cycle Detector Service
 
 위상 정렬 전 순환 감지
 - 명시적 순환 (loop/for_each 내부) vs 암묵적 순환 (일반 엣지) 분리
-- DFS 기반 순환 경로 추적
+- SCC 기반 순환 경로 추적 (graph_dsl.WorkflowGraphIndex 공유, O(V+E))
 - Pre-compilation 검증
 """
 
@@ -11,6 +11,8 @@ import logging
 from typing import Dict, List, Set, Optional, Tuple
 from dataclasses import dataclass
 
+from src.common.graph_dsl import WorkflowGraphIndex
+
 logger = logging.getLogger(__name__)
 
 
@@ -38,19 +40,29 @@ class CycleDetector:
     - ❌ 금지: 일반 엣지로 연결된 노드 간 순환 (A → B → C → A)
     """
     
-    def __init__(self, nodes: List[Dict], edges: List[Dict]):
+    def __init__(
+        self,
+        nodes: List[Dict],
+        edges: List[Dict],
+        index: Optional[WorkflowGraphIndex] = None
+    ):
         """
         Args:
             nodes: 워크플로우 노드 목록
             edges: 워크플로우 엣지 목록
+            index: 검증 단계에서 이미 구축한 WorkflowGraphIndex (없으면 구축)
         """
         self.nodes = nodes
         self.edges = edges
         self.node_map = {node["id"]: node for node in nodes}
+        if index is None or not index.matches(nodes, edges):
+            index = WorkflowGraphIndex(nodes, edges)
+        self.index = index
+        self._loop_internals: Optional[Set[str]] = None
     
     def detect_illegal_cycles(self) -> List[CycleInfo]:
         """
-        금지된 순환 감지 (DFS 기반)
+        금지된 순환 감지 (SCC 기반, 순환을 포함한 SCC마다 대표 순환 하나)
         
         Returns:
             발견된 순환 목록 (빈 리스트면 순환 없음)
@@ -58,24 +70,15 @@ class CycleDetector:
         Raises:
             IllegalCycleError: 금지된 순환 발견 시
         """
-        # 1. 그래프 구성 (loop/for_each 내부는 제외)
-        graph = self._build_graph()
-        
-        # 2. DFS 순환 감지
+        # 1. 공유 인덱스에서 순환 감지 (loop/for_each 내부는 제외)
         cycles = []
-        visited = set()
-        rec_stack = set()
-        
-        for node_id in graph:
-            if node_id not in visited:
-                path = []
-                cycle_info = self._dfs_cycle(
-                    node_id, graph, visited, rec_stack, path
-                )
-                if cycle_info:
-                    cycles.append(cycle_info)
+        for cycle_path in self.index.find_cycles(excluded=self._get_loop_internals()):
+            logger.warning(
+                f"[CYCLE_FOUND] {' → '.join(cycle_path)}"
+            )
+            cycles.append(CycleInfo(path=cycle_path, cycle_type='illegal'))
         
-        # 3. 결과 반환 또는 예외 발생
+        # 2. 결과 반환 또는 예외 발생
         if cycles:
             logger.error(
                 f"[CYCLE_DETECTOR] Found {len(cycles)} illegal cycles:\n" +
@@ -93,59 +96,6 @@ class CycleDetector:
         )
         return cycles
     
-    def _dfs_cycle(
-        self,
-        node_id: str,
-        graph: Dict[str, List[str]],
-        visited: Set[str],
-        rec_stack: Set[str],
-        path: List[str]
-    ) -> Optional[CycleInfo]:
-        """
-        DFS 기반 순환 감지
-        
-        Args:
-            node_id: 현재 노드 ID
-            graph: 인접 리스트 그래프
-            visited: 방문한 노드 Set
-            rec_stack: 재귀 스택 (현재 경로)
-            path: 경로 추적
-        
-        Returns:
-            순환 정보 (순환 없으면 None)
-        """
-        visited.add(node_id)
-        rec_stack.add(node_id)
-        path.append(node_id)
-        
-        for neighbor in graph.get(node_id, []):
-            if neighbor not in visited:
-                # 미방문 노드: 재귀 탐색
-                cycle_info = self._dfs_cycle(
-                    neighbor, graph, visited, rec_stack, path
-                )
-                if cycle_info:
-                    return cycle_info
-            
-            elif neighbor in rec_stack:
-                # 순환 발견!
-                cycle_start = path.index(neighbor)
-                cycle_path = path[cycle_start:] + [neighbor]
-                
-                logger.warning(
-                    f"[CYCLE_FOUND] {' → '.join(cycle_path)}"
-                )
-                
-                return CycleInfo(
-                    path=cycle_path,
-                    cycle_type='illegal'
-                )
-        
-        # 백트래킹
-        rec_stack.remove(node_id)
-        path.pop()
-        return None
-    
     def _build_graph(self) -> Dict[str, List[str]]:
         """
         그래프 구성 (loop/for_each 내부는 제외)
@@ -154,25 +104,14 @@ class CycleDetector:
             인접 리스트 그래프 {node_id: [target_ids]}
         """
         # 1. loop/for_each 내부 노드 추출
-        loop_internals = self._extract_loop_internals()
+        loop_internals = self._get_loop_internals()
         
-        logger.debug(
-            f"[GRAPH_BUILD] Excluding {len(loop_internals)} loop-internal nodes"
-        )
-        
-        # 2. 그래프 초기화
-        graph = {node["id"]: [] for node in self.nodes}
-        
-        # 3. 엣지 추가 (loop 내부는 무시)
-        for edge in self.edges:
-            source = edge["source"]
-            target = edge["target"]
-            
-            # loop 내부 엣지는 무시 (허용된 순환)
-            if source in loop_internals or target in loop_internals:
-                continue
-            
-            graph[source].append(target)
+        # 2. 공유 인덱스의 인접 리스트에서 loop 내부 엣지 제외 (허용된 순환)
+        graph = {
+            node_id: ([] if node_id in loop_internals else
+                      [t for t in targets if t not in loop_internals])
+            for node_id, targets in self.index.successors.items()
+        }
         
         logger.info(
             f"[GRAPH_BUILD] Built graph with {len(graph)} nodes, "
@@ -182,6 +121,15 @@ class CycleDetector:
         
         return graph
     
+    def _get_loop_internals(self) -> Set[str]:
+        """loop/for_each 내부 노드 ID (인스턴스당 1회 추출)"""
+        if self._loop_internals is None:
+            self._loop_internals = self._extract_loop_internals()
+            logger.debug(
+                f"[GRAPH_BUILD] Excluding {len(self._loop_internals)} loop-internal nodes"
+            )
+        return self._loop_internals
+    
     def _extract_loop_internals(self) -> Set[str]:
         """
         loop/for_each 노드 내부의 모든 노드 ID 추출
@@ -243,7 +191,7 @@ class CycleDetector:
     
     def get_topological_order(self) -> List[str]:
         """
-        위상 정렬 (Kahn's Algorithm)
+        위상 정렬 (Kahn's Algorithm, 공유 인덱스 재사용)
         
         Returns:
             위상 정렬된 노드 ID 리스트
@@ -254,33 +202,14 @@ class CycleDetector:
         # 1. 순환 검사
         self.detect_illegal_cycles()
         
-        # 2. 그래프 구성
-        graph = self._build_graph()
-        
-        # 3. in-degree 계산
-        in_degree = {node_id: 0 for node_id in graph}
-        for node_id in graph:
-            for neighbor in graph[node_id]:
-                in_degree[neighbor] += 1
-        
-        # 4. Kahn's Algorithm
-        queue = [node_id for node_id, degree in in_degree.items() if degree == 0]
-        topological_order = []
-        
-        while queue:
-            node_id = queue.pop(0)
-            topological_order.append(node_id)
-            
-            for neighbor in graph[node_id]:
-                in_degree[neighbor] -= 1
-                if in_degree[neighbor] == 0:
-                    queue.append(neighbor)
+        # 2. Kahn's Algorithm (loop 내부 노드는 엣지 없이 포함)
+        topological_order = self.index.topological_order(excluded=self._get_loop_internals())
         
-        # 5. 검증
-        if len(topological_order) != len(graph):
+        # 3. 검증
+        if topological_order is None:
             # 이론적으로는 도달 불가 (사전 순환 검사 통과 시)
             raise IllegalCycleError(
-                f"Topological sort failed: {len(topological_order)} != {len(graph)}"
+                f"Topological sort failed: cycle remains among {len(self.index.successors)} nodes"
             )
         
         logger.info(
@@ -365,7 +294,8 @@ class CycleAnalyzer:
 # 팩토리 함수
 def create_cycle_detector(
     nodes: List[Dict],
-    edges: List[Dict]
+    edges: List[Dict],
+    index: Optional[WorkflowGraphIndex] = None
 ) -> CycleDetector:
     """
     CycleDetector 인스턴스 생성
@@ -373,8 +303,9 @@ def create_cycle_detector(
     Args:
         nodes: 워크플로우 노드 목록
         edges: 워크플로우 엣지 목록
+        index: 검증 단계에서 구축한 WorkflowGraphIndex (재사용 시 재구축 생략)
     
     Returns:
         CycleDetector 인스턴스
     """
-    return CycleDetector(nodes, edges)
+    return CycleDetector(nodes, edges, index=index)
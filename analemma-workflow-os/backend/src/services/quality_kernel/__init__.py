@@ -32,6 +32,7 @@ from .slop_detector import (
     SlopPattern,
     EmojiAnalysisResult
 )
+from .text_statistics import TextStatistics, SentenceStats, compute_text_statistics
 from .quality_gate import (
     QualityGate,
     QualityVerdict,
@@ -106,6 +107,11 @@ __all__ = [
     'SlopPattern',
     'EmojiAnalysisResult',
     
+    # Shared Stage 1 Text Statistics (single-pass)
+    'TextStatistics',
+    'SentenceStats',
+    'compute_text_statistics',
+    
     # Quality Gate
     'QualityGate',
     'QualityVerdict',
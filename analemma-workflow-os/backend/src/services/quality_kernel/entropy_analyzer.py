@@ -33,6 +33,8 @@ from dataclasses import dataclass, field
 from typing import List, Dict, Optional, Tuple
 from enum import Enum
 
+from .text_statistics import TextStatistics, compute_text_statistics, entropy_from_counts
+
 
 class ContentDomain(Enum):
     """콘텐츠 도메인 분류"""
@@ -185,12 +187,13 @@ class EntropyAnalyzer:
         self._word_pattern = re.compile(r'\b[a-zA-Z가-힣]+\b')
         self._sentence_pattern = re.compile(r'[.!?]+')
     
-    def analyze(self, text: str) -> EntropyAnalysisResult:
+    def analyze(self, text: str, stats: Optional[TextStatistics] = None) -> EntropyAnalysisResult:
         """
         텍스트의 엔트로피 분석 수행
         
         Args:
             text: 분석할 텍스트
+            stats: compute_text_statistics(text) 결과 (SlopDetector와 공유 시 전달)
             
         Returns:
             EntropyAnalysisResult: 상세 분석 결과
@@ -198,32 +201,31 @@ class EntropyAnalyzer:
         if not text or len(text.strip()) < 10:
             return self._empty_result()
         
-        # 토큰화
-        words = self._tokenize_words(text)
-        chars = list(text)
+        # 토큰화 / 빈도 / 문장 분할 (한 번의 스윕)
+        if stats is None:
+            stats = compute_text_statistics(text)
+        words = stats.words
         
         if len(words) < 3:
             return self._empty_result()
         
         # 핵심 엔트로피 계산
-        word_entropy = self._calculate_entropy(words)
-        char_entropy = self._calculate_entropy(chars)
+        word_entropy = entropy_from_counts(stats.word_counts.values(), stats.total_words)
+        char_entropy = entropy_from_counts(stats.char_counts.values(), stats.total_chars)
         
         # N-gram 엔트로피
-        bigrams = self._get_ngrams(words, 2)
-        trigrams = self._get_ngrams(words, 3)
-        bigram_entropy = self._calculate_entropy(bigrams) if bigrams else 0.0
-        trigram_entropy = self._calculate_entropy(trigrams) if trigrams else 0.0
+        bigram_entropy = entropy_from_counts(stats.bigram_counts.values(), stats.bigram_total)
+        trigram_entropy = entropy_from_counts(stats.trigram_counts.values(), stats.trigram_total)
         
         # 어휘 풍부성
-        unique_words = set(words)
-        vocabulary_richness = len(unique_words) / len(words) if words else 0.0
+        unique_word_count = len(stats.word_counts)
+        vocabulary_richness = unique_word_count / len(words) if words else 0.0
         
         # 반복성 분석
-        repetition_ratio, high_freq_ngrams = self._analyze_repetition(words)
+        repetition_ratio, high_freq_ngrams = self._analyze_repetition_counts(stats)
         
         # 저엔트로피 구간 탐지
-        low_entropy_segments = self._find_low_entropy_segments(text)
+        low_entropy_segments = self._low_entropy_segments_from_stats(stats)
         
         # ============================================================
         # Length-based Normalization (짧은 텍스트 보정)
@@ -253,9 +255,9 @@ class EntropyAnalyzer:
             trigram_entropy=trigram_entropy,
             repetition_ratio=repetition_ratio,
             total_words=len(words),
-            unique_words=len(unique_words),
-            total_chars=len(chars),
-            unique_chars=len(set(chars)),
+            unique_words=unique_word_count,
+            total_chars=stats.total_chars,
+            unique_chars=len(stats.char_counts),
             passes_threshold=passes,
             domain=self.domain,
             thresholds_used=self.thresholds,
@@ -290,29 +292,18 @@ class EntropyAnalyzer:
         words = self._word_pattern.findall(text.lower())
         return words
     
-    def _get_ngrams(self, tokens: List[str], n: int) -> List[str]:
-        """N-gram 생성"""
-        if len(tokens) < n:
-            return []
-        return [' '.join(tokens[i:i+n]) for i in range(len(tokens) - n + 1)]
-    
-    def _analyze_repetition(self, words: List[str]) -> Tuple[float, Dict[str, int]]:
-        """반복성 분석"""
-        if len(words) < 6:
+    def _analyze_repetition_counts(self, stats: TextStatistics) -> Tuple[float, Dict[str, int]]:
+        """반복성 분석 (공유 trigram 빈도 사용)"""
+        if stats.total_words < 6:
             return 0.0, {}
         
-        # 트라이그램 반복 분석
-        trigrams = self._get_ngrams(words, 3)
-        trigram_counts = Counter(trigrams)
-        
-        # 2회 이상 등장하는 트라이그램
-        repeated = {k: v for k, v in trigram_counts.items() if v >= 2}
-        repeated_count = sum(repeated.values()) - len(repeated)  # 초과 등장 횟수
+        trigram_counts = stats.trigram_counts
+        repeated = [v for v in trigram_counts.values() if v >= 2]
+        repeated_count = sum(repeated) - len(repeated)  # 초과 등장 횟수
+        repetition_ratio = repeated_count / stats.trigram_total if stats.trigram_total else 0.0
         
-        repetition_ratio = repeated_count / len(trigrams) if trigrams else 0.0
-        
-        # 고빈도 n-gram (상위 10개)
-        high_freq = dict(trigram_counts.most_common(10))
+        # 고빈도 n-gram (상위 10개) - 출력용 문자열 키는 여기서만 생성
+        high_freq = {' '.join(k): v for k, v in trigram_counts.most_common(10)}
         
         return repetition_ratio, high_freq
     
@@ -366,27 +357,16 @@ class EntropyAnalyzer:
         
         return normalized_entropy, adjustment
     
-    def _find_low_entropy_segments(self, text: str, segment_size: int = 50) -> List[str]:
-        """저엔트로피 구간 탐지 (정보 증류 트리거용)"""
-        sentences = self._sentence_pattern.split(text)
+    def _low_entropy_segments_from_stats(self, stats: TextStatistics) -> List[str]:
+        """저엔트로피 구간 탐지 (정보 증류 트리거용, 공유 문장 통계 사용)"""
+        cutoff = self.thresholds.min_word_entropy * 0.6
         low_entropy_segments = []
-        
-        for sentence in sentences:
-            sentence = sentence.strip()
-            if len(sentence) < 20:
-                continue
-            
-            words = self._tokenize_words(sentence)
-            if len(words) < 5:
-                continue
-            
-            entropy = self._calculate_entropy(words)
-            
-            # 문장 레벨 엔트로피가 낮으면 기록
-            if entropy < self.thresholds.min_word_entropy * 0.6:
-                low_entropy_segments.append(sentence[:100])
-        
-        return low_entropy_segments[:5]  # 최대 5개
+        for sentence in stats.sentences:
+            if sentence.entropy is not None and sentence.entropy < cutoff:
+                low_entropy_segments.append(sentence.text[:100])
+                if len(low_entropy_segments) == 5:  # 최대 5개
+                    break
+        return low_entropy_segments
     
     def _check_thresholds(
         self,
@@ -55,6 +55,7 @@ import logging
 
 from .entropy_analyzer import EntropyAnalyzer, EntropyAnalysisResult, ContentDomain
 from .slop_detector import SlopDetector, SlopDetectionResult
+from .text_statistics import compute_text_statistics
 from .cost_guardrails import (
     CostGuardrailSystem,
     GuardrailAction,
@@ -633,11 +634,14 @@ Your verdict (REJECT or APPROVE):"""
         Normalized Formula:
         H_norm(X) = H(X) * (1 + α * log₂(1 + N/N_ref))
         """
+        # 토큰화/n-gram/문장 분할은 한 번만 수행하고 두 분석기가 공유
+        stats = compute_text_statistics(text)
+        
         # 엔트로피 분석
-        entropy_result = self.entropy_analyzer.analyze(text)
+        entropy_result = self.entropy_analyzer.analyze(text, stats=stats)
         
         # 슬롭 탐지
-        slop_result = self.slop_detector.detect(text)
+        slop_result = self.slop_detector.detect(text, stats=stats)
         
         # ============================================================
         # 길이 정규화된 엔트로피 사용 (Log-normalization)
@@ -23,6 +23,8 @@ from dataclasses import dataclass, field
 from typing import List, Dict, Set, Tuple, Optional
 from enum import Enum
 
+from .text_statistics import TextStatistics, compute_text_statistics, max_char_ngram_repeat
+
 
 class SlopCategory(Enum):
     """슬롭 카테고리 분류"""
@@ -413,12 +415,13 @@ class SlopDetector:
                     pattern
                 ))
     
-    def detect(self, text: str) -> SlopDetectionResult:
+    def detect(self, text: str, stats: Optional[TextStatistics] = None) -> SlopDetectionResult:
         """
         텍스트에서 슬롭 패턴 탐지
         
         Args:
             text: 분석할 텍스트
+            stats: compute_text_statistics(text) 결과 (EntropyAnalyzer와 공유 시 전달)
             
         Returns:
             SlopDetectionResult: 탐지 결과
@@ -465,7 +468,7 @@ class SlopDetector:
         slop_score = min(1.0, total_severity / (text_length_factor * 5))
         
         # 반복 구조 분석으로 추가 점수
-        repetition_penalty = self._analyze_sentence_repetition(text)
+        repetition_penalty = self._analyze_sentence_repetition(text, stats=stats)
         slop_score = min(1.0, slop_score + repetition_penalty)
         
         # ========================================
@@ -571,16 +574,17 @@ class SlopDetector:
             is_overload=is_overload
         )
     
-    def _analyze_sentence_repetition(self, text: str) -> float:
+    def _analyze_sentence_repetition(self, text: str, stats: Optional[TextStatistics] = None) -> float:
         """문장 구조 반복 분석 + 문자열 n-gram 반복 감지"""
-        sentences = re.split(r'[.!?]+', text)
-        sentences = [s.strip() for s in sentences if len(s.strip()) > 10]
+        if stats is None:
+            stats = compute_text_statistics(text)
+        sentences = [s.text for s in stats.sentences if len(s.text) > 10]
         
         if len(sentences) < 3:
             return 0.0
         
         # 1. 문장 시작 패턴 분석
-        starters = [s.split()[0].lower() if s.split() else "" for s in sentences]
+        starters = [s.split(None, 1)[0].lower() for s in sentences]
         starter_counts = {}
         for starter in starters:
             starter_counts[starter] = starter_counts.get(starter, 0) + 1
@@ -596,11 +600,16 @@ class SlopDetector:
         
         # 2. 문자 n-gram 반복 감지 (Stage 3 vendor 오염 케이스)
         # "2023-08-23 12:00:00" 같은 패턴이 반복되는 경우 탐지
-        ngram_penalty = self._detect_ngram_repetition(text)
+        ngram_penalty = self._detect_ngram_repetition(text, stats=stats)
         
         return min(1.0, base_penalty + ngram_penalty)
     
-    def _detect_ngram_repetition(self, text: str, ngram_size: int = 20) -> float:
+    def _detect_ngram_repetition(
+        self,
+        text: str,
+        ngram_size: int = 20,
+        stats: Optional[TextStatistics] = None
+    ) -> float:
         """
         문자 n-gram 반복 감지
         
@@ -610,6 +619,7 @@ class SlopDetector:
         Args:
             text: 검사할 텍스트
             ngram_size: n-gram 크기 (기본 20자)
+            stats: 공유 텍스트 통계 (n-gram 빈도 캐시)
             
         Returns:
             0.0 ~ 1.0 페널티 점수
@@ -617,21 +627,14 @@ class SlopDetector:
         if len(text) < ngram_size * 2:
             return 0.0
         
-        # 20자 단위로 n-gram 생성
-        ngrams = {}
-        for i in range(len(text) - ngram_size + 1):
-            ngram = text[i:i + ngram_size]
-            # 공백만 있는 ngram은 제외
-            if len(ngram.strip()) < 10:
-                continue
-            ngrams[ngram] = ngrams.get(ngram, 0) + 1
-        
-        if not ngrams:
+        # 가장 많이 반복된 20자 ngram (공백 위주 ngram 제외)
+        if stats is not None:
+            max_count = stats.max_char_ngram_repeat(ngram_size, min_non_space=10)
+        else:
+            max_count = max_char_ngram_repeat(text, ngram_size, min_non_space=10)
+        if not max_count:
             return 0.0
         
-        # 가장 많이 반복된 ngram 찾기
-        max_count = max(ngrams.values())
-        
         # 반복 횟수에 따라 페널티
         if max_count >= 10:  # 10회 이상 반복 → 확실한 슬롭
             return 0.8
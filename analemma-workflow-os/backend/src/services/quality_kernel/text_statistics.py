@@ -0,0 +1,166 @@
+"""
+Text Statistics - Stage 1 공용 텍스트 통계 (Single-pass)
+=========================================================
+
+EntropyAnalyzer와 SlopDetector가 같은 LLM 출력을 각자 토큰화/문장 분할/n-gram화하던
+중복 작업을 한 번의 스윕으로 통합합니다.
+
+한 번의 스윕에서 계산:
+    - 단어 토큰 (소문자, 영어/한국어) 및 빈도
+    - 문자 빈도
+    - 단어 bigram/trigram 빈도 (문자열 join 대신 튜플 키 → 해시만 계산)
+    - 문장 경계 및 문장별 단어 구간 / 엔트로피
+
+문장별 토큰은 전체 토큰 리스트의 구간(slice)으로 표현됩니다.
+문장 구분자([.!?])는 단어 문자가 아니므로 단어 매치가 문장 경계를 넘지 않아
+문장 단위 토큰화 결과와 전체 토큰화 결과가 정확히 일치합니다.
+
+Usage:
+    stats = compute_text_statistics(text)
+    entropy_result = EntropyAnalyzer().analyze(text, stats=stats)
+    slop_result = SlopDetector().detect(text, stats=stats)
+"""
+
+import math
+import re
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional, Tuple
+
+# EntropyAnalyzer / SlopDetector와 동일한 정규식
+WORD_PATTERN = re.compile(r'\b[a-zA-Z가-힣]+\b')
+SENTENCE_PATTERN = re.compile(r'[.!?]+')
+
+# 문장별 엔트로피를 계산할 최소 조건 (EntropyAnalyzer._low_entropy_segments_from_stats 기준)
+SENTENCE_ENTROPY_MIN_CHARS = 20
+SENTENCE_ENTROPY_MIN_WORDS = 5
+
+
+def entropy_from_counts(counts: Iterable[int], total: int) -> float:
+    """
+    빈도 테이블로부터 Shannon Entropy 계산
+
+    H(X) = -Σ P(x_i) * log₂(P(x_i))
+    """
+    if total <= 0:
+        return 0.0
+    entropy = 0.0
+    for count in counts:
+        probability = count / total
+        if probability > 0:
+            entropy -= probability * math.log2(probability)
+    return entropy
+
+
+@dataclass
+class SentenceStats:
+    """문장 하나의 통계 (단어는 TextStatistics.words[word_start:word_end])"""
+    text: str  # strip된 원문
+    word_start: int
+    word_end: int
+    entropy: Optional[float] = None  # 최소 조건 미달 문장은 None
+
+    @property
+    def word_count(self) -> int:
+        return self.word_end - self.word_start
+
+
+@dataclass
+class TextStatistics:
+    """compute_text_statistics() 결과 - Stage 1 분석기들이 공유"""
+    text: str
+    words: List[str]
+    word_counts: Counter
+    char_counts: Counter
+    bigram_counts: Counter   # key: (w1, w2)
+    trigram_counts: Counter  # key: (w1, w2, w3)
+    sentences: List[SentenceStats]
+    _char_ngram_max: Dict[Tuple[int, int], int] = field(default_factory=dict, repr=False)
+
+    @property
+    def total_words(self) -> int:
+        return len(self.words)
+
+    @property
+    def total_chars(self) -> int:
+        return len(self.text)
+
+    @property
+    def bigram_total(self) -> int:
+        return max(0, len(self.words) - 1)
+
+    @property
+    def trigram_total(self) -> int:
+        return max(0, len(self.words) - 2)
+
+    def sentence_words(self, sentence: SentenceStats) -> List[str]:
+        return self.words[sentence.word_start:sentence.word_end]
+
+    def max_char_ngram_repeat(self, ngram_size: int = 20, min_non_space: int = 10) -> int:
+        """max_char_ngram_repeat(self.text, ...) 결과를 캐싱"""
+        key = (ngram_size, min_non_space)
+        if key not in self._char_ngram_max:
+            self._char_ngram_max[key] = max_char_ngram_repeat(self.text, ngram_size, min_non_space)
+        return self._char_ngram_max[key]
+
+
+def max_char_ngram_repeat(text: str, ngram_size: int = 20, min_non_space: int = 10) -> int:
+    """
+    가장 많이 반복된 문자 n-gram의 등장 횟수
+
+    strip 후 min_non_space자 미만인 n-gram(공백 위주)은 제외.
+    필터는 n-gram 내용에만 의존하므로 윈도우마다가 아니라 고유 n-gram에 한 번만 적용.
+    """
+    counts = Counter(text[i:i + ngram_size] for i in range(len(text) - ngram_size + 1))
+    best = 0
+    for ngram, count in counts.items():
+        if count > best and len(ngram.strip()) >= min_non_space:
+            best = count
+    return best
+
+
+def compute_text_statistics(text: str) -> TextStatistics:
+    """
+    텍스트 통계를 한 번의 스윕으로 계산
+
+    문장 경계마다 WORD_PATTERN.findall(lowered, start, end)를 호출하여
+    전체 토큰 리스트와 문장별 토큰 구간을 동시에 얻습니다.
+    """
+    text = text or ""
+    lowered = text.lower()
+    words: List[str] = []
+    sentences: List[SentenceStats] = []
+
+    # lower()가 길이를 바꾸는 문자(예: 'İ')가 있으면 위치 기반 분할을 쓸 수 없음
+    aligned = len(lowered) == len(text)
+
+    start = 0
+    boundaries = [m.span() for m in SENTENCE_PATTERN.finditer(text)]
+    boundaries.append((len(text), len(text)))
+    for sep_start, sep_end in boundaries:
+        raw = text[start:sep_start]
+        word_start = len(words)
+        if aligned:
+            words.extend(WORD_PATTERN.findall(lowered, start, sep_start))
+        else:
+            words.extend(WORD_PATTERN.findall(raw.lower()))
+        stripped = raw.strip()
+        if stripped:
+            sentence = SentenceStats(stripped, word_start, len(words))
+            if (len(stripped) >= SENTENCE_ENTROPY_MIN_CHARS
+                    and sentence.word_count >= SENTENCE_ENTROPY_MIN_WORDS):
+                sentence.entropy = entropy_from_counts(
+                    Counter(words[word_start:len(words)]).values(), sentence.word_count
+                )
+            sentences.append(sentence)
+        start = sep_end
+
+    return TextStatistics(
+        text=text,
+        words=words,
+        word_counts=Counter(words),
+        char_counts=Counter(text),
+        bigram_counts=Counter(zip(words, words[1:])),
+        trigram_counts=Counter(zip(words, words[1:], words[2:])),
+        sentences=sentences,
+    )
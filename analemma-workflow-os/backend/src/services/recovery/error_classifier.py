@@ -119,7 +119,40 @@ class ErrorClassifier:
     ]
     
     MAX_AUTO_HEALING_COUNT = 3
-    
+
+    # 일시적(transient) 에러 세부 클래스 — 재시도 예산(RetryBudgetController)의 버킷 키
+    # 순서대로 검사 (스로틀링 우선: "429 ... timeout" 같은 복합 메시지는 throttling)
+    TRANSIENT_CLASS_PATTERNS = {
+        "throttling": [
+            r"Rate limit",
+            r"RateLimitError",
+            r"\b429\b",
+            r"Too Many Requests",
+            r"ThrottlingException",
+            r"TooManyRequestsException",
+            r"ProvisionedThroughputExceeded",
+            r"Resource.?Exhausted",
+            r"Quota exceeded",
+        ],
+        "timeout": [
+            r"Timeout",
+            r"ETIMEDOUT",
+            r"timed out",
+        ],
+        "connection": [
+            r"Connection.*reset",
+            r"ConnectionError",
+            r"ECONNREFUSED",
+            r"BrokenPipe",
+        ],
+        "unavailable": [
+            r"ServiceUnavailable",
+            r"InternalServerError",
+            r"ModelStreamErrorException",
+            r"\b50[0234]\b",
+        ],
+    }
+
     def __init__(self):
         # 패턴 컴파일 (성능 최적화)
         self._deterministic_compiled = [
@@ -128,6 +161,10 @@ class ErrorClassifier:
         self._semantic_compiled = [
             re.compile(p, re.IGNORECASE) for p in self.SEMANTIC_PATTERNS
         ]
+        self._transient_compiled = [
+            (error_class, re.compile("|".join(patterns), re.IGNORECASE))
+            for error_class, patterns in self.TRANSIENT_CLASS_PATTERNS.items()
+        ]
     
     def classify(
         self, 
@@ -200,6 +237,19 @@ class ErrorClassifier:
             f"Unknown error type, defaulting to manual intervention: {error_type}"
         )
     
+    def transient_class(self, error_type: str, error_message: str) -> Optional[str]:
+        """
+        일시적 에러의 세부 클래스를 반환합니다.
+
+        Returns:
+            "throttling" | "timeout" | "connection" | "unavailable", 해당 없으면 None
+        """
+        full_error_text = f"{error_type}: {error_message}"
+        for error_class, pattern in self._transient_compiled:
+            if pattern.search(full_error_text):
+                return error_class
+        return None
+
     def should_auto_heal(
         self, 
         error_type: str, 
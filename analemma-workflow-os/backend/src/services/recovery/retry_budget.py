@@ -0,0 +1,223 @@
+"""
+Retry Budget Controller
+=======================
+
+커널 재시도(SegmentRunnerService._execute_with_kernel_retry)가 공유하는 재시도 예산.
+
+프로바이더 스로틀링 중에 동시 실행 세그먼트가 각자 지수 백오프로 재시도하면
+재시도 트래픽이 그대로 부하에 더해진다. (provider, error_class)별 토큰 버킷으로
+컨테이너 내 재시도 총량을 제한한다:
+
+  - 재시도 1회 = 토큰 1개
+  - 토큰은 초당 refill_per_s만큼 보충되고, 성공한 세그먼트마다 해당 provider의
+    버킷에 success_credit이 적립된다 (정상 트래픽에 비례하는 재시도 허용량)
+  - 토큰 부족 시: 다음 토큰까지의 대기가 max_wait_s 이내면 토큰을 예약하고
+    그만큼 지연, 초과하면 재시도를 포기(shed)하고 상위(Step Functions) 재시도에 맡긴다
+
+error_class는 ErrorClassifier.transient_class()가 분류한다.
+예산은 프로세스(Lambda 컨테이너) 단위 — 같은 컨테이너의 병렬 브랜치 스레드가 공유한다.
+"""
+
+import logging
+import os
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from src.services.recovery.error_classifier import ErrorClassifier, get_error_classifier
+
+logger = logging.getLogger(__name__)
+
+# 버킷 최대 토큰 수 (버스트 허용량)
+RETRY_BUDGET_CAPACITY = float(os.environ.get("RETRY_BUDGET_CAPACITY", "10"))
+# 초당 토큰 보충량 (예산 하한)
+RETRY_BUDGET_REFILL_PER_S = float(os.environ.get("RETRY_BUDGET_REFILL_PER_S", "0.5"))
+# 성공한 세그먼트 1회당 적립 토큰 (≈ 성공 대비 재시도 비율)
+RETRY_BUDGET_SUCCESS_CREDIT = float(os.environ.get("RETRY_BUDGET_SUCCESS_CREDIT", "0.2"))
+# 토큰 예약 시 허용하는 최대 대기 (초과 시 shed)
+RETRY_BUDGET_MAX_WAIT_S = float(os.environ.get("RETRY_BUDGET_MAX_WAIT_S", "20"))
+
+DEFAULT_PROVIDER = "default"
+OTHER_ERROR_CLASS = "other"
+
+@dataclass(frozen=True)
+class RetryDecision:
+    """재시도 예산 판정 결과."""
+    allowed: bool
+    delay: float          # 토큰 예약 대기 (초). 백오프와 별개로 최소 이만큼 기다려야 함
+    provider: str
+    error_class: str
+    tokens_left: float
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "allowed": self.allowed,
+            "delay": round(self.delay, 3),
+            "provider": self.provider,
+            "error_class": self.error_class,
+            "tokens_left": round(self.tokens_left, 3),
+        }
+
+
+class _TokenBucket:
+    __slots__ = ("tokens", "updated_at", "granted", "delayed", "shed")
+
+    def __init__(self, tokens: float, now: float):
+        self.tokens = tokens
+        self.updated_at = now
+        self.granted = 0
+        self.delayed = 0
+        self.shed = 0
+
+
+def infer_provider(segment_config: Optional[Dict[str, Any]] = None) -> str:
+    """
+    재시도 예산 버킷의 provider (세그먼트 노드 설정 기준).
+
+    세그먼트 LLM 노드가 모두 같은 provider를 쓰면 그 provider, 그 외 "default".
+    재시도 차감(acquire_for_error)과 성공 적립(record_success)이 같은 버킷을
+    가리키도록 에러 텍스트가 아닌 설정만으로 결정한다.
+    """
+    providers = set()
+    for node in (segment_config or {}).get("nodes") or []:
+        if not isinstance(node, dict):
+            continue
+        config = node.get("config") if isinstance(node.get("config"), dict) else node
+        provider = config.get("provider")
+        if provider:
+            providers.add("gemini" if provider == "google" else str(provider))
+    if len(providers) == 1:
+        return providers.pop()
+    return DEFAULT_PROVIDER
+
+
+class RetryBudgetController:
+    """
+    (provider, error_class)별 토큰 버킷 재시도 예산.
+
+    사용:
+        controller = get_retry_budget_controller()
+        decision = controller.acquire_for_error(exc, segment_config)
+        if not decision.allowed:
+            ...  # shed — 재시도 중단
+        time.sleep(max(backoff, decision.delay))
+        ...
+        controller.record_success(infer_provider(segment_config))
+    """
+
+    def __init__(
+        self,
+        capacity: float = RETRY_BUDGET_CAPACITY,
+        refill_per_s: float = RETRY_BUDGET_REFILL_PER_S,
+        success_credit: float = RETRY_BUDGET_SUCCESS_CREDIT,
+        max_wait_s: float = RETRY_BUDGET_MAX_WAIT_S,
+        classifier: Optional[ErrorClassifier] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.capacity = capacity
+        self.refill_per_s = refill_per_s
+        self.success_credit = success_credit
+        self.max_wait_s = max_wait_s
+        self._classifier = classifier
+        self._clock = clock
+        self._buckets: Dict[Tuple[str, str], _TokenBucket] = {}
+        self._lock = threading.Lock()
+
+    # ── 공개 API ──────────────────────────────────────────────────────────────
+
+    def classify(self, error: BaseException) -> str:
+        """ErrorClassifier 기반 error_class (일시적 에러가 아니면 "other")."""
+        classifier = self._classifier or get_error_classifier()
+        return classifier.transient_class(type(error).__name__, str(error)) or OTHER_ERROR_CLASS
+
+    def acquire_for_error(
+        self,
+        error: BaseException,
+        segment_config: Optional[Dict[str, Any]] = None,
+    ) -> RetryDecision:
+        """세그먼트 설정의 provider와 에러의 error_class로 재시도 토큰 1개 요청."""
+        return self.acquire(infer_provider(segment_config), self.classify(error))
+
+    def acquire(self, provider: str, error_class: str) -> RetryDecision:
+        """
+        재시도 토큰 1개 요청.
+
+        토큰이 있으면 즉시 허용. 없으면 다음 토큰 시점까지 예약(음수 잔량)하고 그 대기를
+        delay로 반환하되, 대기가 max_wait_s를 넘으면 거부(shed)한다. 예약이 쌓일수록
+        뒤 요청의 대기가 길어지므로 동시 재시도가 보충 속도에 맞춰 분산된다.
+        """
+        with self._lock:
+            bucket = self._refilled_bucket((provider, error_class))
+            if bucket.tokens >= 1.0:
+                bucket.tokens -= 1.0
+                bucket.granted += 1
+                return RetryDecision(True, 0.0, provider, error_class, bucket.tokens)
+
+            wait = (
+                (1.0 - bucket.tokens) / self.refill_per_s
+                if self.refill_per_s > 0 else float("inf")
+            )
+            if wait > self.max_wait_s:
+                bucket.shed += 1
+                return RetryDecision(False, 0.0, provider, error_class, bucket.tokens)
+
+            bucket.tokens -= 1.0
+            bucket.delayed += 1
+            return RetryDecision(True, wait, provider, error_class, bucket.tokens)
+
+    def record_success(self, provider: str) -> None:
+        """성공한 세그먼트 — 해당 provider의 모든 버킷에 success_credit 적립."""
+        if self.success_credit <= 0:
+            return
+        with self._lock:
+            for key in [k for k in self._buckets if k[0] == provider]:
+                bucket = self._refilled_bucket(key)
+                bucket.tokens = min(self.capacity, bucket.tokens + self.success_credit)
+
+    def get_stats(self) -> Dict[str, Dict[str, Any]]:
+        """버킷별 잔량 및 허용/지연/거부 횟수 (모니터링용)."""
+        with self._lock:
+            return {
+                f"{provider}:{error_class}": {
+                    "tokens": round(self._refilled_bucket((provider, error_class)).tokens, 3),
+                    "granted": bucket.granted,
+                    "delayed": bucket.delayed,
+                    "shed": bucket.shed,
+                }
+                for (provider, error_class), bucket in self._buckets.items()
+            }
+
+    def reset(self) -> None:
+        """모든 버킷 초기화 (테스트용)."""
+        with self._lock:
+            self._buckets.clear()
+
+    # ── 내부 ─────────────────────────────────────────────────────────────────
+
+    def _refilled_bucket(self, key: Tuple[str, str]) -> _TokenBucket:
+        now = self._clock()
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            bucket = self._buckets[key] = _TokenBucket(self.capacity, now)
+            return bucket
+        elapsed = now - bucket.updated_at
+        if elapsed > 0:
+            bucket.tokens = min(self.capacity, bucket.tokens + elapsed * self.refill_per_s)
+            bucket.updated_at = now
+        return bucket
+
+
+# Singleton instance
+_retry_budget_controller = None
+_retry_budget_lock = threading.Lock()
+
+
+def get_retry_budget_controller() -> RetryBudgetController:
+    """컨테이너 공유 RetryBudgetController 인스턴스 반환"""
+    global _retry_budget_controller
+    if _retry_budget_controller is None:
+        with _retry_budget_lock:
+            if _retry_budget_controller is None:
+                _retry_budget_controller = RetryBudgetController()
+    return _retry_budget_controller
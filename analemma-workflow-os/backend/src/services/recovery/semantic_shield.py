@@ -10,14 +10,22 @@
   Ring 0/1 (KERNEL/DRIVER): Stage 1+2만 실행 (고신뢰, 모델 추론 생략)
   Ring 2/3 (SERVICE/USER) : Stage 1+2+3 전체 (ShieldGemma 포함)
 
+Stage 1 캐시:
+  루프마다 반복 검사되는 시스템 프롬프트·도구 출력은 정규화 결과를
+  내용 해시(BLAKE2b) 기준 LRU에 보관하여 재정규화를 생략한다.
+
 Author: Analemma OS Team
 """
 
 import base64
+import hashlib
 import logging
+import os
 import re
+import threading
 import unicodedata
 import time
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from enum import Enum
 from typing import List, Optional, Tuple, Dict, Any
@@ -76,6 +84,47 @@ _HOMOGLYPH_MAP: Dict[str, str] = {
     'ａ': 'a', 'ｂ': 'b', 'ｃ': 'c', 'ｄ': 'd', 'ｅ': 'e',
     'ｆ': 'f', 'ｇ': 'g', 'ｈ': 'h', 'ｉ': 'i', 'ｊ': 'j',
 }
+# 문자 클래스 정규식 — 스캔은 C 레벨, 치환은 매칭된 문자에만 수행
+_HOMOGLYPH_PATTERN = re.compile('[' + ''.join(sorted(_HOMOGLYPH_MAP)) + ']')
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Stage 1 정규화 캐시 (LRU, 내용 해시 키)
+# ─────────────────────────────────────────────────────────────────────────────
+# 정규화는 입력 텍스트만의 순수 함수이므로 같은 내용은 같은 결과를 낸다.
+# 키는 원문 대신 16바이트 다이제스트 — 큰 원문을 키로 붙잡아 두지 않음.
+
+NORMALIZATION_CACHE_SIZE = int(os.environ.get("SEMANTIC_SHIELD_NORMALIZATION_CACHE_SIZE", "512"))
+# 이보다 긴 텍스트는 캐시하지 않음 (항목당 메모리 상한)
+NORMALIZATION_CACHE_MAX_CHARS = int(os.environ.get("SEMANTIC_SHIELD_NORMALIZATION_CACHE_MAX_CHARS", "262144"))
+
+_normalization_cache: "OrderedDict[bytes, Tuple[str, Tuple['Detection', ...]]]" = OrderedDict()
+_normalization_cache_lock = threading.Lock()
+_normalization_stats = {"hits": 0, "misses": 0, "evictions": 0, "bypassed": 0}
+
+
+def _normalization_key(text: str) -> bytes:
+    return hashlib.blake2b(
+        text.encode('utf-8', 'surrogatepass'), digest_size=16,
+    ).digest()
+
+
+def get_normalization_cache_stats() -> Dict[str, Any]:
+    """정규화 캐시 적중률 (모니터링용)"""
+    with _normalization_cache_lock:
+        stats = dict(_normalization_stats)
+        stats["entries"] = len(_normalization_cache)
+    lookups = stats["hits"] + stats["misses"]
+    stats["hit_rate_percent"] = round(stats["hits"] / lookups * 100, 2) if lookups else 0.0
+    return stats
+
+
+def clear_normalization_cache() -> None:
+    """정규화 캐시 및 통계 초기화 (테스트용)"""
+    with _normalization_cache_lock:
+        _normalization_cache.clear()
+        for key in _normalization_stats:
+            _normalization_stats[key] = 0
 
 
 # ─────────────────────────────────────────────────────────────────────────────
@@ -91,6 +140,10 @@ class NormalizationPipeline:
     ZERO_WIDTH = frozenset({'\u200b', '\u200c', '\u200d', '\ufeff', '\u2060'})
     RTL_OVERRIDE = frozenset({'\u202e', '\u202d', '\u200f', '\u200e'})
 
+    # 문자 클래스 정규식 (문자 단위 Python 루프 대신 C 레벨 일괄 스캔·삭제)
+    _ZERO_WIDTH_PATTERN = re.compile('[' + ''.join(sorted(ZERO_WIDTH)) + ']')
+    _RTL_OVERRIDE_PATTERN = re.compile('[' + ''.join(sorted(RTL_OVERRIDE)) + ']')
+
     # Base64 후보: 20자 이상의 유효한 Base64 문자열
     _BASE64_PATTERN = re.compile(r'[A-Za-z0-9+/]{20,}={0,2}', re.ASCII)
 
@@ -100,20 +153,58 @@ class NormalizationPipeline:
         'system:', 'bypass', 'escape', 'you are now',
         '이전 지시', '무시', '시스템 프롬프트',
     })
+    _INJECTION_KEYWORD_PATTERN = re.compile(
+        '|'.join(re.escape(kw) for kw in sorted(_INJECTION_KEYWORDS))
+    )
 
     def normalize(self, text: str) -> Tuple[str, List[Detection]]:
         """
-        정규화 수행.
+        정규화 수행 (내용 해시 LRU 캐시 경유).
 
         Returns:
             (정규화된 텍스트, 탐지 목록)
         """
+        if len(text) > NORMALIZATION_CACHE_MAX_CHARS or NORMALIZATION_CACHE_SIZE <= 0:
+            with _normalization_cache_lock:
+                _normalization_stats["bypassed"] += 1
+            return self._normalize_uncached(text)
+
+        key = _normalization_key(text)
+        with _normalization_cache_lock:
+            cached = _normalization_cache.get(key)
+            if cached is not None:
+                _normalization_cache.move_to_end(key)
+                _normalization_stats["hits"] += 1
+            else:
+                _normalization_stats["misses"] += 1
+        if cached is not None:
+            normalized, detections = cached
+            return normalized, list(detections)
+
+        normalized, detections = self._normalize_uncached(text)
+        with _normalization_cache_lock:
+            _normalization_cache[key] = (normalized, tuple(detections))
+            _normalization_cache.move_to_end(key)
+            while len(_normalization_cache) > NORMALIZATION_CACHE_SIZE:
+                _normalization_cache.popitem(last=False)
+                _normalization_stats["evictions"] += 1
+        return normalized, detections
+
+    def _normalize_uncached(self, text: str) -> Tuple[str, List[Detection]]:
+        """
+        정규화 본체 — 각 단계는 정규식 일괄 연산.
+
+        ZWS·RTL·Homoglyph 대상은 모두 비ASCII 문자이고 ASCII 텍스트는 NFC 불변이므로
+        ASCII 텍스트(도구 출력 JSON 등)는 Base64 검사만 수행한다.
+        """
         detections: List[Detection] = []
+        if text.isascii():
+            return text, self._check_base64(text)
         result = text
 
         # 1-a. Zero-Width Space / BOM 제거
-        if any(c in self.ZERO_WIDTH for c in result):
-            result = ''.join(c for c in result if c not in self.ZERO_WIDTH)
+        result, stripped = self._ZERO_WIDTH_PATTERN.subn('', result)
+        if stripped:
             detections.append(Detection(
                 detection_type=DetectionType.ZERO_WIDTH_CHAR,
                 description="Zero-Width Space / BOM characters stripped",
@@ -121,8 +212,8 @@ class NormalizationPipeline:
             ))
 
         # 1-b. RTL Override 제거
-        if any(c in self.RTL_OVERRIDE for c in result):
-            result = ''.join(c for c in result if c not in self.RTL_OVERRIDE)
+        result, stripped = self._RTL_OVERRIDE_PATTERN.subn('', result)
+        if stripped:
             detections.append(Detection(
                 detection_type=DetectionType.RTL_OVERRIDE,
                 description="RTL override characters stripped",
@@ -143,36 +234,35 @@ class NormalizationPipeline:
         return result, detections
 
     def _check_base64(self, text: str) -> List[Detection]:
-        """Base64 인코딩된 주입 시도 탐지."""
+        """Base64 인코딩된 주입 시도 탐지 (같은 후보 문자열은 한 번만 디코딩)."""
         detections = []
-        for match in self._BASE64_PATTERN.finditer(text):
-            b64_str = match.group(0)
-            try:
-                decoded = base64.b64decode(b64_str + '==').decode('utf-8', errors='ignore')
-                decoded_lower = decoded.lower()
-                if any(kw in decoded_lower for kw in self._INJECTION_KEYWORDS):
-                    detections.append(Detection(
-                        detection_type=DetectionType.BASE64_INJECTION,
-                        description=f"Base64-encoded injection: {decoded[:80]}",
-                        stage=1,
-                    ))
-            except Exception:
-                pass
+        verdicts: Dict[str, Optional[str]] = {}  # 후보 → 주입 시 디코딩 텍스트, 아니면 None
+        for b64_str in self._BASE64_PATTERN.findall(text):
+            if b64_str not in verdicts:
+                verdicts[b64_str] = self._decode_injection(b64_str)
+            decoded = verdicts[b64_str]
+            if decoded is not None:
+                detections.append(Detection(
+                    detection_type=DetectionType.BASE64_INJECTION,
+                    description=f"Base64-encoded injection: {decoded[:80]}",
+                    stage=1,
+                ))
         return detections
 
+    def _decode_injection(self, b64_str: str) -> Optional[str]:
+        """후보를 디코딩해 주입 키워드가 있으면 디코딩 텍스트 반환."""
+        try:
+            decoded = base64.b64decode(b64_str + '==').decode('utf-8', errors='ignore')
+        except Exception:
+            return None
+        if self._INJECTION_KEYWORD_PATTERN.search(decoded.lower()):
+            return decoded
+        return None
+
     def _normalize_homoglyphs(self, text: str) -> Tuple[str, List[Detection]]:
         """Homoglyph(동형이의자) 정규화."""
         detections = []
-        result = []
-        replaced = False
-
-        for char in text:
-            rep = _HOMOGLYPH_MAP.get(char)
-            if rep:
-                result.append(rep)
-                replaced = True
-            else:
-                result.append(char)
+        result, replaced = _HOMOGLYPH_PATTERN.subn(lambda m: _HOMOGLYPH_MAP[m.group()], text)
 
         if replaced:
             detections.append(Detection(
@@ -181,7 +271,7 @@ class NormalizationPipeline:
                 stage=1,
             ))
 
-        return ''.join(result), detections
+        return result, detections
 
 
 # ─────────────────────────────────────────────────────────────────────────────
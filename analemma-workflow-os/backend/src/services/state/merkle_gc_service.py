@@ -17,10 +17,13 @@ OS 아키텍처 고려사항:
 
 import logging
 import os
-from typing import List, Dict, Set, Any, Tuple
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, List, Dict, Set, Any, Optional, Tuple
 from datetime import datetime
 
 import boto3
+from botocore.config import Config
 from botocore.exceptions import ClientError
 
 logger = logging.getLogger(__name__)
@@ -36,6 +39,35 @@ logger = logging.getLogger(__name__)
 # - is_frozen (Boolean): Safe Chain Protection (보안 사고 시)
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 
+# [v3.35] 블록 단위 RefTable 호출(decrement / TOCTOU verify)의 동시 실행 한도.
+# 300-block 매니페스트 = ~900 순차 round trip → wave당 GC_BATCH_SIZE개를
+# 최대 GC_MAX_CONCURRENCY 스레드로 처리 (DynamoDB 호출은 I/O-bound).
+GC_MAX_CONCURRENCY = int(os.environ.get('GC_MAX_CONCURRENCY', '16'))
+GC_BATCH_SIZE = int(os.environ.get('GC_BATCH_SIZE', '100'))
+
+
+class _RefTableClient:
+    """
+    RefTable 항목 API를 resource의 low-level client로 직접 호출 (worker 스레드 공용)
+
+    boto3 resource/Table 객체는 thread-safe하지 않으므로 _map_bounded worker는
+    이 래퍼만 사용한다. resource.meta.client는 thread-safe하며, resource와 같은
+    값 변환(Python 값 ↔ DynamoDB 타입, Number → Decimal)을 그대로 적용한다.
+    """
+
+    def __init__(self, client, table_name: str):
+        self.client = client
+        self.table_name = table_name
+
+    def update_item(self, **kwargs) -> Dict[str, Any]:
+        return self.client.update_item(TableName=self.table_name, **kwargs)
+
+    def get_item(self, **kwargs) -> Dict[str, Any]:
+        return self.client.get_item(TableName=self.table_name, **kwargs)
+
+    def delete_item(self, **kwargs) -> Dict[str, Any]:
+        return self.client.delete_item(TableName=self.table_name, **kwargs)
+
 
 class MerkleGarbageCollector:
     """
@@ -50,8 +82,22 @@ class MerkleGarbageCollector:
     - Glacier 2단계 전략 (30일 → Glacier → 90일 → 삭제)
     """
     
-    def __init__(self, dynamodb_table: str, s3_bucket: str, ref_table: str = None):
-        self.dynamodb = boto3.resource('dynamodb')
+    def __init__(
+        self,
+        dynamodb_table: str,
+        s3_bucket: str,
+        ref_table: str = None,
+        max_concurrency: int = None,
+        batch_size: int = None,
+    ):
+        self.max_concurrency = max(1, max_concurrency or GC_MAX_CONCURRENCY)
+        self.batch_size = max(1, batch_size or GC_BATCH_SIZE)
+
+        # worker 스레드 수만큼 HTTP 커넥션 확보 (botocore 기본 풀 크기 10)
+        self.dynamodb = boto3.resource(
+            'dynamodb',
+            config=Config(max_pool_connections=max(10, self.max_concurrency)),
+        )
         self.table = self.dynamodb.Table(dynamodb_table)
         
         # Reference Counter Table (별도 DynamoDB 테이블)
@@ -60,6 +106,8 @@ class MerkleGarbageCollector:
             'BlockReferenceCounts-dev'
         )
         self.ref_table = self.dynamodb.Table(ref_table_name)
+        # 블록 단위 worker 호출 전용 (thread-safe client 경유)
+        self.ref_client = _RefTableClient(self.ref_table.meta.client, ref_table_name)
         
         self.s3 = boto3.client('s3')
         self.bucket = s3_bucket
@@ -142,23 +190,30 @@ class MerkleGarbageCollector:
         # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
         # Phase 1: Decrement ref counts and collect candidates
         # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-        delete_candidates = []  # (block_id, s3_key) pairs
-        frozen_blocks = []
-
+        block_refs = []  # (block_id, s3_key) pairs
         for block_item in state_blocks:
             block_path = block_item.get('S', '')
             if not block_path:
                 continue
-
             block_id = block_path.split('/')[-1].replace('.json', '')
-            is_deletable = self._decrement_and_check_zero(block_id)
+            block_refs.append((block_id, block_path.replace(f"s3://{self.bucket}/", "")))
+
+        delete_candidates = []  # (block_id, s3_key) pairs
+        frozen_blocks = []
+        phase_start = time.perf_counter()
 
+        # [v3.35] 블록별 decrement는 서로 독립 → bounded 동시 실행.
+        # frozen 여부는 decrement 응답(ALL_NEW / graceful-wait read)에서 함께 얻으므로
+        # skip된 블록마다 _is_block_frozen 재조회를 하지 않음 (판별 불가 시에만 조회).
+        outcomes = self._map_bounded(
+            self._decrement_with_freeze_check, [block_id for block_id, _ in block_refs]
+        )
+        for (block_id, key), (is_deletable, is_frozen) in zip(block_refs, outcomes):
             if is_deletable:
-                key = block_path.replace(f"s3://{self.bucket}/", "")
                 delete_candidates.append((block_id, key))
             else:
                 skipped += 1
-                if self._is_block_frozen(block_id):
+                if is_frozen:
                     frozen_blocks.append(block_id[:8])
 
         # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
@@ -168,11 +223,16 @@ class MerkleGarbageCollector:
         # Phase 2 (actual S3 delete), a concurrent segment write could
         # have incremented the ref_count.  Re-read ref_count with a
         # ConditionExpression to atomically verify it's still 0.
+        # Phase 1이 전부 끝난 뒤 시작하며, 각 verify는 블록별 조건부 삭제라
+        # 동시 실행해도 원자성은 블록 단위로 유지됨.
         # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
         verified_deletes = []
 
-        for block_id, s3_key in delete_candidates:
-            if self._verify_still_unreachable(block_id):
+        still_unreachable = self._map_bounded(
+            self._verify_still_unreachable, [block_id for block_id, _ in delete_candidates]
+        )
+        for (block_id, s3_key), unreachable in zip(delete_candidates, still_unreachable):
+            if unreachable:
                 verified_deletes.append({'Key': s3_key})
             else:
                 skipped += 1
@@ -181,6 +241,14 @@ class MerkleGarbageCollector:
                     f"after decrement — skipping delete"
                 )
 
+        if block_refs:
+            elapsed = time.perf_counter() - phase_start
+            logger.info(
+                f"[GC] Ref-count phase: {len(block_refs)} blocks in {elapsed * 1000:.0f}ms "
+                f"({len(block_refs) / max(elapsed, 1e-6):.0f} blocks/s, "
+                f"concurrency={self.max_concurrency})"
+            )
+
         # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
         # Phase 3: S3 Bulk Delete (only verified blocks)
         # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
@@ -234,6 +302,31 @@ class MerkleGarbageCollector:
         
         return deleted, skipped
     
+    def _map_bounded(self, fn: Callable[[str], Any], block_ids: List[str]) -> List[Any]:
+        """
+        block_ids에 fn을 적용 (결과 순서 = 입력 순서)
+
+        GC_BATCH_SIZE개 단위 wave로 나누어 최대 max_concurrency 스레드에서 실행.
+        boto3 resource(self.ref_table)는 스레드 간 공유 불가 → worker는 self.ref_client
+        (low-level client, thread-safe)만 사용한다.
+        """
+        if len(block_ids) <= 1 or self.max_concurrency <= 1:
+            return [fn(block_id) for block_id in block_ids]
+
+        results: List[Any] = []
+        workers = min(self.max_concurrency, len(block_ids))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for start in range(0, len(block_ids), self.batch_size):
+                results.extend(executor.map(fn, block_ids[start:start + self.batch_size]))
+        return results
+
+    def _decrement_with_freeze_check(self, block_id: str) -> Tuple[bool, bool]:
+        """Phase 1 worker: (삭제 가능 여부, frozen 여부)"""
+        is_deletable, is_frozen = self._decrement_block(block_id)
+        if not is_deletable and is_frozen is None:
+            is_frozen = self._is_block_frozen(block_id)
+        return is_deletable, bool(is_frozen)
+
     def _decrement_and_check_zero(self, block_id: str, graceful_wait_seconds: int = 300) -> bool:
         """
         [핵심 로직] Atomic Reference Counting - Dangling Block 완전 차단
@@ -255,12 +348,23 @@ class MerkleGarbageCollector:
             True: 삭제 가능 (ref_count = 0, not frozen, graceful_wait 경과)
             False: 삭제 불가 (ref_count > 0 또는 frozen 또는 대기 중)
         """
+        return self._decrement_block(block_id, graceful_wait_seconds)[0]
+
+    def _decrement_block(
+        self, block_id: str, graceful_wait_seconds: int = 300
+    ) -> Tuple[bool, Optional[bool]]:
+        """
+        _decrement_and_check_zero 본체: (삭제 가능 여부, frozen 여부)
+
+        frozen 여부는 decrement 응답(ALL_NEW) 또는 graceful-wait 조회 항목에서 얻으며,
+        에러로 판별할 수 없으면 None.
+        """
         try:
             # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
             # [Atomic Update] DynamoDB ADD로 ref_count -1 수행 (음수 방지)
             # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
             import time
-            response = self.ref_table.update_item(
+            response = self.ref_client.update_item(
                 Key={'block_id': block_id},
                 UpdateExpression="""
                     SET ref_count = if_not_exists(ref_count, :zero) - :dec,
@@ -293,7 +397,7 @@ class MerkleGarbageCollector:
                     f"[GC] [Safe Chain] Block {block_id[:8]}... is FROZEN, "
                     f"skipping delete (ref_count={new_count})"
                 )
-                return False
+                return False, True
             
             # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
             # [Deletion Criterion] ref_count = 0 AND graceful_wait 경과
@@ -301,7 +405,7 @@ class MerkleGarbageCollector:
             if new_count == 0:
                 # 카운트가 0이 된 시점 기록 (첫 번째 도달 시만)
                 if not zero_reached_at:
-                    self.ref_table.update_item(
+                    self.ref_client.update_item(
                         Key={'block_id': block_id},
                         UpdateExpression="SET zero_reached_at = :now",
                         ExpressionAttributeValues={':now': datetime.utcnow().isoformat()}
@@ -310,7 +414,7 @@ class MerkleGarbageCollector:
                         f"[GC] Block {block_id[:8]}... ref_count=0 (first time), "
                         f"entering graceful_wait ({graceful_wait_seconds}s)"
                     )
-                    return False  # 아직 삭제하지 않음 (graceful_wait 시작)
+                    return False, False  # 아직 삭제하지 않음 (graceful_wait 시작)
                 
                 # graceful_wait 경과 확인
                 try:
@@ -320,7 +424,7 @@ class MerkleGarbageCollector:
                         f"[GC] Block {block_id[:8]}... invalid zero_reached_at format "
                         f"'{zero_reached_at}': {parse_err} — skipping"
                     )
-                    return False
+                    return False, False
                 elapsed = (datetime.utcnow() - zero_time).total_seconds()
                 
                 if elapsed >= graceful_wait_seconds:
@@ -328,19 +432,19 @@ class MerkleGarbageCollector:
                         f"[GC] Block {block_id[:8]}... ref_count=0, graceful_wait elapsed "
                         f"({elapsed:.0f}s), marking for deletion"
                     )
-                    return True  # 삭제 가능
+                    return True, False  # 삭제 가능
                 else:
                     logger.debug(
                         f"[GC] Block {block_id[:8]}... ref_count=0, graceful_wait in progress "
                         f"({elapsed:.0f}s / {graceful_wait_seconds}s)"
                     )
-                    return False  # 아직 대기 중
+                    return False, False  # 아직 대기 중
             else:
                 logger.debug(
                     f"[GC] Block {block_id[:8]}... still referenced "
                     f"(ref_count={new_count}), skipping"
                 )
-                return False
+                return False, False
             
         except ClientError as e:
             if e.response['Error']['Code'] == 'ConditionalCheckFailedException':
@@ -351,9 +455,13 @@ class MerkleGarbageCollector:
                 )
                 # 현재 상태 조회하여 graceful_wait 확인
                 try:
-                    item_response = self.ref_table.get_item(Key={'block_id': block_id})
+                    item_response = self.ref_client.get_item(Key={'block_id': block_id})
                     item = item_response.get('Item', {})
                     zero_reached_at = item.get('zero_reached_at')
+                    is_frozen = bool(item.get('is_frozen', False))
+                    if is_frozen:
+                        # [v3.35] 조회한 항목으로 freeze도 판별 (TOCTOU verify 이전에 제외)
+                        return False, True
                     
                     if zero_reached_at:
                         try:
@@ -363,26 +471,27 @@ class MerkleGarbageCollector:
                                 f"[GC] Block {block_id[:8]}... invalid zero_reached_at "
                                 f"'{zero_reached_at}': {parse_err} — treating as not ready"
                             )
-                            return False
+                            return False, False
                         elapsed = (datetime.utcnow() - zero_time).total_seconds()
-                        return elapsed >= graceful_wait_seconds
+                        return elapsed >= graceful_wait_seconds, False
+                    return False, False
                 except Exception:
                     pass
-                return False
+                return False, None
             elif e.response['Error']['Code'] == 'ResourceNotFoundException':
                 # Reference Table에 항목이 없음 (이미 삭제됨 또는 초기화 안 됨)
                 logger.warning(
                     f"[GC] Block {block_id[:8]}... not found in RefTable, "
                     f"conservative skip (may be orphaned)"
                 )
-                return False  # Conservative: 삭제하지 않음
+                return False, None  # Conservative: 삭제하지 않음
             else:
                 logger.error(f"[GC] Failed to decrement ref_count for {block_id[:8]}...: {e}")
-                return False  # 에러 시 안전하게 삭제하지 않음
+                return False, None  # 에러 시 안전하게 삭제하지 않음
         
         except Exception as e:
-            logger.error(f"[GC] Unexpected error in _decrement_and_check_zero: {e}")
-            return False
+            logger.error(f"[GC] Unexpected error in _decrement_block: {e}")
+            return False, None
     
     def _is_block_frozen(self, block_id: str) -> bool:
         """
@@ -399,7 +508,7 @@ class MerkleGarbageCollector:
             False: Normal (삭제 가능)
         """
         try:
-            response = self.ref_table.get_item(
+            response = self.ref_client.get_item(
                 Key={'block_id': block_id},
                 ProjectionExpression='is_frozen'
             )
@@ -423,7 +532,7 @@ class MerkleGarbageCollector:
             False: Block was re-referenced or frozen — must NOT delete.
         """
         try:
-            self.ref_table.delete_item(
+            self.ref_client.delete_item(
                 Key={'block_id': block_id},
                 ConditionExpression=(
                     'ref_count <= :zero AND '
@@ -0,0 +1,693 @@
+"""
+Segment Field Access Analyzer - 세그먼트별 정적 read/write 집합 분석
+
+실행 전에 세그먼트의 노드 설정(템플릿, input_key/output_key, operator 코드/params,
+route 조건 등)을 훑어 상태 키 단위의 read set / write set을 계산합니다.
+
+- 파티셔너: 각 세그먼트에 ``field_access``로 저장 (partition_map에 포함)
+- 런타임: 선언된 read 키의 S3 포인터만 미리 병렬 로드 (lazy load 왕복 제거)
+- 런타임: 실행 후 선언되지 않은 top-level 쓰기를 감지
+  (strict 모드에서는 되돌리고 ``__undeclared_writes``에 기록)
+
+분석은 보수적입니다. 정적으로 알 수 없는 노드(알 수 없는 타입, subgraph_ref,
+__state_json 템플릿, 해석 불가한 operator 코드 등)는 dynamic 플래그를 세우며,
+dynamic_writes 세그먼트는 쓰기 제한 대상에서 제외됩니다.
+"""
+
+import ast
+import copy
+import logging
+import os
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+# off: 사용 안 함 / advisory: prefetch + 선언 외 쓰기 로깅 / strict: 선언된 출력만 병합
+FIELD_ACCESS_MODE = os.environ.get("FIELD_ACCESS_MODE", "advisory").strip().lower()
+FIELD_ACCESS_MODES = ("off", "advisory", "strict")
+if FIELD_ACCESS_MODE not in FIELD_ACCESS_MODES:
+    FIELD_ACCESS_MODE = "advisory"
+
+# prefetch 동시 S3 GET 수
+FIELD_ACCESS_PREFETCH_WORKERS = int(os.environ.get("FIELD_ACCESS_PREFETCH_WORKERS", "8"))
+
+FIELD_ACCESS_KEY = "field_access"
+UNDECLARED_WRITES_KEY = "__undeclared_writes"
+
+# state_hydrator.POINTER_MARKER와 동일 (import 순환 방지를 위해 복제)
+POINTER_MARKER = "__s3_pointer__"
+
+# 노드 타입과 무관하게 커널/런너가 기록하는 키
+# (handlers.core.main.KERNEL_MANAGED_KEYS + 라우팅/토큰 집계 키)
+KERNEL_WRITE_KEYS = frozenset({
+    "step_history",
+    "usage",
+    "skill_execution_log",
+    "__next_node",
+    "total_input_tokens",
+    "total_output_tokens",
+    "total_tokens",
+    "estimated_cost_usd",
+    "iteration_token_details",
+    "nested_token_details",
+})
+
+# 프롬프트 템플릿 필드 (llm_chat_runner 우선순위와 동일)
+LLM_PROMPT_FIELDS = ("prompt_content", "user_prompt_template", "prompt_template", "prompt")
+
+_TEMPLATE_VAR_PATTERN = re.compile(r"\{\{\s*([^{}|]+?)\s*(?:\|[^{}]*)?\}\}")
+_TEMPLATE_IF_PATTERN = re.compile(r"\{%\s*if\s+(.+?)\s*%\}")
+_IDENTIFIER_PATTERN = re.compile(r"\b([a-zA-Z_][a-zA-Z0-9_.]*)\b")
+_EXPRESSION_PATH_PATTERN = re.compile(r"\$\.([a-zA-Z_][a-zA-Z0-9_]*)")
+_CONDITION_KEYWORDS = frozenset({
+    "and", "or", "not", "is", "in", "defined", "undefined", "True", "False", "None",
+    "true", "false", "none",
+})
+_STATE_WHOLE_TEMPLATE = "__state_json"
+
+# 노드 타입별 기본 출력 키
+_DEFAULT_OUTPUT_KEYS = {
+    "for_each": "for_each_results",
+    "nested_for_each": "nested_results",
+    "video_chunker": "video_chunks",
+}
+_LOOP_WRITE_KEYS = ("loop_exit_reason", "loop_max_reached")
+
+# 설정만으로 입출력을 알 수 없는 노드 타입
+_OPAQUE_NODE_TYPES = frozenset({
+    "aggregator", "skill_executor", "subgraph", "group", "governor", "dynamic_router",
+})
+
+_stats_lock = threading.Lock()
+_stats = {
+    "prefetch_calls": 0,
+    "prefetched_fields": 0,
+    "prefetch_failures": 0,
+    "prefetch_ms": 0.0,
+    "undeclared_write_checks": 0,
+    "undeclared_writes": 0,
+    "reverted_writes": 0,
+}
+
+
+class FieldAccess:
+    """read/write 집합 누적기 (직렬화 형태는 to_dict 참조)"""
+
+    __slots__ = ("reads", "writes", "write_prefixes", "dynamic_reads", "dynamic_writes")
+
+    def __init__(self):
+        self.reads: Set[str] = set()
+        self.writes: Set[str] = set()
+        self.write_prefixes: Set[str] = set()
+        self.dynamic_reads = False
+        self.dynamic_writes = False
+
+    def read_path(self, path: Any) -> None:
+        """dot 경로의 최상위 키를 read로 기록"""
+        if not isinstance(path, str) or not path.strip():
+            return
+        path = path.strip()
+        if path == _STATE_WHOLE_TEMPLATE:
+            self.dynamic_reads = True
+            return
+        # _get_nested_value는 'a.b'가 최상위 키로 존재하면 그대로 사용하므로 둘 다 기록
+        self.reads.add(path.split(".", 1)[0])
+        if "." in path:
+            self.reads.add(path)
+
+    def write_key(self, key: Any) -> None:
+        if isinstance(key, str) and key:
+            # _set_nested_value는 dot 경로를 중첩 dict로 쓰므로 최상위 키가 바뀜
+            self.writes.add(key.split(".", 1)[0])
+
+    def update(self, other: "FieldAccess") -> None:
+        self.reads |= other.reads
+        self.writes |= other.writes
+        self.write_prefixes |= other.write_prefixes
+        self.dynamic_reads = self.dynamic_reads or other.dynamic_reads
+        self.dynamic_writes = self.dynamic_writes or other.dynamic_writes
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "reads": sorted(self.reads),
+            "writes": sorted(self.writes),
+            "write_prefixes": sorted(self.write_prefixes),
+            "dynamic_reads": self.dynamic_reads,
+            "dynamic_writes": self.dynamic_writes,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "FieldAccess":
+        access = cls()
+        access.reads = set(data.get("reads") or ())
+        access.writes = set(data.get("writes") or ())
+        access.write_prefixes = set(data.get("write_prefixes") or ())
+        access.dynamic_reads = bool(data.get("dynamic_reads"))
+        access.dynamic_writes = bool(data.get("dynamic_writes"))
+        return access
+
+
+# ============================================================================
+# 템플릿 / 표현식 스캔
+# ============================================================================
+
+def _scan_templates(value: Any, access: FieldAccess) -> None:
+    """설정 값 전체에서 {{ var }} / {% if cond %} 참조를 수집 (중첩 dict/list 포함)"""
+    stack = [value]
+    while stack:
+        current = stack.pop()
+        if isinstance(current, str):
+            if "{{" in current:
+                for match in _TEMPLATE_VAR_PATTERN.finditer(current):
+                    access.read_path(match.group(1))
+            if "{%" in current:
+                for match in _TEMPLATE_IF_PATTERN.finditer(current):
+                    for ident in _IDENTIFIER_PATTERN.finditer(match.group(1)):
+                        if ident.group(1) not in _CONDITION_KEYWORDS:
+                            access.read_path(ident.group(1))
+        elif isinstance(current, dict):
+            stack.extend(current.values())
+        elif isinstance(current, (list, tuple)):
+            stack.extend(current)
+
+
+def _scan_expression(expression: Any, access: FieldAccess) -> None:
+    """SafeExpressionEvaluator 문법($.field)의 최상위 필드를 read로 기록"""
+    if isinstance(expression, str):
+        for match in _EXPRESSION_PATH_PATTERN.finditer(expression):
+            access.reads.add(match.group(1))
+
+
+# ============================================================================
+# operator 코드 분석
+# ============================================================================
+
+# result에 대입돼도 dict가 될 수 없는 표현식 → {node_id}_result로 기록됨
+_NON_DICT_EXPRESSIONS = (
+    ast.Constant, ast.List, ast.ListComp, ast.Tuple, ast.Set, ast.SetComp,
+    ast.JoinedStr, ast.Compare, ast.GeneratorExp,
+)
+
+
+def _const_key(node: ast.AST) -> Optional[str]:
+    if isinstance(node, ast.Constant) and isinstance(node.value, str):
+        return node.value
+    return None
+
+
+class _OperatorCodeVisitor(ast.NodeVisitor):
+    """
+    operator_runner가 exec하는 코드에서 state/result 접근을 추출.
+
+    state['k'] / state.get('k') → read, state['k'] = v → write,
+    result = {'k': ...} / result['k'] = v → write.
+    그 외 state/result 사용(별칭, 동적 키, update 등)은 dynamic으로 처리합니다.
+    """
+
+    def __init__(self, access: FieldAccess):
+        self.access = access
+        self._handled: Set[int] = set()
+
+    def visit_Subscript(self, node: ast.Subscript) -> None:
+        target = node.value
+        if isinstance(target, ast.Name) and target.id in ("state", "result"):
+            self._handled.add(id(target))
+            key = _const_key(node.slice)
+            storing = isinstance(node.ctx, (ast.Store, ast.Del))
+            if target.id == "state":
+                if key is None:
+                    if storing:
+                        self.access.dynamic_writes = True
+                    else:
+                        self.access.dynamic_reads = True
+                elif isinstance(node.ctx, ast.Store):
+                    self.access.write_key(key)
+                elif isinstance(node.ctx, ast.Del):
+                    self.access.dynamic_writes = True
+                else:
+                    self.access.read_path(key)
+            elif storing:
+                if key is None or isinstance(node.ctx, ast.Del):
+                    self.access.dynamic_writes = True
+                else:
+                    self.access.write_key(key)
+        self.generic_visit(node)
+
+    def visit_Call(self, node: ast.Call) -> None:
+        func = node.func
+        if isinstance(func, ast.Attribute) and isinstance(func.value, ast.Name) \
+                and func.value.id in ("state", "result"):
+            self._handled.add(id(func.value))
+            if func.attr == "get":
+                key = _const_key(node.args[0]) if node.args else None
+                if func.value.id == "state":
+                    if key is None:
+                        self.access.dynamic_reads = True
+                    else:
+                        self.access.read_path(key)
+            elif func.value.id == "state" and func.attr in ("keys", "values", "items", "copy"):
+                self.access.dynamic_reads = True
+            else:
+                # update / setdefault / pop 등 → 키를 알 수 없는 변경
+                self.access.dynamic_writes = True
+                if func.value.id == "state":
+                    self.access.dynamic_reads = True
+        self.generic_visit(node)
+
+    def _visit_result_assignment(self, value: Optional[ast.AST]) -> None:
+        if value is None or isinstance(value, _NON_DICT_EXPRESSIONS):
+            return
+        if isinstance(value, ast.Dict):
+            keys = [_const_key(k) if k is not None else None for k in value.keys]
+            if all(k is not None for k in keys):
+                for key in keys:
+                    self.access.write_key(key)
+                return
+        self.access.dynamic_writes = True
+
+    def visit_Assign(self, node: ast.Assign) -> None:
+        for target in node.targets:
+            if isinstance(target, ast.Name) and target.id == "result":
+                self._handled.add(id(target))
+                self._visit_result_assignment(node.value)
+            elif isinstance(target, ast.Name) and target.id == "state":
+                self._handled.add(id(target))  # 재바인딩은 exec_state에 영향 없음
+        self.generic_visit(node)
+
+    def visit_AnnAssign(self, node: ast.AnnAssign) -> None:
+        if isinstance(node.target, ast.Name) and node.target.id == "result":
+            self._handled.add(id(node.target))
+            self._visit_result_assignment(node.value)
+        self.generic_visit(node)
+
+    def visit_Name(self, node: ast.Name) -> None:
+        if id(node) in self._handled:
+            return
+        if node.id == "state":
+            # 별칭/함수 인자 등으로 전달 → 접근 범위를 알 수 없음
+            self.access.dynamic_reads = True
+            self.access.dynamic_writes = True
+        elif node.id == "result":
+            # 'r = result; r["k"] = v' 형태의 별칭 쓰기를 배제할 수 없음
+            self.access.dynamic_writes = True
+
+
+def _analyze_operator_code(code: str, access: FieldAccess) -> None:
+    try:
+        tree = ast.parse(code)
+    except SyntaxError:
+        access.dynamic_reads = True
+        access.dynamic_writes = True
+        return
+    _OperatorCodeVisitor(access).visit(tree)
+
+
+# ============================================================================
+# 노드 분석
+# ============================================================================
+
+def _flatten_config(node: Dict[str, Any]) -> Dict[str, Any]:
+    """flat({id, type, prompt, ...})/nested({id, type, config: {...}}) 설정을 하나로 합침"""
+    flat = dict(node)
+    inner = node.get("config")
+    if isinstance(inner, dict):
+        flat.update(inner)
+    return flat
+
+
+def _nested_nodes(config: Dict[str, Any]) -> Tuple[List[Dict[str, Any]], bool]:
+    """
+    for_each / loop / parallel 노드의 하위 노드 목록.
+
+    Returns:
+        (하위 노드 목록, subgraph_ref 등 정적으로 해석 불가한 참조가 있는지)
+    """
+    nested: List[Dict[str, Any]] = []
+    opaque = bool(config.get("subgraph_ref"))
+    for key in ("subgraph_inline", "sub_workflow"):
+        definition = config.get(key)
+        if isinstance(definition, dict):
+            nested.extend(n for n in definition.get("nodes") or [] if isinstance(n, dict))
+    if isinstance(config.get("sub_node_config"), dict):
+        nested.append(config["sub_node_config"])
+    if isinstance(config.get("nodes"), list):
+        nested.extend(n for n in config["nodes"] if isinstance(n, dict))
+    for branch in config.get("branches") or []:
+        if not isinstance(branch, dict):
+            continue
+        opaque = opaque or bool(branch.get("subgraph_ref"))
+        nested.extend(n for n in branch.get("nodes") or [] if isinstance(n, dict))
+        if isinstance(branch.get("sub_workflow"), dict):
+            nested.extend(n for n in branch["sub_workflow"].get("nodes") or [] if isinstance(n, dict))
+    return nested, opaque
+
+
+def analyze_node_access(node: Dict[str, Any]) -> FieldAccess:
+    """
+    단일 노드의 read/write 집합.
+
+    node_runner들의 설정 해석 규칙(handlers.core.main)을 따릅니다.
+    모든 노드는 ``{node_id}_`` 접두사 키(_output, _meta, _error, _status 등)를 쓸 수 있습니다.
+    """
+    access = FieldAccess()
+    if not isinstance(node, dict):
+        access.dynamic_reads = access.dynamic_writes = True
+        return access
+
+    config = _flatten_config(node)
+    node_id = node.get("id") or config.get("id")
+    node_type = node.get("type") or config.get("type")
+
+    if node_id:
+        access.write_prefixes.add(f"{node_id}_")
+    for key in ("output_key", "writes_state_key"):
+        access.write_key(config.get(key))
+
+    _scan_templates(config, access)
+    for path in config.get("input_variables") or []:
+        access.read_path(path if isinstance(path, str) else None)
+
+    if node_type in ("llm_chat", "aiModel", "vision", "image_analysis"):
+        # 프롬프트가 없으면 llm_chat_runner가 *_output 키를 state에서 탐색
+        if node_type in ("llm_chat", "aiModel") and not any(config.get(f) for f in LLM_PROMPT_FIELDS):
+            access.dynamic_reads = True
+
+    elif node_type in ("operator", "operator_custom", "code"):
+        sets = config.get("sets")
+        if isinstance(sets, dict):
+            for key in sets:
+                access.write_key(key)
+        code = config.get("code")
+        if isinstance(code, str) and code.strip():
+            _analyze_operator_code(code, access)
+
+    elif node_type in ("operator_official", "safe_operator"):
+        if config.get("input_key"):
+            access.read_path(config["input_key"])
+        elif not config.get("input"):
+            access.dynamic_reads = True  # 입력 미지정 시 state 전체가 입력
+
+    elif node_type == "route_condition":
+        access.reads.add("__workflow_nodes")
+        for branch in config.get("branches") or []:
+            if isinstance(branch, dict):
+                _scan_expression(branch.get("condition"), access)
+
+    elif node_type in ("for_each", "nested_for_each", "loop", "parallel", "parallel_group"):
+        for key in ("input_list_key", "items_path", "convergence_key"):
+            access.read_path(config.get(key))
+        if node_type == "loop":
+            _scan_expression(config.get("condition"), access)
+            access.write_key(config.get("loop_var") or "loop_index")
+            for key in _LOOP_WRITE_KEYS:
+                access.writes.add(key)
+        elif node_type == "nested_for_each":
+            # 중첩 맵 설정은 다단계 경로를 사용하므로 보수적으로 처리
+            access.dynamic_reads = True
+        if node_type in _DEFAULT_OUTPUT_KEYS and not config.get("output_key"):
+            access.write_key(_DEFAULT_OUTPUT_KEYS[node_type])
+        if node_type == "nested_for_each":
+            output_key = config.get("output_key") or _DEFAULT_OUTPUT_KEYS[node_type]
+            access.write_key(f"{output_key}_summary")
+
+        nested, opaque = _nested_nodes(config)
+        if opaque:
+            access.dynamic_reads = access.dynamic_writes = True
+        for child in nested:
+            access.update(analyze_node_access(child))
+
+    elif node_type in ("api_call", "db_query"):
+        pass  # 템플릿 read + {node_id}_ 접두사 write로 충분
+
+    elif node_type == "video_chunker":
+        if not config.get("output_key"):
+            access.write_key(_DEFAULT_OUTPUT_KEYS[node_type])
+
+    else:
+        # _OPAQUE_NODE_TYPES 및 미등록 타입
+        access.dynamic_reads = access.dynamic_writes = True
+
+    return access
+
+
+# ============================================================================
+# 세그먼트 / partition_map
+# ============================================================================
+
+def analyze_segment_field_access(segment: Dict[str, Any]) -> Dict[str, Any]:
+    """세그먼트(또는 segment_config)의 read/write 집합 - partition_map 저장 형식"""
+    access = FieldAccess()
+    seg_type = segment.get("type")
+
+    if seg_type == "aggregator":
+        # 브랜치 결과 전체를 병합하므로 키 단위로 제한할 수 없음
+        access.dynamic_reads = access.dynamic_writes = True
+    elif seg_type == "parallel_group":
+        for branch in segment.get("branches") or []:
+            for branch_segment in (branch or {}).get("partition_map") or []:
+                access.update(FieldAccess.from_dict(
+                    branch_segment.get(FIELD_ACCESS_KEY) or analyze_segment_field_access(branch_segment)
+                ))
+    else:
+        nodes = segment.get("nodes") or []
+        if not nodes and seg_type not in ("normal", "llm", "hitp"):
+            access.dynamic_reads = access.dynamic_writes = True
+        for node in nodes:
+            access.update(analyze_node_access(node))
+
+    return access.to_dict()
+
+
+def annotate_partition_map(segments: List[Dict[str, Any]]) -> Dict[str, int]:
+    """
+    partition_map의 모든 세그먼트(브랜치 내부 포함)에 field_access를 기록.
+
+    Returns:
+        요약 통계 (annotated / dynamic_reads / dynamic_writes 세그먼트 수)
+    """
+    summary = {"annotated_segments": 0, "dynamic_read_segments": 0, "dynamic_write_segments": 0}
+
+    def _annotate(seg_list: List[Dict[str, Any]]) -> None:
+        for seg in seg_list:
+            # 브랜치 세그먼트를 먼저 기록해야 parallel_group이 결과를 재사용
+            if seg.get("type") == "parallel_group":
+                for branch in seg.get("branches") or []:
+                    _annotate((branch or {}).get("partition_map") or [])
+            field_access = analyze_segment_field_access(seg)
+            seg[FIELD_ACCESS_KEY] = field_access
+            summary["annotated_segments"] += 1
+            summary["dynamic_read_segments"] += int(field_access["dynamic_reads"])
+            summary["dynamic_write_segments"] += int(field_access["dynamic_writes"])
+
+    _annotate(segments)
+    return summary
+
+
+def resolve_segment_field_access(segment_config: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    """파티셔너가 기록한 field_access 사용, 없으면(구버전 아티팩트) 즉석 분석"""
+    if not isinstance(segment_config, dict):
+        return None
+    field_access = segment_config.get(FIELD_ACCESS_KEY)
+    if isinstance(field_access, dict):
+        return field_access
+    return analyze_segment_field_access(segment_config)
+
+
+# ============================================================================
+# 런타임: prefetch / 선언 외 쓰기 감지
+# ============================================================================
+
+def prefetch_declared_reads(
+    state: Dict[str, Any],
+    field_access: Optional[Dict[str, Any]],
+    hydrator: Any,
+    max_workers: int = FIELD_ACCESS_PREFETCH_WORKERS,
+) -> List[str]:
+    """
+    선언된 read 키 중 S3 포인터로 남아있는 값을 병렬로 로드해 state에 채움.
+
+    실패한 키는 포인터를 그대로 두어 기존 lazy load 경로가 처리하게 합니다.
+
+    Returns:
+        로드된 키 목록
+    """
+    if not field_access or hydrator is None or not isinstance(state, dict):
+        return []
+
+    from src.common.state_hydrator import S3Pointer
+
+    pending = []
+    for key in field_access.get("reads") or ():
+        value = state.get(key) if "." not in key else None
+        if isinstance(value, dict) and value.get(POINTER_MARKER):
+            pending.append((key, S3Pointer.from_dict(value)))
+    if not pending:
+        return []
+
+    start = time.perf_counter()
+    loaded: List[str] = []
+    failures = 0
+
+    def _load(item):
+        key, pointer = item
+        return key, hydrator._load_from_s3(pointer)
+
+    workers = max(1, min(max_workers, len(pending)))
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(_load, item) for item in pending]
+        for future, (key, _) in zip(futures, pending):
+            try:
+                _, value = future.result()
+            except Exception as e:
+                failures += 1
+                logger.warning(f"[FieldAccess] Prefetch failed for '{key}', falling back to lazy load: {e}")
+                continue
+            state[key] = value
+            loaded.append(key)
+
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    with _stats_lock:
+        _stats["prefetch_calls"] += 1
+        _stats["prefetched_fields"] += len(loaded)
+        _stats["prefetch_failures"] += failures
+        _stats["prefetch_ms"] += elapsed_ms
+    logger.info(
+        f"[FieldAccess] Prefetched {len(loaded)}/{len(pending)} declared pointer fields "
+        f"in {elapsed_ms:.1f}ms"
+    )
+    return loaded
+
+
+def is_declared_write(key: str, field_access: Dict[str, Any]) -> bool:
+    if key in KERNEL_WRITE_KEYS or key.startswith("_"):
+        return True  # 커널/내부 메타데이터 (_kernel_*, __segment_* 등)
+    if key in (field_access.get("writes") or ()):
+        return True
+    return any(key.startswith(prefix) for prefix in field_access.get("write_prefixes") or ())
+
+
+def snapshot_state(
+    state: Any,
+    field_access: Optional[Dict[str, Any]] = None,
+    mode: str = FIELD_ACCESS_MODE,
+) -> Dict[str, Any]:
+    """
+    실행 전 top-level 스냅샷.
+
+    - advisory: 값 참조만 보관 (O(키 수)). 제자리 중첩 변경은 감지하지 않고
+      top-level 교체/추가/삭제만 경고합니다.
+    - strict: 되돌릴 실행 전 값이 필요하므로 검사 대상(선언되지 않은 쓰기) 키의
+      dict/list/set 값만 deepcopy합니다. 선언된 쓰기 키, 불변 값,
+      dynamic_writes 세그먼트는 복사하지 않습니다.
+    """
+    if not isinstance(state, dict):
+        return {}
+    snapshot = dict(state)
+    if mode != "strict" or (field_access and field_access.get("dynamic_writes")):
+        return snapshot
+    for key, value in snapshot.items():
+        if not isinstance(value, (dict, list, set)):
+            continue
+        if field_access and is_declared_write(key, field_access):
+            continue
+        try:
+            snapshot[key] = copy.deepcopy(value)
+        except Exception:
+            pass  # 복사 불가 값은 참조 비교로 대체
+    return snapshot
+
+
+def find_undeclared_writes(
+    before: Dict[str, Any],
+    after: Dict[str, Any],
+    field_access: Optional[Dict[str, Any]],
+) -> List[str]:
+    """
+    실행 전/후 top-level 키를 비교해 선언되지 않은 추가/변경/삭제 키 목록 반환.
+
+    dynamic_writes 세그먼트는 선언 집합이 불완전하므로 검사하지 않습니다.
+    """
+    if not field_access or field_access.get("dynamic_writes") or not isinstance(after, dict):
+        return []
+
+    undeclared = []
+    for key, value in after.items():
+        if is_declared_write(key, field_access):
+            continue
+        if key not in before:
+            undeclared.append(key)
+            continue
+        previous = before[key]
+        if value is previous:
+            continue
+        try:
+            changed = value != previous
+        except Exception:
+            changed = True
+        if changed:
+            undeclared.append(key)
+    for key in before:
+        if key not in after and not is_declared_write(key, field_access):
+            undeclared.append(key)
+    return sorted(undeclared)
+
+
+def enforce_declared_writes(
+    before: Dict[str, Any],
+    after: Dict[str, Any],
+    field_access: Optional[Dict[str, Any]],
+    mode: str = FIELD_ACCESS_MODE,
+    segment_id: Any = None,
+) -> List[str]:
+    """
+    선언 외 쓰기 처리.
+
+    - advisory: 경고 로그만 남김 (기존처럼 전체 병합)
+    - strict: 선언 외 키를 실행 전 값으로 되돌리고 ``__undeclared_writes``에 기록
+      → 이후 universal_sync_core에는 선언된 출력만 전달됨
+
+    Returns:
+        선언되지 않은 쓰기 키 목록
+    """
+    if mode == "off":
+        return []
+    undeclared = find_undeclared_writes(before, after, field_access)
+    with _stats_lock:
+        _stats["undeclared_write_checks"] += 1
+        _stats["undeclared_writes"] += len(undeclared)
+    if not undeclared:
+        return []
+
+    if mode != "strict":
+        logger.warning(
+            f"[FieldAccess] Segment {segment_id} wrote undeclared keys: {undeclared[:20]}"
+        )
+        return undeclared
+
+    for key in undeclared:
+        if key in before:
+            after[key] = before[key]
+        else:
+            after.pop(key, None)
+    after[UNDECLARED_WRITES_KEY] = undeclared
+    with _stats_lock:
+        _stats["reverted_writes"] += len(undeclared)
+    logger.warning(
+        f"[FieldAccess][strict] Segment {segment_id} reverted undeclared writes: {undeclared[:20]}"
+    )
+    return undeclared
+
+
+def get_field_access_stats() -> Dict[str, Any]:
+    with _stats_lock:
+        return dict(_stats)
+
+
+def reset_field_access_stats() -> None:
+    with _stats_lock:
+        for key in _stats:
+            _stats[key] = 0.0 if isinstance(_stats[key], float) else 0
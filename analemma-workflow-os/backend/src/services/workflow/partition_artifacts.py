@@ -0,0 +1,275 @@
+# -*- coding: utf-8 -*-
+"""
+파티션 아티팩트 저장소 (Content-Addressed Partition Artifacts)
+
+partition_workflow_advanced() 결과를 Workflows 아이템에 inline으로 넣는 대신,
+정규화된 config + 파티셔너 fingerprint의 해시를 키로 하는 불변(immutable) S3 객체로 저장합니다.
+
+- 아티팩트 키: partition-artifacts/{sha256}.json
+- Workflows 아이템에는 참조(partition_artifact)와 스칼라 카운트만 남음 → 400KB 아이템 제한 회피
+- 동일 config는 워크플로우/소유자와 무관하게 같은 아티팩트를 공유
+- Warm container 내에서는 해시 기준 LRU 캐시로 S3 재조회 없이 재사용
+  (내용이 해시로 고정되므로 TTL/무효화 불필요)
+
+Usage:
+    from src.services.workflow.partition_artifacts import (
+        store_partition_artifact, load_partition_artifact, resolve_partition
+    )
+
+    ref = store_partition_artifact(partition_result, workflow_config)   # 저장 시점
+    result = load_partition_artifact(ref)                               # 실행 시작 시점
+    result, ref, source = resolve_partition(workflow_config)            # 참조 없음 → 해시 조회/재계산
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from botocore.exceptions import ClientError
+
+from src.common.aws_clients import get_s3_client
+from src.common.hash_utils import content_hash
+from src.common.json_utils import DecimalEncoder
+from src.services.workflow.partition_service import (
+    partition_workflow_advanced,
+    partitioner_fingerprint,
+)
+
+logger = logging.getLogger(__name__)
+
+ARTIFACT_PREFIX = "partition-artifacts"
+
+# Warm container 캐시 크기 (아티팩트 수 기준)
+PARTITION_ARTIFACT_CACHE_MAX_ENTRIES = int(os.environ.get("PARTITION_ARTIFACT_CACHE_MAX_ENTRIES", "32"))
+
+# 아티팩트 파일 포맷 버전 (파티셔너 버전과 별개)
+ARTIFACT_FORMAT_VERSION = 1
+
+# 해시 → 직렬화된 partition_result (bytes)
+# 파싱된 dict가 아닌 bytes를 보관: 호출자가 partition_map을 수정해도 캐시가 오염되지 않음
+_artifact_cache: "OrderedDict[str, bytes]" = OrderedDict()
+_artifact_cache_lock = threading.Lock()
+_artifact_cache_stats = {"hits": 0, "misses": 0, "s3_loads": 0, "s3_stores": 0, "computed": 0}
+
+
+def _artifact_bucket() -> Optional[str]:
+    """호출 시점 환경변수 기준 (Save Lambda는 SKELETON_S3_BUCKET, Init Lambda는 WORKFLOW_STATE_BUCKET)."""
+    return (
+        os.environ.get("PARTITION_ARTIFACT_BUCKET")
+        or os.environ.get("WORKFLOW_STATE_BUCKET")
+        or os.environ.get("SKELETON_S3_BUCKET")
+    )
+
+
+def normalize_partition_input(workflow_config: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    파티셔닝에 영향을 주는 부분만 추출.
+
+    partition_workflow_advanced는 nodes/edges만 읽으므로 name, description 등의
+    메타데이터 변경은 아티팩트를 무효화하지 않음.
+    """
+    config = workflow_config or {}
+    nodes = [n for n in (config.get("nodes") or []) if isinstance(n, dict) and "id" in n]
+    return {"nodes": nodes, "edges": config.get("edges") or []}
+
+
+def compute_partition_artifact_hash(workflow_config: Dict[str, Any]) -> str:
+    """정규화된 config + 파티셔너 fingerprint의 SHA-256."""
+    return content_hash({
+        "partitioner": partitioner_fingerprint(),
+        "config": normalize_partition_input(workflow_config),
+    })
+
+
+def _artifact_key(artifact_hash: str) -> str:
+    return f"{ARTIFACT_PREFIX}/{artifact_hash}.json"
+
+
+def _build_ref(artifact_hash: str, bucket: str, partition_result: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        "hash": artifact_hash,
+        "bucket": bucket,
+        "key": _artifact_key(artifact_hash),
+        "partitioner_version": partitioner_fingerprint()["version"],
+        "total_segments": partition_result.get("total_segments") or 0,
+    }
+
+
+def _cache_get(artifact_hash: str) -> Optional[bytes]:
+    with _artifact_cache_lock:
+        payload = _artifact_cache.get(artifact_hash)
+        if payload is None:
+            _artifact_cache_stats["misses"] += 1
+            return None
+        _artifact_cache.move_to_end(artifact_hash)
+        _artifact_cache_stats["hits"] += 1
+        return payload
+
+
+def _cache_put(artifact_hash: str, payload: bytes) -> None:
+    with _artifact_cache_lock:
+        _artifact_cache[artifact_hash] = payload
+        _artifact_cache.move_to_end(artifact_hash)
+        while len(_artifact_cache) > PARTITION_ARTIFACT_CACHE_MAX_ENTRIES:
+            _artifact_cache.popitem(last=False)
+
+
+def _serialize(partition_result: Dict[str, Any]) -> bytes:
+    return json.dumps(partition_result, cls=DecimalEncoder, ensure_ascii=False).encode("utf-8")
+
+
+def store_partition_artifact(
+    partition_result: Dict[str, Any],
+    workflow_config: Dict[str, Any],
+    artifact_hash: Optional[str] = None,
+) -> Optional[Dict[str, Any]]:
+    """
+    파티셔닝 결과를 content-addressed 아티팩트로 저장하고 참조를 반환합니다.
+
+    Args:
+        partition_result: partition_workflow_advanced() 결과
+        workflow_config: 결과를 만든 config (해시 계산용)
+        artifact_hash: 이미 계산한 해시가 있으면 전달
+
+    Returns:
+        Workflows 아이템에 저장할 참조 dict. 버킷 미설정/S3 실패 시 None
+        (호출자는 inline 저장으로 폴백).
+    """
+    artifact_hash = artifact_hash or compute_partition_artifact_hash(workflow_config)
+    body = {
+        "format_version": ARTIFACT_FORMAT_VERSION,
+        "artifact_hash": artifact_hash,
+        "partitioner": partitioner_fingerprint(),
+        "created_at": int(time.time()),
+        "partition_result": partition_result,
+    }
+    payload = _serialize(partition_result)
+    _cache_put(artifact_hash, payload)
+
+    bucket = _artifact_bucket()
+    if not bucket:
+        logger.warning("[PartitionArtifact] No artifact bucket configured; skipping S3 store")
+        return None
+
+    try:
+        get_s3_client().put_object(
+            Bucket=bucket,
+            Key=_artifact_key(artifact_hash),
+            Body=_serialize(body),
+            ContentType="application/json",
+            Metadata={"partitioner-version": str(body["partitioner"]["version"])},
+        )
+    except Exception as e:
+        logger.warning(f"[PartitionArtifact] Failed to store artifact {artifact_hash[:12]}: {e}")
+        return None
+
+    with _artifact_cache_lock:
+        _artifact_cache_stats["s3_stores"] += 1
+    logger.info(
+        f"[PartitionArtifact] Stored s3://{bucket}/{_artifact_key(artifact_hash)} "
+        f"({len(payload) / 1024:.1f}KB, {partition_result.get('total_segments', 0)} segments)"
+    )
+    return _build_ref(artifact_hash, bucket, partition_result)
+
+
+def _fetch_artifact(artifact_hash: str, bucket: str, key: Optional[str] = None) -> Optional[bytes]:
+    """S3에서 아티팩트를 읽어 검증 후 warm 캐시에 적재. 없거나 손상된 경우 None."""
+    try:
+        response = get_s3_client().get_object(Bucket=bucket, Key=key or _artifact_key(artifact_hash))
+        body = json.loads(response["Body"].read())
+    except ClientError as e:
+        code = e.response.get("Error", {}).get("Code")
+        if code not in ("NoSuchKey", "404"):
+            logger.warning(f"[PartitionArtifact] Failed to load {artifact_hash[:12]}: {e}")
+        return None
+    except Exception as e:
+        logger.warning(f"[PartitionArtifact] Failed to load {artifact_hash[:12]}: {e}")
+        return None
+
+    if not isinstance(body, dict) or body.get("artifact_hash") != artifact_hash or "partition_result" not in body:
+        logger.warning(f"[PartitionArtifact] Artifact {artifact_hash[:12]} is malformed; ignoring")
+        return None
+
+    payload = _serialize(body["partition_result"])
+    _cache_put(artifact_hash, payload)
+    with _artifact_cache_lock:
+        _artifact_cache_stats["s3_loads"] += 1
+    return payload
+
+
+def load_partition_artifact(ref: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """
+    참조로 아티팩트를 로드합니다 (warm 캐시 → S3).
+
+    Returns:
+        partition_result dict (호출마다 새 객체). 없거나 손상된 경우 None.
+    """
+    if not isinstance(ref, dict) or not ref.get("hash"):
+        return None
+    artifact_hash = ref["hash"]
+
+    payload = _cache_get(artifact_hash)
+    if payload is None:
+        bucket = ref.get("bucket") or _artifact_bucket()
+        if not bucket:
+            return None
+        payload = _fetch_artifact(artifact_hash, bucket, ref.get("key"))
+        if payload is None:
+            return None
+    return json.loads(payload)
+
+
+def resolve_partition(
+    workflow_config: Dict[str, Any],
+    partitioner: Callable[[Dict[str, Any]], Dict[str, Any]] = None,
+    store: bool = True,
+) -> Tuple[Dict[str, Any], Optional[Dict[str, Any]], str]:
+    """
+    참조가 없을 때의 파티션 해석: 해시 → warm 캐시 → S3 → 재계산(+저장).
+
+    Returns:
+        (partition_result, artifact_ref, source)
+        source: "cache" | "s3" | "computed"
+    """
+    artifact_hash = compute_partition_artifact_hash(workflow_config)
+    bucket = _artifact_bucket()
+
+    payload = _cache_get(artifact_hash)
+    source = "cache"
+    if payload is None and bucket:
+        payload = _fetch_artifact(artifact_hash, bucket)
+        source = "s3"
+    if payload is not None:
+        result = json.loads(payload)
+        return result, _build_ref(artifact_hash, bucket, result) if bucket else None, source
+
+    result = (partitioner or partition_workflow_advanced)(workflow_config)
+    with _artifact_cache_lock:
+        _artifact_cache_stats["computed"] += 1
+    stored_ref = None
+    if store and isinstance(result, dict):
+        stored_ref = store_partition_artifact(result, workflow_config, artifact_hash=artifact_hash)
+    return result, stored_ref, "computed"
+
+
+def get_partition_artifact_cache_stats() -> Dict[str, Any]:
+    """Warm container 아티팩트 캐시 통계."""
+    with _artifact_cache_lock:
+        stats = dict(_artifact_cache_stats)
+        stats["entries"] = len(_artifact_cache)
+        stats["cached_bytes"] = sum(len(v) for v in _artifact_cache.values())
+    lookups = stats["hits"] + stats["misses"]
+    stats["hit_rate_percent"] = round(stats["hits"] / lookups * 100, 2) if lookups else 0.0
+    return stats
+
+
+def clear_partition_artifact_cache() -> None:
+    """캐시 및 통계 초기화 (테스트용)."""
+    with _artifact_cache_lock:
+        _artifact_cache.clear()
+        for key in _artifact_cache_stats:
+            _artifact_cache_stats[key] = 0
@@ -3,14 +3,24 @@ import os
 import json
 import logging
 import threading
+from collections import Counter, deque
 from typing import Dict, Any, List, Set, Optional, Tuple, FrozenSet
 
+try:
+    from src.services.workflow.field_access_analyzer import annotate_partition_map
+except ImportError:
+    from services.workflow.field_access_analyzer import annotate_partition_map
+
 logger = logging.getLogger(__name__)
 
 # ============================================================================
 # [v2.0 Production Hardening] 상수 및 설정
 # ============================================================================
 
+# 파티셔너 출력 버전 - partition_map 구조/분할 규칙이 바뀌면 올려야 함
+# 파티션 아티팩트 해시에 포함되어, 버전이 바뀌면 기존 아티팩트를 재사용하지 않음
+PARTITIONER_VERSION = "3.28.0"
+
 # 최대 재귀 깊이 제한 (무한 루프 방지)
 MAX_PARTITION_DEPTH = int(os.environ.get("MAX_PARTITION_DEPTH", "50"))
 
@@ -150,11 +160,11 @@ def validate_dag(
                 in_degree[target] += 1
     
     # 진입 차수가 0인 노드들로 시작
-    queue = [nid for nid, deg in in_degree.items() if deg == 0]
+    queue = deque(nid for nid, deg in in_degree.items() if deg == 0)
     visited_count = 0
     
     while queue:
-        node_id = queue.pop(0)
+        node_id = queue.popleft()
         visited_count += 1
         
         for edge in outgoing_edges.get(node_id, []):
@@ -546,10 +556,10 @@ def _detect_transaction_patterns(
                 # 연결된 노드 추적
                 group_nodes = []
                 visited = set()
-                queue = [node["id"]]
+                queue = deque([node["id"]])
                 
                 while queue:
-                    current_id = queue.pop(0)
+                    current_id = queue.popleft()
                     if current_id in visited:
                         continue
                     visited.add(current_id)
@@ -590,6 +600,22 @@ def _detect_transaction_patterns(
     return implicit_groups
 
 
+def partitioner_fingerprint() -> Dict[str, Any]:
+    """
+    파티셔닝 결과에 영향을 주는 버전/설정 값.
+
+    같은 config라도 이 값이 다르면 partition_map/loop limit이 달라질 수 있으므로
+    파티션 아티팩트 해시에 함께 포함됩니다.
+    """
+    return {
+        "version": PARTITIONER_VERSION,
+        "max_partition_depth": MAX_PARTITION_DEPTH,
+        "loop_limit_safety_multiplier": LOOP_LIMIT_SAFETY_MULTIPLIER,
+        "loop_limit_flat_bonus": LOOP_LIMIT_FLAT_BONUS,
+        "loop_limit_floor": LOOP_LIMIT_FLOOR,
+    }
+
+
 def partition_workflow_advanced(config: Dict[str, Any]) -> Dict[str, Any]:
     """
     고급 워크플로우 분할: HITP 엣지와 LLM 노드 기반으로 세그먼트를 생성합니다.
@@ -703,33 +729,111 @@ def partition_workflow_advanced(config: Dict[str, Any]) -> Dict[str, Any]:
     stats = {"llm": 0, "hitp": 0, "parallel_groups": 0, "branches": 0}
     
     # --- Helper: 합류 지점(Convergence Node) 찾기 ---
-    def find_convergence_node(start_nodes: List[str]) -> Optional[str]:
+    def is_merge_point(node_id: str) -> bool:
+        return len(incoming_edges.get(node_id, [])) > 1
+
+    # [Performance] 노드별 "BFS로 처음 꺼내지는 Merge Point" 메모이제이션
+    # in-degree <= 1인 노드는 부모가 하나뿐이므로, 분기점 아래의 탐색 영역은 Merge Point에서
+    # 끊기는 forest가 됨. 노드마다 (BFS 깊이, Merge Point)를 한 번만 계산해 두면
+    # 분기점마다 BFS를 다시 돌리지 않고 자식 결과의 (깊이, 순서) 최솟값으로 합류점이 결정됨
+    # → 전체 파티셔닝의 합류점 탐색 비용 O(V + E)
+    first_merge_memo: Dict[str, Optional[Tuple[int, str]]] = {}
+
+    def first_merge_below(root: str) -> Optional[Tuple[int, str]]:
         """
-        브랜치들이 공통으로 도달하는 첫 번째 Merge Point를 찾습니다.
-        in-degree > 1인 노드를 후보로 봅니다.
-        
-        [Critical Fix #2] 찾은 합류점은 forced_segment_starts에 등록되어
-        반드시 새 세그먼트의 시작점이 됩니다.
+        root 단일 시작점 BFS가 처음 꺼내는 Merge Point의 (깊이, 노드 ID).
+
+        nodes 맵에 없는 ID끼리 순환하는 경우(DAG 검증 대상 밖)에는 KeyError 대신
+        ValueError를 던져 호출자가 일반 BFS로 폴백하도록 함.
         """
-        queue = list(start_nodes)
+        if root in first_merge_memo:
+            return first_merge_memo[root]
+
+        # 10k 노드 체인에서도 recursion limit에 걸리지 않도록 명시적 스택 사용
+        stack = [root]
+        in_progress = {root}
+        while stack:
+            node_id = stack[-1]
+            children = []
+            pending = False
+            for out_edge in outgoing_edges.get(node_id, []):
+                target = out_edge.get("target")
+                if not target or target in children:
+                    continue
+                children.append(target)
+                if not is_merge_point(target) and target not in first_merge_memo:
+                    if target in in_progress:
+                        raise ValueError(f"cycle through unmapped node '{target}'")
+                    stack.append(target)
+                    in_progress.add(target)
+                    pending = True
+            if pending:
+                continue
+
+            # 같은 깊이면 먼저 나온 자식(엣지 순서)이 BFS에서도 먼저 꺼내짐
+            best = None
+            for target in children:
+                if is_merge_point(target):
+                    candidate = (1, target)
+                else:
+                    below = first_merge_memo[target]
+                    candidate = (below[0] + 1, below[1]) if below else None
+                if candidate and (best is None or candidate[0] < best[0]):
+                    best = candidate
+            first_merge_memo[node_id] = best
+            in_progress.discard(node_id)
+            stack.pop()
+        return first_merge_memo[root]
+
+    def find_convergence_node_bfs(start_nodes: List[str]) -> Optional[str]:
+        """다중 시작점 BFS (메모이제이션 전제가 성립하지 않을 때의 폴백)."""
+        queue = deque(start_nodes)
         seen = set(queue)
-        
+
         while queue:
-            node_id = queue.pop(0)
+            node_id = queue.popleft()
             # Merge Point 후보 확인
-            if len(incoming_edges.get(node_id, [])) > 1:
-                if node_id not in start_nodes:
-                    # [Critical Fix #2] 합류점은 반드시 새 세그먼트 시작점
-                    forced_segment_starts.add(node_id)
-                    logger.debug(f"Convergence node registered as forced segment start: {node_id}")
-                    return node_id
-            
+            if is_merge_point(node_id) and node_id not in start_nodes:
+                return node_id
+
             for out_edge in outgoing_edges.get(node_id, []):
                 target = out_edge.get("target")
                 if target and target not in seen:
                     seen.add(target)
                     queue.append(target)
         return None
+
+    def find_convergence_node(start_nodes: List[str]) -> Optional[str]:
+        """
+        브랜치들이 공통으로 도달하는 첫 번째 Merge Point를 찾습니다.
+        in-degree > 1인 노드를 후보로 봅니다.
+
+        분기점의 타겟들이 모두 같은 부모 하나만 가진 경우(일반적인 분기) 시작점별
+        메모 결과를 합성하고, 그 외에는 다중 시작점 BFS로 폴백합니다. 두 경로의 결과는 동일합니다.
+
+        [Critical Fix #2] 찾은 합류점은 forced_segment_starts에 등록되어
+        반드시 새 세그먼트의 시작점이 됩니다.
+        """
+        parents = {e.get("source") for nid in start_nodes for e in incoming_edges.get(nid, [])}
+        convergence = None
+        if len(parents) <= 1 and not any(is_merge_point(nid) for nid in start_nodes):
+            try:
+                best = None
+                for node_id in start_nodes:
+                    below = first_merge_below(node_id)
+                    if below and (best is None or below[0] < best[0]):
+                        best = below
+                convergence = best[1] if best else None
+            except ValueError:
+                convergence = find_convergence_node_bfs(start_nodes)
+        else:
+            convergence = find_convergence_node_bfs(start_nodes)
+
+        if convergence:
+            # [Critical Fix #2] 합류점은 반드시 새 세그먼트 시작점
+            forced_segment_starts.add(convergence)
+            logger.debug(f"Convergence node registered as forced segment start: {convergence}")
+        return convergence
     
     # --- [Critical Fix] 위상 정렬 헬퍼 ---
     def _topological_sort_nodes(nodes_map: Dict[str, Any], edges_list: List[Dict]) -> List[Dict[str, Any]]:
@@ -781,7 +885,8 @@ def partition_workflow_advanced(config: Dict[str, Any]) -> Dict[str, Any]:
         
         # 정렬되지 않은 노드가 있으면 (사이클 또는 연결 안됨) 원래 순서로 추가
         if len(sorted_ids) < len(node_ids):
-            remaining = [nid for nid in nodes_map.keys() if nid not in sorted_ids]
+            sorted_set = set(sorted_ids)
+            remaining = [nid for nid in nodes_map.keys() if nid not in sorted_set]
             logger.warning(f"Some nodes not topologically sorted, appending in original order: {remaining}")
             sorted_ids.extend(remaining)
         
@@ -789,6 +894,21 @@ def partition_workflow_advanced(config: Dict[str, Any]) -> Dict[str, Any]:
         logger.debug(f"Topological sort result: {[n.get('id') for n in result]}")
         return result
     
+    # [Performance] source별 엣지 인덱스 (config["edges"] 리스트 단위로 캐시)
+    # create_segment가 세그먼트마다 전체 엣지를 훑던 O(segments × E) 스캔 제거
+    # 값: (원본 리스트, {source: [(원본 순서, edge), ...]}) - 원본 리스트를 잡아 두어 id 재사용 방지
+    edge_index_cache: Dict[int, Tuple[List[Dict[str, Any]], Dict[str, List[Tuple[int, Dict[str, Any]]]]]] = {}
+
+    def edges_by_source(all_edges: List[Dict[str, Any]]) -> Dict[str, List[Tuple[int, Dict[str, Any]]]]:
+        cached = edge_index_cache.get(id(all_edges))
+        if cached is not None and cached[0] is all_edges:
+            return cached[1]
+        index: Dict[str, List[Tuple[int, Dict[str, Any]]]] = {}
+        for pos, edge in enumerate(all_edges):
+            index.setdefault(edge.get("source"), []).append((pos, edge))
+        edge_index_cache[id(all_edges)] = (all_edges, index)
+        return index
+
     # --- Segment 생성 헬퍼 ---
     def create_segment(nodes_map, edges_list, s_type="normal", override_id=None, config=None):
         # 🛡️ [v2.6 P0 Fix] 'code' 타입 강제 정정 - ValueError 방지
@@ -804,14 +924,26 @@ def partition_workflow_advanced(config: Dict[str, Any]) -> Dict[str, Any]:
         # [P0 Refactoring] Inter-segment edges 수집
         outgoing_edges = []
         if config:
-            all_edges = config.get("edges", [])
-            for edge in all_edges:
+            index = edges_by_source(config.get("edges", []))
+            # 세그먼트 노드에서 나가는 엣지만 원본 순서대로 수집
+            candidates = sorted(
+                (item for nid in nodes_map for item in index.get(nid, ())),
+                key=lambda item: item[0]
+            )
+            # 중복 방지용 (source, target) 버킷 - 동등한 엣지는 같은 버킷에만 존재
+            existing: Dict[Tuple[Any, Any], List[Dict[str, Any]]] = {}
+            for edge in edges_list:
+                existing.setdefault((edge.get("source"), edge.get("target")), []).append(edge)
+
+            for _, edge in candidates:
                 source = edge.get("source")
                 target = edge.get("target")
                 
                 # Intra-segment edge (양쪽 노드가 모두 이 세그먼트에 있음)
                 if source in nodes_map and target in nodes_map:
-                    if edge not in edges_list:  # 중복 방지
+                    bucket = existing.setdefault((source, target), [])
+                    if edge not in bucket:  # 중복 방지
+                        bucket.append(edge)
                         edges_list.append(edge)
                 
                 # Inter-segment edge (source만 이 세그먼트에 있고 target은 다른 세그먼트)
@@ -883,7 +1015,13 @@ def partition_workflow_advanced(config: Dict[str, Any]) -> Dict[str, Any]:
         local_segments = []
         local_current_nodes = {}
         local_current_edges = []
-        queue = list(start_node_ids)
+        # [Performance] deque + 큐 멤버십 카운터 (list.pop(0) / `in queue` 선형 탐색 제거)
+        queue = deque(start_node_ids)
+        queued = Counter(queue)
+        
+        def enqueue(target_id: str):
+            queue.append(target_id)
+            queued[target_id] += 1
         
         # [Critical Fix #1] 무한 루프 방지용 반복 카운터
         max_iterations = len(nodes) * 2  # 안전 마진
@@ -903,11 +1041,12 @@ def partition_workflow_advanced(config: Dict[str, Any]) -> Dict[str, Any]:
             if iteration_count > max_iterations:
                 logger.error(
                     f"Partition iteration limit exceeded ({max_iterations}). "
-                    f"Possible infinite loop. Queue: {queue[:5]}..."
+                    f"Possible infinite loop. Queue: {list(queue)[:5]}..."
                 )
                 raise PartitionDepthExceededError(iteration_count, max_iterations)
             
-            node_id = queue.pop(0)
+            node_id = queue.popleft()
+            queued[node_id] -= 1
             
             # Stop Condition
             if node_id in visited_nodes: 
@@ -1026,9 +1165,9 @@ def partition_workflow_advanced(config: Dict[str, Any]) -> Dict[str, Any]:
                 # 다음 노드 탐색
                 for out_edge in outgoing_edges.get(node_id, []):
                     tgt = out_edge.get("target")
-                    if tgt and tgt not in visited_nodes and tgt not in queue:
+                    if tgt and tgt not in visited_nodes and not queued[tgt]:
                         if not (stop_at_nodes and tgt in stop_at_nodes):
-                            queue.append(tgt)
+                            enqueue(tgt)
                 continue
             
             # 병렬 그룹 처리 (그래프 분기점 기반)
@@ -1107,7 +1246,7 @@ def partition_workflow_advanced(config: Dict[str, Any]) -> Dict[str, Any]:
                 
                 # 합류점이 있다면 큐에 추가
                 if convergence_node and convergence_node not in visited_nodes:
-                    queue.append(convergence_node)
+                    enqueue(convergence_node)
                 continue
             
             # 일반 노드 처리
@@ -1123,9 +1262,9 @@ def partition_workflow_advanced(config: Dict[str, Any]) -> Dict[str, Any]:
             # 다음 노드 탐색
             for out_edge in outgoing_edges.get(node_id, []):
                 tgt = out_edge.get("target")
-                if tgt and tgt not in visited_nodes and tgt not in queue:
+                if tgt and tgt not in visited_nodes and not queued[tgt]:
                     if not (stop_at_nodes and tgt in stop_at_nodes):
-                        queue.append(tgt)
+                        enqueue(tgt)
         
         flush_local()  # 남은 것 처리
         return local_segments
@@ -1161,6 +1300,10 @@ def partition_workflow_advanced(config: Dict[str, Any]) -> Dict[str, Any]:
         """
         # Aggregator 세그먼트들의 ID 집합을 미리 파악
         aggregator_ids = {s["id"] for s in seg_list if s.get("type") == "aggregator"}
+        # [Performance] 인라인 parallel_group 원본 세그먼트 조회용 (aggregator마다 선형 탐색 제거)
+        seg_by_id: Dict[int, Dict[str, Any]] = {}
+        for s in seg_list:
+            seg_by_id.setdefault(s["id"], s)
         
         for idx, seg in enumerate(seg_list):
             if seg["type"] == "parallel_group":
@@ -1208,7 +1351,7 @@ def partition_workflow_advanced(config: Dict[str, Any]) -> Dict[str, Any]:
                     # Find source parallel segment
                     # Note: seg_list might be partial (recursive), but source_p_seg should be in the same list or parent?
                     # Actually for inline parallel, they are siblings in the same list.
-                    source_seg = next((s for s in seg_list if s["id"] == source_p_seg_id), None)
+                    source_seg = seg_by_id.get(source_p_seg_id)
                     
                     if source_seg and source_seg.get("node_ids"):
                         p_node_id = source_seg["node_ids"][0] # Parallel group node ID
@@ -1311,6 +1454,9 @@ def partition_workflow_advanced(config: Dict[str, Any]) -> Dict[str, Any]:
     
     total_segments_recursive = count_segments_recursive(segments)
     
+    # --- [v3.28] 세그먼트별 정적 read/write 집합 (런타임 prefetch / 선언 외 쓰기 감지용) ---
+    field_access_summary = annotate_partition_map(segments)
+    
     # 🛡️ [Critical Fix] Step Functions Loop Control requires Top-Level Count
     # execution_segments_count must be defined BEFORE use in loop limit calculation
     # It must match len(partition_map), otherwise loop will try to access non-existent indices.
@@ -1383,6 +1529,8 @@ def partition_workflow_advanced(config: Dict[str, Any]) -> Dict[str, Any]:
             "loop_limit_safety_multiplier": LOOP_LIMIT_SAFETY_MULTIPLIER,
             "loop_limit_flat_bonus": LOOP_LIMIT_FLAT_BONUS,
             "loop_limit_floor": LOOP_LIMIT_FLOOR,
+            # [v3.28] Static field-access analysis summary
+            "field_access": field_access_summary,
         }
     }
 
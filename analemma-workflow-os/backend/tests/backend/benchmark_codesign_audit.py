@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+"""
+Benchmark: codesign audit latency on a large (2000-node) workflow
+
+Two scenarios:
+
+    stream  a 2000-node workflow receives streamed node/edge chunks. After
+            each chunk the audit for the touched nodes plus validate_workflow
+            is recomputed. Previous: _incremental_audit(workflow, ids) +
+            validate_workflow(workflow) on the whole graph. New:
+            IncrementalAuditor.apply_chunk + audit_issues + validation_errors.
+    turn    the next codesign turn arrives with a few edited nodes. New:
+            IncrementalAuditor.sync (diff) + audit_issues + validation_errors.
+
+Both paths are checked for identical results at the end.
+
+Run:
+    cd analemma-workflow-os/backend
+    python -m tests.backend.benchmark_codesign_audit
+    python -m tests.backend.benchmark_codesign_audit --nodes 5000 --chunks 500
+"""
+
+import argparse
+import copy
+import json
+import os
+import random
+import sys
+import time
+from typing import Dict, List
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+
+from src.common.graph_dsl import validate_workflow
+from src.services.design.codesign_assistant import _incremental_audit
+from src.services.design.incremental_audit import IncrementalAuditor
+
+NODE_TYPES = ("llm_chat", "api_call", "operator", "route_condition", "for_each", "parallel")
+
+
+def make_node(rng: random.Random, node_id: str, index: int) -> Dict:
+    return {
+        "id": node_id,
+        "type": rng.choice(NODE_TYPES),
+        "position": {"x": 150, "y": 50 + index * 100},
+        "data": {"label": f"Step {node_id}"},
+        "config": {"prompt_content": "summarize", "url": "https://api.example.com"} if rng.random() < 0.8 else {},
+    }
+
+
+def make_workflow(node_count: int, seed: int = 3) -> Dict:
+    rng = random.Random(seed)
+    nodes = [make_node(rng, f"n{i}", i) for i in range(node_count)]
+    edges = [{"id": f"e{i}", "source": f"n{i - 1}", "target": f"n{i}"} for i in range(1, node_count)]
+    for i in range(node_count // 5):
+        src = rng.randrange(node_count - 1)
+        edges.append({"id": f"x{i}", "source": f"n{src}", "target": f"n{rng.randrange(src + 1, node_count)}"})
+    return {"nodes": nodes, "edges": edges}
+
+
+def _issue_set(issues: List[Dict]) -> List[str]:
+    return sorted(json.dumps(i, sort_keys=True, ensure_ascii=False) for i in issues)
+
+
+def benchmark_stream(node_count: int, chunks: int) -> Dict:
+    rng = random.Random(11)
+    base = make_workflow(node_count)
+    script = []
+    for i in range(chunks // 2):
+        node = make_node(rng, f"s{i}", node_count + i)
+        edge = {"id": f"se{i}", "source": f"n{rng.randrange(node_count)}", "target": f"s{i}"}
+        script += [{"type": "node", "data": node}, {"type": "edge", "data": edge}]
+
+    def touched(obj):
+        data = obj["data"]
+        return {data["id"]} if obj["type"] == "node" else {data["source"], data["target"]}
+
+    # 이전 방식: 청크마다 전체 그래프 기준 감사 + 검증
+    workflow = copy.deepcopy(base)
+    start = time.perf_counter()
+    for obj in script:
+        workflow["nodes" if obj["type"] == "node" else "edges"].append(obj["data"])
+        legacy_issues = _incremental_audit(workflow, touched(obj))
+        legacy_errors = validate_workflow(workflow)
+    legacy_ms = (time.perf_counter() - start) * 1000
+
+    start = time.perf_counter()
+    auditor = IncrementalAuditor.from_workflow(base)
+    build_ms = (time.perf_counter() - start) * 1000
+    start = time.perf_counter()
+    for obj in script:
+        issues = auditor.audit_issues(auditor.apply_chunk(obj))
+        errors = auditor.validation_errors()
+    incremental_ms = (time.perf_counter() - start) * 1000
+
+    assert errors == legacy_errors == validate_workflow(workflow)
+    assert _issue_set(issues) == _issue_set(legacy_issues)
+    return {
+        "chunks": len(script),
+        "legacy_us_per_chunk": round(legacy_ms * 1000 / len(script), 1),
+        "incremental_us_per_chunk": round(incremental_ms * 1000 / len(script), 1),
+        "initial_build_ms": round(build_ms, 2),
+        "speedup": round(legacy_ms / incremental_ms, 1),
+    }
+
+
+def benchmark_turn(node_count: int, turns: int = 20, edits_per_turn: int = 5) -> Dict:
+    rng = random.Random(5)
+    workflow = make_workflow(node_count)
+    auditor = IncrementalAuditor.from_workflow(workflow)
+    legacy_s = incremental_s = 0.0
+    for _ in range(turns):
+        workflow = copy.deepcopy(workflow)  # 클라이언트가 보낸 새 워크플로우 JSON
+        affected = set()
+        for _ in range(edits_per_turn):
+            node = rng.choice(workflow["nodes"])
+            node["config"] = {} if node["config"] else {"prompt_content": "x", "url": "u"}
+            affected.add(node["id"])
+
+        start = time.perf_counter()
+        legacy_issues = _incremental_audit(workflow, affected)
+        legacy_errors = validate_workflow(workflow)
+        legacy_s += time.perf_counter() - start
+
+        start = time.perf_counter()
+        auditor.sync(workflow)
+        issues = auditor.audit_issues(affected)
+        errors = auditor.validation_errors()
+        incremental_s += time.perf_counter() - start
+
+        assert errors == legacy_errors and _issue_set(issues) == _issue_set(legacy_issues)
+    return {
+        "turns": turns,
+        "legacy_ms_per_turn": round(legacy_s * 1000 / turns, 2),
+        "incremental_ms_per_turn": round(incremental_s * 1000 / turns, 2),
+        "speedup": round(legacy_s / incremental_s, 1),
+    }
+
+
+def run(node_count: int = 2000, chunks: int = 200) -> Dict:
+    print("\n" + "=" * 70)
+    print(f"BENCHMARK: codesign audit on a {node_count}-node workflow")
+    print("=" * 70)
+
+    stream = benchmark_stream(node_count, chunks)
+    print(
+        f"  stream | legacy {stream['legacy_us_per_chunk']:>9.1f}us/chunk → incremental "
+        f"{stream['incremental_us_per_chunk']:>7.1f}us/chunk ({stream['speedup']}x), "
+        f"initial build {stream['initial_build_ms']}ms"
+    )
+    turn = benchmark_turn(node_count)
+    print(
+        f"  turn   | legacy {turn['legacy_ms_per_turn']:>9.2f}ms/turn  → sync diff   "
+        f"{turn['incremental_ms_per_turn']:>7.2f}ms/turn  ({turn['speedup']}x)"
+    )
+    return {"nodes": node_count, "stream": stream, "turn": turn}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--nodes", type=int, default=2000)
+    parser.add_argument("--chunks", type=int, default=200)
+    parser.add_argument("--output", help="Write JSON results to this path")
+    args = parser.parse_args()
+
+    summary = run(node_count=args.nodes, chunks=args.chunks)
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(summary, f, indent=2)
+    print(json.dumps(summary, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""
+Benchmark: designer cluster / focus-window maintenance per co-design turn
+
+Each simulated turn applies a handful of canvas changes (add node, add edge,
+occasional delete) and then needs cluster info plus a focus window.
+
+    full        compute_workflow_clusters() + extract_focus_window() on the
+                whole workflow every turn (previous behaviour)
+    incremental WorkflowClusterIndex.apply_change() for the turn's events,
+                snapshot() + extract_focus_window(cluster_index=...)
+
+Run:
+    cd analemma-workflow-os/backend
+    python -m tests.backend.benchmark_designer_focus_window
+    python -m tests.backend.benchmark_designer_focus_window --sizes 1000,5000 --turns 50
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import time
+from typing import Dict, List, Tuple
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+
+from src.services.design.designer_service import (
+    WorkflowClusterIndex,
+    compute_workflow_clusters,
+    extract_focus_window,
+)
+
+DEFAULT_SIZES = (1000, 3000, 10000)
+NODE_TYPES = ("llm", "operator", "loop", "dataTransform", "httpRequest", "condition")
+
+
+def make_workflow(node_count: int, seed: int = 11) -> Dict:
+    """Mostly-chain workflow with some cross links, like a large designer canvas."""
+    rng = random.Random(seed)
+    nodes = [{"id": f"n{i}", "type": rng.choice(NODE_TYPES), "data": {"label": f"step {i}"}}
+             for i in range(node_count)]
+    edges = []
+    for i in range(1, node_count):
+        if rng.random() < 0.9:
+            edges.append({"id": f"e{len(edges)}", "source": f"n{i - 1}", "target": f"n{i}"})
+        if rng.random() < 0.2:
+            edges.append({"id": f"e{len(edges)}", "source": f"n{rng.randrange(i)}", "target": f"n{i}"})
+    return {"nodes": nodes, "edges": edges}
+
+
+def make_turns(workflow: Dict, turns: int, seed: int = 5) -> List[List[Tuple[str, Dict]]]:
+    rng = random.Random(seed)
+    node_count = len(workflow["nodes"])
+    script = []
+    for t in range(turns):
+        new_id = f"x{t}"
+        changes = [
+            ("add_node", {"id": new_id, "type": rng.choice(NODE_TYPES)}),
+            ("add_edge", {"id": f"ex{t}", "source": f"n{rng.randrange(node_count)}", "target": new_id}),
+            ("move_node", {"id": new_id}),
+        ]
+        if t % 4 == 3:
+            changes.append(("delete_edge", {"id": f"e{rng.randrange(node_count // 2)}"}))
+        script.append(changes)
+    return script
+
+
+def _apply_to_workflow(workflow: Dict, change_type: str, data: Dict) -> None:
+    if change_type == "add_node":
+        workflow["nodes"].append({"id": data["id"], "type": data["type"], "data": {"label": data["id"]}})
+    elif change_type == "add_edge":
+        workflow["edges"].append(dict(data))
+    elif change_type == "delete_edge":
+        workflow["edges"] = [e for e in workflow["edges"] if e["id"] != data["id"]]
+
+
+def _run(node_count: int, turns: int, incremental: bool) -> Dict:
+    workflow = make_workflow(node_count)
+    script = make_turns(workflow, turns)
+    index = WorkflowClusterIndex.from_workflow(workflow) if incremental else None
+
+    clusters_s = focus_s = 0.0
+    for t, changes in enumerate(script):
+        for change_type, data in changes:
+            _apply_to_workflow(workflow, change_type, data)  # 캔버스 상태 (양쪽 공통, 측정 제외)
+
+        start = time.perf_counter()
+        if incremental:
+            for change_type, data in changes:
+                index.apply_change(change_type, data)
+            index.snapshot()
+        else:
+            compute_workflow_clusters(workflow)
+        mid = time.perf_counter()
+        extract_focus_window(workflow, f"x{t} 노드 수정해줘", cluster_index=index)
+        end = time.perf_counter()
+        clusters_s += mid - start
+        focus_s += end - mid
+
+    return {
+        "clusters_ms": clusters_s * 1000 / turns,
+        "focus_ms": focus_s * 1000 / turns,
+        "total_ms": (clusters_s + focus_s) * 1000 / turns,
+        "stats": index.stats if index else {},
+    }
+
+
+def benchmark_focus_window(sizes=DEFAULT_SIZES, turns: int = 40) -> Dict:
+    print("\n" + "=" * 70)
+    print("BENCHMARK: per-turn cluster + focus window maintenance (ms/turn)")
+    print("=" * 70)
+
+    results = []
+    for node_count in sizes:
+        full = _run(node_count, turns, incremental=False)
+        incremental = _run(node_count, turns, incremental=True)
+        row = {"nodes": node_count, "turns": turns, "index_stats": incremental["stats"]}
+        for key in ("clusters_ms", "focus_ms", "total_ms"):
+            row[f"full_{key}"] = round(full[key], 3)
+            row[f"incremental_{key}"] = round(incremental[key], 3)
+        row["speedup"] = round(full["total_ms"] / incremental["total_ms"], 2)
+        results.append(row)
+        print(
+            f"  {node_count:>6} nodes | clusters {row['full_clusters_ms']:>7.2f} → "
+            f"{row['incremental_clusters_ms']:>6.2f} | focus {row['full_focus_ms']:>7.2f} → "
+            f"{row['incremental_focus_ms']:>6.2f} | total {row['speedup']}x | "
+            f"rebuilds={incremental['stats'].get('rebuilds', 0)}"
+        )
+
+    return {"cases": results}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--sizes", default=",".join(str(s) for s in DEFAULT_SIZES))
+    parser.add_argument("--turns", type=int, default=40)
+    parser.add_argument("--output", help="Write JSON results to this path")
+    args = parser.parse_args()
+
+    summary = benchmark_focus_window(
+        sizes=tuple(int(s) for s in args.sizes.split(",") if s),
+        turns=args.turns,
+    )
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(summary, f, indent=2)
+    print(json.dumps(summary, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,261 @@
+#!/usr/bin/env python3
+"""
+Benchmark: PartialJSONParser streaming throughput
+
+Streams JSONL the way Gemini/Bedrock deliver it to stream_workflow_generation
+(many tiny chunks) and compares the previous buffer-rescanning parser with the
+resumable scanner.
+
+The previous parser appended every chunk to self.buffer and re-ran the
+bracket scan from the start of the buffer, so a large object fed in 10-byte
+chunks cost O(n²). It is capped to a smaller input to keep the run short;
+MB/s is reported for both so the numbers stay comparable.
+
+Scenarios:
+- small_objects: ~200 byte node/edge objects separated by newlines
+- large_objects: a few ~100KB objects (long prompt_content strings)
+- delimited: small objects separated by <<<JSONL_END>>> after a preamble
+
+Run:
+    cd analemma-workflow-os/backend
+    python -m tests.backend.benchmark_designer_stream
+    python -m tests.backend.benchmark_designer_stream --total-kb 1024 --chunk 10 --legacy-kb 128
+"""
+
+import argparse
+import json
+import logging
+import os
+import random
+import sys
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+
+from src.services.design.designer_service import JSONL_DELIMITER, PartialJSONParser
+
+
+class LegacyPartialJSONParser:
+    """Previous implementation (kept verbatim for comparison, logging removed)."""
+
+    def __init__(self, delimiter: str = JSONL_DELIMITER):
+        self.buffer = ""
+        self.delimiter = delimiter
+        self._preamble_stripped = False
+
+    def _strip_preamble(self) -> str:
+        if self._preamble_stripped:
+            return ""
+        first_brace = self.buffer.find("{")
+        if first_brace == -1:
+            if len(self.buffer) > 500:
+                preamble = self.buffer[:500]
+                self.buffer = ""
+                return preamble
+            return ""
+        if first_brace == 0:
+            self._preamble_stripped = True
+            return ""
+        preamble = self.buffer[:first_brace]
+        self.buffer = self.buffer[first_brace:]
+        self._preamble_stripped = True
+        return preamble
+
+    def feed(self, chunk: str) -> List[Dict[str, Any]]:
+        self.buffer += chunk
+        results = []
+        self._strip_preamble()
+        if self.delimiter in self.buffer:
+            parts = self.buffer.split(self.delimiter)
+            for part in parts[:-1]:
+                parsed = self._try_parse_json(part.strip())
+                if parsed is not None:
+                    results.append(parsed)
+            self.buffer = parts[-1]
+            return results
+        while True:
+            obj, remaining = self._extract_complete_json()
+            if obj is None:
+                break
+            results.append(obj)
+            self.buffer = remaining
+        return results
+
+    def _extract_complete_json(self) -> Tuple[Optional[Dict], str]:
+        buffer = self.buffer.lstrip()
+        if not buffer or not buffer.startswith("{"):
+            if "\n" in self.buffer:
+                line, remaining = self.buffer.split("\n", 1)
+                parsed = self._try_parse_json(line.strip())
+                if parsed is not None:
+                    return parsed, remaining
+            return None, self.buffer
+        depth = 0
+        in_string = False
+        escape_next = False
+        for i, char in enumerate(buffer):
+            if escape_next:
+                escape_next = False
+                continue
+            if char == "\\":
+                escape_next = True
+                continue
+            if char == '"' and not escape_next:
+                in_string = not in_string
+                continue
+            if in_string:
+                continue
+            if char == "{":
+                depth += 1
+            elif char == "}":
+                depth -= 1
+                if depth == 0:
+                    json_str = buffer[:i + 1]
+                    remaining = buffer[i + 1:].lstrip()
+                    parsed = self._try_parse_json(json_str)
+                    if parsed is not None:
+                        return parsed, remaining
+                    break
+        return None, self.buffer
+
+    def _try_parse_json(self, text: str) -> Optional[Dict[str, Any]]:
+        if not text:
+            return None
+        try:
+            return json.loads(text)
+        except json.JSONDecodeError:
+            return None
+
+    def flush(self) -> List[Dict[str, Any]]:
+        results = []
+        if self.buffer.strip():
+            parsed = self._try_parse_json(self.buffer.strip())
+            if parsed is not None:
+                results.append(parsed)
+        self.buffer = ""
+        return results
+
+
+# ─── Stream generators ────────────────────────────────────────────────────────
+
+def _node_obj(i: int, rng: random.Random, prompt_len: int) -> Dict[str, Any]:
+    words = ["analyze", "{input}", "summarize", "\"quoted\"", "C:\\path", "줄바꿈\n", "step"]
+    prompt = " ".join(rng.choice(words) for _ in range(max(1, prompt_len // 8)))[:prompt_len]
+    return {
+        "type": "node",
+        "data": {
+            "id": f"node_{i}",
+            "type": "llm_chat",
+            "position": {"x": i * 150, "y": (i % 5) * 100},
+            "data": {"label": f"Step {i}", "prompt_content": prompt},
+        },
+    }
+
+
+def make_stream(scenario: str, total_bytes: int, seed: int = 42) -> Tuple[str, List[Dict[str, Any]]]:
+    """Return (stream_text, expected_objects) of roughly total_bytes."""
+    rng = random.Random(seed)
+    prompt_len = {"small_objects": 80, "large_objects": 100_000, "delimited": 80}[scenario]
+    separator = JSONL_DELIMITER + "\n" if scenario == "delimited" else "\n"
+    parts = ["Here is the updated workflow:\n"] if scenario == "delimited" else []
+    objects: List[Dict[str, Any]] = []
+    size = sum(len(p) for p in parts)
+    i = 0
+    while size < total_bytes:
+        obj = _node_obj(i, rng, prompt_len)
+        line = json.dumps(obj, ensure_ascii=False) + separator
+        objects.append(obj)
+        parts.append(line)
+        size += len(line)
+        i += 1
+    return "".join(parts), objects
+
+
+SCENARIOS = ("small_objects", "large_objects", "delimited")
+
+
+def _run(parser_cls, stream: str, chunk_size: int) -> Tuple[List[Dict[str, Any]], float]:
+    parser = parser_cls()
+    out: List[Dict[str, Any]] = []
+    start = time.perf_counter()
+    for pos in range(0, len(stream), chunk_size):
+        out.extend(parser.feed(stream[pos:pos + chunk_size]))
+    out.extend(parser.flush())
+    return out, time.perf_counter() - start
+
+
+def benchmark_stream(total_kb: int = 1024, chunk_size: int = 10, legacy_kb: int = 128,
+                     scenarios=SCENARIOS):
+    print("\n" + "=" * 70)
+    print(f"BENCHMARK: PartialJSONParser ({total_kb}KB in {chunk_size}-byte chunks)")
+    print("=" * 70)
+
+    logging.getLogger("src.services.design.designer_service").setLevel(logging.ERROR)
+    results = []
+    for scenario in scenarios:
+        stream, expected = make_stream(scenario, total_kb * 1024)
+        objects, elapsed = _run(PartialJSONParser, stream, chunk_size)
+        assert objects == expected, f"{scenario}: parsed {len(objects)}/{len(expected)} objects"
+        mb = len(stream.encode("utf-8")) / (1024 * 1024)
+        row = {
+            "scenario": scenario,
+            "bytes": len(stream.encode("utf-8")),
+            "objects": len(expected),
+            "incremental_ms": round(elapsed * 1000, 2),
+            "incremental_mb_s": round(mb / elapsed, 2),
+        }
+
+        # Legacy 파서는 O(n²) - 작은 입력으로 측정
+        if legacy_kb:
+            legacy_size = min(total_kb, legacy_kb) * 1024
+            if scenario == "large_objects":
+                legacy_size = max(legacy_size, 110 * 1024)  # 객체 1개 이상
+            small_stream, small_expected = make_stream(scenario, legacy_size)
+            legacy_objects, legacy_elapsed = _run(LegacyPartialJSONParser, small_stream, chunk_size)
+            new_objects, new_elapsed = _run(PartialJSONParser, small_stream, chunk_size)
+            small_mb = len(small_stream.encode("utf-8")) / (1024 * 1024)
+            row.update({
+                "legacy_bytes": len(small_stream.encode("utf-8")),
+                "legacy_ms": round(legacy_elapsed * 1000, 2),
+                "legacy_mb_s": round(small_mb / legacy_elapsed, 3),
+                "speedup_same_input": round(legacy_elapsed / new_elapsed, 1),
+                "outputs_match": legacy_objects == new_objects == small_expected,
+            })
+
+        results.append(row)
+        line = (f"  {scenario:<14} {row['bytes'] / 1024:>8.0f}KB objs={row['objects']:>5} | "
+                f"incremental {row['incremental_mb_s']:>7.2f} MB/s")
+        if legacy_kb:
+            line += (f" | legacy {row['legacy_mb_s']:>7.3f} MB/s @{row['legacy_bytes'] / 1024:.0f}KB "
+                     f"({row['speedup_same_input']}x, match={row['outputs_match']})")
+        print(line)
+
+    return {"chunk_size": chunk_size, "cases": results}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--total-kb", type=int, default=1024)
+    parser.add_argument("--chunk", type=int, default=10)
+    parser.add_argument("--legacy-kb", type=int, default=128,
+                        help="Input size for the legacy parser (0 to skip)")
+    parser.add_argument("--scenarios", default=",".join(SCENARIOS))
+    parser.add_argument("--output", help="Write JSON results to this path")
+    args = parser.parse_args()
+
+    summary = benchmark_stream(
+        total_kb=args.total_kb,
+        chunk_size=args.chunk,
+        legacy_kb=args.legacy_kb,
+        scenarios=tuple(s for s in args.scenarios.split(",") if s),
+    )
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(summary, f, indent=2)
+    print(json.dumps(summary, indent=2))
+
+
+if __name__ == "__main__":
+    main()
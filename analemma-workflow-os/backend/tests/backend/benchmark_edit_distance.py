@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+Benchmark: MetadataExtractor.calculate_edit_distance
+
+Compares the previous pure-Python O(n·m) Levenshtein (with chunked sampling
+above 10k chars) against the bit-parallel / banded implementation.
+
+Scenarios model user corrections: a long LLM output with a handful of
+scattered edits.
+
+Run:
+    cd analemma-workflow-os/backend
+    python -m tests.backend.benchmark_edit_distance
+"""
+
+import json
+import os
+import random
+import sys
+import time
+from unittest.mock import MagicMock
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+
+# MetadataExtractor constructs an OpenAI client; not needed for distance math
+sys.modules.setdefault('openai', MagicMock())
+
+
+def legacy_edit_distance(original: str, corrected: str) -> int:
+    """Previous implementation (kept verbatim for comparison)."""
+    if len(original) > 10000 or len(corrected) > 10000:
+        return legacy_edit_distance_sampled(original, corrected)
+
+    if len(original) < len(corrected):
+        return legacy_edit_distance(corrected, original)
+
+    if len(corrected) == 0:
+        return len(original)
+
+    previous_row = list(range(len(corrected) + 1))
+    for i, c1 in enumerate(original):
+        current_row = [i + 1]
+        for j, c2 in enumerate(corrected):
+            insertions = previous_row[j + 1] + 1
+            deletions = current_row[j] + 1
+            substitutions = previous_row[j] + (c1 != c2)
+            current_row.append(min(insertions, deletions, substitutions))
+        previous_row = current_row
+
+    return previous_row[-1]
+
+
+def legacy_edit_distance_sampled(original: str, corrected: str) -> int:
+    chunk_size = 1000
+    total_distance = 0
+    orig_chunks = [original[i:i+chunk_size] for i in range(0, len(original), chunk_size)]
+    corr_chunks = [corrected[i:i+chunk_size] for i in range(0, len(corrected), chunk_size)]
+    for i in range(max(len(orig_chunks), len(corr_chunks))):
+        orig_chunk = orig_chunks[i] if i < len(orig_chunks) else ""
+        corr_chunk = corr_chunks[i] if i < len(corr_chunks) else ""
+        total_distance += legacy_edit_distance(orig_chunk, corr_chunk)
+    return total_distance
+
+
+def make_correction_pair(length: int, edits: int, seed: int = 42):
+    """Random text plus `edits` scattered substitutions/insertions/deletions."""
+    rng = random.Random(seed)
+    alphabet = "abcdefghijklmnopqrstuvwxyz      .,"
+    original = [rng.choice(alphabet) for _ in range(length)]
+    corrected = list(original)
+    for _ in range(edits):
+        pos = rng.randrange(len(corrected))
+        op = rng.choice(("sub", "ins", "del"))
+        if op == "sub":
+            corrected[pos] = "#"
+        elif op == "ins":
+            corrected.insert(pos, "#")
+        else:
+            del corrected[pos]
+    return "".join(original), "".join(corrected)
+
+
+def _time(fn, *args):
+    start = time.perf_counter()
+    value = fn(*args)
+    return value, (time.perf_counter() - start) * 1000
+
+
+def benchmark_edit_distance():
+    from src.services.metadata_extractor import MetadataExtractor
+
+    print("\n" + "=" * 70)
+    print("BENCHMARK: Edit distance (legacy O(n·m) vs bit-parallel/banded)")
+    print("=" * 70)
+
+    extractor = MetadataExtractor()
+    results = []
+
+    # Legacy exact DP becomes impractical well before 10k; cap its input size
+    legacy_exact_limit = 3000
+
+    for length, edits in ((1000, 10), (3000, 30), (10000, 50), (30000, 50), (100000, 100)):
+        original, corrected = make_correction_pair(length, edits)
+
+        new_dist, new_ms = _time(extractor.calculate_edit_distance, original, corrected)
+        banded_dist, banded_ms = _time(
+            extractor.calculate_edit_distance, original, corrected, edits
+        )
+
+        row = {
+            "length": length,
+            "edits": edits,
+            "new_distance": new_dist,
+            "new_ms": round(new_ms, 2),
+            "threshold_distance": banded_dist,
+            "threshold_ms": round(banded_ms, 2),
+        }
+
+        if length <= legacy_exact_limit or length > 10000:
+            legacy_dist, legacy_ms = _time(legacy_edit_distance, original, corrected)
+            row.update({
+                "legacy_distance": legacy_dist,
+                "legacy_ms": round(legacy_ms, 2),
+                "legacy_exact": length <= 10000,
+                "speedup": round(legacy_ms / new_ms, 1) if new_ms else None,
+            })
+        else:
+            row.update({"legacy_distance": None, "legacy_ms": None, "legacy_exact": True})
+
+        results.append(row)
+        legacy_label = (
+            f"{row['legacy_ms']:>10.1f}ms (d={row['legacy_distance']}"
+            f"{'' if row['legacy_exact'] else ', approx'})"
+            if row["legacy_ms"] is not None else f"{'skipped':>12}"
+        )
+        print(
+            f"  n={length:>6} edits={edits:>3} | legacy {legacy_label} | "
+            f"new {new_ms:>8.1f}ms (d={new_dist}) | k={edits} {banded_ms:>8.1f}ms"
+        )
+
+    exact_ok = all(
+        r["legacy_distance"] == r["new_distance"]
+        for r in results if r["legacy_distance"] is not None and r["legacy_exact"]
+    )
+    print(f"\n  Exact results match legacy where legacy is exact: {exact_ok}")
+    return {"cases": results, "exact_match": exact_ok}
+
+
+if __name__ == "__main__":
+    summary = benchmark_edit_distance()
+    print(json.dumps(summary, indent=2))
@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+Benchmark: full workflow graph validation on synthetic workflows up to MAX_NODES_LIMIT
+
+Full validation = validate_workflow + validate_workflow_complexity +
+CycleDetector.get_topological_order on the same workflow.
+
+    separate  each step builds its own WorkflowGraphIndex (no index passed)
+    shared    one WorkflowGraphIndex built per workflow and passed to every step
+
+Per-(V+E) cost is reported so the O(V+E) scaling can be checked across sizes.
+A long single chain is included as the worst case for the old recursive DFS
+(RecursionError past ~1000 nodes).
+
+Run:
+    cd analemma-workflow-os/backend
+    python -m tests.backend.benchmark_graph_validation
+    python -m tests.backend.benchmark_graph_validation --sizes 500,2000,10000
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import time
+from typing import Dict
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+
+from src.common.graph_dsl import (
+    WorkflowGraphIndex,
+    validate_workflow,
+    validate_workflow_complexity,
+)
+from src.services.partitioning.cycle_detector import CycleDetector
+
+# services.workflow.partition_service와 동일한 기본값 (import 시 AWS 설정이 필요해 직접 읽음)
+MAX_NODES_LIMIT = int(os.environ.get("MAX_NODES_LIMIT", "500"))
+NODE_TYPES = ("llm_chat", "api_call", "operator", "parallel", "conditional", "for_each")
+
+
+def make_workflow(node_count: int, seed: int = 7) -> Dict:
+    """DAG with a backbone chain, fan-outs from parallel/conditional nodes and cross links"""
+    rng = random.Random(seed)
+    nodes = [
+        {
+            "id": f"node_{i}",
+            "type": rng.choice(NODE_TYPES),
+            "position": {"x": 150, "y": 50 + i * 100},
+            "config": {"prompt_content": "summarize", "method": "GET"},
+        }
+        for i in range(node_count)
+    ]
+    edges = []
+    for i in range(1, node_count):
+        edges.append({"id": f"e{len(edges)}", "source": f"node_{i - 1}", "target": f"node_{i}"})
+        if nodes[i - 1]["type"] in ("parallel", "conditional") and i + 1 < node_count:
+            for _ in range(rng.randrange(1, 4)):
+                target = rng.randrange(i, node_count)
+                edges.append({"id": f"e{len(edges)}", "source": f"node_{i - 1}", "target": f"node_{target}"})
+        if rng.random() < 0.2:
+            edges.append({"id": f"e{len(edges)}", "source": f"node_{rng.randrange(i)}", "target": f"node_{i}"})
+    return {"nodes": nodes, "edges": edges}
+
+
+def make_chain(node_count: int) -> Dict:
+    nodes = [{"id": f"node_{i}", "type": "operator", "position": {"x": 0, "y": i}} for i in range(node_count)]
+    edges = [{"id": f"e{i}", "source": f"node_{i - 1}", "target": f"node_{i}"} for i in range(1, node_count)]
+    return {"nodes": nodes, "edges": edges}
+
+
+def full_validation(workflow: Dict, shared: bool) -> None:
+    index = WorkflowGraphIndex.from_workflow(workflow) if shared else None
+    assert not validate_workflow(workflow, index=index)
+    result = validate_workflow_complexity(workflow, index=index)
+    assert result.metrics["accidental_cycle_count"] == 0
+    CycleDetector(workflow["nodes"], workflow["edges"], index=index).get_topological_order()
+
+
+def _time_ms(fn, repeats: int) -> float:
+    fn()  # warm-up
+    start = time.perf_counter()
+    for _ in range(repeats):
+        fn()
+    return (time.perf_counter() - start) * 1000 / repeats
+
+
+def benchmark_case(label: str, workflow: Dict, repeats: int) -> Dict:
+    size = len(workflow["nodes"]) + len(workflow["edges"])
+    separate_ms = _time_ms(lambda: full_validation(workflow, shared=False), repeats)
+    shared_ms = _time_ms(lambda: full_validation(workflow, shared=True), repeats)
+    build_ms = _time_ms(lambda: WorkflowGraphIndex.from_workflow(workflow), repeats)
+    return {
+        "case": label,
+        "nodes": len(workflow["nodes"]),
+        "edges": len(workflow["edges"]),
+        "separate_ms": round(separate_ms, 3),
+        "shared_ms": round(shared_ms, 3),
+        "index_build_ms": round(build_ms, 3),
+        "shared_ns_per_element": round(shared_ms * 1e6 / size, 1),
+        "speedup": round(separate_ms / shared_ms, 2),
+    }
+
+
+def run(sizes=(100, 250, MAX_NODES_LIMIT), repeats: int = 20) -> Dict:
+    print("\n" + "=" * 70)
+    print(f"BENCHMARK: full graph validation (MAX_NODES_LIMIT={MAX_NODES_LIMIT})")
+    print("=" * 70)
+
+    cases = []
+    for node_count in sizes:
+        for label, workflow in (("dag", make_workflow(node_count)), ("chain", make_chain(node_count))):
+            row = benchmark_case(label, workflow, repeats)
+            cases.append(row)
+            print(
+                f"  {label:<5} {row['nodes']:>6} nodes {row['edges']:>6} edges | "
+                f"separate {row['separate_ms']:>8.3f}ms → shared {row['shared_ms']:>8.3f}ms "
+                f"({row['speedup']}x) | {row['shared_ns_per_element']:>7.1f} ns/(V+E)"
+            )
+    return {"max_nodes_limit": MAX_NODES_LIMIT, "cases": cases}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--sizes", default=f"100,250,{MAX_NODES_LIMIT}")
+    parser.add_argument("--repeats", type=int, default=20)
+    parser.add_argument("--output", help="Write JSON results to this path")
+    args = parser.parse_args()
+
+    summary = run(
+        sizes=tuple(int(s) for s in args.sizes.split(",") if s),
+        repeats=args.repeats,
+    )
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(summary, f, indent=2)
+    print(json.dumps(summary, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+Benchmark: LocalL1Checker.check latency (p50/p99) with a large injection-pattern set
+
+Setup mirrors a kernel-synced policy: N phrase patterns of the same shape as
+INJECTION_PATTERNS (word\\s+(?:word\\s+)?word), plus the default set, and a
+~4KB JSON params payload (MAX_PARAMS_SCAN_BYTES) on every call.
+
+Compared:
+    sequential   previous implementation — copy the compiled list under the
+                 lock, then pattern.search() one by one
+    automaton    combined anchor automaton on the immutable policy snapshot
+
+Workloads:
+    benign       params that match no pattern (the common, full-scan case)
+    blocked      thought contains the last pattern in the list
+
+Run:
+    cd analemma-workflow-os/backend
+    python -m tests.backend.benchmark_l1_checker
+    python -m tests.backend.benchmark_l1_checker --patterns 1000 --calls 5000
+"""
+
+import argparse
+import json
+import logging
+import os
+import random
+import re
+import string
+import sys
+import threading
+import time
+from typing import Callable, Dict, List
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+
+from src.bridge import local_l1_checker
+from src.bridge.local_l1_checker import MAX_PARAMS_SCAN_BYTES, LocalL1Checker, _normalize
+from src.bridge.shared_policy import INJECTION_PATTERNS
+
+
+def make_patterns(count: int, seed: int = 42) -> List[str]:
+    rng = random.Random(seed)
+    words = ["".join(rng.choice(string.ascii_lowercase) for _ in range(rng.randint(5, 10)))
+             for _ in range(count * 3)]
+    return list(INJECTION_PATTERNS) + [
+        rf"{rng.choice(words)}\s+(?:{rng.choice(words)}\s+)?{rng.choice(words)}"
+        for _ in range(count - len(INJECTION_PATTERNS))
+    ]
+
+
+def make_params() -> Dict:
+    rows = [{"id": i, "customer": f"customer-{i}", "email": f"user{i}@example.com",
+             "note": "monthly billing report for the finance team, region ap-northeast-2"}
+            for i in range(40)]
+    params = {"bucket": "reports", "key": "2026/10/billing.json", "rows": rows}
+    assert len(json.dumps(params)) >= MAX_PARAMS_SCAN_BYTES
+    return params
+
+
+class SequentialChecker(LocalL1Checker):
+    """이전 구현의 패턴 검사 경로 (잠금 하 목록 복사 + 순차 search)."""
+
+    def inject_patterns(self, injection_patterns, capability_map=None, version=None):
+        super().inject_patterns(injection_patterns, capability_map, version)
+        self._compiled = [re.compile(p, re.IGNORECASE | re.UNICODE) for p in injection_patterns]
+        self._seq_lock = threading.RLock()
+
+    def check(self, thought, action, ring_level=3, params=None):
+        params_text = _normalize(json.dumps(params)[:MAX_PARAMS_SCAN_BYTES]) if params else ""
+        scan_text = f"{_normalize(thought)} {_normalize(action)} {params_text}"
+        with self._seq_lock:
+            compiled = list(self._compiled)
+        for pattern in compiled:
+            if pattern.search(scan_text):
+                return local_l1_checker.L1Result(allowed=False, reason=pattern.pattern)
+        return local_l1_checker.L1Result(allowed=True)
+
+
+def _percentiles(fn: Callable[[], object], calls: int) -> Dict:
+    for _ in range(min(50, calls)):
+        fn()  # warm-up
+    samples = []
+    for _ in range(calls):
+        start = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - start)
+    samples.sort()
+    pick = lambda q: samples[min(len(samples) - 1, int(len(samples) * q))] * 1000
+    return {"p50_ms": round(pick(0.50), 3), "p99_ms": round(pick(0.99), 3),
+            "max_ms": round(samples[-1] * 1000, 3)}
+
+
+def run(patterns: int = 500, calls: int = 2000) -> Dict:
+    print("\n" + "=" * 70)
+    print(f"BENCHMARK: LocalL1Checker.check ({patterns} patterns, "
+          f"{MAX_PARAMS_SCAN_BYTES // 1024}KB params, {calls} calls)")
+    print("=" * 70)
+    logging.getLogger(local_l1_checker.__name__).setLevel(logging.ERROR)
+
+    pattern_list = make_patterns(patterns)
+    params = make_params()
+    last_word = pattern_list[-1].split("\\s+")[0]
+    attack = pattern_list[-1].replace("\\s+", " ").replace("(?:", "").replace(")?", "")
+    assert last_word in attack
+
+    results = {}
+    for label, cls in (("sequential", SequentialChecker), ("automaton", LocalL1Checker)):
+        checker = cls()
+        local_l1_checker._build_automaton.cache_clear()
+        build_start = time.perf_counter()
+        checker.inject_patterns(pattern_list, version=f"bench-{label}")
+        build_ms = (time.perf_counter() - build_start) * 1000
+        assert checker.check("summarize", "s3_get_object", 0, params).allowed
+        assert not checker.check(attack, "s3_get_object", 0, params).allowed
+        results[label] = {
+            "inject_ms": round(build_ms, 2),
+            "benign": _percentiles(lambda: checker.check("summarize", "s3_get_object", 0, params), calls),
+            "blocked": _percentiles(lambda: checker.check(attack, "s3_get_object", 0, params), calls),
+        }
+
+    for label, row in results.items():
+        print(f"  {label:<11} benign p50 {row['benign']['p50_ms']:>7.3f}ms  p99 {row['benign']['p99_ms']:>7.3f}ms   "
+              f"blocked p50 {row['blocked']['p50_ms']:>7.3f}ms  p99 {row['blocked']['p99_ms']:>7.3f}ms   "
+              f"(inject {row['inject_ms']:.1f}ms)")
+    p99 = results["automaton"]["benign"]["p99_ms"]
+    print(f"\n  automaton benign p99 {p99:.3f}ms ({'within' if p99 < 1.0 else 'OVER'} the 1ms L1 budget)")
+    return {"patterns": patterns, "calls": calls, "results": results}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--patterns", type=int, default=500)
+    parser.add_argument("--calls", type=int, default=2000)
+    parser.add_argument("--output", help="Write JSON results to this path")
+    args = parser.parse_args()
+
+    summary = run(patterns=args.patterns, calls=args.calls)
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(summary, f, indent=2)
+    print(json.dumps(summary, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+"""
+Benchmark: LLM call goodput with and without the AIMD concurrency limiter
+
+A parallel group of B branches each makes K calls to a local fake provider that
+serves at most C requests at once (429 "Resource exhausted" beyond that, like a
+Gemini per-model quota). Every call is wrapped in with_exponential_backoff,
+the same retry decorator GeminiService uses (delays scaled down for the bench).
+
+Modes:
+    unlimited   branches call the provider directly; only backoff reacts to 429s
+    aimd        each attempt goes through AdaptiveConcurrencyLimiter.slot()
+                (inside the retry, as in GeminiService.invoke_model)
+
+Reported per mode: goodput (successful calls/s), share of calls that completed
+(the rest exhausted their retries and fail the branch), 429s received, and
+p50/p99 end-to-end latency of the calls that completed.
+
+Run:
+    cd analemma-workflow-os/backend
+    python -m tests.backend.benchmark_llm_concurrency_limiter
+    python -m tests.backend.benchmark_llm_concurrency_limiter --branches 200 --capacity 16
+"""
+
+import argparse
+import concurrent.futures
+import json
+import logging
+import os
+import sys
+import threading
+import time
+from typing import Dict, List
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+
+from src.services.llm import concurrency_limiter, gemini_service
+from src.services.llm.concurrency_limiter import AdaptiveConcurrencyLimiter
+from src.services.llm.gemini_service import with_exponential_backoff
+
+
+class RateCappedProvider:
+    """동시 처리 상한 C를 넘는 요청은 즉시 429. 처리 중 요청 수에 따라 지연이 조금 늘어난다."""
+
+    def __init__(self, capacity: int, service_s: float, reject_s: float):
+        self.capacity = capacity
+        self.service_s = service_s
+        self.reject_s = reject_s
+        self.in_flight = 0
+        self.rejected = 0
+        self.served = 0
+        self._lock = threading.Lock()
+
+    def generate_content(self, prompt: str) -> str:
+        with self._lock:
+            if self.in_flight >= self.capacity:
+                self.rejected += 1
+                admitted = False
+            else:
+                self.in_flight += 1
+                load = self.in_flight / self.capacity
+                admitted = True
+        if not admitted:
+            time.sleep(self.reject_s)
+            raise RuntimeError("429 Resource exhausted: Quota exceeded for generate_content")
+        try:
+            time.sleep(self.service_s * (1 + 0.5 * load))
+            return f"ok:{prompt}"
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+                self.served += 1
+
+
+def _percentile(values: List[float], pct: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct))]
+
+
+def run_mode(mode: str, branches: int, calls: int, capacity: int,
+             service_ms: float, base_delay_s: float) -> Dict:
+    provider = RateCappedProvider(capacity, service_ms / 1000, reject_s=0.002)
+    limiter = AdaptiveConcurrencyLimiter("bench/fake", max_queue_wait_s=300)
+
+    @with_exponential_backoff(max_attempts=5, base_delay=base_delay_s, max_delay=base_delay_s * 16)
+    def call(prompt: str) -> str:
+        if mode == "aimd":
+            with limiter.slot():
+                return provider.generate_content(prompt)
+        return provider.generate_content(prompt)
+
+    latencies: List[float] = []
+    failures = [0]
+    lock = threading.Lock()
+
+    def branch(branch_id: int) -> None:
+        for i in range(calls):
+            start = time.perf_counter()
+            try:
+                call(f"{branch_id}-{i}")
+            except Exception:
+                with lock:
+                    failures[0] += 1
+                continue
+            with lock:
+                latencies.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    with concurrent.futures.ThreadPoolExecutor(max_workers=branches) as executor:
+        list(executor.map(branch, range(branches)))
+    elapsed = time.perf_counter() - start
+
+    row = {
+        "mode": mode,
+        "elapsed_s": round(elapsed, 3),
+        "goodput_per_s": round(len(latencies) / elapsed, 1),
+        "succeeded": len(latencies),
+        "failed": failures[0],
+        "completion": round(len(latencies) / (branches * calls), 3),
+        "throttled_429": provider.rejected,
+        "p50_ms": round(_percentile(latencies, 0.50) * 1000, 1) if latencies else None,
+        "p99_ms": round(_percentile(latencies, 0.99) * 1000, 1) if latencies else None,
+    }
+    if mode == "aimd":
+        stats = limiter.get_stats()
+        row["final_limit"] = stats["limit"]
+        row["limit_decreases"] = stats["decreases"]
+    return row
+
+
+def run(branches: int = 100, calls: int = 3, capacity: int = 10,
+        service_ms: float = 50.0, base_delay_ms: float = 50.0) -> Dict:
+    print("\n" + "=" * 70)
+    print(f"BENCHMARK: LLM goodput, {branches} branches x {calls} calls, "
+          f"provider capacity {capacity} in flight, {service_ms}ms per call")
+    print("=" * 70)
+    logging.getLogger(gemini_service.__name__).setLevel(logging.CRITICAL)  # 재시도 소진 로그 포함
+    logging.getLogger(concurrency_limiter.__name__).setLevel(logging.ERROR)
+
+    ideal = capacity / (service_ms * 1.5 / 1000)  # 포화 시 호출당 지연 1.5x
+    rows = [run_mode(mode, branches, calls, capacity, service_ms, base_delay_ms / 1000)
+            for mode in ("unlimited", "aimd")]
+    for row in rows:
+        extra = (f"  limit→{row['final_limit']} ({row['limit_decreases']} decreases)"
+                 if row["mode"] == "aimd" else "")
+        print(f"  {row['mode']:<10} {row['goodput_per_s']:>7.1f} calls/s "
+              f"({row['goodput_per_s'] / ideal:.0%} of cap)  completed {row['completion']:.0%}  "
+              f"failed {row['failed']:>4}  429s {row['throttled_429']:>5}  "
+              f"p50 {row['p50_ms']}ms  p99 {row['p99_ms']}ms{extra}")
+    return {"branches": branches, "calls": calls, "capacity": capacity,
+            "service_ms": service_ms, "ideal_goodput_per_s": round(ideal, 1), "results": rows}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--branches", type=int, default=100)
+    parser.add_argument("--calls", type=int, default=3)
+    parser.add_argument("--capacity", type=int, default=10)
+    parser.add_argument("--service-ms", type=float, default=50.0)
+    parser.add_argument("--base-delay-ms", type=float, default=50.0)
+    parser.add_argument("--output", help="Write JSON results to this path")
+    args = parser.parse_args()
+
+    summary = run(branches=args.branches, calls=args.calls, capacity=args.capacity,
+                  service_ms=args.service_ms, base_delay_ms=args.base_delay_ms)
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(summary, f, indent=2)
+    print(json.dumps(summary, indent=2))
+
+
+if __name__ == "__main__":
+    main()
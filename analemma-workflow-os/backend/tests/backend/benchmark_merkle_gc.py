@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+"""
+Benchmark: MerkleGarbageCollector ref-count throughput (blocks processed per second)
+
+One TTL-expired manifest with N blocks runs through _cleanup_manifest_blocks
+against an in-memory BlockReferenceCounts table that adds a fixed latency per
+DynamoDB call (the round trip dominates in Lambda; local CPU is negligible).
+
+Block mix per manifest (same for every concurrency level):
+    40%  still shared (ref_count 3 → 2, skipped)
+    30%  past graceful wait (conditional-check read → TOCTOU verify → delete)
+    20%  first time at zero (decrement + zero_reached_at write)
+    10%  frozen (skipped, reported by the Safe Chain log)
+
+Run:
+    cd analemma-workflow-os/backend
+    python -m tests.backend.benchmark_merkle_gc
+    python -m tests.backend.benchmark_merkle_gc --blocks 1000 --latency-ms 5
+"""
+
+import argparse
+import json
+import logging
+import os
+import sys
+import threading
+import time
+from datetime import datetime, timedelta
+from typing import Dict, List
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+os.environ.setdefault("AWS_DEFAULT_REGION", "us-east-1")
+
+from botocore.exceptions import ClientError
+
+from src.services.state import merkle_gc_service
+from src.services.state.merkle_gc_service import MerkleGarbageCollector
+
+
+def _conditional_failure(operation: str) -> ClientError:
+    return ClientError(
+        {"Error": {"Code": "ConditionalCheckFailedException", "Message": "condition failed"}},
+        operation,
+    )
+
+
+class LatencyRefTable:
+    """In-memory ref table implementing only the conditions the GC issues."""
+
+    def __init__(self, items: Dict[str, Dict], latency_s: float):
+        self.items = items
+        self.latency_s = latency_s
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def _round_trip(self):
+        time.sleep(self.latency_s)
+        with self._lock:
+            self.calls += 1
+
+    def update_item(self, Key, UpdateExpression, ExpressionAttributeValues,
+                    ConditionExpression=None, ReturnValues=None):
+        self._round_trip()
+        with self._lock:
+            item = self.items.get(Key["block_id"])
+            if "ref_count = if_not_exists" in UpdateExpression:
+                if item is None or item.get("ref_count", 0) <= 0:
+                    raise _conditional_failure("UpdateItem")
+                item["ref_count"] -= 1
+                item.setdefault("zero_reached_at", None)
+            else:  # SET zero_reached_at = :now
+                item["zero_reached_at"] = ExpressionAttributeValues[":now"]
+            return {"Attributes": dict(item)}
+
+    def get_item(self, Key, ProjectionExpression=None):
+        self._round_trip()
+        with self._lock:
+            item = self.items.get(Key["block_id"])
+            return {"Item": dict(item)} if item is not None else {}
+
+    def delete_item(self, Key, ConditionExpression, ExpressionAttributeValues):
+        self._round_trip()
+        with self._lock:
+            item = self.items.get(Key["block_id"])
+            if item is None or item.get("ref_count", 0) > 0 or item.get("is_frozen"):
+                raise _conditional_failure("DeleteItem")
+            del self.items[Key["block_id"]]
+
+
+class LatencyS3:
+    def __init__(self, latency_s: float):
+        self.latency_s = latency_s
+        self.deleted: List[str] = []
+
+    def delete_objects(self, Bucket, Delete):
+        time.sleep(self.latency_s)
+        self.deleted.extend(obj["Key"] for obj in Delete["Objects"])
+        return {}
+
+
+def make_items(blocks: int) -> Dict[str, Dict]:
+    long_ago = (datetime.utcnow() - timedelta(hours=1)).isoformat()
+    items = {}
+    for i in range(blocks):
+        bucket = i % 10
+        if bucket < 4:
+            items[f"blk{i:05d}"] = {"ref_count": 3}
+        elif bucket < 7:
+            items[f"blk{i:05d}"] = {"ref_count": 0, "zero_reached_at": long_ago}
+        elif bucket < 9:
+            items[f"blk{i:05d}"] = {"ref_count": 1}
+        else:
+            items[f"blk{i:05d}"] = {"ref_count": 2, "is_frozen": True}
+    return items
+
+
+def run_once(blocks: int, latency_s: float, concurrency: int) -> Dict:
+    gc = MerkleGarbageCollector("bench-manifests", "bench-bucket", ref_table="bench-refs",
+                                max_concurrency=concurrency)
+    items = make_items(blocks)
+    gc.ref_client = LatencyRefTable(items, latency_s)
+    gc.s3 = LatencyS3(latency_s)
+    manifest = {"s3_pointers": {"M": {"state_blocks": {"L": [
+        {"S": f"s3://bench-bucket/blocks/{block_id}.json"} for block_id in items
+    ]}}}}
+
+    start = time.perf_counter()
+    deleted, skipped = gc._cleanup_manifest_blocks(manifest)
+    elapsed = time.perf_counter() - start
+    return {
+        "concurrency": concurrency,
+        "elapsed_s": round(elapsed, 3),
+        "blocks_per_s": round(blocks / elapsed, 1),
+        "dynamodb_calls": gc.ref_client.calls,
+        "deleted": deleted,
+        "skipped": skipped,
+    }
+
+
+def run(blocks: int = 300, latency_ms: float = 8.0, levels=(1, 4, 16, 32)) -> Dict:
+    print("\n" + "=" * 70)
+    print(f"BENCHMARK: Merkle GC ref-count phase ({blocks} blocks, {latency_ms}ms per DynamoDB call)")
+    print("=" * 70)
+    logging.getLogger(merkle_gc_service.__name__).setLevel(logging.ERROR)
+
+    rows = [run_once(blocks, latency_ms / 1000, level) for level in levels]
+    baseline = rows[0]
+    for row in rows:
+        assert (row["deleted"], row["skipped"]) == (baseline["deleted"], baseline["skipped"])
+        print(f"  concurrency {row['concurrency']:>3}: {row['elapsed_s']:>7.3f}s  "
+              f"{row['blocks_per_s']:>8.1f} blocks/s  ({row['dynamodb_calls']} DynamoDB calls, "
+              f"{baseline['elapsed_s'] / row['elapsed_s']:.1f}x)")
+    print(f"\n  deleted {baseline['deleted']}, skipped {baseline['skipped']} at every level")
+    return {"blocks": blocks, "latency_ms": latency_ms, "results": rows}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--blocks", type=int, default=300)
+    parser.add_argument("--latency-ms", type=float, default=8.0)
+    parser.add_argument("--output", help="Write JSON results to this path")
+    args = parser.parse_args()
+
+    summary = run(blocks=args.blocks, latency_ms=args.latency_ms)
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(summary, f, indent=2)
+    print(json.dumps(summary, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,198 @@
+#!/usr/bin/env python3
+"""
+Benchmark: partition_workflow_advanced scaling
+
+Partitions synthetic DAGs from 100 to 10k nodes and reports wall time per
+node. Two graph shapes are generated:
+
+- fork_join: hyper_stress-style stages (fork → N parallel chains with LLM
+  nodes → join), with a nested fork inside some branches.
+- comb: a long spine where every spine node forks a short side chain that
+  never converges. This used to rerun the convergence BFS over the whole
+  remaining spine at every fork (quadratic).
+
+MAX_NODES_LIMIT is raised on the module for the duration of the run.
+
+Run:
+    cd analemma-workflow-os/backend
+    python -m tests.backend.benchmark_partitioning
+    python -m tests.backend.benchmark_partitioning --sizes 100,1000,10000 --output /tmp/partition.json
+"""
+
+import argparse
+import json
+import logging
+import os
+import random
+import sys
+import time
+from typing import Any, Dict, List
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+
+# services.workflow 패키지 import 시 DynamoDB 리소스가 생성됨 (호출은 없음)
+os.environ.setdefault("AWS_DEFAULT_REGION", "us-east-1")
+
+DEFAULT_SIZES = (100, 500, 1000, 2000, 5000, 10000)
+
+
+def _node(node_id: str, rng: random.Random, llm_ratio: float = 0.2) -> Dict[str, Any]:
+    if rng.random() < llm_ratio:
+        return {"id": node_id, "type": "llm_chat", "config": {"prompt_content": node_id}}
+    return {"id": node_id, "type": "operator", "config": {"code": "pass"}}
+
+
+def make_fork_join_dag(target_nodes: int, width: int = 4, chain: int = 5, seed: int = 42) -> Dict[str, Any]:
+    """Sequential fork/join stages until ~target_nodes nodes exist."""
+    rng = random.Random(seed)
+    nodes: List[Dict[str, Any]] = []
+    edges: List[Dict[str, Any]] = []
+
+    def add(node_id):
+        nodes.append(_node(node_id, rng))
+        return node_id
+
+    def link(src, tgt, edge_type="edge"):
+        edges.append({"id": f"{src}->{tgt}", "source": src, "target": tgt, "type": edge_type})
+
+    prev = add("start")
+    stage = 0
+    while len(nodes) < target_nodes:
+        fork = add(f"s{stage}_fork")
+        link(prev, fork, "hitp" if stage % 7 == 6 else "edge")
+        join = f"s{stage}_join"
+        tails = []
+        for b in range(width):
+            last = fork
+            for c in range(chain):
+                cur = add(f"s{stage}_b{b}_n{c}")
+                link(last, cur)
+                last = cur
+                # 일부 브랜치에 중첩 fork/join
+                if b == 0 and c == 1 and stage % 3 == 0:
+                    inner_join = add(f"s{stage}_b{b}_ij")
+                    for ib in range(2):
+                        inner = add(f"s{stage}_b{b}_i{ib}")
+                        link(last, inner)
+                        link(inner, inner_join)
+                    last = inner_join
+            tails.append(last)
+        add(join)
+        for tail in tails:
+            link(tail, join)
+        prev = join
+        stage += 1
+
+    return {"id": f"fork_join_{target_nodes}", "nodes": nodes, "edges": edges}
+
+
+def make_comb_dag(target_nodes: int, tooth: int = 2, seed: int = 7) -> Dict[str, Any]:
+    """Spine with a non-converging side chain at every spine node."""
+    rng = random.Random(seed)
+    nodes: List[Dict[str, Any]] = []
+    edges: List[Dict[str, Any]] = []
+    spine = 0
+    prev = None
+    while len(nodes) < target_nodes:
+        sid = f"spine_{spine}"
+        nodes.append(_node(sid, rng, llm_ratio=0.05))
+        if prev:
+            edges.append({"source": prev, "target": sid, "type": "edge"})
+        last = sid
+        for t in range(tooth):
+            tid = f"tooth_{spine}_{t}"
+            nodes.append(_node(tid, rng, llm_ratio=0.05))
+            edges.append({"source": last, "target": tid, "type": "edge"})
+            last = tid
+        prev = sid
+        spine += 1
+    return {"id": f"comb_{target_nodes}", "nodes": nodes, "edges": edges}
+
+
+GRAPH_SHAPES = {
+    "fork_join": make_fork_join_dag,
+    "comb": make_comb_dag,
+}
+
+
+def _partition(partition_service, config):
+    start = time.perf_counter()
+    result = partition_service.partition_workflow_advanced(config)
+    return result, (time.perf_counter() - start) * 1000
+
+
+def benchmark_partitioning(sizes=DEFAULT_SIZES, shapes=tuple(GRAPH_SHAPES), repeats: int = 3):
+    from src.services.workflow import partition_service
+
+    print("\n" + "=" * 70)
+    print("BENCHMARK: partition_workflow_advanced scaling")
+    print("=" * 70)
+
+    # 분할 로직 자체만 측정 - 대규모 그래프 경고/디버그 로그는 끔
+    logging.getLogger(partition_service.__name__).setLevel(logging.ERROR)
+
+    original_limit = partition_service.MAX_NODES_LIMIT
+    original_depth = partition_service.MAX_PARTITION_DEPTH
+    results = []
+    try:
+        partition_service.MAX_NODES_LIMIT = max(max(sizes) * 2, original_limit)
+        # comb 형태는 spine 노드마다 재귀 한 단계씩 깊어짐
+        partition_service.MAX_PARTITION_DEPTH = max(max(sizes), original_depth)
+        recursion_limit = sys.getrecursionlimit()
+        sys.setrecursionlimit(max(recursion_limit, max(sizes) * 20))
+        try:
+            for shape in shapes:
+                for size in sizes:
+                    config = GRAPH_SHAPES[shape](size)
+                    timings = []
+                    result = None
+                    for _ in range(repeats):
+                        result, ms = _partition(partition_service, json.loads(json.dumps(config)))
+                        timings.append(ms)
+                    best = min(timings)
+                    row = {
+                        "shape": shape,
+                        "nodes": len(config["nodes"]),
+                        "edges": len(config["edges"]),
+                        "best_ms": round(best, 2),
+                        "us_per_node": round(best * 1000 / len(config["nodes"]), 2),
+                        "total_segments": result["total_segments"],
+                        "segments_recursive": result["metadata"]["total_segments_recursive"],
+                    }
+                    results.append(row)
+                    print(
+                        f"  {shape:<10} nodes={row['nodes']:>6} edges={row['edges']:>6} | "
+                        f"{row['best_ms']:>10.1f}ms | {row['us_per_node']:>8.1f}µs/node | "
+                        f"segments={row['segments_recursive']}"
+                    )
+        finally:
+            sys.setrecursionlimit(recursion_limit)
+    finally:
+        partition_service.MAX_NODES_LIMIT = original_limit
+        partition_service.MAX_PARTITION_DEPTH = original_depth
+
+    return {"cases": results}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--sizes", default=",".join(str(s) for s in DEFAULT_SIZES))
+    parser.add_argument("--shapes", default=",".join(GRAPH_SHAPES))
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--output", help="Write JSON results to this path")
+    args = parser.parse_args()
+
+    summary = benchmark_partitioning(
+        sizes=tuple(int(s) for s in args.sizes.split(",") if s),
+        shapes=tuple(s for s in args.shapes.split(",") if s),
+        repeats=args.repeats,
+    )
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(summary, f, indent=2)
+    print(json.dumps(summary, indent=2))
+
+
+if __name__ == "__main__":
+    main()
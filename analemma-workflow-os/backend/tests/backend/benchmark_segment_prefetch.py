@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+"""
+Benchmark: segment transition latency with and without speculative prefetch
+
+A chain of N segments runs one after another, like the Step Functions segment
+loop. Each transition builds a new SegmentRunnerService and hydrator, as the
+Lambda handler does per invocation, and then runs the pre-execution path of
+execute_segment:
+
+    manifest segment_config (_load_segment_config_from_manifest / take_config)
+    → field access read set → prefetch_declared_reads of S3 pointers
+    → (prefetch mode) schedule the next segment → segment executes (sleep)
+
+Every segment reads two static pointer fields (context, corpus) and the output
+of the previous segment, and writes its own output as a new pointer. Static reads
+can be prefetched; the previous output is produced by the running segment, so it
+always misses. S3 is an in-memory fake with fixed per-GET latency.
+
+Reported per mode: transition latency (mean / p95), S3 GETs on the critical path,
+and prefetch hit rates (get_segment_prefetch_stats).
+
+Run:
+    cd analemma-workflow-os/backend
+    python -m tests.backend.benchmark_segment_prefetch
+    python -m tests.backend.benchmark_segment_prefetch --segments 100 --get-latency-ms 40
+"""
+
+import argparse
+import hashlib
+import io
+import json
+import logging
+import os
+import statistics
+import sys
+import threading
+import time
+from typing import Dict
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+os.environ.setdefault("AWS_DEFAULT_REGION", "us-east-1")
+
+import boto3
+
+from src.common.state_hydrator import StateHydrator
+from src.services.execution import segment_prefetcher, segment_runner_service
+from src.services.execution.segment_prefetcher import (
+    clear_segment_prefetch_state,
+    collect_state_pointers,
+    get_segment_prefetch_stats,
+    get_segment_prefetcher,
+)
+from src.services.execution.segment_runner_service import SegmentRunnerService
+from src.services.workflow.field_access_analyzer import prefetch_declared_reads, resolve_segment_field_access
+
+BUCKET = "bench-state"
+MANIFEST_PATH = f"s3://{BUCKET}/manifests/bench.json"
+
+
+class FakeS3:
+    """GetObject에 고정 지연을 넣은 인메모리 S3. 호출 스레드별로 GET 수를 센다."""
+
+    def __init__(self, get_latency_s: float):
+        self.get_latency_s = get_latency_s
+        self.objects: Dict[str, bytes] = {}
+        self.gets_by_thread: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def put_object(self, Bucket, Key, Body, **kwargs):
+        self.objects[Key] = Body if isinstance(Body, bytes) else Body.encode("utf-8")
+
+    def get_object(self, Bucket, Key):
+        with self._lock:
+            name = threading.current_thread().name
+            self.gets_by_thread[name] = self.gets_by_thread.get(name, 0) + 1
+        time.sleep(self.get_latency_s)
+        body = self.objects[Key]
+        return {"Body": io.BytesIO(body), "ContentLength": len(body)}
+
+
+def _pointer(s3: FakeS3, field: str, value) -> Dict:
+    body = json.dumps(value)
+    key = f"state/{field}_{time.time_ns()}.json"
+    s3.put_object(Bucket=BUCKET, Key=key, Body=body)
+    return {"__s3_pointer__": True, "bucket": BUCKET, "key": key, "size_bytes": len(body),
+            "checksum": hashlib.md5(body.encode("utf-8")).hexdigest()[:8], "field_name": field}
+
+
+def build_manifest(segments: int) -> Dict:
+    return {"segments": [
+        {"segment_id": i, "segment_config": {
+            "id": i, "node_ids": [f"s{i}"],
+            "nodes": [{"id": f"s{i}", "type": "llm_chat", "config": {
+                "prompt": "{{context}} {{corpus}} {{out_%d}}" % (i - 1), "output_key": f"out_{i}"}}]}}
+        for i in range(segments)
+    ]}
+
+
+def run_mode(prefetch: bool, segments: int, get_latency_s: float, exec_s: float) -> Dict:
+    s3 = FakeS3(get_latency_s)
+    boto3.client = lambda *args, **kwargs: s3
+    s3.put_object(Bucket=BUCKET, Key="manifests/bench.json", Body=json.dumps(build_manifest(segments)))
+    clear_segment_prefetch_state()
+    state = {"context": _pointer(s3, "context", {"policy": "x" * 2000}),
+             "corpus": _pointer(s3, "corpus", ["doc"] * 500),
+             "out_-1": _pointer(s3, "out_-1", "seed")}
+
+    transitions = []
+    for i in range(segments):
+        start = time.perf_counter()
+        runner = SegmentRunnerService.__new__(SegmentRunnerService)
+        runner.hydrator = StateHydrator(bucket_name=BUCKET, s3_client=s3)
+        event = {"segment_manifest_s3_path": MANIFEST_PATH, "segment_index": i, "ownerId": "bench"}
+
+        config = get_segment_prefetcher().take_config("bench", MANIFEST_PATH, i) if prefetch else None
+        if config is None:
+            config = runner._load_segment_config_from_manifest(MANIFEST_PATH, i)
+        segment_state = dict(state)
+        pointers = collect_state_pointers(segment_state)
+        field_access = resolve_segment_field_access(config)
+        if prefetch:
+            get_segment_prefetcher().seed_hydrator(runner.hydrator, segment_state, field_access["reads"])
+        prefetch_declared_reads(segment_state, field_access, runner.hydrator)
+        if prefetch:
+            runner._schedule_next_segment_prefetch(event, i, field_access, pointers)
+        transitions.append((time.perf_counter() - start) * 1000)
+
+        time.sleep(exec_s)  # segment execution overlaps the prefetch
+        state[f"out_{i}"] = _pointer(s3, f"out_{i}", f"result {i}")
+
+    critical_gets = sum(n for name, n in s3.gets_by_thread.items() if not name.startswith("segment-prefetch"))
+    row = {"mode": "prefetch" if prefetch else "baseline", "segments": segments,
+           "transition_ms_mean": round(statistics.mean(transitions), 2),
+           "transition_ms_p95": round(sorted(transitions)[int(0.95 * (len(transitions) - 1))], 2),
+           "critical_path_gets": critical_gets,
+           "background_gets": sum(s3.gets_by_thread.values()) - critical_gets}
+    if prefetch:
+        stats = get_segment_prefetch_stats()
+        row.update(config_hit_rate=stats["config_hit_rate"], pointer_hit_rate=stats["pointer_hit_rate"])
+    return row
+
+
+def run(segments: int = 50, get_latency_ms: float = 25.0, exec_ms: float = 150.0) -> Dict:
+    print("\n" + "=" * 70)
+    print(f"BENCHMARK: {segments}-segment chain, {get_latency_ms}ms per S3 GET, "
+          f"{exec_ms}ms per segment execution")
+    print("=" * 70)
+    for module in (segment_runner_service, segment_prefetcher):
+        logging.getLogger(module.__name__).setLevel(logging.WARNING)
+    logging.getLogger("src.services.workflow.field_access_analyzer").setLevel(logging.WARNING)
+
+    rows = [run_mode(prefetch, segments, get_latency_ms / 1000, exec_ms / 1000) for prefetch in (False, True)]
+    for row in rows:
+        hits = (f"  config hit {row['config_hit_rate']:.0%}  pointer hit {row['pointer_hit_rate']:.0%}"
+                if "config_hit_rate" in row else "")
+        print(f"  {row['mode']:<9} transition mean {row['transition_ms_mean']:>7.2f}ms  "
+              f"p95 {row['transition_ms_p95']:>7.2f}ms  critical GETs {row['critical_path_gets']:>4}"
+              f"  background GETs {row['background_gets']:>4}{hits}")
+    return {"segments": segments, "get_latency_ms": get_latency_ms, "exec_ms": exec_ms, "results": rows}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--segments", type=int, default=50)
+    parser.add_argument("--get-latency-ms", type=float, default=25.0)
+    parser.add_argument("--exec-ms", type=float, default=150.0)
+    parser.add_argument("--output", help="Write JSON results to this path")
+    args = parser.parse_args()
+
+    summary = run(segments=args.segments, get_latency_ms=args.get_latency_ms, exec_ms=args.exec_ms)
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(summary, f, indent=2)
+    print(json.dumps(summary, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""
+Benchmark: SemanticShield NormalizationPipeline throughput (MB/s)
+
+Corpus (what a ReAct loop re-inspects every iteration):
+    system_prompt   ~16KB English instructions with a few homoglyphs / ZWS
+    tool_output     ~64KB JSON tool result with base64 attachments and ids
+    korean_chat     ~8KB Korean conversation with full-width latin
+
+Compared:
+    legacy      previous per-character loops (any()/join, dict lookups per char,
+                keyword any() per base64 candidate)
+    bulk        C-level character-class scans (ASCII fast path) + deduplicated
+                base64 decoding, no cache
+    cached      bulk + content-hash LRU, the same texts inspected repeatedly
+                (first pass misses, the rest hit)
+
+Run:
+    cd analemma-workflow-os/backend
+    python -m tests.backend.benchmark_semantic_shield_normalization
+    python -m tests.backend.benchmark_semantic_shield_normalization --rounds 50
+"""
+
+import argparse
+import base64
+import json
+import os
+import random
+import sys
+import time
+import unicodedata
+from typing import Callable, Dict, List, Tuple
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+
+from src.services.recovery.semantic_shield import (
+    _HOMOGLYPH_MAP,
+    Detection,
+    DetectionType,
+    NormalizationPipeline,
+    clear_normalization_cache,
+    get_normalization_cache_stats,
+)
+
+
+class LegacyNormalizationPipeline(NormalizationPipeline):
+    """변경 전 Stage 1 구현 (문자 단위 루프)."""
+
+    def normalize(self, text: str) -> Tuple[str, List[Detection]]:
+        detections: List[Detection] = []
+        result = text
+        if any(c in self.ZERO_WIDTH for c in result):
+            result = ''.join(c for c in result if c not in self.ZERO_WIDTH)
+            detections.append(Detection(DetectionType.ZERO_WIDTH_CHAR, "Zero-Width Space / BOM characters stripped", 1))
+        if any(c in self.RTL_OVERRIDE for c in result):
+            result = ''.join(c for c in result if c not in self.RTL_OVERRIDE)
+            detections.append(Detection(DetectionType.RTL_OVERRIDE, "RTL override characters stripped", 1))
+        for match in self._BASE64_PATTERN.finditer(result):
+            try:
+                decoded = base64.b64decode(match.group(0) + '==').decode('utf-8', errors='ignore')
+                if any(kw in decoded.lower() for kw in self._INJECTION_KEYWORDS):
+                    detections.append(Detection(DetectionType.BASE64_INJECTION,
+                                                f"Base64-encoded injection: {decoded[:80]}", 1))
+            except Exception:
+                pass
+        result = unicodedata.normalize('NFC', result)
+        chars, replaced = [], False
+        for char in result:
+            rep = _HOMOGLYPH_MAP.get(char)
+            if rep:
+                chars.append(rep)
+                replaced = True
+            else:
+                chars.append(char)
+        if replaced:
+            detections.append(Detection(DetectionType.HOMOGLYPH,
+                                        "Homoglyph chars normalized (Cyrillic/Greek/Full-width → Latin)", 1))
+        return ''.join(chars), detections
+
+
+def make_corpus(seed: int = 7) -> Dict[str, str]:
+    rng = random.Random(seed)
+    sentence = ("You are a careful finance assistant. Always cite the source document, "
+                "never reveal credentials, and keep answers under 200 words. ")
+    system_prompt = (sentence * 110)[:16_000] + " ѕummary​ rules"
+    rows = [{
+        "id": f"inv-{i:05d}",
+        "customer": f"customer-{rng.randint(1, 999)}",
+        "attachment": base64.b64encode(os.urandom(48)).decode(),
+        "memo": "monthly invoice for cloud usage",
+    } for i in range(300)]
+    tool_output = json.dumps({"rows": rows})[:64_000]
+    korean_chat = ("사용자: 지난달 청구서 요약해줘. 어시스턴트: ＡＷＳ 비용이 증가했습니다. " * 150)[:8_000]
+    return {"system_prompt": system_prompt, "tool_output": tool_output, "korean_chat": korean_chat}
+
+
+def _mb_per_s(fn: Callable[[str], object], texts: List[str], rounds: int) -> float:
+    total = sum(len(t.encode('utf-8')) for t in texts) * rounds
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for text in texts:
+            fn(text)
+    return total / (time.perf_counter() - start) / 1e6
+
+
+def run(rounds: int = 20) -> Dict:
+    print("\n" + "=" * 70)
+    print(f"BENCHMARK: NormalizationPipeline throughput ({rounds} inspections per text)")
+    print("=" * 70)
+
+    corpus = make_corpus()
+    legacy, bulk = LegacyNormalizationPipeline(), NormalizationPipeline()
+    for text in corpus.values():
+        expected = legacy.normalize(text)
+        actual = bulk._normalize_uncached(text)
+        assert expected[0] == actual[0]
+        assert [d.detection_type for d in expected[1]] == [d.detection_type for d in actual[1]]
+
+    results = {}
+    for name, text in corpus.items():
+        clear_normalization_cache()
+        row = {
+            "bytes": len(text.encode('utf-8')),
+            "legacy_mb_s": _mb_per_s(legacy.normalize, [text], rounds),
+            "bulk_mb_s": _mb_per_s(bulk._normalize_uncached, [text], rounds),
+            "cached_mb_s": _mb_per_s(bulk.normalize, [text], rounds),
+        }
+        results[name] = {k: round(v, 1) if isinstance(v, float) else v for k, v in row.items()}
+        print(f"  {name:<14} {row['bytes'] / 1024:>5.1f}KB  legacy {row['legacy_mb_s']:>8.1f} MB/s  "
+              f"bulk {row['bulk_mb_s']:>8.1f} MB/s ({row['bulk_mb_s'] / row['legacy_mb_s']:.1f}x)  "
+              f"cached {row['cached_mb_s']:>9.1f} MB/s ({row['cached_mb_s'] / row['legacy_mb_s']:.0f}x)")
+
+    clear_normalization_cache()
+    texts = list(corpus.values())
+    mixed = {
+        "legacy_mb_s": round(_mb_per_s(legacy.normalize, texts, rounds), 1),
+        "cached_mb_s": round(_mb_per_s(bulk.normalize, texts, rounds), 1),
+        "cache": get_normalization_cache_stats(),
+    }
+    print(f"\n  mixed loop ({len(texts)} texts × {rounds}): legacy {mixed['legacy_mb_s']} MB/s → "
+          f"cached {mixed['cached_mb_s']} MB/s, hit rate {mixed['cache']['hit_rate_percent']}%")
+    return {"rounds": rounds, "per_text": results, "mixed": mixed}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--rounds", type=int, default=20)
+    parser.add_argument("--output", help="Write JSON results to this path")
+    args = parser.parse_args()
+
+    summary = run(rounds=args.rounds)
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(summary, f, indent=2)
+    print(json.dumps(summary, indent=2))
+
+
+if __name__ == "__main__":
+    main()
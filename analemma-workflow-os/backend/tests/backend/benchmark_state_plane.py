@@ -0,0 +1,547 @@
+#!/usr/bin/env python3
+"""
+Offline state-plane benchmark suite.
+
+Runs the scenarios from src/handlers/utils/benchmark_handler.py plus the
+state-plane hot paths (save_state_delta, load_latest_state,
+universal_sync_core) against an in-process S3/DynamoDB stand-in (moto) with
+configurable injected per-call latency, so regressions show up before deploy.
+
+Results are machine-readable JSON. With --baseline, median timings are
+compared against a previous run and the process exits non-zero when any
+scenario regresses beyond --tolerance.
+
+Run:
+    cd analemma-workflow-os/backend
+    python -m tests.backend.benchmark_state_plane --latency-ms 15 --output /tmp/state_plane.json
+    python -m tests.backend.benchmark_state_plane --baseline /tmp/state_plane.json
+
+    # Smoke mode (zero latency, small inputs) under pytest:
+    python -m pytest tests/backend/benchmark_state_plane.py
+"""
+
+import argparse
+import contextlib
+import json
+import os
+import random
+import statistics
+import sys
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, Iterator, List, Optional
+from unittest.mock import patch
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+
+import boto3
+from moto import mock_aws
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# In-process AWS stand-in
+# ═══════════════════════════════════════════════════════════════════════════
+
+BUCKET = "bench-state-bucket"
+MANIFESTS_TABLE = "WorkflowManifests-v3-bench"
+BLOCK_REFERENCES_TABLE = "WorkflowBlockReferences-v3-bench"
+WORKFLOWS_TABLE = "Workflows-v3-bench"
+
+# Client attributes that are local (no network round trip) on real boto3
+_LOCAL_ATTRIBUTES = frozenset({
+    "meta", "exceptions", "get_paginator", "get_waiter", "can_paginate",
+    "close", "name", "table_name", "load", "reload",
+})
+
+
+class CallStats:
+    """Thread-safe per-operation call counter."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.calls: Dict[str, int] = {}
+
+    def record(self, operation: str) -> None:
+        with self._lock:
+            self.calls[operation] = self.calls.get(operation, 0) + 1
+
+    def snapshot(self) -> Dict[str, int]:
+        with self._lock:
+            return dict(self.calls)
+
+    def reset(self) -> None:
+        with self._lock:
+            self.calls.clear()
+
+
+class LatencyInjectingProxy:
+    """Wraps a boto3 client/resource/Table and sleeps before every API call.
+
+    Latency is `latency_ms` plus uniform jitter in [0, jitter_ms]. Sleeping
+    releases the GIL, so thread-pooled I/O in the code under test overlaps the
+    same way it does against real S3/DynamoDB.
+    """
+
+    def __init__(self, target: Any, service: str, latency_ms: float,
+                 jitter_ms: float, stats: CallStats, rng: random.Random):
+        self._target = target
+        self._service = service
+        self._latency_s = latency_ms / 1000.0
+        self._jitter_s = jitter_ms / 1000.0
+        self._stats = stats
+        self._rng = rng
+
+    def _delay(self) -> float:
+        if self._jitter_s:
+            return self._latency_s + self._rng.uniform(0, self._jitter_s)
+        return self._latency_s
+
+    def __getattr__(self, name: str) -> Any:
+        attr = getattr(self._target, name)
+        if name == "Table":
+            # dynamodb resource: wrap returned Table objects too
+            def _table(*args, **kwargs):
+                return LatencyInjectingProxy(
+                    attr(*args, **kwargs), self._service, self._latency_s * 1000,
+                    self._jitter_s * 1000, self._stats, self._rng,
+                )
+            return _table
+        if not callable(attr) or name in _LOCAL_ATTRIBUTES or name.startswith("_"):
+            return attr
+
+        def _call(*args, **kwargs):
+            self._stats.record(f"{self._service}.{name}")
+            delay = self._delay()
+            if delay > 0:
+                time.sleep(delay)
+            return attr(*args, **kwargs)
+        return _call
+
+
+class OfflineAWS:
+    """Handle returned by `offline_aws()`: call stats and resource names."""
+
+    def __init__(self, stats: CallStats, latency_ms: float, jitter_ms: float):
+        self.stats = stats
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.bucket = BUCKET
+        self.manifests_table = MANIFESTS_TABLE
+        self.block_references_table = BLOCK_REFERENCES_TABLE
+        self.workflows_table = WORKFLOWS_TABLE
+
+
+def _create_resources() -> None:
+    s3 = boto3.client("s3", region_name="us-east-1")
+    s3.create_bucket(Bucket=BUCKET)
+
+    ddb = boto3.client("dynamodb", region_name="us-east-1")
+    ddb.create_table(
+        TableName=MANIFESTS_TABLE,
+        KeySchema=[{"AttributeName": "manifest_id", "KeyType": "HASH"}],
+        AttributeDefinitions=[{"AttributeName": "manifest_id", "AttributeType": "S"}],
+        BillingMode="PAY_PER_REQUEST",
+    )
+    ddb.create_table(
+        TableName=BLOCK_REFERENCES_TABLE,
+        KeySchema=[
+            {"AttributeName": "workflow_id", "KeyType": "HASH"},
+            {"AttributeName": "block_id", "KeyType": "RANGE"},
+        ],
+        AttributeDefinitions=[
+            {"AttributeName": "workflow_id", "AttributeType": "S"},
+            {"AttributeName": "block_id", "AttributeType": "S"},
+        ],
+        BillingMode="PAY_PER_REQUEST",
+    )
+    ddb.create_table(
+        TableName=WORKFLOWS_TABLE,
+        KeySchema=[
+            {"AttributeName": "ownerId", "KeyType": "HASH"},
+            {"AttributeName": "workflowId", "KeyType": "RANGE"},
+        ],
+        AttributeDefinitions=[
+            {"AttributeName": "ownerId", "AttributeType": "S"},
+            {"AttributeName": "workflowId", "AttributeType": "S"},
+        ],
+        BillingMode="PAY_PER_REQUEST",
+    )
+
+
+@contextlib.contextmanager
+def offline_aws(latency_ms: float = 0.0, jitter_ms: float = 0.0, seed: int = 7) -> Iterator[OfflineAWS]:
+    """Start the moto stand-in and route boto3.client/resource through latency proxies."""
+    stats = CallStats()
+    rng = random.Random(seed)
+    env = {
+        "AWS_ACCESS_KEY_ID": "testing",
+        "AWS_SECRET_ACCESS_KEY": "testing",
+        "AWS_SESSION_TOKEN": "testing",
+        "AWS_DEFAULT_REGION": "us-east-1",
+        "AWS_REGION": "us-east-1",
+        "WORKFLOWS_TABLE": WORKFLOWS_TABLE,
+        "WORKFLOW_STATE_BUCKET": BUCKET,
+        "SKELETON_S3_BUCKET": BUCKET,
+        "MANIFESTS_TABLE": MANIFESTS_TABLE,
+        "BLOCK_REFERENCES_TABLE": BLOCK_REFERENCES_TABLE,
+    }
+
+    with patch.dict(os.environ, env), mock_aws():
+        _create_resources()
+        real_client, real_resource = boto3.client, boto3.resource
+
+        def _client(service_name, *args, **kwargs):
+            kwargs.setdefault("region_name", "us-east-1")
+            return LatencyInjectingProxy(
+                real_client(service_name, *args, **kwargs),
+                service_name, latency_ms, jitter_ms, stats, rng,
+            )
+
+        def _resource(service_name, *args, **kwargs):
+            kwargs.setdefault("region_name", "us-east-1")
+            return LatencyInjectingProxy(
+                real_resource(service_name, *args, **kwargs),
+                service_name, latency_ms, jitter_ms, stats, rng,
+            )
+
+        from src.handlers.utils import universal_sync_core as usc
+        saved_usc = (usc._s3_client, usc._S3_BUCKET)
+        usc._s3_client, usc._S3_BUCKET = None, None
+        try:
+            with patch.object(boto3, "client", _client), patch.object(boto3, "resource", _resource):
+                yield OfflineAWS(stats, latency_ms, jitter_ms)
+        finally:
+            usc._s3_client, usc._S3_BUCKET = saved_usc
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# Helpers
+# ═══════════════════════════════════════════════════════════════════════════
+
+def _timings_summary(samples: List[float]) -> Dict[str, float]:
+    ordered = sorted(samples)
+    p95_index = min(len(ordered) - 1, int(round(0.95 * (len(ordered) - 1))))
+    return {
+        "median_ms": round(statistics.median(ordered) * 1000, 3),
+        "p95_ms": round(ordered[p95_index] * 1000, 3),
+        "min_ms": round(ordered[0] * 1000, 3),
+        "samples": len(ordered),
+    }
+
+
+def _make_state(n_fields: int, field_kb: float, seed: int = 1) -> Dict[str, Any]:
+    rng = random.Random(seed)
+    chunk = max(1, int(field_kb * 1024) // 64)
+    return {
+        f"field_{i}": {
+            "items": [f"{rng.getrandbits(128):032x}_{j:04d}" for j in range(chunk)],
+            "index": i,
+        }
+        for i in range(n_fields)
+    }
+
+
+def _new_kernel(env: OfflineAWS):
+    from src.services.state.state_versioning_service import StateVersioningService
+    return StateVersioningService(
+        dynamodb_table=env.manifests_table,
+        s3_bucket=env.bucket,
+        block_references_table=env.block_references_table,
+    )
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# Scenarios
+# ═══════════════════════════════════════════════════════════════════════════
+
+def scenario_save_state_delta(env: OfflineAWS, iterations: int = 5,
+                              n_fields: int = 10, field_kb: float = 5) -> Dict[str, Any]:
+    """save_state_delta: Merkle block upload + manifest transaction + pointer + tagging."""
+    kernel = _new_kernel(env)
+    state = _make_state(n_fields, field_kb)
+    previous = None
+    samples = []
+    env.stats.reset()
+    for segment_id in range(iterations):
+        # Change one field per segment so block content differs every run
+        state["field_0"]["index"] = segment_id
+        t0 = time.perf_counter()
+        result = kernel.save_state_delta(
+            delta=state, workflow_id="wf-bench", execution_id="exec-bench",
+            owner_id="owner-bench", segment_id=segment_id,
+            previous_manifest_id=previous,
+            dirty_keys=set(state.keys()), full_state=state,
+        )
+        samples.append(time.perf_counter() - t0)
+        previous = result["manifest_id"]
+
+    calls = env.stats.snapshot()
+    return {
+        "scenario": "save_state_delta",
+        "fields": n_fields,
+        "field_kb": field_kb,
+        **_timings_summary(samples),
+        "aws_calls_per_save": {k: v / iterations for k, v in sorted(calls.items())},
+        "last_manifest_id": previous,
+    }
+
+
+def scenario_load_latest_state(env: OfflineAWS, iterations: int = 5,
+                               n_fields: int = 10, field_kb: float = 5) -> Dict[str, Any]:
+    """load_latest_state: pointer read + manifest read + parallel block download."""
+    kernel = _new_kernel(env)
+    state = _make_state(n_fields, field_kb, seed=2)
+    kernel.save_state_delta(
+        delta=state, workflow_id="wf-load", execution_id="exec-load",
+        owner_id="owner-bench", segment_id=0,
+    )
+
+    samples = []
+    loaded: Dict[str, Any] = {}
+    env.stats.reset()
+    for _ in range(iterations):
+        t0 = time.perf_counter()
+        loaded = kernel.load_latest_state(workflow_id="wf-load", owner_id="owner-bench")
+        samples.append(time.perf_counter() - t0)
+
+    calls = env.stats.snapshot()
+    return {
+        "scenario": "load_latest_state",
+        "fields": n_fields,
+        "field_kb": field_kb,
+        **_timings_summary(samples),
+        "aws_calls_per_load": {k: v / iterations for k, v in sorted(calls.items())},
+        "round_trip_ok": loaded == state,
+    }
+
+
+def scenario_universal_sync_core(env: OfflineAWS, iterations: int = 5,
+                                 base_fields: int = 40, large_field_kb: float = 60) -> Dict[str, Any]:
+    """universal_sync_core: flatten + merge + offload of an oversized field to S3."""
+    from src.handlers.utils.universal_sync_core import universal_sync_core
+
+    base_state = {
+        "execution_id": "exec-sync",
+        "idempotency_key": "idem-sync",
+        "segment_to_run": 3,
+        "loop_counter": 0,
+        "total_segments": 10,
+        **{f"ctx_{i}": {"value": i, "tags": [f"t{j}" for j in range(10)]} for i in range(base_fields)},
+    }
+    samples = []
+    offloaded = 0
+    next_actions = set()
+    env.stats.reset()
+    for run in range(iterations):
+        new_result = {
+            "final_state": {
+                "llm_response": "R" * int(large_field_kb * 1024) + str(run),
+                "summary": f"run {run}",
+            },
+            # 정상 세그먼트 전이 — next_segment_to_run이 없으면 CONTINUE가 FAILED로 강등된다
+            "status": "CONTINUE",
+            "next_segment_to_run": base_state["segment_to_run"] + 1,
+        }
+        t0 = time.perf_counter()
+        out = universal_sync_core(base_state, new_result, {"action": "sync", "execution_id": "exec-sync"})
+        samples.append(time.perf_counter() - t0)
+        next_actions.add(out["next_action"])
+        llm_value = out["state_data"].get("llm_response")
+        if isinstance(llm_value, dict) and (llm_value.get("__s3_offloaded") or llm_value.get("s3_path")):
+            offloaded += 1
+
+    calls = env.stats.snapshot()
+    return {
+        "scenario": "universal_sync_core",
+        "base_fields": base_fields,
+        "large_field_kb": large_field_kb,
+        **_timings_summary(samples),
+        "offloaded_runs": offloaded,
+        "next_actions": sorted(next_actions),
+        "aws_calls_per_sync": {k: v / iterations for k, v in sorted(calls.items())},
+    }
+
+
+def _handler_scenario(name: str) -> Callable[[OfflineAWS], Dict[str, Any]]:
+    """Adapt a benchmark_handler benchmark so it runs inside the stand-in."""
+    def _run(env: OfflineAWS, **_ignored) -> Dict[str, Any]:
+        from src.handlers.utils import benchmark_handler
+        env.stats.reset()
+        t0 = time.perf_counter()
+        result = benchmark_handler.AVAILABLE_BENCHMARKS[name]()
+        elapsed = time.perf_counter() - t0
+        result = dict(result)
+        result.setdefault("scenario", name)
+        result["wall_ms"] = round(elapsed * 1000, 3)
+        result["aws_calls"] = env.stats.snapshot()
+        return result
+    _run.__name__ = f"scenario_{name}"
+    return _run
+
+
+SCENARIOS: Dict[str, Callable[..., Dict[str, Any]]] = {
+    "save_state_delta": scenario_save_state_delta,
+    "load_latest_state": scenario_load_latest_state,
+    "universal_sync_core": scenario_universal_sync_core,
+    "incremental_hashing": _handler_scenario("incremental_hashing"),
+    "parallel_io": _handler_scenario("parallel_io"),
+    "control_plane_size": _handler_scenario("control_plane_size"),
+    "speculative_atomicity": _handler_scenario("speculative_atomicity"),
+    "parallel_hashing": _handler_scenario("parallel_hashing"),
+}
+
+# Timing keys compared against a baseline, in order of preference
+_REGRESSION_METRICS = ("median_ms", "wall_ms")
+
+
+def run_suite(scenarios: Optional[List[str]] = None, latency_ms: float = 10.0,
+              jitter_ms: float = 2.0, iterations: int = 5) -> Dict[str, Any]:
+    """Run the selected scenarios and return a JSON-serializable report."""
+    selected = scenarios or list(SCENARIOS.keys())
+    unknown = [s for s in selected if s not in SCENARIOS]
+    if unknown:
+        raise ValueError(f"Unknown scenarios: {unknown}. Available: {list(SCENARIOS)}")
+
+    results: Dict[str, Any] = {}
+    started = time.perf_counter()
+    with offline_aws(latency_ms=latency_ms, jitter_ms=jitter_ms) as env:
+        for name in selected:
+            fn = SCENARIOS[name]
+            try:
+                if name in ("save_state_delta", "load_latest_state", "universal_sync_core"):
+                    results[name] = fn(env, iterations=iterations)
+                else:
+                    results[name] = fn(env)
+            except Exception as e:
+                results[name] = {"scenario": name, "error": f"{type(e).__name__}: {e}"}
+
+    return {
+        "suite": "state_plane",
+        "config": {
+            "latency_ms": latency_ms,
+            "jitter_ms": jitter_ms,
+            "iterations": iterations,
+            "scenarios": selected,
+        },
+        "results": results,
+        "metadata": {
+            "python": sys.version.split()[0],
+            "total_elapsed_ms": round((time.perf_counter() - started) * 1000, 1),
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+        },
+    }
+
+
+def compare_to_baseline(report: Dict[str, Any], baseline: Dict[str, Any],
+                        tolerance: float = 0.25) -> List[Dict[str, Any]]:
+    """Return scenarios whose median timing regressed by more than `tolerance`."""
+    regressions = []
+    for name, current in report.get("results", {}).items():
+        previous = baseline.get("results", {}).get(name, {})
+        metric = next((m for m in _REGRESSION_METRICS if m in current), None)
+        if metric is None:
+            continue
+        cur_value = current[metric]
+        prev_value = previous.get(metric)
+        if not prev_value:
+            continue
+        ratio = cur_value / prev_value
+        if ratio > 1 + tolerance:
+            regressions.append({
+                "scenario": name,
+                "metric": metric,
+                "baseline_ms": prev_value,
+                "current_ms": cur_value,
+                "ratio": round(ratio, 3),
+            })
+    return regressions
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Offline state-plane benchmark suite")
+    parser.add_argument("--scenarios", nargs="*", help=f"Subset of: {', '.join(SCENARIOS)}")
+    parser.add_argument("--latency-ms", type=float, default=10.0, help="Injected latency per AWS call")
+    parser.add_argument("--jitter-ms", type=float, default=2.0, help="Uniform jitter added to latency")
+    parser.add_argument("--iterations", type=int, default=5)
+    parser.add_argument("--output", help="Write JSON report to this path (default: stdout)")
+    parser.add_argument("--baseline", help="Previous JSON report to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="Allowed median slowdown ratio")
+    args = parser.parse_args(argv)
+
+    # 저장소 모듈의 print()가 stdout JSON 리포트에 섞이지 않도록 실행 중에는 stderr로 돌린다
+    with contextlib.redirect_stdout(sys.stderr):
+        report = run_suite(args.scenarios, args.latency_ms, args.jitter_ms, args.iterations)
+
+    exit_code = 0
+    if args.baseline:
+        with open(args.baseline) as f:
+            regressions = compare_to_baseline(report, json.load(f), args.tolerance)
+        report["regressions"] = regressions
+        exit_code = 1 if regressions else 0
+
+    errors = [n for n, r in report["results"].items() if "error" in r]
+    if errors:
+        exit_code = 1
+
+    payload = json.dumps(report, indent=2, default=str)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(payload)
+        print(f"Report written to: {args.output}", file=sys.stderr)
+    else:
+        print(payload)
+    return exit_code
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# pytest smoke mode (zero latency, small inputs)
+# ═══════════════════════════════════════════════════════════════════════════
+
+def test_save_then_load_round_trip():
+    with offline_aws() as env:
+        saved = scenario_save_state_delta(env, iterations=2, n_fields=3, field_kb=1)
+        loaded = scenario_load_latest_state(env, iterations=1, n_fields=3, field_kb=1)
+    assert saved["last_manifest_id"].startswith("manifest-exec-bench-1-")
+    assert saved["aws_calls_per_save"]["s3.put_object"] == 3
+    assert loaded["round_trip_ok"] is True
+
+
+def test_injected_latency_is_applied():
+    with offline_aws(latency_ms=20) as env:
+        result = scenario_load_latest_state(env, iterations=1, n_fields=1, field_kb=1)
+    # pointer read + manifest read + block download, each >= 20ms
+    assert result["median_ms"] >= 60
+
+
+def test_universal_sync_core_offloads_large_field():
+    with offline_aws() as env:
+        result = scenario_universal_sync_core(env, iterations=1, base_fields=2, large_field_kb=40)
+    assert result["offloaded_runs"] == 1
+    assert result["next_actions"] == ["CONTINUE"]
+    assert result["aws_calls_per_sync"].get("s3.put_object", 0) >= 1
+
+
+def test_stdout_is_a_single_json_report(capsys, monkeypatch):
+    original = SCENARIOS["universal_sync_core"]
+
+    def noisy(env, **kwargs):
+        print("debug output from code under test")
+        return original(env, **kwargs)
+
+    monkeypatch.setitem(SCENARIOS, "universal_sync_core", noisy)
+    main(["--scenarios", "universal_sync_core", "--latency-ms", "0", "--jitter-ms", "0", "--iterations", "1"])
+    report = json.loads(capsys.readouterr().out)
+    assert report["results"]["universal_sync_core"]["next_actions"] == ["CONTINUE"]
+
+
+def test_baseline_comparison_flags_regression():
+    report = {"results": {"save_state_delta": {"median_ms": 13.0}, "x": {"median_ms": 1.0}}}
+    baseline = {"results": {"save_state_delta": {"median_ms": 10.0}, "x": {"median_ms": 1.0}}}
+    regressions = compare_to_baseline(report, baseline, tolerance=0.25)
+    assert [r["scenario"] for r in regressions] == ["save_state_delta"]
+
+
+if __name__ == "__main__":
+    sys.exit(main())
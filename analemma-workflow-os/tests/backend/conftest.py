@@ -51,3 +51,19 @@ def setup_global_test_environment(request):
         sys.modules['openai'] = MagicMock()
 
     yield
+
+
+class FakeClock:
+    """Manually advanced clock for components that take a ``clock`` callable."""
+
+    def __init__(self, now=0.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def fake_clock():
+    """A FakeClock starting at 0.0; advance it by assigning or adding to ``.now``."""
+    return FakeClock()
@@ -0,0 +1,145 @@
+# -*- coding: utf-8 -*-
+"""Unit tests for duration-aware (makespan) branch bin packing in SegmentRunnerService."""
+
+import pytest
+
+from src.handlers.utils import node_stats_collector
+from src.services.execution import segment_runner_service
+from src.services.execution.segment_runner_service import (
+    SegmentRunnerService,
+    clear_node_duration_cache,
+)
+
+STATS = {"llm_chat": 20.0, "operator_official": 0.5}
+POLICY = {"max_concurrent_memory_mb": 450, "max_concurrent_branches": 10, "strategy": "RESOURCE_OPTIMIZED"}
+
+
+def _branch(name, node_types):
+    return {"id": name, "nodes": [{"id": f"{name}_{i}", "type": t, "config": {}} for i, t in enumerate(node_types)]}
+
+
+@pytest.fixture
+def runner(monkeypatch):
+    clear_node_duration_cache()
+    lookups = []
+
+    def fake_stats(node_types, default=5.0):
+        lookups.append(list(node_types))
+        return {t: STATS[t] for t in node_types if t in STATS}
+
+    monkeypatch.setattr(node_stats_collector, "get_node_stats_for_eta", fake_stats)
+    yield SegmentRunnerService.__new__(SegmentRunnerService), lookups
+    clear_node_duration_cache()
+
+
+def _makespan(batches, durations_by_id):
+    return sum(max(durations_by_id[b["id"]] for b in batch) for batch in batches)
+
+
+class TestBranchBinPacking:
+
+    def test_branch_duration_estimate_expands_containers(self, runner):
+        service, _ = runner
+        for_each = {"id": "fe", "type": "for_each", "config": {
+            "input_list_key": "docs", "sub_workflow": {"nodes": [{"id": "s", "type": "llm_chat", "config": {}}]}}}
+        loop = {"id": "lp", "type": "loop", "config": {
+            "max_iterations": 2, "nodes": [{"id": "o", "type": "operator_official", "config": {}}]}}
+        branches = [{"id": "a", "nodes": [for_each, loop]}, _branch("b", ["unknown_type"])]
+
+        durations = service._estimate_branch_durations(branches, {"docs": [1, 2, 3]})
+
+        assert durations == [3 * 20.0 + 2 * 0.5, segment_runner_service.DEFAULT_NODE_DURATION_S]
+
+    def test_no_stats_falls_back_to_heuristic(self, runner, monkeypatch):
+        service, _ = runner
+        monkeypatch.setattr(node_stats_collector, "get_node_stats_for_eta", lambda node_types, default=5.0: {})
+        assert service._estimate_branch_durations([_branch("a", ["mystery"])], {}) is None
+
+        monkeypatch.setattr(segment_runner_service, "BRANCH_PACKING_DURATION_AWARE", False)
+        assert service._estimate_branch_durations([_branch("a", ["llm_chat"])], {}) is None
+
+    def test_slow_branches_share_a_batch(self, runner):
+        service, _ = runner
+        # 가볍고 느린 LLM 브랜치(110MB, 20s)와 무겁고 빠른 operator 브랜치(130MB, 4s):
+        # 메모리 휴리스틱은 무거운 브랜치부터 채워 느린 브랜치를 여러 배치에 흩뜨린다.
+        slow = [_branch(f"slow{i}", ["llm_chat"]) for i in range(4)]
+        fast = [_branch(f"fast{i}", ["operator_official"] * 8) for i in range(4)]
+        branches = [b for pair in zip(fast, slow) for b in pair]
+        estimates = [service._estimate_branch_resources(b, {}) for b in branches]
+        durations = service._estimate_branch_durations(branches, {})
+        by_id = {b["id"]: d for b, d in zip(branches, durations)}
+
+        heuristic = service._bin_pack_branches(branches, estimates, POLICY)
+        packed = service._bin_pack_branches(branches, estimates, POLICY, durations=durations)
+
+        assert _makespan(packed, by_id) < _makespan(heuristic, by_id)
+        assert sorted(b["id"] for batch in packed for b in batch) == sorted(b["id"] for b in branches)
+        for batch in packed:
+            assert sum(service._estimate_branch_resources(b, {})["memory_mb"] for b in batch) <= 450
+        assert {b["id"] for b in packed[0]} == {"slow0", "slow1", "slow2", "slow3"}
+
+    def test_never_worse_than_heuristic_and_shared_resources_stay_isolated(self, runner):
+        service, _ = runner
+        branches = [_branch("a", ["llm_chat"]), _branch("b", ["operator_official"]),
+                    {"id": "w", "nodes": [{"id": "w0", "type": "db_write", "config": {}}]}]
+        estimates = [service._estimate_branch_resources(b, {}) for b in branches]
+        durations = [10.0, 10.0, 1.0]
+
+        heuristic = service._bin_pack_branches(branches, estimates, POLICY)
+        packed = service._bin_pack_branches(branches, estimates, POLICY, durations=durations)
+
+        assert packed == heuristic
+        assert [b["id"] for b in packed[-1]] == ["w"]
+
+    def test_stats_are_cached_including_misses(self, runner):
+        service, lookups = runner
+        branches = [_branch("a", ["llm_chat", "mystery"])]
+        service._estimate_branch_durations(branches, {})
+        service._estimate_branch_durations(branches, {})
+        assert lookups == [["llm_chat", "mystery"]]
+
+    def test_lookup_failure_is_cached_and_warned_once(self, runner, monkeypatch, caplog):
+        service, _ = runner
+        calls = []
+
+        def failing(node_types, default=5.0):
+            calls.append(list(node_types))
+            raise RuntimeError("AccessDenied")
+
+        monkeypatch.setattr(node_stats_collector, "get_node_stats_for_eta", failing)
+        branches = [_branch("a", ["llm_chat"])]
+        with caplog.at_level("DEBUG", logger=segment_runner_service.__name__):
+            for _ in range(5):
+                service._estimate_branch_durations(branches, {})
+            segment_runner_service._node_duration_cache.clear()  # TTL 만료와 동일
+            service._estimate_branch_durations(branches, {})
+        warnings = [r for r in caplog.records if r.levelname == "WARNING" and "NodeStats" in r.getMessage()]
+        assert len(calls) == 2 and len(warnings) == 1
+
+    def test_collector_lookup_warning_is_rate_limited(self, monkeypatch, caplog):
+        from botocore.exceptions import ClientError
+
+        class DeniedTable:
+            def get_item(self, Key):
+                raise ClientError({"Error": {"Code": "AccessDeniedException", "Message": "denied"}}, "GetItem")
+
+        monkeypatch.setattr(node_stats_collector, "table", DeniedTable())
+        monkeypatch.setattr(node_stats_collector, "_last_lookup_warning_at", None)
+        with caplog.at_level("DEBUG"):
+            for _ in range(3):
+                assert node_stats_collector.get_node_stats_for_eta(["llm_chat", "operator_official"], default=None) == {}
+        warnings = [r for r in caplog.records if r.levelname == "WARNING" and "Failed to get stats" in r.getMessage()]
+        assert len(warnings) == 1
+
+    def test_schedule_parallel_group_uses_duration_aware_packing(self, runner):
+        service, _ = runner
+        service.state_bucket = None
+        slow = [_branch(f"slow{i}", ["llm_chat"]) for i in range(4)]
+        fast = [_branch(f"fast{i}", ["operator_official"] * 8) for i in range(4)]
+        segment_config = {"branches": [b for pair in zip(fast, slow) for b in pair], "resource_policy": POLICY}
+
+        result = service._schedule_parallel_group(segment_config, {}, segment_id=1)
+
+        assert result["status"] == "SCHEDULED_PARALLEL"
+        assert result["scheduling_metadata"]["duration_aware_packing"] is True
+        assert {b["id"] for b in result["execution_batches"][0]} == {"slow0", "slow1", "slow2", "slow3"}
@@ -0,0 +1,192 @@
+# -*- coding: utf-8 -*-
+"""Unit tests for the diff-based IncrementalAuditor used by codesign audits."""
+
+import copy
+import json
+import random
+
+from src.common.graph_dsl import (
+    _count_parallel_branches,
+    _find_orphan_nodes,
+    validate_workflow,
+)
+from src.services.design.codesign_assistant import CodesignContext, _incremental_audit
+from src.services.design.incremental_audit import IncrementalAuditor
+
+NODE_TYPES = ["llm_chat", "api_call", "operator", "loop", "parallel", "start"]
+
+
+def _node(rng, node_id):
+    node = {"id": node_id, "type": rng.choice(NODE_TYPES)}
+    if rng.random() < 0.85:
+        node["position"] = {"x": 150, "y": 50}
+    if rng.random() < 0.5:
+        node["config"] = {"prompt_content": "p", "url": "https://example.com"}
+    return node
+
+
+def _random_workflow(seed, node_count=40, edge_count=45):
+    rng = random.Random(seed)
+    nodes = [_node(rng, f"n{i}") for i in range(node_count)]
+    edges = []
+    for i in range(edge_count):
+        edge = {"source": f"n{rng.randrange(node_count + 2)}", "target": f"n{rng.randrange(node_count + 2)}"}
+        if rng.random() < 0.9:
+            edge["id"] = f"e{rng.randrange(edge_count)}"  # 일부 중복 ID 포함
+        edges.append(edge)
+    return {"nodes": nodes, "edges": edges}
+
+
+def _as_set(issues):
+    return sorted(json.dumps(i, sort_keys=True, ensure_ascii=False) for i in issues)
+
+
+class TestEquivalence:
+
+    def test_sync_matches_full_validation_after_random_edits(self):
+        for seed in range(30):
+            rng = random.Random(seed)
+            workflow = _random_workflow(seed)
+            auditor = IncrementalAuditor.from_workflow(workflow)
+            for step in range(10):
+                workflow = copy.deepcopy(workflow)
+                roll = rng.random()
+                if roll < 0.3 and workflow["nodes"]:
+                    workflow["nodes"].pop(rng.randrange(len(workflow["nodes"])))
+                elif roll < 0.6:
+                    workflow["nodes"].insert(rng.randrange(len(workflow["nodes"]) + 1),
+                                             _node(rng, f"x{step}"))
+                elif workflow["edges"]:
+                    workflow["edges"].pop(rng.randrange(len(workflow["edges"])))
+                auditor.sync(workflow)
+
+                assert auditor.exact
+                assert auditor.validation_errors() == validate_workflow(workflow)
+                affected = {f"n{rng.randrange(40)}", f"x{step}"}
+                assert _as_set(auditor.audit_issues(affected)) == \
+                    _as_set(_incremental_audit(workflow, affected))
+                assert sorted(auditor.orphan_nodes()) == \
+                    sorted(_find_orphan_nodes(workflow["nodes"], workflow["edges"]))
+                assert auditor.parallel_branches() == \
+                    _count_parallel_branches(workflow["nodes"], workflow["edges"])
+
+    def test_streamed_chunks_match_validation_at_end_of_stream(self):
+        base = _random_workflow(7)
+        auditor = IncrementalAuditor.from_workflow(base)
+        final = copy.deepcopy(base)
+        rng = random.Random(7)
+        for i in range(30):
+            node = _node(rng, f"s{i}")
+            edge = {"id": f"se{i}", "source": f"n{rng.randrange(40)}", "target": f"s{i}"}
+            for obj in ({"type": "edge", "data": edge}, {"type": "node", "data": node}):
+                auditor.apply_chunk(obj)
+            final["nodes"].append(node)
+            final["edges"].append(edge)
+        assert auditor.validation_errors() == validate_workflow(final)
+        assert _as_set(auditor.audit_issues({"s3", "n1"})) == \
+            _as_set(_incremental_audit(final, {"s3", "n1"}))
+
+    def test_op_chunks_update_and_remove_match_validation(self):
+        rng = random.Random(11)
+        base = _random_workflow(11)
+        for i, edge in enumerate(base["edges"]):
+            edge["id"] = f"e{i}"  # op 명령은 ID로 대상을 지정
+        auditor = IncrementalAuditor.from_workflow(base)
+        final = copy.deepcopy(base)
+
+        def mirror(obj):
+            kind = "nodes" if obj["type"] == "node" else "edges"
+            if obj["op"] == "add":
+                final[kind].append(obj["data"])
+            elif obj["op"] == "update":
+                final[kind] = [{**item, **obj["changes"]} if item.get("id") == obj["id"] else item
+                               for item in final[kind]]
+            else:
+                final[kind] = [item for item in final[kind] if item.get("id") != obj["id"]]
+
+        chunks = [
+            {"op": "remove", "type": "edge", "id": "e3"},
+            {"op": "remove", "type": "node", "id": "n5"},
+            {"op": "update", "type": "node", "id": "n6", "changes": {"type": "api_call"}},
+            {"op": "update", "type": "node", "id": "n7", "changes": {"position": {"x": 150, "y": 90}}},
+            {"op": "update", "type": "edge", "id": "e4", "changes": {"target": "n8"}},
+            {"op": "add", "type": "node", "data": _node(rng, "s1")},
+            {"op": "add", "type": "edge", "data": {"id": "se1", "source": "n1", "target": "s1"}},
+            {"op": "remove", "type": "edge", "id": "e10"},
+        ]
+        affected = set()
+        for obj in chunks:
+            affected |= auditor.apply_chunk(obj)
+            mirror(obj)
+
+        assert auditor.exact
+        assert auditor.edge_count == len(final["edges"]) and auditor.node_count == len(final["nodes"])
+        assert all(edge.get("id") for edge in auditor.to_workflow()["edges"])  # 가짜 None->None 엣지 없음
+        assert auditor.validation_errors() == validate_workflow(final)
+        assert sorted(auditor.orphan_nodes()) == sorted(_find_orphan_nodes(final["nodes"], final["edges"]))
+        assert _as_set(auditor.audit_issues(affected)) == _as_set(_incremental_audit(final, affected))
+        assert {"n6", "n7", "s1", "n1", "n8"} <= affected
+
+    def test_unresolvable_op_chunk_forces_full_audit(self):
+        workflow = {"nodes": [{"id": "a", "type": "start", "position": {}}], "edges": []}
+        auditor = IncrementalAuditor.from_workflow(workflow)
+        assert auditor.apply_chunk({"op": "remove", "type": "edge", "id": "missing"}) == set()
+        assert not auditor.exact and auditor.edge_count == 0
+        assert _incremental_audit(workflow, {"a"}, auditor=auditor) == _incremental_audit(workflow, {"a"})
+
+        auditor.sync(workflow)  # 다음 턴 동기화로 복구
+        assert auditor.exact
+        assert auditor.apply_chunk({"op": "update", "type": "node", "id": "zzz", "changes": {}}) == set()
+        assert not auditor.exact
+
+    def test_duplicate_node_ids_fall_back(self):
+        auditor = IncrementalAuditor.from_workflow({
+            "nodes": [{"id": "a"}, {"id": "a"}], "edges": [],
+        })
+        assert not auditor.exact
+        workflow = {"nodes": [{"id": "a", "type": "llm_chat"}], "edges": []}
+        assert _incremental_audit(workflow, {"a"}, auditor=auditor) == \
+            _incremental_audit(workflow, {"a"})
+
+
+class TestGraphInvariants:
+
+    def test_cycle_detected_when_edge_closes_loop(self):
+        nodes = [{"id": n, "type": "operator", "position": {}} for n in "abc"]
+        edges = [{"id": "ab", "source": "a", "target": "b"}, {"id": "bc", "source": "b", "target": "c"}]
+        auditor = IncrementalAuditor.from_workflow({"nodes": nodes, "edges": edges})
+        assert auditor.cycles() == ([], [])
+
+        auditor.apply_chunk({"type": "edge", "data": {"id": "ca", "source": "c", "target": "a"}})
+        _, accidental = auditor.cycles()
+        assert accidental == [["c", "a", "b", "c"]]
+
+        auditor.sync({"nodes": nodes, "edges": edges})  # 순환 엣지 제거
+        assert auditor.cycles() == ([], [])
+        assert auditor.stats["cycle_rebuilds"] == 1
+
+    def test_append_only_stream_skips_cycle_search(self):
+        auditor = IncrementalAuditor()
+        previous = None
+        for i in range(50):
+            auditor.apply_chunk({"type": "node", "data": {"id": f"n{i}", "type": "operator"}})
+            if previous:
+                auditor.apply_chunk({"type": "edge", "data": {"id": f"e{i}", "source": previous, "target": f"n{i}"}})
+            previous = f"n{i}"
+        assert auditor.stats["cycle_searches"] == 0
+        assert auditor.graph_invariants()["orphans"] == []
+
+
+def test_context_records_streamed_chunks_between_syncs():
+    context = CodesignContext()
+    context.update_workflow({"nodes": [{"id": "a", "type": "start", "position": {}}], "edges": []})
+    context.sync_auditor()
+    context.record_streamed_chunk({"type": "node", "data": {"id": "b", "type": "api_call"}})
+    context.record_streamed_chunk({"type": "text", "data": "ignored"})
+    assert context.streamed_node_ids == {"b"}
+
+    issues = _incremental_audit(context.current_workflow, {"b"}, auditor=context.auditor)
+    assert {i["type"] for i in issues} == {"orphan_node", "missing_config"}
+
+    context.sync_auditor()  # 다음 턴: 클라이언트 워크플로우 기준으로 되돌아감
+    assert context.streamed_node_ids == set() and context.auditor.node_count == 1
@@ -0,0 +1,273 @@
+# -*- coding: utf-8 -*-
+"""Unit tests for the incremental WorkflowClusterIndex used by designer focus windows."""
+
+import asyncio
+import copy
+import json
+import random
+
+from src.services.design import codesign_assistant
+from src.services.design.codesign_assistant import CodesignContext, _summarize_workflow
+from src.services.design.designer_service import (
+    WorkflowClusterIndex,
+    compute_workflow_clusters,
+    extract_focus_window,
+    get_cached_clusters,
+)
+
+
+def _random_workflow(node_count=60, edge_count=50, seed=3):
+    rng = random.Random(seed)
+    nodes = [{"id": f"n{i}", "type": rng.choice(["llm", "operator", "loop"])} for i in range(node_count)]
+    edges = []
+    for i in range(edge_count):
+        src, tgt = rng.sample(range(node_count), 2)
+        edges.append({"id": f"e{i}", "source": f"n{src}", "target": f"n{tgt}"})
+    return {"nodes": nodes, "edges": edges}
+
+
+def _members(clusters):
+    return sorted(sorted(c["members"]) for c in clusters["clusters"])
+
+
+def _apply(workflow, change_type, data):
+    """Mirror a canvas change onto the raw workflow dict."""
+    if change_type == "add_node":
+        workflow["nodes"].append({"id": data["id"], "type": data.get("type", "unknown")})
+    elif change_type == "add_edge":
+        workflow["edges"].append(dict(data))
+    elif change_type == "delete_edge":
+        workflow["edges"] = [e for e in workflow["edges"] if e["id"] != data["id"]]
+    elif change_type == "delete_node":
+        workflow["nodes"] = [n for n in workflow["nodes"] if n["id"] != data["id"]]
+        workflow["edges"] = [
+            e for e in workflow["edges"] if data["id"] not in (e["source"], e["target"])
+        ]
+
+
+class TestIncrementalUpdates:
+
+    def test_from_workflow_matches_full_recompute(self):
+        workflow = _random_workflow()
+        index = WorkflowClusterIndex.from_workflow(workflow)
+        expected = compute_workflow_clusters(workflow)
+        snapshot = index.snapshot()
+        assert _members(snapshot) == _members(expected)
+        assert snapshot["centrality"] == expected["centrality"]
+
+    def test_additions_are_exact_without_rebuild(self):
+        workflow = _random_workflow()
+        index = WorkflowClusterIndex.from_workflow(workflow)
+        changes = [
+            ("add_node", {"id": "x1", "type": "llm"}),
+            ("add_edge", {"id": "ex1", "source": "x1", "target": "n3"}),
+            ("add_edge", {"id": "ex2", "source": "n10", "target": "n40"}),
+            ("update_node", {"id": "n10", "type": "operator"}),
+            ("move_node", {"id": "n3"}),
+        ]
+        for change_type, data in changes:
+            _apply(workflow, change_type, data)
+            index.apply_change(change_type, data)
+        workflow["nodes"][10]["type"] = "operator"
+
+        expected = compute_workflow_clusters(workflow)
+        assert index.is_consistent_with(workflow)
+        assert _members(index.snapshot()) == _members(expected)
+        assert index.snapshot()["centrality"] == expected["centrality"]
+        assert index.stats["rebuilds"] == 0 and index.drift == 0
+
+    def test_deletions_keep_centrality_exact_and_accumulate_drift(self):
+        workflow = _random_workflow()
+        index = WorkflowClusterIndex.from_workflow(workflow, min_drift=100)
+        for change_type, data in [("delete_edge", {"id": "e0"}), ("delete_node", {"id": "n5"})]:
+            _apply(workflow, change_type, data)
+            index.apply_change(change_type, data)
+
+        expected = compute_workflow_clusters(workflow)
+        assert index.is_consistent_with(workflow)
+        assert index.snapshot()["centrality"] == expected["centrality"]
+        assert index.drift == 2 and index.stats["rebuilds"] == 0
+        # 과병합만 허용: 전체 재계산의 각 클러스터는 인덱스 클러스터 하나에 포함
+        index_cluster = index.snapshot()["node_to_cluster"]
+        for cluster in expected["clusters"]:
+            assert len({index_cluster[m] for m in cluster["members"]}) == 1
+
+        index.rebuild()
+        assert _members(index.snapshot()) == _members(expected)
+
+    def test_drift_threshold_triggers_full_recompute(self):
+        workflow = _random_workflow(node_count=40, edge_count=30)
+        index = WorkflowClusterIndex.from_workflow(workflow, drift_threshold=0.05, min_drift=1)
+        for i in range(3):
+            _apply(workflow, "delete_edge", {"id": f"e{i}"})
+            index.apply_change("delete_edge", {"id": f"e{i}"})
+        assert index.stats["rebuilds"] == 1 and index.drift == 0
+        assert _members(index.snapshot()) == _members(compute_workflow_clusters(workflow))
+
+    def test_edge_delete_by_endpoints_and_unknown_events(self):
+        index = WorkflowClusterIndex.from_workflow({
+            "nodes": [{"id": "a"}, {"id": "b"}],
+            "edges": [{"source": "a", "target": "b"}, {"source": "a", "target": "b"}],
+        })
+        index.apply_change("delete_edge", {"source": "a", "target": "b"})
+        assert index.adjacency["a"] == {"b"}  # 병렬 엣지 하나가 남아 있음
+        index.apply_change("delete_edge", {"source": "a", "target": "b"})
+        assert index.adjacency["a"] == set() and index.centrality("a") == 0
+        index.apply_change("delete_edge", {"id": "missing"})
+        index.apply_change("group_nodes", {"node_ids": ["a", "b"]})
+        assert index.stats["ignored"] == 1 and index.edge_count == 0
+
+
+class TestConsistency:
+
+    def test_same_size_rewire_is_detected(self):
+        workflow = _random_workflow()
+        index = WorkflowClusterIndex.from_workflow(workflow)
+        assert index.is_consistent_with(copy.deepcopy(workflow))
+
+        rewired = copy.deepcopy(workflow)
+        rewired["edges"][0]["target"] = "n59" if rewired["edges"][0]["target"] != "n59" else "n58"
+        assert not index.is_consistent_with(rewired)
+        assert extract_focus_window(rewired, "n1 수정", max_nodes=5, cluster_index=index) == \
+            extract_focus_window(rewired, "n1 수정", max_nodes=5)
+
+        retyped = copy.deepcopy(workflow)
+        retyped["nodes"][0]["type"] = "trigger"
+        assert not index.is_consistent_with(retyped)
+
+    def test_fingerprint_tracks_incremental_changes_and_ignores_order(self):
+        workflow = _random_workflow()
+        index = WorkflowClusterIndex.from_workflow(workflow, min_drift=100)
+        for change_type, data in [
+            ("add_node", {"id": "x1", "type": "llm"}),
+            ("add_edge", {"id": "ex1", "source": "x1", "target": "n3"}),
+            ("delete_edge", {"id": "e4"}),
+            ("delete_node", {"id": "n7"}),
+        ]:
+            _apply(workflow, change_type, data)
+            index.apply_change(change_type, data)
+        index.apply_change("update_node", {"id": "n1", "type": "loop"})
+        workflow["nodes"][1]["type"] = "loop"
+
+        shuffled = {"nodes": list(reversed(workflow["nodes"])), "edges": list(reversed(workflow["edges"]))}
+        assert index.is_consistent_with(shuffled)
+
+    def test_edges_missing_an_endpoint_are_ignored(self):
+        workflow = _random_workflow()
+        workflow["edges"] += [{"id": "d1", "source": None, "target": "n1"}, {"id": "d2", "source": "n2"}]
+        index = WorkflowClusterIndex.from_workflow(workflow)
+        assert index.edge_count == len(workflow["edges"]) - 2
+        assert index.is_consistent_with(workflow)
+
+        index.apply_change("add_edge", {"id": "d3", "source": "n1", "target": None})
+        assert index.stats["ignored"] == 1 and index.is_consistent_with(workflow)
+        assert _members(index.snapshot()) == _members(compute_workflow_clusters(workflow))
+
+    def test_update_workflow_drops_index_of_another_workflow(self):
+        context = CodesignContext()
+        context.update_workflow(_random_workflow(seed=3))
+        index = context.get_cluster_index()
+
+        context.update_workflow(copy.deepcopy(context.current_workflow))
+        assert context.cluster_index is index
+
+        swapped = _random_workflow(seed=4)
+        context.update_workflow(swapped)
+        assert context.cluster_index is None
+        assert context.get_cluster_index().is_consistent_with(swapped)
+
+
+class TestCodesignWiring:
+
+    def test_stream_applies_each_change_once(self, monkeypatch):
+        monkeypatch.setattr(codesign_assistant, "_is_mock_mode", lambda: True)
+        session_id = "cluster-index-session"
+        workflow = _random_workflow()
+        context = codesign_assistant.get_or_create_context(session_id)
+        try:
+            context.update_workflow(copy.deepcopy(workflow))
+            index = context.get_cluster_index()
+
+            changes = [
+                {"type": "add_node", "data": {"id": "x1", "type": "llm"}},
+                {"type": "add_edge", "data": {"id": "ex1", "source": "x1", "target": "n3"}},
+            ]
+            for change in changes:
+                _apply(workflow, change["type"], change["data"])
+
+            async def drain():
+                async for _ in codesign_assistant.stream_codesign_response(
+                    "x1 연결", copy.deepcopy(workflow), recent_changes=changes, session_id=session_id
+                ):
+                    pass
+
+            asyncio.run(drain())
+            assert context.cluster_index is index
+            assert index.stats["incremental_updates"] == 2 and index.stats["ignored"] == 0
+            assert index.is_consistent_with(workflow)
+        finally:
+            codesign_assistant._session_contexts.pop(session_id, None)
+
+    def test_turn_checks_workflow_content_once(self, monkeypatch):
+        context = CodesignContext()
+        context.update_workflow(_random_workflow(node_count=200, edge_count=260))
+        context.get_cluster_index()
+
+        scans = []
+        original = WorkflowClusterIndex._content_fingerprint
+        monkeypatch.setattr(WorkflowClusterIndex, "_content_fingerprint",
+                            staticmethod(lambda nodes, edges: scans.append(1) or original(nodes, edges)))
+        workflow = copy.deepcopy(context.current_workflow)
+        context.record_user_change("move_node", {"id": "n1"})
+        context.update_workflow(workflow)
+        _summarize_workflow(context.current_workflow, user_request="n150 수정",
+                            cluster_index=context.get_cluster_index())
+        assert len(scans) == 1
+
+    def test_bedrock_summary_uses_focus_window(self):
+        workflow = _random_workflow(node_count=200, edge_count=260)
+        for node in workflow["nodes"]:
+            node["data"] = {"label": f"step {node['id']}"}
+        index = WorkflowClusterIndex.from_workflow(workflow)
+        summary = json.loads(_summarize_workflow(workflow, user_request="n150 노드 수정해줘", cluster_index=index))
+        focus = extract_focus_window(workflow, "n150 노드 수정해줘", max_nodes=10)
+
+        assert [n["id"] for n in summary["nodes"]] == [n["id"] for n in focus["focus_nodes"]]
+        assert len(summary["nodes"]) <= 10
+        assert "n150" in {n["id"] for n in summary["nodes"]}
+        assert summary["remaining_nodes"] == 200 - len(focus["focus_nodes"])
+        assert summary == json.loads(_summarize_workflow(workflow, user_request="n150 노드 수정해줘"))
+
+
+class TestFocusWindowIntegration:
+
+    def test_focus_window_identical_with_index(self):
+        workflow = _random_workflow(node_count=200, edge_count=260)
+        index = WorkflowClusterIndex.from_workflow(workflow)
+        for request in ("n7 노드 수정해줘", "add retry", "전체 구조 설명"):
+            assert extract_focus_window(workflow, request, cluster_index=index) == \
+                extract_focus_window(workflow, request)
+
+    def test_stale_index_is_ignored(self):
+        workflow = _random_workflow()
+        stale = WorkflowClusterIndex.from_workflow({"nodes": [], "edges": []})
+        workflow["metadata"] = {"_cluster_cache": {"clusters": []}}
+        assert get_cached_clusters(workflow, stale) == {"clusters": []}
+        assert extract_focus_window(workflow, "n1 수정", max_nodes=5, cluster_index=stale) == \
+            extract_focus_window(workflow, "n1 수정", max_nodes=5)
+
+    def test_codesign_context_applies_recorded_changes(self):
+        workflow = _random_workflow()
+        context = CodesignContext()
+        context.update_workflow(workflow)
+        index = context.get_cluster_index()
+
+        data = {"id": "new", "type": "llm"}
+        _apply(workflow, "add_node", data)
+        context.record_user_change("add_node", data)
+        assert context.get_cluster_index() is index
+        assert index.node_count == len(workflow["nodes"])
+
+        # 이벤트 없이 바뀐 워크플로우는 재구성
+        workflow["nodes"].append({"id": "untracked"})
+        assert context.get_cluster_index() is not index
@@ -0,0 +1,74 @@
+# -*- coding: utf-8 -*-
+"""Unit tests for the streaming PartialJSONParser in designer_service."""
+
+import json
+
+import pytest
+
+from src.services.design.designer_service import JSONL_DELIMITER, PartialJSONParser
+
+
+def _objects():
+    return [
+        {"type": "node", "data": {"id": f"n{i}", "label": 'a {b} "c" \\ d\n' + JSONL_DELIMITER}}
+        for i in range(6)
+    ]
+
+
+def _stream(objs, separator="\n", preamble=""):
+    return preamble + "".join(json.dumps(o, ensure_ascii=False) + separator for o in objs)
+
+
+def _feed_all(parser, text, chunk_size):
+    out = []
+    for pos in range(0, len(text), chunk_size):
+        out.extend(parser.feed(text[pos:pos + chunk_size]))
+    return out + parser.flush()
+
+
+class TestStreaming:
+
+    @pytest.mark.parametrize("chunk_size", [1, 2, 3, 7, 10, 4096])
+    @pytest.mark.parametrize("separator", ["\n", JSONL_DELIMITER, ""])
+    def test_any_chunking_yields_same_objects(self, chunk_size, separator):
+        text = _stream(_objects(), separator, preamble="Here is the updated workflow:\n")
+        assert _feed_all(PartialJSONParser(), text, chunk_size) == _objects()
+
+    def test_object_is_emitted_as_soon_as_it_closes(self):
+        parser = PartialJSONParser()
+        assert parser.feed('{"type": "node", "data": {') == []
+        assert parser.feed('"id": "a"}}') == [{"type": "node", "data": {"id": "a"}}]
+
+    def test_escape_split_across_chunks(self):
+        parser = PartialJSONParser()
+        assert parser.feed('{"label": "quote\\') == []
+        assert parser.feed('"}"}') == [{"label": 'quote"}'}]
+
+    def test_buffer_holds_only_unfinished_text(self):
+        parser = PartialJSONParser()
+        parser.feed('preamble {"a": 1}\n{"b": ')
+        assert parser.buffer == '{"b": '
+
+
+class TestRecovery:
+
+    def test_delimiter_discards_unterminated_object(self):
+        parser = PartialJSONParser()
+        assert parser.feed('{"a": {"unterminated": 1') == []
+        assert parser.feed(JSONL_DELIMITER + '{"b": 2}') == [{"b": 2}]
+
+    def test_partial_delimiter_at_chunk_boundary(self):
+        parser = PartialJSONParser()
+        half = len(JSONL_DELIMITER) // 2
+        assert parser.feed('{"a": 1' + JSONL_DELIMITER[:half]) == []
+        assert parser.feed(JSONL_DELIMITER[half:] + '{"b": 2}') == [{"b": 2}]
+
+    def test_invalid_balanced_span_does_not_stall(self):
+        parser = PartialJSONParser()
+        assert parser.feed('{not json}\n{"ok": true}') == [{"ok": True}]
+
+    def test_flush_resets_state(self):
+        parser = PartialJSONParser()
+        parser.feed('{"a": "open')
+        assert parser.flush() == []
+        assert parser.feed('{"b": 1}') == [{"b": 1}]
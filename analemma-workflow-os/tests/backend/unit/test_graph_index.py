@@ -0,0 +1,133 @@
+# -*- coding: utf-8 -*-
+"""Unit tests for the shared WorkflowGraphIndex used by graph_dsl validators and CycleDetector."""
+
+import random
+
+import pytest
+
+from src.common.graph_dsl import (
+    INTENTIONAL_LOOP_NODE_TYPES,
+    WorkflowGraphIndex,
+    _count_parallel_branches,
+    _detect_cycles_with_intent,
+    _find_orphan_nodes,
+    get_graph_index,
+    validate_workflow,
+    validate_workflow_complexity,
+)
+from src.services.partitioning.cycle_detector import CycleDetector, IllegalCycleError
+
+
+def _random_workflow(seed, node_count=30):
+    rng = random.Random(seed)
+    types = ["operator", "llm_chat", "parallel", "conditional", "for_each", "loop"]
+    nodes = [{"id": f"n{rng.randrange(node_count + 2)}", "type": rng.choice(types), "position": {}}
+             for _ in range(node_count)]
+    edges = [{"id": f"e{rng.randrange(40)}",
+              "source": f"n{rng.randrange(node_count + 2)}",
+              "target": f"n{rng.randrange(node_count + 2)}"}
+             for _ in range(rng.randrange(node_count * 2))]
+    return {"nodes": nodes, "edges": edges}
+
+
+def _is_cycle(index, path):
+    return path[0] == path[-1] and all(
+        path[i + 1] in index.successors[path[i]] for i in range(len(path) - 1)
+    )
+
+
+class TestSharedIndex:
+
+    def test_validators_identical_with_and_without_index(self):
+        for seed in range(40):
+            workflow = _random_workflow(seed)
+            nodes, edges = workflow["nodes"], workflow["edges"]
+            index = WorkflowGraphIndex.from_workflow(workflow)
+
+            assert validate_workflow(workflow, index=index) == validate_workflow(workflow)
+            assert sorted(_find_orphan_nodes(nodes, edges, index=index)) == \
+                sorted(_find_orphan_nodes(nodes, edges))
+            assert _count_parallel_branches(nodes, edges, index=index) == \
+                _count_parallel_branches(nodes, edges)
+            shared = validate_workflow_complexity(workflow, index=index)
+            separate = validate_workflow_complexity(workflow)
+            assert shared.metrics == separate.metrics
+            assert shared.errors == separate.errors and shared.warnings == separate.warnings
+
+    def test_stale_index_is_rebuilt(self):
+        workflow = {"nodes": [{"id": "a"}, {"id": "b"}], "edges": []}
+        index = get_graph_index(workflow)
+        assert get_graph_index(workflow, index) is index
+
+        workflow["edges"].append({"id": "ab", "source": "a", "target": "b"})
+        assert get_graph_index(workflow, index) is not index
+        assert _find_orphan_nodes(workflow["nodes"], workflow["edges"], index=index) == []
+
+
+class TestCycles:
+
+    def test_mixed_component_reports_intentional_and_accidental(self):
+        # loop → a → loop (의도적) 과 a → b → a (제어 노드 우회, 설계 실수)가 같은 SCC
+        nodes = [{"id": "loop", "type": "loop"}, {"id": "a"}, {"id": "b"}]
+        edges = [
+            {"source": "loop", "target": "a"}, {"source": "a", "target": "loop"},
+            {"source": "a", "target": "b"}, {"source": "b", "target": "a"},
+        ]
+        intentional, accidental = _detect_cycles_with_intent(nodes, edges, INTENTIONAL_LOOP_NODE_TYPES)
+        assert intentional == [{"path": ["loop", "a", "loop"], "control_node": "loop"}]
+        assert accidental == [["a", "b", "a"]]
+
+    def test_one_cycle_per_component_and_self_loops(self):
+        nodes = [{"id": n} for n in "abcde"]
+        edges = [{"source": s, "target": t} for s, t in ("ab", "bc", "ca", "ba", "dd")]
+        index = WorkflowGraphIndex(nodes, edges)
+        cycles = index.find_cycles()
+        assert cycles == [["a", "b", "a"], ["d", "d"]]
+        assert all(_is_cycle(index, c) for c in cycles)
+        assert not index.is_acyclic() and index.topological_order() is None
+
+    def test_deep_chain_has_no_recursion_limit(self):
+        count = 5000
+        nodes = [{"id": f"n{i}", "type": "operator"} for i in range(count)]
+        edges = [{"source": f"n{i - 1}", "target": f"n{i}"} for i in range(1, count)]
+        index = WorkflowGraphIndex(nodes, edges)
+        assert index.find_cycles() == [] and len(index.topological_order()) == count
+
+        edges.append({"source": f"n{count - 1}", "target": "n0"})
+        _, accidental = _detect_cycles_with_intent(nodes, edges, INTENTIONAL_LOOP_NODE_TYPES)
+        assert len(accidental) == 1 and len(accidental[0]) == count + 1
+
+
+class TestCycleDetector:
+
+    def _workflow(self):
+        nodes = [
+            {"id": "start", "type": "operator"},
+            {"id": "loop", "type": "loop", "config": {"nodes": [{"id": "inner"}]}},
+            {"id": "inner", "type": "llm_chat"},
+            {"id": "end", "type": "operator"},
+        ]
+        edges = [
+            {"source": "start", "target": "loop"},
+            {"source": "loop", "target": "inner"},
+            {"source": "inner", "target": "loop"},  # loop 내부 순환 (허용)
+            {"source": "loop", "target": "end"},
+        ]
+        return nodes, edges
+
+    def test_reuses_shared_index_and_excludes_loop_internals(self):
+        nodes, edges = self._workflow()
+        index = WorkflowGraphIndex(nodes, edges)
+        detector = CycleDetector(nodes, edges, index=index)
+        assert detector.index is index
+        assert detector.detect_illegal_cycles() == []
+
+        order = detector.get_topological_order()
+        assert sorted(order) == sorted(n["id"] for n in nodes)
+        assert order.index("start") < order.index("loop") < order.index("end")
+
+    def test_illegal_cycle_raises(self):
+        nodes, edges = self._workflow()
+        edges.append({"source": "end", "target": "start"})
+        with pytest.raises(IllegalCycleError, match="start → loop → end → start"):
+            CycleDetector(nodes, edges).get_topological_order()
@@ -1,19 +1,28 @@
 # -*- coding: utf-8 -*-
 """Unit tests for incremental dirty-key hashing (Phase 3)."""
 
+import hashlib
+
 import pytest
 
 from src.common.hash_utils import (
+    STREAM_CONTAINER_MIN_ITEMS,
     HOT_FIELDS,
     WARM_FIELDS,
     COLD_FIELDS,
     SubBlockHashRegistry,
+    _canonical_bytes,
+    _iter_canonical_chunks,
     classify_field_block,
     content_hash,
     streaming_content_hash,
 )
 
 
+def _full_root(state):
+    return SubBlockHashRegistry().compute_incremental_root(state, set(state))[0]
+
+
 # ── classify_field_block ─────────────────────────────────────────────────────
 
 class TestClassifyFieldBlock:
@@ -178,3 +187,77 @@ class TestHashConsistency:
         assert ch != sh  # Intentionally different wire formats
         assert len(ch) == 64
         assert len(sh) == 64
+
+
+# ── Large-container streaming ────────────────────────────────────────────────
+
+class TestStreamingChunks:
+
+    def test_chunks_are_byte_identical_to_canonical_json(self):
+        n = STREAM_CONTAINER_MIN_ITEMS * 2
+        data = {
+            f"k{i:03d}é": {"items": list(range(n)), "nested": {f"z{j}": j for j in range(n)}, "t": (1, 2)}
+            for i in range(n)
+        }
+        assert b"".join(_iter_canonical_chunks(data)) == _canonical_bytes(data)
+
+    def test_stream_failure_falls_back_like_canonical_bytes(self):
+        big = {f"k{i}": i for i in range(STREAM_CONTAINER_MIN_ITEMS)}
+        big["bad"] = object()  # 직렬화 불가 → repr() fallback
+        mixed = {i: i for i in range(STREAM_CONTAINER_MIN_ITEMS)}
+        mixed["s"] = 1  # str/int 혼합 키 → sort 실패
+        for value in (big, mixed):
+            expected = hashlib.sha256(b"v:" + _canonical_bytes(value) + b",").hexdigest()
+            assert streaming_content_hash({"v": value}) == expected
+
+
+# ── Block-field index ────────────────────────────────────────────────────────
+
+class TestBlockFieldIndex:
+
+    def test_unclassified_change_matches_full_recompute(self):
+        state = {"llm_response": "a", "step_history": [1], "custom_key": 1}
+        registry = SubBlockHashRegistry()
+        registry.compute_incremental_root(state, set(state))
+        state["custom_key"] = 2
+        root, hashes = registry.compute_incremental_root(state, {"custom_key"})
+        assert root == _full_root(state)
+        assert "unclassified" in hashes
+
+    def test_index_follows_added_and_removed_keys(self):
+        state = {"llm_response": "a", "custom_key": 1}
+        registry = SubBlockHashRegistry()
+        registry.compute_incremental_root(state, set(state))
+
+        state["total_tokens"] = 7
+        del state["custom_key"]
+        root, hashes = registry.compute_incremental_root(state, {"total_tokens", "custom_key"})
+        assert root == _full_root(state)
+        assert "unclassified" not in hashes and "warm" not in hashes
+        assert registry._extract_block_fields(state, "hot") == {"llm_response": "a", "total_tokens": 7}
+
+    def test_unreported_key_changes_rebuild_the_index(self):
+        state = {"llm_response": "a", "total_tokens": 1}
+        registry = SubBlockHashRegistry()
+        registry.compute_incremental_root(state, set(state))
+
+        state["usage"] = {"in": 1}  # dirty_keys에 보고되지 않은 추가 (크기 불일치)
+        assert registry.compute_incremental_root(state, {"llm_response"})[0] == _full_root(state)
+
+        del state["usage"]
+        state["token_usage"] = 3  # 보고되지 않은 키 교체
+        del state["total_tokens"]
+        state["total_input_tokens"] = 4
+        assert registry.compute_incremental_root(state, {"llm_response"})[0] == _full_root(state)
+
+    def test_parallel_groups_match_serial_incrementally(self):
+        state = {f"node_{i}": i for i in range(50)}
+        state.update({"llm_response": "a", "ownerId": "o", "workflow_config": {}})
+        serial, parallel = SubBlockHashRegistry(), SubBlockHashRegistry()
+        serial.compute_incremental_root(state, set(state))
+        parallel.compute_incremental_root_parallel(state, set(state), max_workers=4)
+        state["node_3"] = -1
+        state["llm_response"] = "b"
+        dirty = {"node_3", "llm_response"}
+        assert serial.compute_incremental_root(state, dirty) == \
+            parallel.compute_incremental_root_parallel(state, dirty, max_workers=4)
@@ -194,3 +194,118 @@ class TestInstructionDistillerLogic:
         assert "Rule A" in merged # Keeps existing casing
         assert "Rule B" in merged
 
+
+
+class TestActiveInstructionCache:
+
+    @pytest.fixture(autouse=True)
+    def reset_cache(self):
+        instruction_distiller._active_instruction_cache.clear()
+        instruction_distiller._usage_count_buffer.clear()
+        instruction_distiller._pending_usage_total = 0
+        for key in instruction_distiller._active_instruction_cache_stats:
+            instruction_distiller._active_instruction_cache_stats[key] = 0
+        yield
+        instruction_distiller._active_instruction_cache.clear()
+        instruction_distiller._usage_count_buffer.clear()
+        instruction_distiller._pending_usage_total = 0
+
+    @staticmethod
+    def _latest_and_item(sk="node-1#20260101000000", weight="1.0"):
+        return {
+            "LATEST#node-1": {"Item": {"latest_instruction_sk": sk}},
+            sk: {"Item": {
+                "is_active": True,
+                "weighted_instructions": [{"text": "Be concise", "weight": Decimal(weight)}],
+            }},
+        }
+
+    def _wire_table(self, mock_table, records):
+        mock_table.get_item.side_effect = lambda Key: records.get(Key["sk"], {})
+
+    def test_second_lookup_served_from_cache(self, mock_aws_clients):
+        _, _, mock_table = mock_aws_clients
+        self._wire_table(mock_table, self._latest_and_item())
+
+        first = instruction_distiller.get_active_instructions("user-1", "wf-1", "node-1")
+        second = instruction_distiller.get_active_instructions("user-1", "wf-1", "node-1")
+
+        assert first == second == ["Be concise"]
+        assert mock_table.get_item.call_count == 2  # pointer + record, once
+        stats = instruction_distiller.get_active_instruction_cache_stats()
+        assert stats["hits"] == 1 and stats["misses"] == 1
+        assert stats["hit_ratio"] == 0.5
+
+    def test_missing_instructions_are_cached(self, mock_aws_clients):
+        _, _, mock_table = mock_aws_clients
+        self._wire_table(mock_table, {})
+
+        for _ in range(3):
+            assert instruction_distiller.get_active_instructions("user-1", "wf-1", "node-1") == []
+
+        assert mock_table.get_item.call_count == 1
+
+    def test_usage_counts_are_buffered_and_flushed_in_batch(self, mock_aws_clients):
+        _, _, mock_table = mock_aws_clients
+        self._wire_table(mock_table, self._latest_and_item())
+
+        for _ in range(5):
+            instruction_distiller.get_active_instructions("user-1", "wf-1", "node-1")
+
+        mock_table.update_item.assert_not_called()
+        assert instruction_distiller.get_active_instruction_cache_stats()["pending_usage_increments"] == 5
+
+        flushed = instruction_distiller.flush_instruction_usage_counts()
+
+        assert flushed == 1
+        mock_table.update_item.assert_called_once()
+        assert mock_table.update_item.call_args[1]["ExpressionAttributeValues"] == {":inc": 5}
+
+    def test_usage_flush_triggered_by_threshold(self, mock_aws_clients):
+        _, _, mock_table = mock_aws_clients
+        self._wire_table(mock_table, self._latest_and_item())
+
+        with patch.object(instruction_distiller, "USAGE_FLUSH_THRESHOLD", 3):
+            for _ in range(3):
+                instruction_distiller.get_active_instructions("user-1", "wf-1", "node-1")
+
+        assert mock_table.update_item.call_args[1]["ExpressionAttributeValues"] == {":inc": 3}
+
+    def test_handler_flushes_pending_usage_on_exit(self, mock_aws_clients):
+        _, _, mock_table = mock_aws_clients
+        self._wire_table(mock_table, self._latest_and_item())
+        for _ in range(2):
+            instruction_distiller.get_active_instructions("user-1", "wf-1", "node-1")
+        mock_table.update_item.assert_not_called()
+
+        response = instruction_distiller.lambda_handler({"detail": {"execution_id": "exec-1"}}, None)
+
+        assert response["statusCode"] == 400
+        assert mock_table.update_item.call_args[1]["ExpressionAttributeValues"] == {":inc": 2}
+        assert instruction_distiller.get_active_instruction_cache_stats()["pending_usage_increments"] == 0
+
+    def test_new_version_invalidates_entry(self, mock_aws_clients):
+        _, _, mock_table = mock_aws_clients
+        self._wire_table(mock_table, self._latest_and_item())
+        instruction_distiller.get_active_instructions("user-1", "wf-1", "node-1")
+
+        # Re-writing the same version keeps the entry
+        instruction_distiller.invalidate_active_instructions(
+            "user-1", "wf-1", "node-1", new_latest_sk="node-1#20260101000000"
+        )
+        assert ("user-1", "wf-1", "node-1") in instruction_distiller._active_instruction_cache
+
+        instruction_distiller.invalidate_active_instructions(
+            "user-1", "wf-1", "node-1", new_latest_sk="node-1#20260202000000"
+        )
+        assert ("user-1", "wf-1", "node-1") not in instruction_distiller._active_instruction_cache
+
+    def test_expired_entry_is_reloaded(self, mock_aws_clients):
+        _, _, mock_table = mock_aws_clients
+        self._wire_table(mock_table, self._latest_and_item())
+
+        with patch.object(instruction_distiller, "ACTIVE_INSTRUCTION_CACHE_TTL_SECONDS", 0):
+            instruction_distiller.get_active_instructions("user-1", "wf-1", "node-1")
+            instruction_distiller.get_active_instructions("user-1", "wf-1", "node-1")
+
+        assert mock_table.get_item.call_count == 4
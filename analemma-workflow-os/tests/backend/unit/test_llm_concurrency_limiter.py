@@ -0,0 +1,197 @@
+# -*- coding: utf-8 -*-
+"""Unit tests for the AIMD LLM concurrency limiter and its provider wiring."""
+
+import threading
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.services.llm import concurrency_limiter
+from src.services.llm.concurrency_limiter import (
+    OUTCOME_ERROR,
+    OUTCOME_SUCCESS,
+    OUTCOME_THROTTLED,
+    AdaptiveConcurrencyLimiter,
+    ConcurrencyLimitTimeout,
+    get_concurrency_limiter,
+    get_concurrency_limiter_stats,
+    is_throttle_error,
+    reset_concurrency_limiters,
+)
+
+
+@pytest.fixture(autouse=True)
+def _fresh_registry():
+    reset_concurrency_limiters()
+    yield
+    reset_concurrency_limiters()
+
+
+@pytest.fixture
+def make_limiter(fake_clock):
+    def make(**kwargs):
+        kwargs.setdefault("clock", fake_clock)
+        return AdaptiveConcurrencyLimiter("test/model", **kwargs)
+    return make
+
+
+def _complete(limiter, outcome=OUTCOME_SUCCESS, latency=1.0):
+    ticket = limiter.acquire()
+    limiter._clock.now += latency
+    limiter.release(ticket, outcome)
+
+
+class TestAimd:
+
+    def test_additive_increase_while_saturated(self, make_limiter):
+        limiter = make_limiter(initial_limit=4)
+        tickets = [limiter.acquire() for _ in range(4)]
+        limiter._clock.now += 1.0
+        for ticket in tickets:
+            limiter.release(ticket, OUTCOME_SUCCESS)
+        # 한도만큼의 성공 ≈ +1 (한도 절반 미만이던 첫 호출은 제외)
+        assert limiter.limit == 4 and 4.5 < limiter._limit < 5
+
+    def test_idle_success_does_not_grow_limit(self, make_limiter):
+        limiter = make_limiter(initial_limit=10)
+        for _ in range(20):
+            _complete(limiter)  # in_flight 1 < limit/2
+        assert limiter._limit == 10
+
+    def test_throttle_halves_once_per_congestion_window(self, make_limiter):
+        limiter = make_limiter(initial_limit=16)
+        tickets = [limiter.acquire() for _ in range(8)]
+        limiter._clock.now += 1.0
+        for ticket in tickets:
+            limiter.release(ticket, OUTCOME_THROTTLED)
+        assert limiter._limit == 8  # 동시에 시작된 호출들의 429는 1회만 감소
+        assert limiter.get_stats()["throttled"] == 8
+        assert limiter.get_stats()["decreases"] == 1
+
+        _complete(limiter, OUTCOME_THROTTLED)  # 감소 이후 시작된 호출
+        assert limiter._limit == 4
+
+    def test_limit_respects_bounds(self, make_limiter):
+        limiter = make_limiter(initial_limit=2, min_limit=1)
+        for _ in range(5):
+            _complete(limiter, OUTCOME_THROTTLED)
+        assert limiter._limit == 1
+
+        limiter = make_limiter(initial_limit=2, max_limit=3)
+        for _ in range(50):
+            tickets = [limiter.acquire(), limiter.acquire()]
+            for ticket in tickets:
+                limiter.release(ticket, OUTCOME_SUCCESS)
+        assert limiter._limit == 3
+
+    def test_latency_spike_decreases_gently(self, make_limiter):
+        limiter = make_limiter(initial_limit=10, latency_tolerance=2.0)
+        _complete(limiter, latency=1.0)
+        _complete(limiter, latency=5.0)
+        assert limiter._limit == pytest.approx(9.0)
+        assert limiter.get_stats()["latency_spikes"] == 1
+
+    def test_non_throttle_error_keeps_limit(self, make_limiter):
+        limiter = make_limiter(initial_limit=4)
+        _complete(limiter, OUTCOME_ERROR)
+        assert limiter._limit == 4
+
+
+class TestQueueing:
+
+    def test_excess_calls_wait_for_a_slot(self):
+        limiter = AdaptiveConcurrencyLimiter("q", initial_limit=2, max_limit=2)
+        peak = [0]
+        active = [0]
+        lock = threading.Lock()
+
+        def call():
+            with limiter.slot():
+                with lock:
+                    active[0] += 1
+                    peak[0] = max(peak[0], active[0])
+                time.sleep(0.01)
+                with lock:
+                    active[0] -= 1
+
+        threads = [threading.Thread(target=call) for _ in range(10)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert peak[0] == 2
+        stats = limiter.get_stats()
+        assert stats["acquired"] == 10 and stats["queued"] > 0
+        assert stats["in_flight"] == 0 and stats["waiting"] == 0
+
+    def test_queue_timeout(self):
+        limiter = AdaptiveConcurrencyLimiter("q", initial_limit=1)
+        ticket = limiter.acquire()
+        with pytest.raises(ConcurrencyLimitTimeout):
+            limiter.acquire(timeout=0.02)
+        limiter.release(ticket)
+        assert limiter.get_stats()["queue_timeouts"] == 1
+        limiter.release(limiter.acquire(timeout=0.02))
+
+    def test_slot_classifies_exceptions(self, make_limiter):
+        limiter = make_limiter(initial_limit=8)
+        with pytest.raises(RuntimeError):
+            with limiter.slot():
+                raise RuntimeError("429 Resource exhausted: Quota exceeded")
+        with pytest.raises(ValueError):
+            with limiter.slot():
+                raise ValueError("invalid response_schema")
+        stats = limiter.get_stats()
+        assert stats["throttled"] == 1 and stats["decreases"] == 1
+        assert stats["in_flight"] == 0
+
+
+class TestRegistryAndWiring:
+
+    def test_throttle_detection(self):
+        class ThrottlingException(Exception):
+            pass
+
+        assert is_throttle_error(ThrottlingException("Rate exceeded"))
+        assert is_throttle_error(Exception("429 Too Many Requests"))
+        assert not is_throttle_error(Exception("connection reset"))
+
+    def test_registry_is_per_provider_and_model(self):
+        a = get_concurrency_limiter("gemini", "gemini-2.0-flash")
+        assert get_concurrency_limiter("gemini", "gemini-2.0-flash") is a
+        assert get_concurrency_limiter("gemini", "gemini-1.5-pro") is not a
+        assert get_concurrency_limiter("bedrock", "gemini-2.0-flash") is not a
+        assert set(get_concurrency_limiter_stats()) == {
+            "gemini/gemini-2.0-flash", "gemini/gemini-1.5-pro", "bedrock/gemini-2.0-flash",
+        }
+
+    def test_bedrock_service_call_goes_through_limiter(self, monkeypatch):
+        from src.services.llm import bedrock_service
+
+        monkeypatch.setattr(concurrency_limiter, "LLM_CONCURRENCY_LIMITER_ENABLED", True)
+        service = bedrock_service.BedrockService()
+        monkeypatch.setattr(service, "is_mock_mode", lambda: False)
+        client = MagicMock()
+        seen_in_flight = []
+
+        def invoke_model(body, modelId):
+            seen_in_flight.append(get_concurrency_limiter("bedrock", modelId).in_flight)
+            response = MagicMock()
+            response["body"].read.return_value = b'{"content": [{"text": "ok"}]}'
+            return response
+
+        client.invoke_model.side_effect = invoke_model
+        service._client = client
+
+        assert service.invoke_model("anthropic.claude-3-haiku", "hi") == {"content": [{"text": "ok"}]}
+        assert seen_in_flight == [1]
+        stats = get_concurrency_limiter_stats()["bedrock/anthropic.claude-3-haiku"]
+        assert stats["acquired"] == 1 and stats["in_flight"] == 0
+
+    def test_disabled_flag_bypasses_limiter(self, monkeypatch):
+        monkeypatch.setattr(concurrency_limiter, "LLM_CONCURRENCY_LIMITER_ENABLED", False)
+        with concurrency_limiter.provider_slot("gemini", "m"):
+            pass
+        assert get_concurrency_limiter_stats() == {}
@@ -0,0 +1,177 @@
+# -*- coding: utf-8 -*-
+"""Unit tests for single-flight coalescing of identical deterministic LLM calls."""
+
+import threading
+import time
+
+import pytest
+
+from src.services.llm.request_coalescer import (
+    SOURCE_CACHE,
+    SOURCE_COALESCED,
+    SOURCE_PROVIDER,
+    LLMRequestCoalescer,
+    clear_coalescing_state,
+    coalescing_key,
+    get_execution_token_report,
+    is_deterministic,
+)
+
+USAGE = {"input_tokens": 100, "output_tokens": 20, "total_tokens": 120, "estimated_cost_usd": 0.001}
+
+
+def _run_concurrently(n, fn):
+    barrier = threading.Barrier(n)
+    results = [None] * n
+
+    def worker(i):
+        barrier.wait()
+        results[i] = fn()
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(n)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    return results
+
+
+class TestCoalescer:
+
+    def test_key_and_determinism(self):
+        base = coalescing_key("gemini", "m", {"temperature": 0, "max_tokens": 10}, "sys", "hi")
+        assert base == coalescing_key("gemini", "m", {"max_tokens": 10, "temperature": 0}, "sys", "hi")
+        assert base != coalescing_key("gemini", "m", {"temperature": 0, "max_tokens": 11}, "sys", "hi")
+        assert base != coalescing_key("gemini", "m", {"temperature": 0, "max_tokens": 10}, None, "hi")
+        assert base != coalescing_key("bedrock", "m", {"temperature": 0, "max_tokens": 10}, "sys", "hi")
+        assert is_deterministic(0) and is_deterministic("0.0")
+        assert not is_deterministic(0.2) and not is_deterministic(None) and not is_deterministic("x")
+
+    def test_concurrent_identical_calls_share_one_request(self):
+        coalescer = LLMRequestCoalescer()
+        calls = []
+
+        def invoke():
+            calls.append(1)
+            time.sleep(0.05)
+            return {"content": [{"text": "answer"}]}
+
+        results = _run_concurrently(8, lambda: coalescer.execute("ex1", "k", invoke))
+
+        assert len(calls) == 1
+        sources = sorted(source for _, source in results)
+        assert sources == [SOURCE_COALESCED] * 7 + [SOURCE_PROVIDER]
+        assert all(result == {"content": [{"text": "answer"}]} for result, _ in results)
+        assert len({id(result) for result, _ in results}) == 8  # 공유본이 아닌 사본
+
+    def test_scope_is_per_execution(self):
+        coalescer = LLMRequestCoalescer(cache_ttl_s=60)
+        calls = []
+        coalescer.execute("ex1", "k", lambda: calls.append(1) or "a")
+        _, source = coalescer.execute("ex2", "k", lambda: calls.append(1) or "a")
+        assert source == SOURCE_PROVIDER and len(calls) == 2
+
+    def test_leader_error_reaches_followers_and_is_not_cached(self):
+        coalescer = LLMRequestCoalescer(cache_ttl_s=60)
+
+        def failing():
+            time.sleep(0.05)
+            raise RuntimeError("429 Resource exhausted")
+
+        def call():
+            try:
+                coalescer.execute("ex1", "k", failing)
+            except RuntimeError as e:
+                return str(e)
+
+        assert _run_concurrently(4, call) == ["429 Resource exhausted"] * 4
+        _, source = coalescer.execute("ex1", "k", lambda: "ok")
+        assert source == SOURCE_PROVIDER
+
+    def test_ttl_cache(self, fake_clock):
+        clock = fake_clock
+        coalescer = LLMRequestCoalescer(cache_ttl_s=30, clock=clock)
+        coalescer.execute("ex1", "k", lambda: "first")
+        clock.now = 29
+        assert coalescer.execute("ex1", "k", lambda: "second") == ("first", SOURCE_CACHE)
+        clock.now = 31
+        assert coalescer.execute("ex1", "k", lambda: "second") == ("second", SOURCE_PROVIDER)
+        assert LLMRequestCoalescer().execute("ex1", "k", lambda: "x")[1] == SOURCE_PROVIDER
+
+    def test_accounting_before_and_after(self):
+        coalescer = LLMRequestCoalescer()
+        assert coalescer.account("ex1", SOURCE_PROVIDER, USAGE) is USAGE
+        follower = coalescer.account("ex1", SOURCE_COALESCED, USAGE)
+        coalescer.account("ex1", SOURCE_CACHE, USAGE)
+
+        assert follower["total_tokens"] == 0 and follower["estimated_cost_usd"] == 0.0
+        assert follower["coalesced_tokens"] == 120 and follower["cost_saved_usd"] == pytest.approx(0.001)
+        report = coalescer.get_execution_token_report("ex1")
+        assert report["llm_calls"] == 3 and report["provider_calls"] == 1
+        assert (report["coalesced"], report["cache_hits"]) == (1, 1)
+        assert (report["tokens_before"], report["tokens_after"], report["tokens_saved"]) == (360, 120, 240)
+        assert report["cost_saved_usd"] == pytest.approx(0.002)
+
+
+class TestLlmChatRunnerCoalescing:
+
+    @pytest.fixture
+    def runner(self, monkeypatch):
+        from src.handlers.core import main
+
+        clear_coalescing_state()
+        monkeypatch.setenv("MOCK_MODE", "false")
+        calls = []
+
+        def fake_bedrock(model_id, system_prompt, user_prompt, max_tokens=None,
+                         temperature=None, read_timeout_seconds=None):
+            calls.append((user_prompt, temperature))
+            time.sleep(0.05)
+            return {"content": [{"text": "answer"}], "usage": {"input_tokens": 100, "output_tokens": 20}}
+
+        monkeypatch.setattr(main, "invoke_bedrock_model", fake_bedrock)
+        yield main.llm_chat_runner, calls
+        clear_coalescing_state()
+
+    @staticmethod
+    def _config(**overrides):
+        config = {"id": "summarize", "type": "llm_chat", "provider": "bedrock", "model": "claude-3-haiku",
+                  "prompt": "Summarize {{item}} in one line", "temperature": 0,
+                  "coalesce_identical_requests": True}
+        config.update(overrides)
+        return config
+
+    def test_branches_with_identical_prompts_make_one_provider_call(self, runner):
+        llm_chat_runner, calls = runner
+        outputs = _run_concurrently(
+            5, lambda: llm_chat_runner({"execution_id": "exec-1", "item": "doc"}, self._config()))
+
+        assert len(calls) == 1 and calls[0][1] == 0  # temperature 0이 기본값으로 바뀌지 않음
+        assert all(o["summarize_output"] == "answer" for o in outputs)
+        assert sorted(o["summarize_meta"]["coalesced"] for o in outputs) == ["coalesced"] * 4 + ["provider"]
+        assert sum(o["usage"]["total_tokens"] for o in outputs) == 120
+        report = get_execution_token_report("exec-1")
+        assert (report["tokens_before"], report["tokens_after"]) == (600, 120)
+
+    def test_non_deterministic_or_unscoped_calls_are_not_coalesced(self, runner):
+        llm_chat_runner, calls = runner
+        _run_concurrently(3, lambda: llm_chat_runner(
+            {"execution_id": "exec-2", "item": "doc"}, self._config(temperature=0.7)))
+        _run_concurrently(3, lambda: llm_chat_runner({"item": "doc"}, self._config()))
+        _run_concurrently(3, lambda: llm_chat_runner(
+            {"execution_id": "exec-2", "item": "doc"}, self._config(coalesce_identical_requests=False)))
+        assert len(calls) == 9
+
+    def test_requested_tokens_count_every_call(self, runner):
+        llm_chat_runner, _ = runner
+        first = llm_chat_runner({"execution_id": "exec-3", "item": "doc"}, self._config(temperature=0.7))
+        summary = first["_kernel_execution_summary"]
+        assert summary["total_llm_tokens_requested"] == summary["total_llm_tokens"] == 120
+
+        state = {"execution_id": "exec-3", "item": "doc", "_kernel_execution_summary": summary}
+        outputs = _run_concurrently(3, lambda: llm_chat_runner(dict(state), self._config()))
+
+        # 이전 요약(비합치기 120) 위에 누적 — 합쳐진 호출도 요청 토큰은 120
+        summaries = [o["_kernel_execution_summary"] for o in outputs]
+        assert [s["total_llm_tokens_requested"] for s in summaries] == [240] * 3
+        assert sorted(s["total_llm_tokens"] for s in summaries) == [120, 120, 240]
@@ -0,0 +1,183 @@
+# -*- coding: utf-8 -*-
+"""Unit tests for the durable, content-addressed LLM response store."""
+
+import gzip
+import json
+import time
+
+import boto3
+import pytest
+from moto import mock_aws
+
+from src.services.llm import response_store
+from src.services.llm.request_coalescer import clear_coalescing_state, get_execution_token_report
+from src.services.llm.response_store import (
+    InMemoryResponseBackend,
+    LLMResponseStore,
+    S3ResponseBackend,
+    resolve_cache_ttl,
+    response_key,
+)
+
+RESPONSE = {"content": [{"text": "answer"}], "usage": {"input_tokens": 100, "output_tokens": 20}}
+KEY = response_key("bedrock", "m", {"temperature": 0}, "sys", "hello")
+
+
+class TestResponseStore:
+
+    def test_key_is_content_addressed(self):
+        assert KEY == response_key("bedrock", "m", {"temperature": 0}, "sys", "hello")
+        assert KEY != response_key("bedrock", "m", {"temperature": 0}, "sys", "hello!")
+        assert len(KEY) == 64
+        assert LLMResponseStore.object_key("wf-1", KEY) == f"merkle-blocks/wf-1/llm-responses/{KEY[:2]}/{KEY}.json"
+
+    def test_round_trip_and_workflow_scope(self):
+        store = LLMResponseStore(InMemoryResponseBackend())
+        assert store.get("wf-1", KEY, 60) is None
+        assert store.put("wf-1", KEY, RESPONSE, 60, "bedrock", "m")
+        assert store.get("wf-1", KEY, 60) == RESPONSE
+        assert store.get("wf-2", KEY, 60) is None
+        stats = store.get_stats()
+        assert (stats["hits"], stats["misses"], stats["writes"]) == (1, 2, 1)
+
+    def test_ttl_uses_current_workflow_setting(self, fake_clock):
+        clock = fake_clock
+        clock.now = 1_000_000.0
+        store = LLMResponseStore(InMemoryResponseBackend(), clock=clock)
+        store.put("wf-1", KEY, RESPONSE, 3600, "bedrock", "m")
+        clock.now += 600
+        assert store.get("wf-1", KEY, 3600) == RESPONSE
+        assert store.get("wf-1", KEY, 300) is None  # 워크플로우 TTL 단축 즉시 반영
+        clock.now += 3600
+        assert store.get("wf-1", KEY, 86400) is None  # 저장 시 TTL을 넘길 수 없음
+        assert store.get_stats()["expired"] == 2
+
+    def test_backend_failures_degrade_to_miss(self):
+        class Broken:
+            def get(self, object_key):
+                raise RuntimeError("s3 down")
+
+            def put(self, object_key, body, metadata):
+                raise RuntimeError("s3 down")
+
+        store = LLMResponseStore(Broken())
+        assert store.get("wf-1", KEY, 60) is None
+        assert store.put("wf-1", KEY, RESPONSE, 60, "bedrock", "m") is False
+        stats = store.get_stats()
+        assert (stats["read_errors"], stats["write_errors"]) == (1, 1)
+
+    def test_s3_backend_stores_next_to_merkle_blocks(self):
+        with mock_aws():
+            s3 = boto3.client("s3", region_name="us-east-1")
+            s3.create_bucket(Bucket="state-bucket")
+            store = LLMResponseStore(S3ResponseBackend("state-bucket", s3_client=s3))
+
+            assert store.get("wf-1", KEY, 60) is None
+            store.put("wf-1", KEY, RESPONSE, 60, "bedrock", "m")
+            assert store.get("wf-1", KEY, 60) == RESPONSE
+
+            object_key = LLMResponseStore.object_key("wf-1", KEY)
+            record = json.loads(gzip.decompress(s3.get_object(Bucket="state-bucket", Key=object_key)["Body"].read()))
+            assert record["key"] == KEY and record["model"] == "m"
+            tags = s3.get_object_tagging(Bucket="state-bucket", Key=object_key)["TagSet"]
+            assert {"Key": "status", "Value": "ready"} in tags
+
+    def test_stored_objects_are_covered_by_bucket_lifecycle_rule(self):
+        import os
+        import yaml
+
+        class _CfnLoader(yaml.SafeLoader):
+            pass
+
+        _CfnLoader.add_multi_constructor("!", lambda loader, suffix, node: None)
+        base_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+        with open(os.path.join(base_dir, "backend", "template.yaml")) as f:
+            template = yaml.load(f, Loader=_CfnLoader)
+        rules = template["Resources"]["WorkflowStateBucketResource"]["Properties"]["LifecycleConfiguration"]["Rules"]
+
+        with mock_aws():
+            s3 = boto3.client("s3", region_name="us-east-1")
+            s3.create_bucket(Bucket="state-bucket")
+            LLMResponseStore(S3ResponseBackend("state-bucket", s3_client=s3)).put("wf-1", KEY, RESPONSE, 60, "bedrock", "m")
+            object_key = LLMResponseStore.object_key("wf-1", KEY)
+            tags = s3.get_object_tagging(Bucket="state-bucket", Key=object_key)["TagSet"]
+
+        matching = [
+            rule for rule in rules
+            if rule.get("TagFilters") and all(tag in tags for tag in rule["TagFilters"])
+            and object_key.startswith(rule.get("Prefix", ""))
+        ]
+        assert len(matching) == 1
+        assert matching[0]["ExpirationInDays"] > 0
+        assert matching[0]["NoncurrentVersionExpiration"]["NoncurrentDays"] > 0
+
+    def test_resolve_cache_ttl(self, monkeypatch):
+        monkeypatch.setattr(response_store, "LLM_DURABLE_CACHE_ENABLED", False)
+        assert resolve_cache_ttl({}, {}) is None
+        assert resolve_cache_ttl({"llm_response_cache": {"enabled": True, "ttl_seconds": 120}}, {}) == 120
+        assert resolve_cache_ttl({"llm_response_cache": {"enabled": True, "ttl_seconds": 120}},
+                                 {"durable_response_cache": False}) is None
+        assert resolve_cache_ttl(None, {"durable_response_cache": True}) == response_store.LLM_DURABLE_CACHE_TTL_S
+
+
+class TestLlmChatRunnerDurableCache:
+
+    @pytest.fixture
+    def runner(self, monkeypatch):
+        from src.handlers.core import main
+
+        clear_coalescing_state()
+        monkeypatch.setenv("MOCK_MODE", "false")
+        store = LLMResponseStore(InMemoryResponseBackend())
+        monkeypatch.setattr(response_store, "_response_store", store)
+        calls = []
+
+        def fake_bedrock(model_id, system_prompt, user_prompt, max_tokens=None,
+                         temperature=None, read_timeout_seconds=None):
+            calls.append(user_prompt)
+            return {"content": [{"text": f"answer to {user_prompt}"}],
+                    "usage": {"input_tokens": 100, "output_tokens": 20}}
+
+        monkeypatch.setattr(main, "invoke_bedrock_model", fake_bedrock)
+        yield main.llm_chat_runner, store, calls
+        clear_coalescing_state()
+
+    @staticmethod
+    def _state(execution_id, ttl_seconds=3600, **extra):
+        return {"execution_id": execution_id, "workflow_id": "wf-1", "item": "doc",
+                "workflow_config": {"llm_response_cache": {"enabled": True, "ttl_seconds": ttl_seconds}},
+                **extra}
+
+    CONFIG = {"id": "summarize", "type": "llm_chat", "provider": "bedrock", "model": "claude-3-haiku",
+              "prompt": "Summarize {{item}} in one line", "temperature": 0}
+
+    def test_rerun_reuses_stored_response(self, runner):
+        llm_chat_runner, store, calls = runner
+        first = llm_chat_runner(self._state("exec-1"), self.CONFIG)
+        replay = llm_chat_runner(self._state("exec-2"), self.CONFIG)
+
+        assert len(calls) == 1
+        assert replay["summarize_output"] == first["summarize_output"]
+        assert first["summarize_meta"]["coalesced"] == "provider"
+        assert replay["summarize_meta"]["coalesced"] == "durable_cache"
+        assert replay["usage"]["total_tokens"] == 0 and replay["usage"]["coalesced_tokens"] == 120
+        assert get_execution_token_report("exec-2")["durable_hits"] == 1
+        assert store.get_stats()["tokens_saved"] == 120
+
+    def test_changed_prompt_or_opt_out_calls_provider(self, runner):
+        llm_chat_runner, _, calls = runner
+        llm_chat_runner(self._state("exec-1"), self.CONFIG)
+        llm_chat_runner(self._state("exec-2", item="other doc"), self.CONFIG)
+        llm_chat_runner(self._state("exec-3"), {**self.CONFIG, "temperature": 0.5})
+        llm_chat_runner(self._state("exec-4"), {**self.CONFIG, "durable_response_cache": False})
+        assert len(calls) == 4
+
+    def test_expired_entry_is_refreshed(self, runner, fake_clock, monkeypatch):
+        llm_chat_runner, store, calls = runner
+        llm_chat_runner(self._state("exec-1", ttl_seconds=1), self.CONFIG)
+        fake_clock.now = time.time() + 5
+        monkeypatch.setattr(store, "_clock", fake_clock)
+        llm_chat_runner(self._state("exec-2", ttl_seconds=1), self.CONFIG)
+        llm_chat_runner(self._state("exec-3", ttl_seconds=1), self.CONFIG)
+        assert len(calls) == 2
+        assert store.get_stats()["expired"] == 1
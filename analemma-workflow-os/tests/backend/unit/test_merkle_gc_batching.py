@@ -0,0 +1,146 @@
+# -*- coding: utf-8 -*-
+"""Unit tests for concurrent, bounded ref-count processing in MerkleGarbageCollector."""
+
+from datetime import datetime, timedelta
+
+import boto3
+import pytest
+from moto import mock_aws
+
+from src.services.state.merkle_gc_service import MerkleGarbageCollector
+
+BUCKET = "gc-test-bucket"
+REF_TABLE = "BlockReferenceCounts-test"
+MANIFEST_TABLE = "WorkflowManifests-test"
+
+_LONG_AGO = (datetime.utcnow() - timedelta(hours=1)).isoformat()
+
+# block_id → ref table item (None = no item)
+BLOCKS = {
+    "deletable0": {"ref_count": 0, "zero_reached_at": _LONG_AGO},
+    "deletable1": {"ref_count": 0, "zero_reached_at": _LONG_AGO},
+    "firstzero": {"ref_count": 1},
+    "shared": {"ref_count": 3},
+    "frozenref": {"ref_count": 2, "is_frozen": True},
+    "frozenzero": {"ref_count": 0, "zero_reached_at": _LONG_AGO, "is_frozen": True},
+    "missing": None,
+}
+
+
+@pytest.fixture
+def aws():
+    with mock_aws():
+        dynamodb = boto3.resource("dynamodb", region_name="us-east-1")
+        dynamodb.create_table(
+            TableName=REF_TABLE,
+            KeySchema=[{"AttributeName": "block_id", "KeyType": "HASH"}],
+            AttributeDefinitions=[{"AttributeName": "block_id", "AttributeType": "S"}],
+            BillingMode="PAY_PER_REQUEST",
+        )
+        dynamodb.create_table(
+            TableName=MANIFEST_TABLE,
+            KeySchema=[{"AttributeName": "manifest_id", "KeyType": "HASH"}],
+            AttributeDefinitions=[{"AttributeName": "manifest_id", "AttributeType": "S"}],
+            BillingMode="PAY_PER_REQUEST",
+        )
+        s3 = boto3.client("s3", region_name="us-east-1")
+        s3.create_bucket(Bucket=BUCKET)
+        yield dynamodb, s3
+
+
+def _seed(dynamodb, s3):
+    table = dynamodb.Table(REF_TABLE)
+    for block_id, item in BLOCKS.items():
+        s3.put_object(Bucket=BUCKET, Key=f"blocks/{block_id}.json", Body=b"{}")
+        if item is not None:
+            table.put_item(Item={"block_id": block_id, **item})
+
+
+def _manifest():
+    return {"s3_pointers": {"M": {"state_blocks": {"L": [
+        {"S": f"s3://{BUCKET}/blocks/{block_id}.json"} for block_id in BLOCKS
+    ]}}}}
+
+
+def _remaining_objects(s3):
+    listing = s3.list_objects_v2(Bucket=BUCKET).get("Contents", [])
+    return {obj["Key"].split("/")[-1].replace(".json", "") for obj in listing}
+
+
+def _gc(**kwargs):
+    return MerkleGarbageCollector(MANIFEST_TABLE, BUCKET, ref_table=REF_TABLE, **kwargs)
+
+
+class TestConcurrentCleanup:
+
+    @pytest.mark.parametrize("concurrency, batch_size", [(1, 100), (8, 3)])
+    def test_same_outcome_sequential_and_concurrent(self, aws, concurrency, batch_size):
+        dynamodb, s3 = aws
+        _seed(dynamodb, s3)
+
+        deleted, skipped = _gc(max_concurrency=concurrency, batch_size=batch_size) \
+            ._cleanup_manifest_blocks(_manifest())
+
+        assert (deleted, skipped) == (2, 5)
+        assert _remaining_objects(s3) == set(BLOCKS) - {"deletable0", "deletable1"}
+        table = dynamodb.Table(REF_TABLE)
+        assert "Item" not in table.get_item(Key={"block_id": "deletable0"})
+        first_zero = table.get_item(Key={"block_id": "firstzero"})["Item"]
+        assert first_zero["ref_count"] == 0 and first_zero["zero_reached_at"]
+        assert table.get_item(Key={"block_id": "shared"})["Item"]["ref_count"] == 2
+
+    def test_freeze_is_read_from_decrement_response(self, aws, monkeypatch):
+        dynamodb, s3 = aws
+        _seed(dynamodb, s3)
+        gc = _gc(max_concurrency=4)
+        lookups = []
+        original = gc._is_block_frozen
+        monkeypatch.setattr(gc, "_is_block_frozen", lambda block_id: lookups.append(block_id) or original(block_id))
+
+        outcomes = {block_id: gc._decrement_with_freeze_check(block_id) for block_id in BLOCKS}
+
+        assert outcomes["frozenref"] == (False, True)
+        assert outcomes["frozenzero"] == (False, True)  # graceful wait 경과했어도 frozen이면 제외
+        assert outcomes["deletable0"] == (True, False)
+        assert lookups == []  # 'missing'도 조회 항목(빈 Item)으로 판별됨
+
+    def test_re_referenced_block_survives_toctou_check(self, aws):
+        dynamodb, s3 = aws
+        _seed(dynamodb, s3)
+        table = dynamodb.Table(REF_TABLE)
+
+        class RacingGC(MerkleGarbageCollector):
+            def _decrement_with_freeze_check(self, block_id):
+                outcome = super()._decrement_with_freeze_check(block_id)
+                if block_id == "deletable1":
+                    # Phase 1과 Phase 2 사이에 다른 세그먼트가 블록을 다시 참조
+                    table.update_item(Key={"block_id": block_id}, UpdateExpression="SET ref_count = :one",
+                                      ExpressionAttributeValues={":one": 1})
+                return outcome
+
+        gc = RacingGC(MANIFEST_TABLE, BUCKET, ref_table=REF_TABLE, max_concurrency=8)
+        deleted, skipped = gc._cleanup_manifest_blocks(_manifest())
+
+        assert (deleted, skipped) == (1, 6)
+        assert "deletable1" in _remaining_objects(s3)
+        assert table.get_item(Key={"block_id": "deletable1"})["Item"]["ref_count"] == 1
+
+    def test_map_bounded_preserves_order_across_batches(self, aws):
+        gc = _gc(max_concurrency=4, batch_size=3)
+        ids = [f"b{i}" for i in range(10)]
+        assert gc._map_bounded(str.upper, ids) == [i.upper() for i in ids]
+
+    def test_workers_use_thread_safe_client_with_sized_pool(self, aws, monkeypatch):
+        dynamodb, s3 = aws
+        _seed(dynamodb, s3)
+        gc = _gc(max_concurrency=16, batch_size=4)
+        assert gc.ref_client.client is gc.ref_table.meta.client
+        assert gc.ref_client.client.meta.config.max_pool_connections >= 16
+
+        def shared_resource_call(**kwargs):
+            raise AssertionError("worker used the shared Table resource")
+
+        for op in ("update_item", "get_item", "delete_item"):
+            monkeypatch.setattr(gc.ref_table, op, shared_resource_call)
+
+        assert gc._cleanup_manifest_blocks(_manifest()) == (2, 5)
@@ -0,0 +1,90 @@
+# -*- coding: utf-8 -*-
+"""Unit tests for MetadataExtractor.calculate_edit_distance."""
+
+import random
+from unittest.mock import patch
+
+import pytest
+
+from src.services.metadata_extractor import (
+    MetadataExtractor,
+    _banded_edit_distance,
+    _bit_parallel_edit_distance,
+)
+
+
+def _reference_levenshtein(a: str, b: str) -> int:
+    previous = list(range(len(b) + 1))
+    for i, ca in enumerate(a):
+        current = [i + 1]
+        for j, cb in enumerate(b):
+            current.append(min(previous[j + 1] + 1, current[j] + 1, previous[j] + (ca != cb)))
+        previous = current
+    return previous[-1]
+
+
+@pytest.fixture
+def extractor():
+    with patch("src.services.metadata_extractor.openai.AsyncOpenAI"):
+        return MetadataExtractor()
+
+
+def _random_pairs(count=500, max_len=24, seed=7):
+    rng = random.Random(seed)
+    for _ in range(count):
+        a = "".join(rng.choice("abc") for _ in range(rng.randint(0, max_len)))
+        b = "".join(rng.choice("abc") for _ in range(rng.randint(0, max_len)))
+        yield a, b
+
+
+class TestEditDistanceExactness:
+
+    @pytest.mark.parametrize("a,b,expected", [
+        ("", "", 0),
+        ("abc", "", 3),
+        ("", "abc", 3),
+        ("kitten", "sitting", 3),
+        ("flaw", "lawn", 2),
+        ("안녕하세요", "안녕하십니까", 3),
+    ])
+    def test_known_values(self, extractor, a, b, expected):
+        assert extractor.calculate_edit_distance(a, b) == expected
+
+    def test_bit_parallel_matches_reference(self):
+        for a, b in _random_pairs():
+            assert _bit_parallel_edit_distance(a, b) == _reference_levenshtein(a, b), (a, b)
+
+    def test_banded_matches_reference_within_threshold(self):
+        for a, b in _random_pairs(count=300):
+            expected = _reference_levenshtein(a, b)
+            for k in range(6):
+                assert _banded_edit_distance(a, b, k) == (expected if expected <= k else k + 1)
+
+    def test_symmetric(self, extractor):
+        for a, b in _random_pairs(count=100):
+            assert extractor.calculate_edit_distance(a, b) == extractor.calculate_edit_distance(b, a)
+
+    def test_exact_above_former_sampling_limit(self, extractor):
+        """Texts above 10k chars used to get a chunk-sampled approximation."""
+        original = "abcdefghij" * 1500
+        # Shift content across chunk boundaries; sampling would report thousands
+        corrected = "X" + original[:7000] + original[7001:]
+        assert extractor.calculate_edit_distance(original, corrected) == 2
+
+
+class TestEditDistanceThreshold:
+
+    def test_returns_threshold_plus_one_when_exceeded(self, extractor):
+        assert extractor.calculate_edit_distance("aaaa", "bbbb", max_distance=2) == 3
+
+    def test_length_difference_short_circuits(self, extractor):
+        assert extractor.calculate_edit_distance("a" * 500, "a", max_distance=10) == 11
+
+    def test_within_threshold_is_exact(self, extractor):
+        original = "lorem ipsum dolor sit amet " * 400
+        corrected = original.replace("dolor", "dolar", 3)
+        assert extractor.calculate_edit_distance(original, corrected, max_distance=5) == 3
+
+    def test_negative_threshold_rejected(self, extractor):
+        with pytest.raises(ValueError):
+            extractor.calculate_edit_distance("a", "b", max_distance=-1)
@@ -0,0 +1,120 @@
+# -*- coding: utf-8 -*-
+"""Unit tests for the request-classification LRU in model_router."""
+
+import asyncio
+import json
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.common import model_router
+from src.common.model_router import (
+    classify_intent_with_llm,
+    classify_request,
+    clear_routing_cache,
+    get_routing_cache_stats,
+    workflow_shape_fingerprint,
+)
+
+
+def _workflow(node_count=8, node_type="llm_chat", edge_count=3):
+    return {
+        "nodes": [{"id": f"n{i}", "type": node_type} for i in range(node_count)],
+        "edges": [{"source": "n0", "target": f"n{i}"} for i in range(1, edge_count + 1)],
+    }
+
+
+@pytest.fixture(autouse=True)
+def _reset_cache(monkeypatch):
+    monkeypatch.delenv("DISABLE_PRE_ROUTING", raising=False)
+    clear_routing_cache()
+    yield
+    clear_routing_cache()
+
+
+class TestClassifyRequest:
+
+    def test_repeated_request_is_served_from_cache(self):
+        with patch.object(model_router, "estimate_request_complexity",
+                          wraps=model_router.estimate_request_complexity) as estimate:
+            first = classify_request("co-design", _workflow(), "병렬로 처리하고 retry 추가")
+            second = classify_request("co-design", _workflow(), "병렬로 처리하고 RETRY 추가")
+        assert first is second
+        assert estimate.call_count == 1
+        assert get_routing_cache_stats()["hits"] == 1
+
+    def test_whitespace_variants_are_not_conflated(self):
+        # 부정 문맥 검사("do not")는 공백에 민감 — 캐시 순서와 무관하게 같은 결과여야 한다
+        negated = "please do not add a loop here"
+        wrapped = "please do\nnot add a loop here"
+        expected = {r: model_router._detect_structural_complexity_semantic(r)[0] for r in (negated, wrapped)}
+        assert expected[negated] != expected[wrapped]
+
+        for order in ((negated, wrapped), (wrapped, negated)):
+            clear_routing_cache()
+            for request in order:
+                assert classify_request("co-design", _workflow(), request)["needs_structure"] == expected[request]
+            assert get_routing_cache_stats()["misses"] == 2
+
+    def test_workflow_shape_is_part_of_the_key(self):
+        classify_request("co-design", _workflow(), "add logging")
+        classify_request("co-design", _workflow(node_type="operator"), "add logging")
+        classify_request("co-design", _workflow(edge_count=5), "add logging")
+        assert get_routing_cache_stats()["misses"] == 3
+
+    def test_matches_uncached_classification(self):
+        request = "이전 버전 참고해서 loop 없이 만들어줘"
+        result = classify_request("co-design", _workflow(), request)
+        assert result["tier"] == model_router.estimate_request_complexity("co-design", _workflow(), request)
+        assert (result["needs_structure"], result["struct_confidence"], list(result["struct_keywords"])) == \
+            model_router._detect_structural_complexity_semantic(request)
+
+    def test_lru_bound(self):
+        with patch.object(model_router, "ROUTING_CLASSIFICATION_CACHE_SIZE", 2):
+            for request in ("a request", "b request", "c request"):
+                classify_request("co-design", _workflow(), request)
+        stats = get_routing_cache_stats()
+        assert stats["entries"] == 2 and stats["evictions"] == 1
+
+    def test_fingerprint_ignores_node_order_and_ids(self):
+        wf = _workflow()
+        shuffled = {"nodes": list(reversed(wf["nodes"])), "edges": wf["edges"]}
+        assert workflow_shape_fingerprint(wf) == workflow_shape_fingerprint(shuffled)
+
+
+class TestIntentCache:
+
+    def test_llm_called_only_on_miss(self):
+        service = MagicMock()
+        service.invoke_model.return_value = json.dumps(
+            {"needs_structure": True, "needs_long_context": False,
+             "complexity_tier": "premium", "reasoning": "loop"}
+        )
+        with patch("src.services.llm.gemini_service.get_gemini_flash_8b_service",
+                   return_value=service, create=True):
+            first = asyncio.run(classify_intent_with_llm("루프로 반복해줘"))
+            second = asyncio.run(classify_intent_with_llm("루프로 반복해줘"))
+        assert first == second and first["confidence"] == 0.9
+        assert service.invoke_model.call_count == 1
+        assert get_routing_cache_stats()["llm_calls"] == 1
+
+    def test_fallback_result_is_not_cached(self):
+        service = MagicMock()
+        service.invoke_model.side_effect = RuntimeError("throttled")
+        with patch("src.services.llm.gemini_service.get_gemini_flash_8b_service",
+                   return_value=service, create=True):
+            asyncio.run(classify_intent_with_llm("parallel map"))
+            asyncio.run(classify_intent_with_llm("parallel map"))
+        assert service.invoke_model.call_count == 2
+
+
+def test_routing_latency_is_recorded():
+    with patch.object(model_router, "_is_gemini_available", return_value=False):
+        for _ in range(3):
+            model_router.select_optimal_model(
+                "co-design", _workflow(), "add a step",
+                budget_constraint=model_router.ModelTier.ECONOMY,
+            )
+    stats = get_routing_cache_stats()
+    assert stats["routing_latency_ms"]["samples"] == 3
+    assert stats["hits"] == 2
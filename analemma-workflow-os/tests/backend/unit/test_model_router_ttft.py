@@ -0,0 +1,151 @@
+# -*- coding: utf-8 -*-
+"""Unit tests for AdaptiveTTFTTracker (incremental stats, tails, batched flush)."""
+
+import threading
+import time
+from typing import Dict, List
+
+import pytest
+
+from src.common import model_router
+from src.common.model_router import AdaptiveTTFTTracker, TTFTStorageBackend
+
+
+class _RecordingBackend(TTFTStorageBackend):
+
+    def __init__(self, remote: Dict[str, List[int]] = None, block: threading.Event = None):
+        self.saved: Dict[str, List[int]] = {}
+        self.batches = 0
+        self.loads = 0
+        self.remote = remote or {}
+        self.block = block
+
+    def save(self, model_id, ttft_ms):
+        raise AssertionError("save_batch should be used")
+
+    def save_batch(self, model_id, ttft_samples):
+        if self.block is not None:
+            self.block.wait(5)
+        self.batches += 1
+        self.saved.setdefault(model_id, []).extend(ttft_samples)
+
+    def load(self, model_id):
+        self.loads += 1
+        return list(self.remote.get(model_id, []))
+
+    def is_available(self):
+        return True
+
+
+def _reference_ewma(samples, decay):
+    weighted_sum = weight_total = 0.0
+    for i, sample in enumerate(samples):
+        weight = decay ** (len(samples) - 1 - i)
+        weighted_sum += sample * weight
+        weight_total += weight
+    return weighted_sum / weight_total
+
+
+class TestIncrementalStats:
+
+    def test_effective_ttft_matches_full_recompute(self):
+        tracker = AdaptiveTTFTTracker(window_size=5, decay_factor=0.8)
+        samples = [500, 420, 610, 380, 900, 450, 470, 300, 1200, 510, 490, 505]
+        for i, sample in enumerate(samples, 1):
+            tracker.record_ttft("m", sample)
+            expected = _reference_ewma(samples[max(0, i - 5):i], 0.8)
+            assert tracker.get_effective_ttft("m", 500) == max(166, min(int(expected), 1500))
+
+    def test_percentiles_track_sliding_window(self):
+        tracker = AdaptiveTTFTTracker(window_size=20)
+        for sample in [100] * 18 + [900, 1000]:
+            tracker.record_ttft("m", sample)
+        assert tracker.get_ttft_percentiles("m") == {"p50": 100, "p95": 900}
+
+        # 느린 샘플이 윈도우에서 밀려나면 꼬리도 회복
+        for _ in range(20):
+            tracker.record_ttft("m", 120)
+        assert tracker.get_ttft_percentiles("m") == {"p50": 120, "p95": 120}
+
+    def test_bad_tail_degrades_health_even_with_good_mean(self):
+        tracker = AdaptiveTTFTTracker(window_size=20, decay_factor=0.5)
+        for sample in [1500] * 2 + [100] * 18:
+            tracker.record_ttft("m", sample)
+        assert tracker.get_effective_ttft("m", 300) <= 300 * 1.2
+        assert tracker.get_model_health("m", 300) == "unhealthy"
+        assert tracker.get_routing_ttft("m", 300) > tracker.get_effective_ttft("m", 300)
+
+    def test_no_samples_returns_baseline(self):
+        tracker = AdaptiveTTFTTracker()
+        assert tracker.get_effective_ttft("m", 400) == 400
+        assert tracker.get_tail_ttft("m", 400) == 400
+        assert tracker.get_ttft_percentiles("m") is None
+
+
+class TestBatchedFlush:
+
+    def test_record_does_not_write_synchronously(self):
+        gate = threading.Event()
+        backend = _RecordingBackend(block=gate)
+        tracker = AdaptiveTTFTTracker(distributed_backend=backend, flush_batch_size=3,
+                                      flush_interval_seconds=3600)
+        start = time.monotonic()
+        for sample in (100, 200, 300, 400):
+            tracker.record_ttft("m", sample)
+        assert time.monotonic() - start < 1.0  # 백엔드가 막혀 있어도 기록은 즉시 반환
+        gate.set()
+        tracker._flush_thread.join(5)
+        tracker.flush()
+        assert backend.saved["m"] == [100, 200, 300, 400]
+
+    def test_flush_batches_per_model(self):
+        backend = _RecordingBackend()
+        tracker = AdaptiveTTFTTracker(distributed_backend=backend, flush_batch_size=100,
+                                      flush_interval_seconds=3600)
+        for sample in (1, 2, 3):
+            tracker.record_ttft("a", sample)
+        tracker.record_ttft("b", 9)
+        assert backend.batches == 0
+        assert tracker.flush() == 4
+        assert backend.batches == 2
+        assert backend.saved == {"a": [1, 2, 3], "b": [9]}
+        assert tracker.get_flush_stats()["pending_samples"] == 0
+
+    def test_cold_start_sync_loads_once(self):
+        backend = _RecordingBackend(remote={"m": [200, 220, 240]})
+        tracker = AdaptiveTTFTTracker(distributed_backend=backend)
+        first = tracker.get_effective_ttft("m", 500)
+        for _ in range(5):
+            assert tracker.get_effective_ttft("m", 500) == first
+        tracker.get_effective_ttft("unknown", 500)
+        tracker.get_effective_ttft("unknown", 500)
+        assert backend.loads == 2
+        assert tracker.get_all_metrics()["m"]["sample_count"] == 3
+
+    def test_drain_waits_for_in_flight_background_flush(self):
+        gate = threading.Event()
+        backend = _RecordingBackend(block=gate)
+        tracker = AdaptiveTTFTTracker(distributed_backend=backend, flush_batch_size=2,
+                                      flush_interval_seconds=3600)
+        for sample in (100, 200, 300):
+            tracker.record_ttft("m", sample)  # 백그라운드 스레드가 앞 2개를 가져간 채 대기
+        threading.Timer(0.1, gate.set).start()
+
+        tracker.drain(timeout=5)
+
+        # 핸들러 종료 시점에 버퍼와 진행 중이던 배치가 모두 저장됨 (동결 후 유실 없음)
+        assert backend.saved["m"] == [100, 200, 300]
+        assert tracker.get_flush_stats()["pending_samples"] == 0
+
+
+def test_codesign_worker_flushes_ttft_on_exit(monkeypatch):
+    from src.handlers.core import codesign_worker_handler
+
+    calls = []
+    monkeypatch.setattr(codesign_worker_handler, "flush_ttft_metrics", lambda: calls.append(1))
+    assert codesign_worker_handler.lambda_handler({}, None)["statusCode"] == 400
+    assert calls == [1]
+
+
+def test_module_level_flush_without_backend_is_noop():
+    assert model_router.flush_ttft_metrics() == 0
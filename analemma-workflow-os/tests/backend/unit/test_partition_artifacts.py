@@ -0,0 +1,150 @@
+# -*- coding: utf-8 -*-
+"""Unit tests for content-addressed partition artifacts."""
+
+from unittest.mock import MagicMock, patch
+
+import boto3
+import pytest
+from moto import mock_aws
+
+from src.services.workflow import partition_artifacts, partition_service
+from src.services.workflow.partition_artifacts import (
+    clear_partition_artifact_cache,
+    compute_partition_artifact_hash,
+    get_partition_artifact_cache_stats,
+    load_partition_artifact,
+    resolve_partition,
+    store_partition_artifact,
+)
+from src.services.workflow.partition_service import partition_workflow_advanced
+
+BUCKET = "partition-artifact-test"
+
+
+def _workflow(extra_node=False):
+    nodes = [
+        {"id": "a", "type": "operator", "config": {}},
+        {"id": "b", "type": "llm_chat", "config": {"prompt_content": "hi"}},
+        {"id": "c", "type": "operator", "config": {}},
+    ]
+    edges = [{"source": "a", "target": "b"}, {"source": "b", "target": "c"}]
+    if extra_node:
+        nodes.append({"id": "d", "type": "operator", "config": {}})
+        edges.append({"source": "c", "target": "d"})
+    return {"name": "wf", "nodes": nodes, "edges": edges}
+
+
+@pytest.fixture(autouse=True)
+def _reset_cache():
+    clear_partition_artifact_cache()
+    yield
+    clear_partition_artifact_cache()
+
+
+@pytest.fixture
+def s3_bucket(monkeypatch):
+    monkeypatch.setenv("PARTITION_ARTIFACT_BUCKET", BUCKET)
+    with mock_aws():
+        client = boto3.client("s3", region_name="us-east-1")
+        client.create_bucket(Bucket=BUCKET)
+        with patch.object(partition_artifacts, "get_s3_client", return_value=client):
+            yield client
+
+
+class TestArtifactHash:
+
+    def test_ignores_non_partition_metadata(self):
+        renamed = dict(_workflow(), name="renamed", description="x")
+        assert compute_partition_artifact_hash(_workflow()) == compute_partition_artifact_hash(renamed)
+
+    def test_changes_with_graph(self):
+        assert compute_partition_artifact_hash(_workflow()) != compute_partition_artifact_hash(_workflow(True))
+
+    def test_changes_with_partitioner_version(self):
+        before = compute_partition_artifact_hash(_workflow())
+        with patch.object(partition_service, "PARTITIONER_VERSION", "test-next"):
+            assert compute_partition_artifact_hash(_workflow()) != before
+
+
+class TestArtifactStore:
+
+    def test_round_trip_through_s3(self, s3_bucket):
+        result = partition_workflow_advanced(_workflow())
+        ref = store_partition_artifact(result, _workflow())
+        assert ref["bucket"] == BUCKET
+        assert ref["key"].endswith(f"{ref['hash']}.json")
+
+        clear_partition_artifact_cache()
+        loaded = load_partition_artifact(ref)
+        assert loaded["partition_map"] == result["partition_map"]
+        assert loaded["estimated_executions"] == result["estimated_executions"]
+        assert get_partition_artifact_cache_stats()["s3_loads"] == 1
+
+    def test_warm_cache_skips_s3(self, s3_bucket):
+        result = partition_workflow_advanced(_workflow())
+        ref = store_partition_artifact(result, _workflow())
+        failing = MagicMock()
+        failing.get_object.side_effect = AssertionError("S3 should not be called")
+        with patch.object(partition_artifacts, "get_s3_client", return_value=failing):
+            first = load_partition_artifact(ref)
+            first["partition_map"].clear()
+            # 호출자 수정이 캐시에 반영되지 않아야 함
+            assert load_partition_artifact(ref)["partition_map"] == result["partition_map"]
+        assert get_partition_artifact_cache_stats()["hits"] == 2
+
+    def test_missing_artifact_returns_none(self, s3_bucket):
+        assert load_partition_artifact({"hash": "0" * 64, "bucket": BUCKET}) is None
+
+    def test_store_without_bucket_returns_none(self, monkeypatch):
+        for var in ("PARTITION_ARTIFACT_BUCKET", "WORKFLOW_STATE_BUCKET", "SKELETON_S3_BUCKET"):
+            monkeypatch.delenv(var, raising=False)
+        result = partition_workflow_advanced(_workflow())
+        assert store_partition_artifact(result, _workflow()) is None
+
+
+class TestResolvePartition:
+
+    def test_computes_once_then_reuses(self, s3_bucket):
+        partitioner = MagicMock(side_effect=partition_workflow_advanced)
+        first, ref, source = resolve_partition(_workflow(), partitioner=partitioner)
+        assert source == "computed" and ref is not None
+
+        _, _, source = resolve_partition(_workflow(), partitioner=partitioner)
+        assert source == "cache"
+
+        # 새 컨테이너 (warm 캐시 없음) → S3 아티팩트 재사용
+        clear_partition_artifact_cache()
+        second, _, source = resolve_partition(_workflow(), partitioner=partitioner)
+        assert source == "s3"
+        assert second["partition_map"] == first["partition_map"]
+        assert partitioner.call_count == 1
+
+
+class TestInitializeStateDataResolution:
+
+    def test_inline_partition_map_is_used_as_is(self):
+        from src.common.initialize_state_data import _resolve_precompiled_partition
+        db_data = {"partition_map": [{"id": 0, "type": "normal"}], "total_segments": 1,
+                   "estimated_executions": 100, "loop_analysis": {}}
+        assert _resolve_precompiled_partition(db_data)["partition_map"] == db_data["partition_map"]
+
+    def test_artifact_ref_is_loaded_without_extra_db_read(self, s3_bucket):
+        from src.common import initialize_state_data
+        result = partition_workflow_advanced(_workflow())
+        ref = store_partition_artifact(result, _workflow())
+        clear_partition_artifact_cache()
+
+        with patch.object(initialize_state_data, "_dynamodb") as dynamodb:
+            resolved = initialize_state_data._resolve_precompiled_partition(
+                {"config": _workflow(), "partition_artifact": ref, "total_segments": 3}
+            )
+            dynamodb.Table.assert_not_called()
+        assert resolved["partition_map"] == result["partition_map"]
+        assert resolved["llm_segments_count"] == result["llm_segments"]
+        assert resolved["loop_analysis"] == result["loop_analysis"]
+
+    def test_unavailable_artifact_falls_back(self, s3_bucket):
+        from src.common.initialize_state_data import _resolve_precompiled_partition
+        assert _resolve_precompiled_partition(
+            {"config": _workflow(), "partition_artifact": {"hash": "f" * 64, "bucket": BUCKET}}
+        ) is None
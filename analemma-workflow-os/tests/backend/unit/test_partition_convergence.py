@@ -0,0 +1,107 @@
+# -*- coding: utf-8 -*-
+"""Unit tests for convergence detection in partition_workflow_advanced."""
+
+from unittest.mock import patch
+
+import pytest
+
+from src.services.workflow import partition_service
+from src.services.workflow.partition_service import partition_workflow_advanced
+
+
+def _op(node_id):
+    return {"id": node_id, "type": "operator", "config": {}}
+
+
+def _wf(node_ids, pairs):
+    return {
+        "nodes": [_op(n) for n in node_ids],
+        "edges": [{"source": s, "target": t, "type": "edge"} for s, t in pairs],
+    }
+
+
+def _parallel_groups(segments):
+    for seg in segments:
+        if seg["type"] == "parallel_group":
+            yield seg
+            for branch in seg["branches"]:
+                yield from _parallel_groups(branch["partition_map"])
+
+
+def _aggregator_for(segments, parallel_seg):
+    return next(s for s in segments if s["id"] == parallel_seg["default_next"])
+
+
+class TestConvergence:
+
+    def test_diamond_converges_at_join(self):
+        wf = _wf(
+            ["a", "b1", "b2", "join", "tail"],
+            [("a", "b1"), ("a", "b2"), ("b1", "join"), ("b2", "join"), ("join", "tail")],
+        )
+        result = partition_workflow_advanced(wf)
+        segments = result["partition_map"]
+        p_seg = next(_parallel_groups(segments))
+        assert _aggregator_for(segments, p_seg)["convergence_node"] == "join"
+        assert "join" in result["forced_segment_starts"]
+
+    def test_nearest_merge_wins_over_longer_branch(self):
+        # b1 쪽 체인이 길어도 BFS 깊이가 더 얕은 merge(m)가 합류점
+        wf = _wf(
+            ["a", "b1", "b1x", "b1y", "b2", "m", "z"],
+            [("a", "b1"), ("a", "b2"), ("b1", "b1x"), ("b1x", "b1y"), ("b1y", "m"),
+             ("b2", "m"), ("m", "z")],
+        )
+        segments = partition_workflow_advanced(wf)["partition_map"]
+        p_seg = next(_parallel_groups(segments))
+        assert _aggregator_for(segments, p_seg)["convergence_node"] == "m"
+
+    def test_nested_fork_join(self):
+        wf = _wf(
+            ["a", "b1", "c1", "c2", "ij", "b2", "join"],
+            [("a", "b1"), ("a", "b2"), ("b1", "c1"), ("b1", "c2"), ("c1", "ij"),
+             ("c2", "ij"), ("ij", "join"), ("b2", "join")],
+        )
+        result = partition_workflow_advanced(wf)
+        assert len(list(_parallel_groups(result["partition_map"]))) == 2
+        assert set(result["forced_segment_starts"]) == {"ij", "join"}
+        assert result["metadata"]["nodes_processed"] == 7
+
+    def test_branch_without_merge_has_no_convergence(self):
+        wf = _wf(["a", "b1", "b2"], [("a", "b1"), ("a", "b2")])
+        segments = partition_workflow_advanced(wf)["partition_map"]
+        p_seg = next(_parallel_groups(segments))
+        assert _aggregator_for(segments, p_seg)["convergence_node"] is None
+
+    def test_branch_target_that_is_itself_a_merge(self):
+        # b2는 a와 b1 양쪽에서 들어오는 merge - 시작점이므로 합류점 후보에서 제외
+        wf = _wf(
+            ["a", "b1", "b2", "z"],
+            [("a", "b1"), ("a", "b2"), ("b1", "b2"), ("b2", "z"), ("b1", "z")],
+        )
+        segments = partition_workflow_advanced(wf)["partition_map"]
+        p_seg = next(_parallel_groups(segments))
+        assert _aggregator_for(segments, p_seg)["convergence_node"] == "z"
+
+
+class TestScaling:
+
+    def test_long_comb_partitions_every_node(self):
+        """Spine with a side chain per node: each fork used to rescan the rest of the spine."""
+        node_ids, pairs = [], []
+        for i in range(400):
+            node_ids += [f"s{i}", f"t{i}"]
+            pairs.append((f"s{i}", f"t{i}"))
+            if i:
+                pairs.append((f"s{i - 1}", f"s{i}"))
+        with patch.object(partition_service, "MAX_NODES_LIMIT", 1000), \
+                patch.object(partition_service, "MAX_PARTITION_DEPTH", 1000):
+            result = partition_workflow_advanced(_wf(node_ids, pairs))
+        assert result["metadata"]["nodes_processed"] == 800
+        assert result["forced_segment_starts"] == []
+
+    def test_node_limit_still_enforced(self):
+        wf = _wf([f"n{i}" for i in range(3)], [("n0", "n1"), ("n1", "n2")])
+        with patch.object(partition_service, "MAX_NODES_LIMIT", 2):
+            with pytest.raises(ValueError):
+                partition_workflow_advanced(wf)
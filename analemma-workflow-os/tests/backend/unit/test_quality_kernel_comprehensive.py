@@ -69,6 +69,9 @@ from services.quality_kernel import (
     InterceptorResult,
     create_kernel_interceptor,
     register_node_interceptor,
+    
+    # Shared Stage 1 statistics
+    compute_text_statistics,
 )
 
 
@@ -507,6 +510,42 @@ class TestEntropyAnalysis:
         assert bad_result.word_entropy < 1.0
 
 
+# ============================================================
+# 공용 텍스트 통계 (Single-pass) 테스트
+# ============================================================
+
+class TestSharedTextStatistics:
+    """EntropyAnalyzer / SlopDetector가 공유하는 단일 스윕 통계"""
+    
+    def test_sentence_tokens_match_per_sentence_tokenization(self):
+        """문장별 토큰 구간 == 문장 단위 재토큰화 결과"""
+        analyzer = EntropyAnalyzer()
+        text = "First sentence has words! Second one, 두 번째 문장? Third... fourth_x line."
+        stats = compute_text_statistics(text)
+        
+        assert stats.words == analyzer._tokenize_words(text)
+        for sentence in stats.sentences:
+            assert stats.sentence_words(sentence) == analyzer._tokenize_words(sentence.text)
+    
+    def test_shared_stats_give_identical_results(self):
+        """stats 전달 여부와 무관하게 동일한 결과"""
+        text = MOCK_SLOP_RESPONSES['SLOP_BOILERPLATE'] + " " + MOCK_SLOP_RESPONSES['QUALITY_HIGH_TECHNICAL']
+        stats = compute_text_statistics(text)
+        analyzer = EntropyAnalyzer(domain=ContentDomain.TECHNICAL_REPORT)
+        detector = SlopDetector()
+        
+        assert analyzer.analyze(text, stats=stats).to_dict() == analyzer.analyze(text).to_dict()
+        assert detector.detect(text, stats=stats).to_dict() == detector.detect(text).to_dict()
+    
+    def test_high_frequency_ngrams_keep_string_keys(self):
+        """내부 n-gram은 튜플 키지만 결과는 기존처럼 공백 join 문자열"""
+        text = "the cache key is stable. " * 6
+        result = EntropyAnalyzer().analyze(text)
+        
+        assert result.high_frequency_ngrams.get("the cache key") == 6
+        assert result.repetition_ratio > 0.5
+
+
 # ============================================================
 # 비용 가드레일 테스트
 # ============================================================
@@ -2516,3 +2516,196 @@ def test_llm_timeout_capped_by_wall_clock(mock_client):
     if timeout_val is not None:
         assert timeout_val <= 120.0
         assert timeout_val >= 10.0
+
+
+# ─── Test 45: Governance probes of a batch overlap in time ────────────────────
+
+def _slow_approving_bridge(enter_delay: float, active: Dict[str, int]):
+    """Bridge mock whose segment __enter__ sleeps (kernel round trip) and tracks overlap."""
+    bridge = MagicMock()
+    bridge.workflow_id = "test"
+    lock = threading.Lock()
+    created = []
+
+    def segment_side_effect(*args, **kwargs):
+        created.append(kwargs.get("action"))
+        handle = MagicMock()
+        handle.allowed = True
+        handle.should_kill = False
+        handle.should_rollback = False
+        handle.checkpoint_id = f"cp_{kwargs.get('action')}"
+        handle.action_params = kwargs.get("params", {})
+
+        def enter(*_):
+            with lock:
+                active["now"] += 1
+                active["peak"] = max(active["peak"], active["now"])
+            time.sleep(enter_delay)
+            with lock:
+                active["now"] -= 1
+            return handle
+
+        ctx = MagicMock()
+        ctx.__enter__ = MagicMock(side_effect=enter)
+        ctx.__exit__ = MagicMock(return_value=False)
+        return ctx
+
+    bridge.segment = MagicMock(side_effect=segment_side_effect)
+    bridge._test_created = created
+    return bridge
+
+
+def test_governance_probes_run_concurrently(mock_client):
+    """4 probes × 100ms kernel latency finish in well under 400ms; segments are created in tool order."""
+    from backend.src.bridge.react_executor import ReactExecutor
+
+    active = {"now": 0, "peak": 0}
+    bridge = _slow_approving_bridge(0.1, active)
+
+    exec_ = ReactExecutor(bridge=bridge, model_id="test")
+    for name in ("tool_a", "tool_b", "tool_c", "tool_d"):
+        exec_.add_tool(name, name, {"type": "object", "properties": {}}, lambda p, n=name: n)
+
+    blocks = [MockToolUseBlock(id=f"t{i}", name=name, input={})
+              for i, name in enumerate(("tool_a", "tool_b", "tool_c", "tool_d"))]
+    start = time.monotonic()
+    results, segments, killed = exec_._process_tool_batch(blocks, "think", 1, 0, {})
+    elapsed = time.monotonic() - start
+
+    assert not killed
+    assert elapsed < 0.3
+    assert active["peak"] > 1
+    assert bridge._test_created == ["tool_a", "tool_b", "tool_c", "tool_d"]
+    assert [r["tool_use_id"] for r in results] == ["t0", "t1", "t2", "t3"]
+    assert [r["content"] for r in results] == ["tool_a", "tool_b", "tool_c", "tool_d"]
+
+
+# ─── Test 46: Approved handlers run concurrently, bounded, in order ──────────
+
+def test_approved_handlers_bounded_concurrency_preserves_order(mock_bridge):
+    """Handlers with varied latency run at most tool_concurrency at a time; results keep batch order."""
+    from backend.src.bridge.react_executor import ReactExecutor
+
+    exec_ = ReactExecutor(bridge=mock_bridge, model_id="test", tool_concurrency=2)
+    lock = threading.Lock()
+    active = {"now": 0, "peak": 0}
+
+    def make_handler(delay, value):
+        def handler(p):
+            with lock:
+                active["now"] += 1
+                active["peak"] = max(active["peak"], active["now"])
+            time.sleep(delay)
+            with lock:
+                active["now"] -= 1
+            return value
+        return handler
+
+    delays = [0.08, 0.01, 0.05, 0.02, 0.06]
+    for i, delay in enumerate(delays):
+        exec_.add_tool(f"tool_{i}", "t", {"type": "object", "properties": {}}, make_handler(delay, f"out_{i}"))
+
+    blocks = [MockToolUseBlock(id=f"t{i}", name=f"tool_{i}", input={}) for i in range(len(delays))]
+    results, _, killed = exec_._process_tool_batch(blocks, "think", 1, 0, {})
+
+    assert not killed
+    assert active["peak"] == 2
+    assert [r["tool_use_id"] for r in results] == [f"t{i}" for i in range(len(delays))]
+    assert [r["content"] for r in results] == [f"out_{i}" for i in range(len(delays))]
+
+
+def test_tool_concurrency_one_is_sequential(mock_bridge):
+    """tool_concurrency=1 keeps the previous strictly sequential handler execution."""
+    from backend.src.bridge.react_executor import ReactExecutor
+
+    exec_ = ReactExecutor(bridge=mock_bridge, model_id="test", tool_concurrency=1)
+    threads = []
+    for i in range(3):
+        exec_.add_tool(f"tool_{i}", "t", {"type": "object", "properties": {}},
+                       lambda p: threads.append(threading.current_thread().name) or "ok")
+
+    blocks = [MockToolUseBlock(id=f"t{i}", name=f"tool_{i}", input={}) for i in range(3)]
+    results, _, _ = exec_._process_tool_batch(blocks, "think", 1, 0, {})
+
+    assert [r["content"] for r in results] == ["ok"] * 3
+    assert len(threads) == 3
+
+
+# ─── Test 47: SIGKILL from a slow probe still aborts every handler ───────────
+
+def test_concurrent_probes_sigkill_waits_for_all_probes(mock_client):
+    """A SIGKILL arriving from the slowest probe aborts the batch before any handler runs."""
+    from backend.src.bridge.react_executor import ReactExecutor
+
+    bridge = MagicMock()
+    bridge.workflow_id = "test"
+
+    def segment_side_effect(*args, **kwargs):
+        kill = kwargs.get("action") == "evil_tool"
+        handle = MagicMock()
+        handle.allowed = not kill
+        handle.should_kill = kill
+        handle.should_rollback = False
+        handle.checkpoint_id = "cp"
+        handle.recovery_instruction = "Injection detected" if kill else None
+        handle.action_params = {}
+
+        def enter(*_):
+            time.sleep(0.1 if kill else 0.0)
+            return handle
+
+        ctx = MagicMock()
+        ctx.__enter__ = MagicMock(side_effect=enter)
+        ctx.__exit__ = MagicMock(return_value=False)
+        return ctx
+
+    bridge.segment = MagicMock(side_effect=segment_side_effect)
+
+    exec_ = ReactExecutor(bridge=bridge, model_id="test", tool_concurrency=4)
+    called = []
+    for name in ("fast_a", "fast_b", "evil_tool"):
+        exec_.add_tool(name, name, {"type": "object", "properties": {}},
+                       lambda p, n=name: called.append(n) or n)
+
+    blocks = [MockToolUseBlock(id=f"t{i}", name=name, input={})
+              for i, name in enumerate(("fast_a", "evil_tool", "fast_b"))]
+    results, _, killed = exec_._process_tool_batch(blocks, "think", 1, 0, {})
+
+    assert killed
+    assert called == []
+    assert all("ABORTED" in r["content"] for r in results)
+
+
+# ─── Test 48: Bridge segments of a concurrent batch are deterministic siblings ─
+
+def test_bridge_concurrent_segments_share_parent():
+    """loop_index/parent are fixed when segment() is called, not when the probe enters."""
+    import concurrent.futures
+    from backend.src.bridge.python_bridge import AnalemmaBridge, SegmentResult
+
+    bridge = AnalemmaBridge(workflow_id="wf", ring_level=3, mode="strict")
+    bridge._parent_segment_id = "cp_prev"
+    proposals = []
+
+    def fake_propose(proposal):
+        # 먼저 열린 segment가 가장 늦게 커널 응답을 받음
+        context = proposal["segment_context"]
+        time.sleep(0.03 * (4 - context["loop_index"]))
+        proposals.append(proposal)
+        return SegmentResult(status="APPROVED", checkpoint_id=f"cp_{context['loop_index']}")
+
+    def probe(segment_cm):
+        with segment_cm as seg:
+            return seg.allowed
+
+    with patch.object(bridge, "_send_propose", side_effect=fake_propose), \
+            patch.object(bridge, "_send_observation"):
+        segments = [bridge.segment(thought="t", action="read_only", params={"i": i}) for i in range(3)]
+        with concurrent.futures.ThreadPoolExecutor(max_workers=3) as pool:
+            assert list(pool.map(probe, segments)) == [True, True, True]
+
+    by_index = {p["segment_context"]["loop_index"]: p for p in proposals}
+    assert [by_index[i]["payload"]["action_params"]["i"] for i in (1, 2, 3)] == [0, 1, 2]
+    assert {p["segment_context"]["parent_segment_id"] for p in proposals} == {"cp_prev"}
+    # 다음 부모는 완료 순서와 무관하게 배치의 마지막 segment
+    assert bridge._parent_segment_id == "cp_3"
@@ -0,0 +1,170 @@
+# -*- coding: utf-8 -*-
+"""Unit tests for the shared kernel retry budget (RetryBudgetController)."""
+
+import threading
+
+import pytest
+from botocore.exceptions import ClientError
+
+from src.services.execution import segment_runner_service
+from src.services.execution.segment_runner_service import SegmentRunnerService
+from src.services.recovery.error_classifier import ErrorClassifier
+from src.services.recovery.retry_budget import RetryBudgetController, infer_provider
+
+
+def _throttle(operation="InvokeModel"):
+    return ClientError({"Error": {"Code": "ThrottlingException", "Message": "Rate exceeded"}}, operation)
+
+
+class TestClassification:
+
+    @pytest.mark.parametrize("error_type, message, expected", [
+        ("ClientError", "An error occurred (ThrottlingException) when calling the InvokeModel operation", "throttling"),
+        ("Exception", "429 Resource Exhausted: Quota exceeded for Gemini API", "throttling"),
+        ("ReadTimeoutError", "Read timed out", "timeout"),
+        ("ConnectionError", "Connection reset by peer", "connection"),
+        ("ClientError", "ServiceUnavailable", "unavailable"),
+        ("ValueError", "bad input", None),
+    ])
+    def test_transient_class(self, error_type, message, expected):
+        assert ErrorClassifier().transient_class(error_type, message) == expected
+
+    def test_infer_provider(self):
+        config = {"nodes": [{"type": "llm_chat", "config": {"provider": "bedrock"}}]}
+        assert infer_provider(config) == "bedrock"
+        assert infer_provider({"nodes": [{"config": {"provider": "google"}}]}) == "gemini"
+        mixed = {"nodes": [{"config": {"provider": "bedrock"}}, {"provider": "gemini"}]}
+        assert infer_provider(mixed) == "default"
+        assert infer_provider(None) == "default"
+
+    def test_charge_and_credit_use_the_same_bucket(self, fake_clock):
+        controller = RetryBudgetController(capacity=1, refill_per_s=0, success_credit=1.0,
+                                           max_wait_s=0, clock=fake_clock)
+        config = {"nodes": [{"type": "llm_chat", "config": {"provider": "bedrock"}}]}
+        # 에러 텍스트가 다른 서비스(S3)를 가리켜도 세그먼트 provider 버킷에서 차감
+        assert controller.acquire_for_error(_throttle("GetObject"), config).provider == "bedrock"
+        assert not controller.acquire_for_error(_throttle("GetObject"), config).allowed
+
+        controller.record_success(infer_provider(config))
+        assert controller.acquire_for_error(_throttle("PutItem"), config).allowed
+
+
+class TestTokenBucket:
+
+    def test_grant_then_delay_then_shed(self, fake_clock):
+        clock = fake_clock
+        controller = RetryBudgetController(capacity=2, refill_per_s=1.0, max_wait_s=2.5, clock=clock)
+
+        decisions = [controller.acquire("bedrock", "throttling") for _ in range(5)]
+
+        assert [(d.allowed, d.delay) for d in decisions] == [
+            (True, 0.0), (True, 0.0),       # 버스트
+            (True, 1.0), (True, 2.0),       # 예약: 다음 토큰 시점까지 대기가 늘어남
+            (False, 0.0),                   # 3초 대기 > max_wait → shed
+        ]
+        stats = controller.get_stats()["bedrock:throttling"]
+        assert (stats["granted"], stats["delayed"], stats["shed"]) == (2, 2, 1)
+
+    def test_refill_and_success_credit(self, fake_clock):
+        clock = fake_clock
+        controller = RetryBudgetController(capacity=2, refill_per_s=0.5, success_credit=0.5,
+                                           max_wait_s=0, clock=clock)
+        controller.acquire("gemini", "throttling")
+        controller.acquire("gemini", "throttling")
+        assert not controller.acquire("gemini", "throttling").allowed
+
+        clock.now = 2.0  # +1 토큰
+        assert controller.acquire("gemini", "throttling").delay == 0.0
+        assert not controller.acquire("gemini", "throttling").allowed
+
+        controller.record_success("gemini")
+        controller.record_success("gemini")
+        assert controller.acquire("gemini", "throttling").allowed
+
+    def test_buckets_are_independent_per_provider_and_class(self, fake_clock):
+        controller = RetryBudgetController(capacity=1, refill_per_s=0, clock=fake_clock)
+        assert controller.acquire("bedrock", "throttling").allowed
+        assert not controller.acquire("bedrock", "throttling").allowed
+        assert controller.acquire("bedrock", "timeout").allowed
+        assert controller.acquire("gemini", "throttling").allowed
+
+
+class FlakyProvider:
+    """Simulated throttling provider: each segment's first `failures_per_segment` calls are throttled."""
+
+    def __init__(self, failures_per_segment):
+        self.failures_per_segment = failures_per_segment
+        self.calls = 0
+        self._seen = {}
+        self._lock = threading.Lock()
+
+    def __call__(self, initial_state, **kwargs):
+        with self._lock:
+            self.calls += 1
+            seen = self._seen[initial_state["n"]] = self._seen.get(initial_state["n"], 0) + 1
+        if seen <= self.failures_per_segment:
+            raise _throttle()
+        return {"ok": True}
+
+
+def _run_segments(monkeypatch, provider, controller, segments):
+    monkeypatch.setattr(segment_runner_service, "get_retry_budget_controller", lambda: controller)
+    sleeps = []
+    monkeypatch.setattr(segment_runner_service.time, "sleep", sleeps.append)
+    runner = SegmentRunnerService.__new__(SegmentRunnerService)
+    runner._execute_with_auto_split = provider
+    config = {"id": "seg", "nodes": [{"id": "llm", "type": "llm_chat", "config": {"provider": "bedrock"}}]}
+
+    results = [None] * segments
+
+    def worker(i):
+        results[i] = runner._execute_with_kernel_retry(config, {"n": i}, "user", {})
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(segments)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    return results, sleeps
+
+
+class TestKernelRetryWithBudget:
+
+    def test_outage_retries_are_shed_once_budget_is_spent(self, fake_clock, monkeypatch):
+        provider = FlakyProvider(failures_per_segment=10 ** 6)  # 지속 장애
+        controller = RetryBudgetController(capacity=5, refill_per_s=0, clock=fake_clock)
+
+        results, _ = _run_segments(monkeypatch, provider, controller, segments=20)
+
+        # 예산 없이는 20 × (1 + KERNEL_MAX_RETRIES) = 80회 호출
+        assert provider.calls == 20 + 5
+        errors = [error for _, error in results]
+        assert all(error is not None for error in errors)
+        shed = sum(error["retry_shed"] for error in errors)
+        assert shed == controller.get_stats()["bedrock:throttling"]["shed"]
+        # 토큰 3개를 모두 쓴 세그먼트만 shed 없이 재시도 한도로 종료 가능 (최대 1개)
+        assert shed >= 19
+
+    def test_flaky_provider_recovers_with_delayed_retries(self, fake_clock, monkeypatch):
+        provider = FlakyProvider(failures_per_segment=1)
+        controller = RetryBudgetController(capacity=4, refill_per_s=1.0, success_credit=0,
+                                           max_wait_s=10, clock=fake_clock)
+
+        results, sleeps = _run_segments(monkeypatch, provider, controller, segments=8)
+
+        assert all(error is None for _, error in results)
+        stats = controller.get_stats()["bedrock:throttling"]
+        assert stats["granted"] == 4 and stats["delayed"] == 4 and stats["shed"] == 0
+        # 예약된 재시도는 토큰 시점(1s, 2s, 3s, 4s)보다 먼저 깨어나지 않음
+        assert sorted(sleeps)[-1] >= 4.0
+        assert provider.calls == 16
+
+    def test_non_retryable_error_does_not_spend_budget(self, fake_clock, monkeypatch):
+        def broken(initial_state, **kwargs):
+            raise ValueError("schema mismatch")
+
+        controller = RetryBudgetController(capacity=1, refill_per_s=0, clock=fake_clock)
+        results, sleeps = _run_segments(monkeypatch, broken, controller, segments=3)
+
+        assert all(error["retry_attempts"] == 1 and not error["retry_shed"] for _, error in results)
+        assert controller.get_stats() == {} and sleeps == []
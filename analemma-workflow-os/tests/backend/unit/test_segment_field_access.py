@@ -0,0 +1,199 @@
+# -*- coding: utf-8 -*-
+"""Unit tests for static segment field-access analysis and its runtime enforcement."""
+
+from src.common.state_hydrator import S3Pointer
+from src.services.workflow.field_access_analyzer import (
+    UNDECLARED_WRITES_KEY,
+    analyze_node_access,
+    analyze_segment_field_access,
+    enforce_declared_writes,
+    find_undeclared_writes,
+    prefetch_declared_reads,
+    resolve_segment_field_access,
+    snapshot_state,
+)
+from src.services.workflow.partition_service import partition_workflow_advanced
+
+
+def _access(node):
+    return analyze_node_access(node).to_dict()
+
+
+class TestNodeAnalysis:
+
+    def test_llm_templates_and_output_key(self):
+        access = _access({
+            "id": "writer", "type": "llm_chat",
+            "config": {
+                "prompt_content": "Summarize {{ doc.body | tojson }} for {{user_name}}",
+                "system_prompt": "{% if tone is defined %}Use {{tone}}{% endif %}",
+                "output_key": "summary",
+            },
+        })
+        assert access["reads"] == ["doc", "doc.body", "tone", "user_name"]
+        assert access["writes"] == ["summary"]
+        assert access["write_prefixes"] == ["writer_"]
+        assert not access["dynamic_reads"] and not access["dynamic_writes"]
+
+    def test_llm_without_prompt_or_with_state_json_is_dynamic_read(self):
+        assert _access({"id": "a", "type": "llm_chat", "config": {}})["dynamic_reads"]
+        assert _access({"id": "a", "type": "llm_chat",
+                        "config": {"prompt_content": "{{ __state_json }}"}})["dynamic_reads"]
+
+    def test_operator_code_and_sets(self):
+        code = (
+            "items = state.get('items', [])\n"
+            "state['count'] = len(items) + state['offset']\n"
+            "result = {'total': sum(items), 'ok': True}\n"
+        )
+        access = _access({"id": "op", "type": "operator", "config": {"code": code, "sets": {"flag": 1}}})
+        assert access["reads"] == ["items", "offset"]
+        assert access["writes"] == ["count", "flag", "ok", "total"]
+        assert not access["dynamic_reads"] and not access["dynamic_writes"]
+
+    def test_operator_code_aliasing_is_dynamic(self):
+        assert _access({"id": "op", "type": "operator", "code": "helper(state)"})["dynamic_writes"]
+        assert _access({"id": "op", "type": "operator", "code": "result = build()"})["dynamic_writes"]
+        assert _access({"id": "op", "type": "operator", "code": "state[key] = 1"})["dynamic_writes"]
+        assert _access({"id": "op", "type": "operator", "code": "def ("})["dynamic_reads"]
+
+    def test_operator_official_and_route_condition(self):
+        official = _access({"id": "f", "type": "operator_official",
+                            "config": {"strategy": "filter", "input_key": "rows.data",
+                                       "params": {"min": "{{threshold}}"}, "output_key": "kept"}})
+        assert official["reads"] == ["rows", "rows.data", "threshold"]
+        assert official["writes"] == ["kept"]
+        assert _access({"id": "f", "type": "operator_official", "config": {}})["dynamic_reads"]
+
+        route = _access({"id": "r", "type": "route_condition", "config": {"branches": [
+            {"condition": "$.score >= 0.8 and $.status == 'ok'", "target": "x"},
+        ]}})
+        assert route["reads"] == ["__workflow_nodes", "score", "status"]
+        assert not route["dynamic_writes"]
+
+    def test_for_each_recurses_into_sub_workflow(self):
+        access = _access({"id": "fe", "type": "for_each", "config": {
+            "input_list_key": "docs",
+            "sub_workflow": {"nodes": [
+                {"id": "inner", "type": "llm_chat", "config": {"prompt_content": "{{item}} {{lang}}"}},
+            ]},
+        }})
+        assert {"docs", "lang"} <= set(access["reads"])
+        assert access["writes"] == ["for_each_results"]
+        assert access["write_prefixes"] == ["fe_", "inner_"]
+
+        ref = _access({"id": "fe", "type": "for_each", "config": {"subgraph_ref": "sg1"}})
+        assert ref["dynamic_reads"] and ref["dynamic_writes"]
+
+    def test_unknown_type_is_opaque(self):
+        access = _access({"id": "s", "type": "skill_executor", "config": {}})
+        assert access["dynamic_reads"] and access["dynamic_writes"]
+
+
+class TestPartitionAnnotation:
+
+    def test_partition_map_segments_carry_field_access(self):
+        workflow = {
+            "nodes": [
+                {"id": "a", "type": "operator", "config": {"sets": {"topic": "x"}}},
+                {"id": "b", "type": "llm_chat", "config": {"prompt_content": "{{topic}}", "output_key": "draft"}},
+            ],
+            "edges": [{"source": "a", "target": "b"}],
+        }
+        result = partition_workflow_advanced(workflow)
+        segments = result["partition_map"]
+        assert all("field_access" in seg for seg in segments)
+        merged_reads = set().union(*(seg["field_access"]["reads"] for seg in segments))
+        merged_writes = set().union(*(seg["field_access"]["writes"] for seg in segments))
+        assert "topic" in merged_reads and {"topic", "draft"} <= merged_writes
+        assert result["metadata"]["field_access"]["annotated_segments"] == len(segments)
+
+    def test_parallel_group_unions_branches_and_aggregator_is_dynamic(self):
+        branch = {"partition_map": [{"id": 1, "type": "normal", "nodes": [
+            {"id": "x", "type": "operator", "config": {"sets": {"left": 1}}},
+        ]}]}
+        group = analyze_segment_field_access({"id": 0, "type": "parallel_group", "nodes": [], "branches": [branch]})
+        assert group["writes"] == ["left"] and not group["dynamic_writes"]
+        assert analyze_segment_field_access({"id": 2, "type": "aggregator", "nodes": []})["dynamic_writes"]
+
+    def test_resolve_prefers_stored_annotation(self):
+        stored = {"reads": ["a"], "writes": [], "write_prefixes": [], "dynamic_reads": False, "dynamic_writes": False}
+        assert resolve_segment_field_access({"nodes": [], "field_access": stored}) is stored
+        legacy = resolve_segment_field_access({"type": "normal", "nodes": [
+            {"id": "n", "type": "operator", "config": {"sets": {"k": 1}}},
+        ]})
+        assert legacy["writes"] == ["k"]
+
+
+class _FakeHydrator:
+    def __init__(self, payloads, fail=()):
+        self.payloads = payloads
+        self.fail = set(fail)
+        self.loaded = []
+
+    def _load_from_s3(self, pointer):
+        if pointer.field_name in self.fail:
+            raise IOError("boom")
+        self.loaded.append(pointer.field_name)
+        return self.payloads[pointer.field_name]
+
+
+def _pointer(name):
+    return S3Pointer(bucket="b", key=f"state/{name}", size_bytes=10, checksum="", field_name=name).to_dict()
+
+
+class TestRuntime:
+
+    def test_prefetch_loads_only_declared_pointer_reads(self):
+        state = {"doc": _pointer("doc"), "other": _pointer("other"), "bad": _pointer("bad"), "plain": 1}
+        hydrator = _FakeHydrator({"doc": {"body": "hi"}, "other": [1]}, fail={"bad"})
+        field_access = {"reads": ["bad", "doc", "plain"], "writes": []}
+
+        loaded = prefetch_declared_reads(state, field_access, hydrator)
+
+        assert loaded == ["doc"]
+        assert hydrator.loaded == ["doc"]
+        assert state["doc"] == {"body": "hi"}
+        assert state["other"]["__s3_pointer__"] and state["bad"]["__s3_pointer__"]
+
+    def test_undeclared_writes_advisory_and_strict(self):
+        field_access = {"reads": [], "writes": ["draft"], "write_prefixes": ["b_"],
+                        "dynamic_reads": False, "dynamic_writes": False}
+        before = {"draft": None, "keep": 1, "gone": 2}
+        after = {"draft": "text", "b_meta": {}, "keep": 99, "leak": 3, "step_history": [], "_metadata": {}}
+        assert find_undeclared_writes(before, after, field_access) == ["gone", "keep", "leak"]
+
+        advisory = dict(after)
+        assert enforce_declared_writes(before, advisory, field_access, mode="advisory") == ["gone", "keep", "leak"]
+        assert advisory == after
+
+        strict = dict(after)
+        enforce_declared_writes(snapshot_state(before, mode="strict"), strict, field_access, mode="strict")
+        assert strict["keep"] == 1 and strict["gone"] == 2 and "leak" not in strict
+        assert strict["draft"] == "text" and "b_meta" in strict
+        assert strict[UNDECLARED_WRITES_KEY] == ["gone", "keep", "leak"]
+
+    def test_nested_in_place_mutation_is_detected_and_reverted(self):
+        field_access = {"reads": [], "writes": ["draft"], "dynamic_reads": False, "dynamic_writes": False}
+        state = {"draft": {"body": "b"}, "config": {"limits": {"max": 1}}, "history": ["a"]}
+        advisory = snapshot_state(state, field_access, mode="advisory")
+        assert all(advisory[key] is state[key] for key in state)  # advisory는 참조만 보관
+
+        before = snapshot_state(state, field_access, mode="strict")
+        assert before["draft"] is state["draft"]  # 선언된 쓰기 키는 복사하지 않음
+
+        # 노드가 선언 외 키의 중첩 값을 제자리에서 변경
+        state["config"]["limits"]["max"] = 99
+        state["history"].append("b")
+        state["draft"]["body"] = "b2"
+        assert find_undeclared_writes(before, state, field_access) == ["config", "history"]
+
+        enforce_declared_writes(before, state, field_access, mode="strict")
+        assert state["config"] == {"limits": {"max": 1}} and state["history"] == ["a"]
+        assert state["draft"] == {"body": "b2"}
+
+    def test_dynamic_writes_are_never_restricted(self):
+        field_access = {"writes": [], "dynamic_writes": True}
+        after = {"anything": 1}
+        assert enforce_declared_writes({}, after, field_access, mode="strict") == []
+        assert after == {"anything": 1}
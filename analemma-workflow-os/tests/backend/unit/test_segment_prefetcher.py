@@ -0,0 +1,166 @@
+# -*- coding: utf-8 -*-
+"""Unit tests for speculative prefetch of the next manifest segment."""
+
+import hashlib
+import json
+
+import boto3
+import pytest
+from moto import mock_aws
+
+from src.services.execution.segment_prefetcher import (
+    SegmentPrefetcher,
+    clear_segment_prefetch_state,
+    get_segment_prefetch_stats,
+    get_segment_prefetcher,
+    predict_next_segments,
+)
+from src.services.execution.segment_runner_service import SegmentRunnerService
+from src.common.state_hydrator import StateHydrator
+
+BUCKET = "state-bucket"
+MANIFEST_PATH = f"s3://{BUCKET}/manifests/m1.json"
+
+
+def _segment(seg_id, node_ids, reads_key=None, outgoing=()):
+    nodes = [{"id": n, "type": "operator_official", "config": {}} for n in node_ids]
+    if reads_key:
+        nodes = [{"id": node_ids[0], "type": "llm_chat", "config": {"prompt": "{{" + reads_key + "}}"}}]
+    return {"segment_id": seg_id, "segment_config": {
+        "id": seg_id, "nodes": nodes, "node_ids": list(node_ids),
+        "outgoing_edges": [{"target_node": t} for t in outgoing]}}
+
+
+def _pointer(key, body):
+    return {"__s3_pointer__": True, "bucket": BUCKET, "key": key, "size_bytes": len(body),
+            "checksum": hashlib.md5(body.encode("utf-8")).hexdigest()[:8], "field_name": key}
+
+
+class TestPrediction:
+
+    def test_linear_and_edge_targets(self):
+        segments = [_segment(0, ["a"]), _segment(1, ["b"], outgoing=["a", "c"]),
+                    _segment(2, ["c"]), _segment(3, ["d"])]
+        assert predict_next_segments(segments, 0, depth=1) == [1]
+        assert predict_next_segments(segments, 0, depth=2) == [1, 2]
+        assert predict_next_segments(segments, 1, depth=1) == [2, 0]  # back-edge → 루프 시작 세그먼트
+        assert predict_next_segments(segments, 3, depth=1) == []
+        assert predict_next_segments(segments, 9) == []
+
+
+class TestPrefetcherCache:
+
+    def test_take_is_single_use_and_ttl_bounded(self, fake_clock):
+        clock = fake_clock
+        prefetcher = SegmentPrefetcher(ttl_s=10, clock=clock)
+        segments = [_segment(0, ["a"]), _segment(1, ["b"]), _segment(2, ["c"])]
+        prefetcher.schedule("owner", MANIFEST_PATH, 0, lambda: segments, None, lambda c: (), {})
+        prefetcher.wait_idle()
+
+        config = prefetcher.take_config("owner", MANIFEST_PATH, 1)
+        assert config["node_ids"] == ["b"]
+        config["nodes"].clear()  # 소비자의 제자리 수정이 매니페스트 사본에 번지지 않음
+        assert segments[1]["segment_config"]["nodes"]
+        assert prefetcher.take_config("owner", MANIFEST_PATH, 1) is None
+        assert prefetcher.take_config("other-owner", MANIFEST_PATH, 1) is None
+
+        loads = []
+        prefetcher.schedule("owner", MANIFEST_PATH, 1, lambda: loads.append(1) or segments, None, lambda c: (), {})
+        prefetcher.wait_idle()
+        assert loads == []  # 캐시된 매니페스트 재사용
+        clock.now = 11
+        assert prefetcher.take_config("owner", MANIFEST_PATH, 2) is None
+
+        stats = prefetcher.get_stats()
+        assert (stats["config_hits"], stats["config_misses"]) == (1, 3)
+        assert stats["config_hit_rate"] == 0.25
+
+    def test_pointer_prefetch_skips_current_writes_and_seeds_hydrator(self):
+        prefetcher = SegmentPrefetcher()
+        segments = [_segment(0, ["a"]), _segment(1, ["b"], reads_key="doc")]
+        doc, summary = _pointer("doc.json", '"x"'), _pointer("summary.json", '"y"')
+        loaded = []
+
+        def load_pointer(pointer):
+            loaded.append(pointer["key"])
+            return {"text": pointer["key"]}
+
+        reads = lambda config: ["doc", "summary"]
+        prefetcher.schedule("o", MANIFEST_PATH, 0, lambda: segments, load_pointer, reads,
+                            {"doc": doc, "summary": summary}, current_writes={"summary"})
+        prefetcher.wait_idle()
+        assert loaded == ["doc.json"]
+
+        hydrator = StateHydrator(bucket_name=BUCKET, s3_client=object())
+        state = {"doc": doc, "summary": summary, "plain": 1}
+        assert prefetcher.seed_hydrator(hydrator, state, ["doc", "summary", "plain"]) == ["doc"]
+        assert hydrator._cache[f"{BUCKET}/doc.json"] == {"text": "doc.json"}
+        stats = prefetcher.get_stats()
+        assert (stats["pointer_hits"], stats["pointer_misses"], stats["pointer_hit_rate"]) == (1, 1, 0.5)
+
+    def test_errors_and_invalidation(self):
+        prefetcher = SegmentPrefetcher()
+
+        def broken():
+            raise RuntimeError("s3 down")
+
+        prefetcher.schedule("o", MANIFEST_PATH, 0, broken, None, lambda c: (), {})
+        prefetcher.wait_idle()
+        assert prefetcher.get_stats()["prefetch_errors"] == 1
+
+        prefetcher.schedule("o", MANIFEST_PATH, 0, lambda: [_segment(0, ["a"]), _segment(1, ["b"])],
+                            None, lambda c: (), {})
+        prefetcher.wait_idle()
+        prefetcher.invalidate(MANIFEST_PATH)
+        assert prefetcher.take_config("o", MANIFEST_PATH, 1) is None
+
+    def test_transition_latency_report(self):
+        prefetcher = SegmentPrefetcher()
+        prefetcher.record_transition(10.0, True)
+        prefetcher.record_transition(30.0, True)
+        prefetcher.record_transition(90.0, False)
+        stats = prefetcher.get_stats()
+        assert (stats["avg_transition_ms_hit"], stats["avg_transition_ms_miss"]) == (20.0, 90.0)
+        assert (stats["transitions_hit"], stats["transitions_miss"]) == (2, 1)
+
+
+class TestSegmentRunnerPrefetch:
+
+    @pytest.fixture
+    def s3(self, monkeypatch):
+        with mock_aws():
+            client = boto3.client("s3", region_name="us-east-1")
+            client.create_bucket(Bucket=BUCKET)
+            monkeypatch.setattr(boto3, "client", lambda *a, **k: client)
+            clear_segment_prefetch_state()
+            yield client
+            clear_segment_prefetch_state()
+
+    def test_next_segment_config_and_reads_are_prefetched(self, s3):
+        segments = [_segment(0, ["a"]), _segment(1, ["b"], reads_key="doc")]
+        s3.put_object(Bucket=BUCKET, Key="manifests/m1.json", Body=json.dumps({"segments": segments}))
+        body = json.dumps({"text": "large document"})
+        s3.put_object(Bucket=BUCKET, Key="doc.json", Body=body)
+        doc = _pointer("doc.json", body)
+
+        runner = SegmentRunnerService.__new__(SegmentRunnerService)
+        runner.hydrator = StateHydrator(bucket_name=BUCKET, s3_client=s3)
+        event = {"segment_manifest_s3_path": MANIFEST_PATH, "segment_index": 0, "ownerId": "owner"}
+
+        runner._load_segment_config_from_manifest(MANIFEST_PATH, 0)
+        runner._schedule_next_segment_prefetch(event, 0, {"reads": [], "writes": []}, {"doc": doc})
+        get_segment_prefetcher().wait_idle()
+
+        assert get_segment_prefetcher().take_config("owner", MANIFEST_PATH, 1)["node_ids"] == ["b"]
+        next_hydrator = StateHydrator(bucket_name=BUCKET, s3_client=s3)
+        assert get_segment_prefetcher().seed_hydrator(next_hydrator, {"doc": doc}, ["doc"]) == ["doc"]
+        assert next_hydrator._cache[f"{BUCKET}/doc.json"] == {"text": "large document"}
+        stats = get_segment_prefetch_stats()
+        assert (stats["configs_prefetched"], stats["pointers_prefetched"]) == (1, 1)
+
+    def test_asl_injected_config_is_not_prefetched(self, s3):
+        runner = SegmentRunnerService.__new__(SegmentRunnerService)
+        runner.hydrator = StateHydrator(bucket_name=BUCKET, s3_client=s3)
+        event = {"segment_manifest_s3_path": MANIFEST_PATH, "segment_config": {"nodes": []}}
+        runner._schedule_next_segment_prefetch(event, 0, None, {})
+        assert get_segment_prefetch_stats()["prefetches_scheduled"] == 0